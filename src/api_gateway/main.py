@@ -13,6 +13,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from .speaker_bucket_management_router import close_service_client
 from .speaker_bucket_management_router import router as speaker_bucket_router
 # from .enhanced_error_reporting_router import router as error_reporting_router
 # from .verification_workflow_router import router as verification_router
@@ -31,6 +32,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting API Gateway")
     yield
     logger.info("Shutting down API Gateway")
+    await close_service_client()
 
 
 # Create FastAPI app
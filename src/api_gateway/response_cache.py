@@ -0,0 +1,208 @@
+"""
+API Gateway Response Cache
+
+In-process cache for aggregate gateway responses that fan out to several
+services. Entries are fresh for a per-endpoint TTL and may then be served
+stale while one background request revalidates them. Concurrent misses for
+the same key share a single upstream fetch (single-flight), and every entry
+carries an ETag so clients can revalidate with If-None-Match. The number of
+entries is bounded, evicting the least recently used.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long an endpoint's responses are fresh, then servable while stale."""
+
+    ttl_seconds: float
+    stale_seconds: float = 0.0
+    # Freshness of degraded responses, which are never served stale; zero
+    # means they are returned to the callers waiting on them but not cached
+    degraded_ttl_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response body with its ETag."""
+
+    value: Any
+    etag: str
+    stored_at: float
+    degraded: bool = False
+
+
+def make_etag(value: Any, volatile_fields: Iterable[str] = ()) -> str:
+    """Strong ETag over the JSON body, ignoring top-level volatile fields."""
+    if isinstance(value, dict) and volatile_fields:
+        value = {k: v for k, v in value.items() if k not in volatile_fields}
+    body = json.dumps(value, sort_keys=True, default=str).encode()
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class ResponseCache:
+    """
+    Stale-while-revalidate response cache with request coalescing.
+
+    Counters:
+        hits: served fresh from cache
+        stale_hits: served stale while a revalidation runs
+        misses: no usable entry, caller started the upstream fetch
+        coalesced: no usable entry, caller joined a fetch already in flight
+        revalidations: background refreshes started for stale entries
+        errors: upstream fetches that raised
+        evictions: least recently used entries dropped to stay within
+            max_entries
+    """
+
+    def __init__(
+        self,
+        volatile_fields: Iterable[str] = ("timestamp",),
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: int = 1024,
+    ):
+        self._volatile_fields = tuple(volatile_fields)
+        self._clock = clock
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._stats: Counter = Counter()
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        policy: CachePolicy,
+        is_degraded: Optional[Callable[[Any], bool]] = None,
+    ) -> CacheEntry:
+        """
+        Get the entry for key, fetching it when missing or fully expired.
+
+        Args:
+            key: Cache key identifying the response
+            fetch: Coroutine function producing the response body
+            policy: Freshness policy of the endpoint
+            is_degraded: Predicate marking response bodies that are missing
+                data, such as a fan-out with a failed section; these are
+                cached for policy.degraded_ttl_seconds only
+
+        Returns:
+            Cached or freshly fetched entry
+
+        Raises:
+            Whatever fetch raised, for the caller that needed the value;
+            failures are not cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            age = self._clock() - entry.stored_at
+            if entry.degraded:
+                ttl_seconds, stale_seconds = policy.degraded_ttl_seconds, 0.0
+            else:
+                ttl_seconds, stale_seconds = policy.ttl_seconds, policy.stale_seconds
+            if age < ttl_seconds:
+                self._stats["hits"] += 1
+                return entry
+            if age < ttl_seconds + stale_seconds:
+                self._stats["stale_hits"] += 1
+                if key not in self._in_flight:
+                    self._stats["revalidations"] += 1
+                    self._start_fetch(key, fetch, policy, is_degraded)
+                return entry
+
+        if key in self._in_flight:
+            self._stats["coalesced"] += 1
+        else:
+            self._stats["misses"] += 1
+            self._start_fetch(key, fetch, policy, is_degraded)
+
+        # Shield the shared fetch so one cancelled caller cannot cancel it
+        # for everyone else waiting on it
+        return await asyncio.shield(self._in_flight[key])
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry for key."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counter values plus the current number of entries."""
+        counters = (
+            "hits",
+            "stale_hits",
+            "misses",
+            "coalesced",
+            "revalidations",
+            "errors",
+            "evictions",
+        )
+        return {
+            **{name: self._stats[name] for name in counters},
+            "entries": len(self._entries),
+        }
+
+    def _start_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        policy: CachePolicy,
+        is_degraded: Optional[Callable[[Any], bool]],
+    ) -> None:
+        task = asyncio.ensure_future(self._fetch(key, fetch, policy, is_degraded))
+        self._in_flight[key] = task
+        # Retrieve failures of background revalidations nobody awaits
+        task.add_done_callback(_consume_exception)
+
+    async def _fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        policy: CachePolicy,
+        is_degraded: Optional[Callable[[Any], bool]],
+    ) -> CacheEntry:
+        try:
+            value = await fetch()
+        except Exception:
+            self._stats["errors"] += 1
+            logger.warning(f"Upstream fetch failed for cache key {key}", exc_info=True)
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        entry = CacheEntry(
+            value=value,
+            etag=make_etag(value, self._volatile_fields),
+            stored_at=self._clock(),
+            degraded=is_degraded is not None and is_degraded(value),
+        )
+        if entry.degraded and policy.degraded_ttl_seconds <= 0:
+            self._entries.pop(key, None)
+        else:
+            self._store(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
@@ -5,14 +5,17 @@ Comprehensive API gateway router that aggregates all speaker bucket management e
 Provides a unified interface for the complete speaker bucket management workflow.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import JSONResponse, Response
+
+from .response_cache import CacheEntry, CachePolicy, ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -27,38 +30,147 @@ VERIFICATION_SERVICE_URL = "http://verification-service:8000"
 RAG_INTEGRATION_SERVICE_URL = "http://ris-dev:8002"
 
 
+# Freshness of cached aggregate responses; stale entries are still served
+# while a background request refreshes them. Responses missing a section
+# because a service failed are only kept briefly and never served stale.
+COMPREHENSIVE_VIEW_CACHE_POLICY = CachePolicy(
+    ttl_seconds=15, stale_seconds=60, degraded_ttl_seconds=2
+)
+DASHBOARD_OVERVIEW_CACHE_POLICY = CachePolicy(
+    ttl_seconds=30, stale_seconds=300, degraded_ttl_seconds=2
+)
+
+# Upper bound on each downstream call made while aggregating several services;
+# a slower service is reported as missing instead of delaying the response
+DOWNSTREAM_DEADLINE_SECONDS = 5.0
+
+
 class ServiceClient:
-    """HTTP client for inter-service communication."""
+    """
+    HTTP client for inter-service communication.
 
-    def __init__(self):
-        self.timeout = httpx.Timeout(30.0)
+    Wraps one pooled httpx.AsyncClient for the lifetime of the application,
+    so requests reuse keep-alive connections (and HTTP/2 where the service
+    negotiates it) instead of connecting for every call.
+    """
+
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self._client = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
+        )
 
-    async def get(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request to service."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make GET request to service, failing after deadline seconds if given."""
+        return await self._request("GET", url, deadline, params=params)
 
     async def post(self, url: str, json: Optional[Dict] = None) -> Dict[str, Any]:
         """Make POST request to service."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(url, json=json)
-            response.raise_for_status()
-            return response.json()
+        return await self._request("POST", url, json=json)
 
     async def put(self, url: str, json: Optional[Dict] = None) -> Dict[str, Any]:
         """Make PUT request to service."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.put(url, json=json)
-            response.raise_for_status()
-            return response.json()
+        return await self._request("PUT", url, json=json)
+
+    async def get_many(
+        self,
+        urls: Dict[str, str],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make independent GET requests concurrently.
+
+        Each request is bounded by deadline seconds, DOWNSTREAM_DEADLINE_SECONDS
+        by default. Returns the response body for each name, or the exception its
+        request raised (asyncio.TimeoutError past the deadline), so callers
+        can return partial results when one service is slow or failing.
+        """
+        if deadline is None:
+            deadline = DOWNSTREAM_DEADLINE_SECONDS
+        names = list(urls)
+        results = await asyncio.gather(
+            *(self.get(urls[name], deadline=deadline) for name in names),
+            return_exceptions=True,
+        )
+        return dict(zip(names, results))
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def _request(
+        self, method: str, url: str, deadline: Optional[float] = None, **kwargs
+    ) -> Dict[str, Any]:
+        response = await asyncio.wait_for(
+            self._client.request(method, url, **kwargs), deadline
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+_service_client: Optional[ServiceClient] = None
+
+# Sections of a complete dashboard overview
+DASHBOARD_SECTIONS = (
+    "speaker_statistics",
+    "ser_metrics",
+    "rag_processing",
+    "transition_statistics",
+    "validation_statistics",
+)
+
+# Dashboard sections whose outcome is reported as the service's status
+DASHBOARD_SERVICE_SECTIONS = {
+    "speaker_statistics": "user_management",
+    "ser_metrics": "verification",
+    "rag_processing": "rag_integration",
+}
 
 
 # Dependency for service client
 async def get_service_client() -> ServiceClient:
-    """Get service client instance."""
-    return ServiceClient()
+    """Get the application-wide service client instance."""
+    global _service_client
+    if _service_client is None:
+        _service_client = ServiceClient()
+    return _service_client
+
+
+async def close_service_client() -> None:
+    """Close the application-wide service client on shutdown."""
+    global _service_client
+    if _service_client is not None:
+        await _service_client.aclose()
+        _service_client = None
+
+
+_response_cache = ResponseCache()
+
+
+# Dependency for the aggregate response cache
+async def get_response_cache() -> ResponseCache:
+    """Get the application-wide response cache."""
+    return _response_cache
+
+
+def _cached_response(request: Request, entry: CacheEntry) -> Response:
+    """Serve a cached entry, or 304 Not Modified if the client has it."""
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip() for tag in if_none_match.split(",")}
+    if entry.etag in client_etags or "*" in client_etags:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=entry.value, headers=headers)
 
 
 # =====================================================
@@ -113,68 +225,43 @@ async def get_speakers(
 
 @router.get("/speakers/{speaker_id}/comprehensive", response_model=dict)
 async def get_speaker_comprehensive_view(
+    request: Request,
     speaker_id: UUID = Path(..., description="Speaker ID"),
     include_ser_analysis: bool = Query(True),
     include_error_patterns: bool = Query(True),
     include_transition_history: bool = Query(True),
     client: ServiceClient = Depends(get_service_client),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     """
     Get comprehensive speaker view with data from all services.
 
     Aggregates speaker information, SER analysis, error patterns,
     and transition history for complete speaker assessment.
+    Responses are cached briefly and support If-None-Match revalidation.
     """
     try:
         logger.info(f"Getting comprehensive view for speaker: {speaker_id}")
 
-        # Get speaker basic information
-        speaker_url = f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/speakers/{speaker_id}"
-        speaker_data = await client.get(speaker_url)
-
-        comprehensive_view = {
-            "speaker": speaker_data,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        # Get SER analysis if requested
-        if include_ser_analysis:
-            try:
-                ser_url = f"{VERIFICATION_SERVICE_URL}/api/v1/ser/speaker/{speaker_id}/analysis"
-                ser_data = await client.get(ser_url)
-                comprehensive_view["ser_analysis"] = ser_data
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get SER analysis for speaker {speaker_id}: {e}"
-                )
-                comprehensive_view["ser_analysis"] = None
-
-        # Get error patterns if requested
-        if include_error_patterns:
-            try:
-                patterns_url = f"{RAG_INTEGRATION_SERVICE_URL}/api/v1/speaker-rag/speaker/{speaker_id}/error-patterns"
-                patterns_data = await client.get(patterns_url)
-                comprehensive_view["error_patterns"] = patterns_data
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get error patterns for speaker {speaker_id}: {e}"
-                )
-                comprehensive_view["error_patterns"] = None
-
-        # Get transition history if requested
-        if include_transition_history:
-            try:
-                history_url = f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/bucket-transitions/speaker/{speaker_id}/history"
-                history_data = await client.get(history_url)
-                comprehensive_view["transition_history"] = history_data
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get transition history for speaker {speaker_id}: {e}"
-                )
-                comprehensive_view["transition_history"] = None
+        cache_key = (
+            f"comprehensive:{speaker_id}:{include_ser_analysis}:"
+            f"{include_error_patterns}:{include_transition_history}"
+        )
+        entry = await cache.get_or_fetch(
+            cache_key,
+            lambda: _fetch_comprehensive_view(
+                client,
+                speaker_id,
+                include_ser_analysis,
+                include_error_patterns,
+                include_transition_history,
+            ),
+            COMPREHENSIVE_VIEW_CACHE_POLICY,
+            _has_failed_section,
+        )
 
         logger.info(f"Comprehensive view retrieved for speaker: {speaker_id}")
-        return comprehensive_view
+        return _cached_response(request, entry)
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
@@ -187,6 +274,63 @@ async def get_speaker_comprehensive_view(
         raise HTTPException(status_code=500, detail="Failed to get comprehensive view")
 
 
+async def _fetch_comprehensive_view(
+    client: ServiceClient,
+    speaker_id: UUID,
+    include_ser_analysis: bool,
+    include_error_patterns: bool,
+    include_transition_history: bool,
+) -> Dict[str, Any]:
+    """Fan out to the services making up the comprehensive speaker view."""
+    # Fetch speaker information and the requested sections concurrently
+    urls = {"speaker": f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/speakers/{speaker_id}"}
+    if include_ser_analysis:
+        urls["ser_analysis"] = (
+            f"{VERIFICATION_SERVICE_URL}/api/v1/ser/speaker/{speaker_id}/analysis"
+        )
+    if include_error_patterns:
+        urls["error_patterns"] = (
+            f"{RAG_INTEGRATION_SERVICE_URL}/api/v1/speaker-rag/speaker/{speaker_id}"
+            "/error-patterns"
+        )
+    if include_transition_history:
+        urls["transition_history"] = (
+            f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/bucket-transitions"
+            f"/speaker/{speaker_id}/history"
+        )
+
+    results = await client.get_many(urls)
+
+    # Speaker information is required; the other sections are optional
+    speaker_data = results.pop("speaker")
+    if isinstance(speaker_data, BaseException):
+        raise speaker_data
+
+    comprehensive_view = {
+        "speaker": speaker_data,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+    for section, data in results.items():
+        if isinstance(data, BaseException):
+            logger.warning(
+                f"Failed to get {section} for speaker {speaker_id}: {data!r}"
+            )
+            data = None
+        comprehensive_view[section] = data
+
+    return comprehensive_view
+
+
+def _has_failed_section(comprehensive_view: Dict[str, Any]) -> bool:
+    """Whether a requested section of the view could not be fetched."""
+    return any(
+        comprehensive_view[section] is None
+        for section in ("ser_analysis", "error_patterns", "transition_history")
+        if section in comprehensive_view
+    )
+
+
 # =====================================================
 # WORKFLOW ORCHESTRATION ENDPOINTS
 # =====================================================
@@ -328,78 +472,83 @@ async def complete_speaker_assessment_workflow(
 
 
 @router.get("/dashboard/overview", response_model=dict)
-async def get_dashboard_overview(client: ServiceClient = Depends(get_service_client)):
+async def get_dashboard_overview(
+    request: Request,
+    client: ServiceClient = Depends(get_service_client),
+    cache: ResponseCache = Depends(get_response_cache),
+):
     """
     Get dashboard overview with key metrics from all services.
 
     Aggregates statistics and metrics for the speaker bucket management dashboard.
+    Responses are cached briefly and support If-None-Match revalidation.
     """
     try:
         logger.info("Getting dashboard overview")
 
-        dashboard_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "services_status": {},
-        }
+        entry = await cache.get_or_fetch(
+            "dashboard_overview",
+            lambda: _fetch_dashboard_overview(client),
+            DASHBOARD_OVERVIEW_CACHE_POLICY,
+            _has_failed_service,
+        )
 
-        # Get speaker statistics
-        try:
-            stats_url = (
-                f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/speakers/statistics/buckets"
-            )
-            speaker_stats = await client.get(stats_url)
-            dashboard_data["speaker_statistics"] = speaker_stats
-            dashboard_data["services_status"]["user_management"] = "healthy"
-        except Exception as e:
-            logger.warning(f"Failed to get speaker statistics: {e}")
-            dashboard_data["services_status"]["user_management"] = "error"
+        logger.info("Dashboard overview retrieved successfully")
+        return _cached_response(request, entry)
 
-        # Get SER metrics summary
-        try:
-            ser_url = f"{VERIFICATION_SERVICE_URL}/api/v1/ser/metrics/summary"
-            ser_stats = await client.get(ser_url)
-            dashboard_data["ser_metrics"] = ser_stats
-            dashboard_data["services_status"]["verification"] = "healthy"
-        except Exception as e:
-            logger.warning(f"Failed to get SER metrics: {e}")
-            dashboard_data["services_status"]["verification"] = "error"
+    except Exception as e:
+        logger.error(f"Failed to get dashboard overview: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get dashboard overview")
 
-        # Get RAG processing summary
-        try:
-            rag_url = (
-                f"{RAG_INTEGRATION_SERVICE_URL}/api/v1/speaker-rag/statistics/summary"
-            )
-            rag_stats = await client.get(rag_url)
-            dashboard_data["rag_processing"] = rag_stats
-            dashboard_data["services_status"]["rag_integration"] = "healthy"
-        except Exception as e:
-            logger.warning(f"Failed to get RAG processing stats: {e}")
-            dashboard_data["services_status"]["rag_integration"] = "error"
 
-        # Get transition statistics
-        try:
-            transition_url = f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/bucket-transitions/statistics/summary"
-            transition_stats = await client.get(transition_url)
-            dashboard_data["transition_statistics"] = transition_stats
-        except Exception as e:
-            logger.warning(f"Failed to get transition statistics: {e}")
+async def _fetch_dashboard_overview(client: ServiceClient) -> Dict[str, Any]:
+    """Fan out to the services making up the dashboard overview."""
+    dashboard_data = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "services_status": {},
+    }
 
-        # Get validation statistics
-        try:
-            validation_url = (
+    # Fetch all service statistics concurrently; a slow or failing
+    # service leaves its section out instead of failing the overview
+    results = await client.get_many(
+        {
+            "speaker_statistics": (
+                f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/speakers/statistics/buckets"
+            ),
+            "ser_metrics": f"{VERIFICATION_SERVICE_URL}/api/v1/ser/metrics/summary",
+            "rag_processing": (
+                f"{RAG_INTEGRATION_SERVICE_URL}/api/v1/speaker-rag/statistics/summary"
+            ),
+            "transition_statistics": (
+                f"{USER_MANAGEMENT_SERVICE_URL}/api/v1/bucket-transitions"
+                "/statistics/summary"
+            ),
+            "validation_statistics": (
                 f"{VERIFICATION_SERVICE_URL}/api/v1/mt-validation/statistics/summary"
+            ),
+        }
+    )
+
+    for section, data in results.items():
+        if isinstance(data, BaseException):
+            logger.warning(f"Failed to get {section}: {data!r}")
+        else:
+            dashboard_data[section] = data
+
+        service = DASHBOARD_SERVICE_SECTIONS.get(section)
+        if service is not None:
+            dashboard_data["services_status"][service] = (
+                "error" if isinstance(data, BaseException) else "healthy"
             )
-            validation_stats = await client.get(validation_url)
-            dashboard_data["validation_statistics"] = validation_stats
-        except Exception as e:
-            logger.warning(f"Failed to get validation statistics: {e}")
 
-        logger.info("Dashboard overview retrieved successfully")
-        return dashboard_data
+    return dashboard_data
 
-    except Exception as e:
-        logger.error(f"Failed to get dashboard overview: {e}")
-        raise HTTPException(status_code=500, detail="Failed to get dashboard overview")
+
+def _has_failed_service(dashboard_data: Dict[str, Any]) -> bool:
+    """Whether a section of the overview could not be fetched."""
+    return "error" in dashboard_data["services_status"].values() or any(
+        section not in dashboard_data for section in DASHBOARD_SECTIONS
+    )
 
 
 # =====================================================
@@ -487,3 +636,19 @@ async def comprehensive_health_check(
     except Exception as e:
         logger.error(f"Failed to perform comprehensive health check: {e}")
         raise HTTPException(status_code=500, detail="Failed to perform health check")
+
+
+# =====================================================
+# CACHE ENDPOINTS
+# =====================================================
+
+
+@router.get("/cache/stats")
+async def get_cache_stats(cache: ResponseCache = Depends(get_response_cache)):
+    """
+    Get aggregate response cache counters.
+
+    Reports fresh and stale hits, misses, requests coalesced onto an
+    in-flight fetch, background revalidations and upstream errors.
+    """
+    return cache.stats()
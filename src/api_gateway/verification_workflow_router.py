@@ -58,6 +58,7 @@ class BatchProcessModel(BaseModel):
     """Batch process verification jobs request model"""
     speaker_ids: List[str] = Field(..., description="List of speaker IDs")
     max_jobs_per_speaker: int = Field(default=5, ge=1, le=20, description="Max jobs per speaker")
+    batch_id: Optional[str] = Field(None, description="ID of an interrupted batch to resume")
 
 
 # =====================================================
@@ -271,7 +272,8 @@ async def batch_process_verification_jobs(
     Batch process verification jobs for multiple speakers.
     
     Pulls jobs and applies RAG corrections for multiple speakers
-    in a single operation for efficiency.
+    in a single operation for efficiency. Pass the batch_id of an
+    interrupted batch to skip the speakers it already completed.
     """
     try:
         logger.info(f"Batch processing verification jobs for {len(request.speaker_ids)} speakers")
@@ -279,7 +281,8 @@ async def batch_process_verification_jobs(
         # Execute use case
         results = await use_case.batch_process_verification_jobs(
             speaker_ids=request.speaker_ids,
-            max_jobs_per_speaker=request.max_jobs_per_speaker
+            max_jobs_per_speaker=request.max_jobs_per_speaker,
+            batch_id=request.batch_id,
         )
         
         logger.info(f"Batch processing completed: {results['processed_speakers']} speakers processed")
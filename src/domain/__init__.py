@@ -0,0 +1,6 @@
+"""
+Shared Domain
+
+Domain logic shared by several services. Deployed alongside every service
+image (see deployment/podman/Dockerfile.*).
+"""
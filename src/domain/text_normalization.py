@@ -0,0 +1,197 @@
+"""
+Text Normalization
+
+Shared normalization and tokenization for transcription text, used by SER
+scoring in the verification service and by error-correction pair extraction
+in the RAG integration service. Patterns are compiled once at import time and
+punctuation stripping uses a `str.translate` table instead of regex passes.
+"""
+
+import itertools
+import re
+from functools import lru_cache
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SENTENCE_PUNCTUATION_SPACING_PATTERN = re.compile(r"\s*([.!?])\s*")
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"[.!?]+")
+SENTENCE_WORD_PATTERN = re.compile(r"[^\s.!?]+")
+
+TOKEN_CACHE_SIZE = 4096
+INTERNER_MAX_SIZE = 100_000
+
+
+class _PunctuationTable(dict):
+    """
+    `str.translate` table that deletes every non-word, non-space character.
+
+    Entries are filled on first sight of a code point, so the table matches
+    the Unicode semantics of `re.sub(r"[^\\w\\s]", "", text)` without
+    enumerating the whole code space up front.
+    """
+
+    def __missing__(self, code_point: int) -> Optional[int]:
+        character = chr(code_point)
+        keep = character.isalnum() or character == "_" or character.isspace()
+        value = code_point if keep else None
+        self[code_point] = value
+        return value
+
+
+PUNCTUATION_TABLE = _PunctuationTable()
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of whitespace into single spaces and strip the ends."""
+    if not text:
+        return ""
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def normalize_for_scoring(text: str) -> str:
+    """
+    Normalize text for word-level SER comparison.
+
+    Lowercases, removes punctuation and collapses whitespace.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(tokenize_for_scoring(text))
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def tokenize_for_scoring(text: str) -> Tuple[str, ...]:
+    """
+    Normalize and tokenize text for word-level SER comparison.
+
+    Results are cached because the same reference text is typically scored
+    against several hypotheses (original ASR and RAG-corrected output).
+
+    Args:
+        text: Input text
+
+    Returns:
+        Tuple of lowercase tokens without punctuation
+    """
+    if not text:
+        return ()
+    return tuple(text.lower().translate(PUNCTUATION_TABLE).split())
+
+
+def normalize_for_extraction(text: str) -> str:
+    """
+    Normalize text for error-correction pair extraction.
+
+    Keeps case and punctuation but collapses whitespace and puts exactly one
+    space after sentence-ending punctuation.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text
+    """
+    if not text:
+        return ""
+    text = WHITESPACE_PATTERN.sub(" ", text)
+    text = SENTENCE_PUNCTUATION_SPACING_PATTERN.sub(r"\1 ", text)
+    return text.strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text on sentence-ending punctuation, dropping empty sentences."""
+    sentences = SENTENCE_BOUNDARY_PATTERN.split(text)
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+class TokenSpan(NamedTuple):
+    """A word and its character offsets [start, end) in the original text."""
+
+    text: str
+    start: int
+    end: int
+
+
+def split_sentence_tokens(text: str) -> List[List[TokenSpan]]:
+    """
+    Split text into sentences of words with their original offsets.
+
+    Produces the same sentences and words as
+    `split_sentences(normalize_for_extraction(text))` split on whitespace,
+    but each word keeps its position in the un-normalized text, so callers
+    can slice context or highlight a span without searching for it.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of sentences, each a list of word spans
+    """
+    sentences: List[List[TokenSpan]] = []
+    current: List[TokenSpan] = []
+    previous_end = 0
+    for match in SENTENCE_WORD_PATTERN.finditer(text or ""):
+        if current and SENTENCE_BOUNDARY_PATTERN.search(
+            text, previous_end, match.start()
+        ):
+            sentences.append(current)
+            current = []
+        current.append(TokenSpan(match.group(), match.start(), match.end()))
+        previous_end = match.end()
+    if current:
+        sentences.append(current)
+    return sentences
+
+
+class TokenInterner:
+    """
+    Maps tokens to integer IDs shared across calls.
+
+    IDs are drawn from a single counter and never reused, so concurrent
+    callers cannot observe colliding IDs. When the vocabulary grows past
+    `max_size` a fresh vocabulary is started; calls already in progress keep
+    using the vocabulary they started with, so IDs stay consistent within a
+    call.
+    """
+
+    def __init__(self, max_size: int = INTERNER_MAX_SIZE):
+        self._max_size = max_size
+        self._vocabulary: Dict[Hashable, int] = {}
+        self._ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+    def intern(self, *sequences: Sequence[Hashable]) -> Tuple[List[int], ...]:
+        """
+        Map every token of the given sequences onto integer IDs.
+
+        Args:
+            sequences: Token sequences that will be compared with each other
+
+        Returns:
+            One list of IDs per input sequence
+        """
+        vocabulary = self._vocabulary
+        if len(vocabulary) > self._max_size:
+            vocabulary = {}
+            self._vocabulary = vocabulary
+
+        ids = self._ids
+        result = []
+        for tokens in sequences:
+            sequence_ids = []
+            for token in tokens:
+                token_id = vocabulary.get(token)
+                if token_id is None:
+                    token_id = vocabulary.setdefault(token, next(ids))
+                sequence_ids.append(token_id)
+            result.append(sequence_ids)
+        return tuple(result)
+
+
+default_interner = TokenInterner()
@@ -4,6 +4,8 @@ Request DTOs for the Error Reporting Service application layer.
 These DTOs define the structure of incoming requests to use cases.
 """
 
+import base64
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -67,6 +69,24 @@ class SubmitErrorReportRequest:
             raise ValueError("additional_notes cannot exceed 1000 characters")
 
 
+@dataclass(frozen=True)
+class SubmitErrorReportsBulkRequest:
+    """
+    Request DTO for submitting a batch of error reports.
+
+    Valid reports are persisted chunk_size at a time; each chunk is written
+    in a single round trip and succeeds or fails as a whole.
+    """
+
+    reports: List[SubmitErrorReportRequest]
+    chunk_size: int = 1000
+
+    def __post_init__(self):
+        """Validate the chunk size"""
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+
 @dataclass(frozen=True)
 class GetErrorReportRequest:
     """
@@ -106,14 +126,62 @@ class ErrorFilters:
     requires_specialized_knowledge: Optional[bool] = None
 
 
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Keyset position after the last item of a page.
+
+    Results are ordered by (reported_at, error_id), so the next page starts
+    strictly after this pair. The total seen on the first page is carried
+    along so later pages need not count again.
+    """
+
+    reported_at: datetime
+    error_id: str
+    total: Optional[int] = None
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token"""
+        payload = json.dumps(
+            [self.reported_at.isoformat(), self.error_id, self.total],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Decode a token produced by encode().
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            reported_at, error_id, total = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(
+                reported_at=datetime.fromisoformat(reported_at),
+                error_id=str(error_id),
+                total=None if total is None else int(total),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+
 @dataclass(frozen=True)
 class PaginationParams:
     """
     Pagination parameters for search requests.
+
+    Either page-based (page/size) or cursor-based: pass the next_cursor of
+    the previous page to continue with keyset pagination. include_total
+    controls whether the total match count is computed.
     """
 
     page: int = 1
     size: int = 10
+    cursor: Optional[str] = None
+    include_total: bool = True
 
     def __post_init__(self):
         """Validate pagination parameters"""
@@ -32,6 +32,32 @@ class SubmitErrorReportResponse:
             object.__setattr__(self, "validation_warnings", [])
 
 
+@dataclass(frozen=True)
+class BulkSubmissionItemResult:
+    """
+    Outcome of one report in a bulk submission.
+    """
+
+    index: int  # Position of the report in the submitted batch
+    status: str  # success, failed
+    error_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SubmitErrorReportsBulkResponse:
+    """
+    Response DTO for bulk error report submission.
+
+    Contains one result per submitted report, in submission order.
+    """
+
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BulkSubmissionItemResult]
+
+
 @dataclass(frozen=True)
 class EnhancedMetadataResponse:
     """
@@ -127,17 +153,21 @@ class GetErrorReportResponse:
 class PaginatedErrorReports:
     """
     Paginated collection of error reports.
+
+    total is None when the count was not requested. next_cursor is set
+    when a full page was returned and more results may follow.
     """
 
     items: List[ErrorReport]
-    total: int
+    total: Optional[int]
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None
 
     def __post_init__(self):
         """Calculate total pages"""
-        if self.size > 0:
+        if self.total is not None and self.size > 0:
             calculated_pages = (self.total + self.size - 1) // self.size
             object.__setattr__(self, "pages", calculated_pages)
         else:
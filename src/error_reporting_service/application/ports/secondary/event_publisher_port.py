@@ -7,6 +7,7 @@ by infrastructure adapters.
 """
 
 from abc import ABC, abstractmethod
+from typing import List
 
 from error_reporting_service.domain.events.domain_events import (
     ErrorDeletedEvent,
@@ -36,6 +37,22 @@ class EventPublisher(ABC):
         """
         pass
 
+    async def publish_errors_reported(self, events: List[ErrorReportedEvent]) -> None:
+        """
+        Publish a batch of error reported events.
+
+        Publishers that can send several messages in one request should
+        override this default, which publishes the events one at a time.
+
+        Args:
+            events: The error reported events to publish
+
+        Raises:
+            EventPublishingError: If the publish operation fails
+        """
+        for event in events:
+            await self.publish_error_reported(event)
+
     @abstractmethod
     async def publish_error_updated(self, event: ErrorUpdatedEvent) -> None:
         """
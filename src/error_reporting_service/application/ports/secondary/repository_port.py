@@ -7,11 +7,33 @@ by infrastructure adapters.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from error_reporting_service.domain.entities.error_report import ErrorReport
 
+# Criteria keys that select a page rather than filter results
+PAGINATION_KEYS = frozenset(
+    {"limit", "offset", "after", "include_total", "sort_field", "sort_direction"}
+)
+
+# sort_field value ranking text_search results by relevance (the default
+# whenever text_search is given and no other sort field is requested)
+RELEVANCE_SORT_FIELD = "relevance"
+
+
+def orders_by_relevance(criteria: Dict[str, Any]) -> bool:
+    """
+    Whether search results are ranked by text relevance.
+
+    Relevance-ranked results have no (reported_at, error_id) keyset order, so
+    they are paged with offsets only.
+    """
+    return (
+        "text_search" in criteria
+        and criteria.get("sort_field", RELEVANCE_SORT_FIELD) == RELEVANCE_SORT_FIELD
+    )
+
 
 class ErrorReportRepository(ABC):
     """
@@ -37,6 +59,25 @@ class ErrorReportRepository(ABC):
         """
         pass
 
+    async def save_many(self, error_reports: List[ErrorReport]) -> List[ErrorReport]:
+        """
+        Save a batch of error reports in a single write.
+
+        Either all reports are saved or none are. Repositories backed by a
+        store with bulk writes should override this default, which saves the
+        reports one at a time and therefore is not atomic.
+
+        Args:
+            error_reports: The error reports to save
+
+        Returns:
+            The saved error reports, in input order
+
+        Raises:
+            RepositoryError: If the save operation fails
+        """
+        return [await self.save(error_report) for error_report in error_reports]
+
     @abstractmethod
     async def find_by_id(self, error_id: UUID) -> Optional[ErrorReport]:
         """
@@ -145,6 +186,37 @@ class ErrorReportRepository(ABC):
         """
         pass
 
+    async def search_page(
+        self, criteria: Dict[str, Any]
+    ) -> Tuple[List[ErrorReport], Optional[int]]:
+        """
+        Search for one page of error reports and optionally their total count.
+
+        Besides the search filters, criteria may contain "limit", "offset",
+        "after" (a (reported_at, error_id) keyset position to continue from)
+        and "include_total". Repositories that can count in the same query
+        should override this default, which issues a separate count.
+
+        Args:
+            criteria: Search criteria dictionary
+
+        Returns:
+            Tuple of (error reports, total matching count or None)
+
+        Raises:
+            RepositoryError: If the search operation fails
+        """
+        error_reports = await self.search(criteria, limit=criteria.get("limit", 20))
+        total = None
+        if criteria.get("include_total", True):
+            filters = {
+                key: value
+                for key, value in criteria.items()
+                if key not in PAGINATION_KEYS
+            }
+            total = await self.count(filters)
+        return error_reports, total
+
     @abstractmethod
     async def count(self, criteria: Optional[Dict[str, Any]] = None) -> int:
         """
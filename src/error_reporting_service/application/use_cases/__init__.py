@@ -6,5 +6,6 @@ Use cases orchestrate domain logic and coordinate between domain services and in
 """
 
 from .submit_error_report import SubmitErrorReportUseCase
+from .submit_error_reports_bulk import SubmitErrorReportsBulkUseCase
 
-__all__ = ["SubmitErrorReportUseCase"]
+__all__ = ["SubmitErrorReportUseCase", "SubmitErrorReportsBulkUseCase"]
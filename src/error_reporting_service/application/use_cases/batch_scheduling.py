@@ -0,0 +1,128 @@
+"""
+Batch Scheduling
+
+Concurrency controls for batch use cases that call slow downstream
+services: a token bucket for request rates, and a per-service limiter
+combining a concurrency semaphore, the token bucket and retries with
+jittered exponential backoff.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Allows rate_per_second acquisitions per second on average, with bursts
+    of up to capacity. Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+
+        self._rate = rate_per_second
+        self._capacity = capacity if capacity is not None else max(1.0, rate_per_second)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries with full-jitter exponential backoff."""
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 10.0
+    # Failures that retrying cannot fix, such as missing jobs
+    non_retryable: Tuple[Type[BaseException], ...] = (ValueError,)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after the given failed attempt (1-based)."""
+        ceiling = min(
+            self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, ceiling)
+
+
+class ServiceLimiter:
+    """
+    Limits the calls a batch makes to one downstream service.
+
+    At most max_concurrency calls are in flight and at most rate_per_second
+    start per second. Failed calls are retried per the retry policy; the
+    backoff wait does not hold a concurrency slot.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        rate_per_second: float,
+        retry_policy: RetryPolicy = RetryPolicy(),
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+
+        self.name = name
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(rate_per_second)
+        self._retry_policy = retry_policy
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run operation within the service's limits.
+
+        Raises:
+            The last failure once retries are exhausted, or a non-retryable
+            failure immediately
+        """
+        attempt = 1
+        while True:
+            await self._bucket.acquire()
+            async with self._semaphore:
+                try:
+                    return await operation()
+                except self._retry_policy.non_retryable:
+                    raise
+                except Exception as e:
+                    if attempt >= self._retry_policy.max_attempts:
+                        raise
+                    delay = self._retry_policy.backoff(attempt)
+                    logger.warning(
+                        f"{self.name} call failed (attempt {attempt}), "
+                        f"retrying in {delay:.2f}s: {e}"
+                    )
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -5,13 +5,19 @@ Provides analytics and insights for the enhanced error reporting dashboard.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from error_reporting_service.domain.entities.error_report import BucketType
+from error_reporting_service.domain.entities.error_report import (
+    BucketType,
+    ErrorReport,
+)
 from error_reporting_service.domain.ports.error_report_repository import (
     ErrorReportRepository,
 )
+from error_reporting_service.domain.ports.error_report_rollup_repository import (
+    ErrorReportRollupRepository,
+)
 from error_reporting_service.domain.ports.speaker_bucket_history_repository import (
     SpeakerBucketHistoryRepository,
 )
@@ -28,6 +34,17 @@ from error_reporting_service.application.dto.responses import (
     DashboardMetricsResponse,
     BucketDistributionResponse,
 )
+from error_reporting_service.domain.services.metadata_aggregation import (
+    MetadataAggregator,
+)
+from error_reporting_service.domain.value_objects.error_report_rollup import (
+    ErrorReportRollup,
+    RollupGranularity,
+    rollup_ranges,
+)
+
+# Reports read per page when metadata insights scan raw error reports
+SCAN_CHUNK_SIZE = 5000
 
 
 class DashboardAnalyticsUseCase:
@@ -39,11 +56,14 @@ class DashboardAnalyticsUseCase:
         bucket_history_repository: SpeakerBucketHistoryRepository,
         performance_metrics_repository: SpeakerPerformanceMetricsRepository,
         verification_job_repository: VerificationJobRepository,
+        rollup_repository: Optional[ErrorReportRollupRepository] = None,
     ):
         self._error_report_repository = error_report_repository
         self._bucket_history_repository = bucket_history_repository
         self._performance_metrics_repository = performance_metrics_repository
         self._verification_job_repository = verification_job_repository
+        # Metadata insights read pre-aggregated rollups when available
+        self._rollup_repository = rollup_repository
 
     async def get_dashboard_metrics(
         self, request: GetDashboardMetricsRequest
@@ -119,40 +139,106 @@ class DashboardAnalyticsUseCase:
         }
 
     async def _get_metadata_insights(self, time_period: str) -> Dict:
-        """Get enhanced metadata insights"""
-        
-        days = self._get_days_from_period(time_period)
-        start_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Get error reports within time period
-        filters = {
-            "date_from": start_date,
-            "date_to": datetime.utcnow(),
+        """
+        Get enhanced metadata insights
+
+        Reads hourly/daily rollups when a rollup repository is configured,
+        otherwise scans the raw error reports in the time period.
+        """
+        date_from, date_to = self._get_insights_window(time_period)
+
+        if self._rollup_repository is not None:
+            aggregator = await self._aggregate_rollups(date_from, date_to)
+        else:
+            aggregator = await self._scan_error_reports(date_from, date_to)
+
+        return aggregator.insights()
+
+    async def check_metadata_rollup_consistency(
+        self, time_period: str = "last_30_days"
+    ) -> Dict:
+        """
+        Compare rollup-based metadata insights with a raw scan of the reports.
+
+        Both paths use the same time window. Differences point at rollups
+        that missed submissions or updates and need a rebuild.
+        """
+        if self._rollup_repository is None:
+            raise ValueError("No rollup repository configured")
+
+        date_from, date_to = self._get_insights_window(time_period)
+        from_rollups = (await self._aggregate_rollups(date_from, date_to)).insights()
+        from_reports = (await self._scan_error_reports(date_from, date_to)).insights()
+
+        differences = {
+            insight: {"rollups": value, "raw_reports": from_reports[insight]}
+            for insight, value in from_rollups.items()
+            if value != from_reports[insight]
         }
-        
-        error_reports = await self._error_report_repository.search_errors(filters)
-        
-        # Analyze metadata patterns
-        audio_quality_distribution = self._analyze_audio_quality(error_reports)
-        speaker_clarity_distribution = self._analyze_speaker_clarity(error_reports)
-        background_noise_distribution = self._analyze_background_noise(error_reports)
-        speaker_count_distribution = self._analyze_speaker_count(error_reports)
-        
-        # Analyze correlations
-        correlations = self._analyze_metadata_correlations(error_reports)
-        
         return {
-            "total_errors_analyzed": len(error_reports),
-            "audio_quality_distribution": audio_quality_distribution,
-            "speaker_clarity_distribution": speaker_clarity_distribution,
-            "background_noise_distribution": background_noise_distribution,
-            "speaker_count_distribution": speaker_count_distribution,
-            "overlapping_speech_frequency": self._calculate_overlapping_speech_frequency(error_reports),
-            "specialized_knowledge_frequency": self._calculate_specialized_knowledge_frequency(error_reports),
-            "metadata_correlations": correlations,
-            "complexity_score_distribution": self._analyze_complexity_scores(error_reports),
+            "consistent": not differences,
+            "date_from": date_from,
+            "date_to": date_to,
+            "differences": differences,
         }
 
+    def _get_insights_window(self, time_period: str) -> Tuple[datetime, datetime]:
+        """Metadata insights window, starting on an hour so rollups cover it exactly"""
+        days = self._get_days_from_period(time_period)
+        date_to = datetime.utcnow()
+        date_from = RollupGranularity.HOUR.truncate(date_to - timedelta(days=days))
+        return date_from, date_to
+
+    async def _load_rollups(
+        self, date_from: datetime, date_to: datetime
+    ) -> List[ErrorReportRollup]:
+        """Read daily rollups for whole days and hourly rollups for the rest"""
+        rollups = []
+        for granularity, period_from, period_to in rollup_ranges(date_from, date_to):
+            rollups.extend(
+                await self._rollup_repository.get_rollups(
+                    granularity, period_from, period_to
+                )
+            )
+        return rollups
+
+    async def _aggregate_rollups(
+        self, date_from: datetime, date_to: datetime
+    ) -> MetadataAggregator:
+        """Count the rollups covering the window"""
+        aggregator = MetadataAggregator()
+        aggregator.add_rollups(await self._load_rollups(date_from, date_to))
+        return aggregator
+
+    async def _scan_error_reports(
+        self, date_from: datetime, date_to: datetime
+    ) -> MetadataAggregator:
+        """Count the raw error reports in the window, one page at a time"""
+        aggregator = MetadataAggregator()
+        await aggregator.add_report_chunks(
+            self._iter_error_reports(date_from, date_to)
+        )
+        return aggregator
+
+    async def _iter_error_reports(
+        self, date_from: datetime, date_to: datetime
+    ) -> AsyncIterator[List[ErrorReport]]:
+        """Page through the window's error reports in keyset order"""
+        query = {
+            "date_from": date_from,
+            "date_to": date_to,
+            "sort_direction": "asc",
+            "limit": SCAN_CHUNK_SIZE,
+        }
+        while True:
+            error_reports = await self._error_report_repository.search_errors(query)
+            if error_reports:
+                yield error_reports
+            if len(error_reports) < SCAN_CHUNK_SIZE:
+                return
+            last = error_reports[-1]
+            query = {**query, "after": (last.reported_at, last.error_id)}
+
     async def _get_verification_metrics(self, time_period: str) -> Dict:
         """Get verification workflow metrics"""
         
@@ -214,142 +300,3 @@ class DashboardAnalyticsUseCase:
             "average": 0,    # 5.0-6.9
             "poor": 0,       # 0.0-4.9
         }
-
-    def _analyze_audio_quality(self, error_reports: List) -> Dict:
-        """Analyze audio quality distribution"""
-        
-        quality_counts = {"good": 0, "fair": 0, "poor": 0}
-        
-        for report in error_reports:
-            quality = report.enhanced_metadata.audio_quality.value
-            quality_counts[quality] = quality_counts.get(quality, 0) + 1
-        
-        total = len(error_reports)
-        return {
-            quality: {
-                "count": count,
-                "percentage": round((count / total) * 100, 2) if total > 0 else 0
-            }
-            for quality, count in quality_counts.items()
-        }
-
-    def _analyze_speaker_clarity(self, error_reports: List) -> Dict:
-        """Analyze speaker clarity distribution"""
-        
-        clarity_counts = {"clear": 0, "somewhat_clear": 0, "unclear": 0, "very_unclear": 0}
-        
-        for report in error_reports:
-            clarity = report.enhanced_metadata.speaker_clarity.value
-            clarity_counts[clarity] = clarity_counts.get(clarity, 0) + 1
-        
-        total = len(error_reports)
-        return {
-            clarity: {
-                "count": count,
-                "percentage": round((count / total) * 100, 2) if total > 0 else 0
-            }
-            for clarity, count in clarity_counts.items()
-        }
-
-    def _analyze_background_noise(self, error_reports: List) -> Dict:
-        """Analyze background noise distribution"""
-        
-        noise_counts = {"none": 0, "low": 0, "medium": 0, "high": 0}
-        
-        for report in error_reports:
-            noise = report.enhanced_metadata.background_noise.value
-            noise_counts[noise] = noise_counts.get(noise, 0) + 1
-        
-        total = len(error_reports)
-        return {
-            noise: {
-                "count": count,
-                "percentage": round((count / total) * 100, 2) if total > 0 else 0
-            }
-            for noise, count in noise_counts.items()
-        }
-
-    def _analyze_speaker_count(self, error_reports: List) -> Dict:
-        """Analyze number of speakers distribution"""
-        
-        speaker_counts = {"one": 0, "two": 0, "three": 0, "four": 0, "five": 0}
-        
-        for report in error_reports:
-            count = report.enhanced_metadata.number_of_speakers.value
-            speaker_counts[count] = speaker_counts.get(count, 0) + 1
-        
-        total = len(error_reports)
-        return {
-            count: {
-                "count": speaker_count,
-                "percentage": round((speaker_count / total) * 100, 2) if total > 0 else 0
-            }
-            for count, speaker_count in speaker_counts.items()
-        }
-
-    def _calculate_overlapping_speech_frequency(self, error_reports: List) -> float:
-        """Calculate frequency of overlapping speech"""
-        
-        if not error_reports:
-            return 0.0
-        
-        overlapping_count = sum(
-            1 for report in error_reports 
-            if report.enhanced_metadata.overlapping_speech
-        )
-        
-        return round((overlapping_count / len(error_reports)) * 100, 2)
-
-    def _calculate_specialized_knowledge_frequency(self, error_reports: List) -> float:
-        """Calculate frequency of specialized knowledge requirement"""
-        
-        if not error_reports:
-            return 0.0
-        
-        specialized_count = sum(
-            1 for report in error_reports 
-            if report.enhanced_metadata.requires_specialized_knowledge
-        )
-        
-        return round((specialized_count / len(error_reports)) * 100, 2)
-
-    def _analyze_metadata_correlations(self, error_reports: List) -> Dict:
-        """Analyze correlations between metadata fields"""
-        
-        # This would perform correlation analysis
-        # For now, return placeholder correlations
-        return {
-            "audio_quality_vs_rectification": 0.0,
-            "speaker_clarity_vs_complexity": 0.0,
-            "background_noise_vs_errors": 0.0,
-            "overlapping_speech_vs_difficulty": 0.0,
-        }
-
-    def _analyze_complexity_scores(self, error_reports: List) -> Dict:
-        """Analyze complexity score distribution"""
-        
-        if not error_reports:
-            return {"low": 0, "medium": 0, "high": 0, "very_high": 0}
-        
-        complexity_counts = {"low": 0, "medium": 0, "high": 0, "very_high": 0}
-        
-        for report in error_reports:
-            score = report.calculate_complexity_score()
-            
-            if score <= 2.0:
-                complexity_counts["low"] += 1
-            elif score <= 3.5:
-                complexity_counts["medium"] += 1
-            elif score <= 4.5:
-                complexity_counts["high"] += 1
-            else:
-                complexity_counts["very_high"] += 1
-        
-        total = len(error_reports)
-        return {
-            level: {
-                "count": count,
-                "percentage": round((count / total) * 100, 2) if total > 0 else 0
-            }
-            for level, count in complexity_counts.items()
-        }
@@ -0,0 +1,65 @@
+"""
+Refresh Error Report Rollups Use Case
+
+Periodically rebuilds the dashboard's hourly and daily error report rollups
+from the raw reports. Submission keeps the rollups current incrementally;
+the refresh corrects counts for reports that were updated or deleted, or
+whose increment failed.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from error_reporting_service.domain.ports.error_report_rollup_repository import (
+    ErrorReportRollupRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshErrorReportRollupsUseCase:
+    """Use case for rebuilding recent error report rollups"""
+
+    def __init__(
+        self,
+        rollup_repository: ErrorReportRollupRepository,
+        lookback_days: int = 2,
+    ):
+        """
+        Initialize the use case with its dependencies.
+
+        Args:
+            rollup_repository: Repository holding the rollups
+            lookback_days: Number of most recent days rebuilt per refresh
+        """
+        if lookback_days <= 0:
+            raise ValueError("lookback_days must be positive")
+
+        self._rollup_repository = rollup_repository
+        self._lookback_days = lookback_days
+
+    async def execute(self) -> int:
+        """
+        Rebuild rollups for the last lookback_days days, including today.
+
+        Returns:
+            Number of error reports counted
+        """
+        date_to = datetime.utcnow()
+        date_from = date_to - timedelta(days=self._lookback_days - 1)
+        return await self._rollup_repository.rebuild(date_from, date_to)
+
+    async def run_periodically(self, interval_seconds: float = 3600) -> None:
+        """
+        Refresh every interval_seconds until cancelled.
+
+        Failures are logged and retried at the next interval.
+        """
+        while True:
+            try:
+                counted = await self.execute()
+                logger.info(f"Rebuilt error report rollups from {counted} reports")
+            except Exception:
+                logger.exception("Error report rollup refresh failed")
+            await asyncio.sleep(interval_seconds)
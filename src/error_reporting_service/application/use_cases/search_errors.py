@@ -3,13 +3,17 @@ Search Errors Use Case
 
 This use case handles searching and filtering error reports.
 It includes authorization checks, caching, pagination, and sorting.
+Pages can be requested by number or by an opaque keyset cursor.
 """
 
 import hashlib
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from error_reporting_service.application.dto.requests import SearchErrorsRequest
+from error_reporting_service.application.dto.requests import (
+    PageCursor,
+    SearchErrorsRequest,
+)
 from error_reporting_service.application.dto.responses import (
     PaginatedErrorReports,
     SearchErrorsResponse,
@@ -20,6 +24,7 @@ from error_reporting_service.application.ports.secondary.authorization_port impo
 from error_reporting_service.application.ports.secondary.cache_port import CachePort
 from error_reporting_service.application.ports.secondary.repository_port import (
     ErrorReportRepository,
+    orders_by_relevance,
 )
 from error_reporting_service.domain.entities.error_report import ErrorReport
 
@@ -79,15 +84,20 @@ class SearchErrorsUseCase:
             return self._create_response_from_cache(cached_results)
 
         # 4. Build search filters
-        search_filters = self._build_search_filters(request)
+        cursor = self._decode_cursor(request.pagination)
+        search_filters = self._build_search_filters(request, cursor)
 
-        # 5. Execute search
-        error_reports = await self._repository.search(search_filters)
-        total_count = await self._repository.count_by_filters(search_filters)
+        # 5. Execute search (page and total in one repository call)
+        error_reports, total_count = await self._repository.search_page(search_filters)
+        if total_count is None and cursor is not None:
+            total_count = cursor.total
 
         # 6. Apply pagination
         paginated_results = self._paginate_results(
-            error_reports, total_count, request.pagination
+            error_reports,
+            total_count,
+            request.pagination,
+            keyset_ordered=not orders_by_relevance(search_filters),
         )
 
         # 7. Cache the results
@@ -112,6 +122,23 @@ class SearchErrorsUseCase:
         if pagination.size > 100:  # Maximum page size limit
             raise ValueError("Page size cannot exceed 100")
 
+    def _decode_cursor(self, pagination) -> Optional[PageCursor]:
+        """
+        Decode the opaque pagination cursor, if any.
+
+        Args:
+            pagination: Pagination parameters
+
+        Returns:
+            Decoded cursor, or None for page-number pagination
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if not pagination.cursor:
+            return None
+        return PageCursor.decode(pagination.cursor)
+
     def _generate_cache_key(self, request: SearchErrorsRequest) -> str:
         """
         Generate a cache key for the search request.
@@ -145,6 +172,8 @@ class SearchErrorsUseCase:
             "pagination": {
                 "page": request.pagination.page,
                 "size": request.pagination.size,
+                "cursor": request.pagination.cursor,
+                "include_total": request.pagination.include_total,
             },
             "sort": {"field": request.sort.field, "direction": request.sort.direction},
         }
@@ -170,12 +199,15 @@ class SearchErrorsUseCase:
             # Cache errors should not break the flow
             return None
 
-    def _build_search_filters(self, request: SearchErrorsRequest) -> Dict[str, Any]:
+    def _build_search_filters(
+        self, request: SearchErrorsRequest, cursor: Optional[PageCursor] = None
+    ) -> Dict[str, Any]:
         """
         Build search filters for the repository query.
 
         Args:
             request: The search request
+            cursor: Decoded keyset position to continue after, if any
 
         Returns:
             Dictionary of search filters
@@ -208,32 +240,56 @@ class SearchErrorsUseCase:
 
         # Add pagination and sorting
         filters["limit"] = request.pagination.size
-        filters["offset"] = (request.pagination.page - 1) * request.pagination.size
+        if cursor is not None:
+            # Keyset pagination; reuse the total carried by the cursor
+            filters["after"] = (cursor.reported_at, cursor.error_id)
+            filters["include_total"] = (
+                request.pagination.include_total and cursor.total is None
+            )
+        else:
+            filters["offset"] = (request.pagination.page - 1) * request.pagination.size
+            filters["include_total"] = request.pagination.include_total
         filters["sort_field"] = request.sort.field
         filters["sort_direction"] = request.sort.direction
 
         return filters
 
     def _paginate_results(
-        self, error_reports: List[ErrorReport], total_count: int, pagination
+        self,
+        error_reports: List[ErrorReport],
+        total_count: Optional[int],
+        pagination,
+        keyset_ordered: bool = True,
     ) -> PaginatedErrorReports:
         """
         Create paginated results from error reports.
 
         Args:
             error_reports: List of error reports
-            total_count: Total number of matching records
+            total_count: Total number of matching records, if known
             pagination: Pagination parameters
+            keyset_ordered: Whether results follow the keyset order, so a
+                next-page cursor can be issued (not for relevance ranking)
 
         Returns:
             PaginatedErrorReports object
         """
+        next_cursor = None
+        if keyset_ordered and error_reports and len(error_reports) == pagination.size:
+            last = error_reports[-1]
+            next_cursor = PageCursor(
+                reported_at=last.reported_at,
+                error_id=str(last.error_id),
+                total=total_count,
+            ).encode()
+
         return PaginatedErrorReports(
             items=error_reports,
             total=total_count,
             page=pagination.page,
             size=pagination.size,
             pages=0,  # Will be calculated in __post_init__
+            next_cursor=next_cursor,
         )
 
     async def _cache_results(
@@ -254,6 +310,7 @@ class SearchErrorsUseCase:
                 "page": results.page,
                 "size": results.size,
                 "pages": results.pages,
+                "next_cursor": results.next_cursor,
             }
 
             # Cache for 5 minutes (search results change frequently)
@@ -314,6 +371,7 @@ class SearchErrorsUseCase:
             page=cached_data["page"],
             size=cached_data["size"],
             pages=cached_data["pages"],
+            next_cursor=cached_data.get("next_cursor"),
         )
 
         return SearchErrorsResponse(results=paginated_results, status="success")
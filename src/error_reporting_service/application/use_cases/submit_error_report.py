@@ -5,7 +5,9 @@ This use case handles the submission of new error reports.
 It orchestrates domain validation, persistence, and event publishing.
 """
 
+import logging
 from datetime import datetime
+from typing import List, Optional
 from uuid import UUID, uuid4
 
 from error_reporting_service.application.dto.requests import (
@@ -32,6 +34,9 @@ from error_reporting_service.domain.entities.error_report import (
     EnhancedMetadata,
 )
 from error_reporting_service.domain.events.domain_events import ErrorReportedEvent
+from error_reporting_service.domain.ports.error_report_rollup_repository import (
+    ErrorReportRollupRepository,
+)
 from error_reporting_service.domain.services.categorization_service import (
     ErrorCategorizationService,
 )
@@ -39,6 +44,8 @@ from error_reporting_service.domain.services.validation_service import (
     ErrorValidationService,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class SubmitErrorReportUseCase:
     """
@@ -54,6 +61,7 @@ class SubmitErrorReportUseCase:
         event_publisher: EventPublisher,
         validation_service: ErrorValidationService,
         categorization_service: ErrorCategorizationService,
+        rollup_repository: Optional[ErrorReportRollupRepository] = None,
     ):
         """
         Initialize the use case with its dependencies.
@@ -63,11 +71,13 @@ class SubmitErrorReportUseCase:
             event_publisher: Publisher for domain events
             validation_service: Service for error validation
             categorization_service: Service for error categorization
+            rollup_repository: Optional dashboard rollups to count reports into
         """
         self._repository = repository
         self._event_publisher = event_publisher
         self._validation_service = validation_service
         self._categorization_service = categorization_service
+        self._rollup_repository = rollup_repository
 
     async def execute(
         self, request: SubmitErrorReportRequest
@@ -96,10 +106,13 @@ class SubmitErrorReportUseCase:
         # 3. Persist error report
         saved_error = await self._repository.save(error_report)
 
-        # 4. Publish domain event
+        # 4. Count into dashboard rollups
+        await self._update_rollups([saved_error])
+
+        # 5. Publish domain event
         await self._publish_error_reported_event(saved_error)
 
-        # 5. Return success response
+        # 6. Return success response
         return SubmitErrorReportResponse(
             error_id=str(saved_error.error_id),
             status="success",
@@ -173,6 +186,26 @@ class SubmitErrorReportUseCase:
         if not self._validation_service.validate_context_integrity(error_report):
             raise ValueError("Invalid error context or position")
 
+    async def _update_rollups(self, error_reports: List[ErrorReport]) -> None:
+        """
+        Count saved error reports into the dashboard rollups.
+
+        The reports are already saved, so a failure here is logged rather
+        than raised; the periodic rollup rebuild corrects the counts.
+
+        Args:
+            error_reports: The error reports that were saved
+        """
+        if self._rollup_repository is None:
+            return
+
+        try:
+            await self._rollup_repository.add_reports(error_reports)
+        except Exception:
+            logger.exception(
+                "Failed to update rollups for %d error reports", len(error_reports)
+            )
+
     async def _publish_error_reported_event(self, error_report: ErrorReport) -> None:
         """
         Publish the error reported domain event.
@@ -180,7 +213,20 @@ class SubmitErrorReportUseCase:
         Args:
             error_report: The error report that was saved
         """
-        event = ErrorReportedEvent(
+        event = self._build_error_reported_event(error_report)
+        await self._event_publisher.publish_error_reported(event)
+
+    def _build_error_reported_event(self, error_report: ErrorReport) -> ErrorReportedEvent:
+        """
+        Build the error reported domain event for a saved error report.
+
+        Args:
+            error_report: The error report that was saved
+
+        Returns:
+            ErrorReportedEvent for the error report
+        """
+        return ErrorReportedEvent(
             event_id=str(uuid4()),
             correlation_id=str(uuid4()),
             timestamp=datetime.utcnow(),
@@ -194,5 +240,3 @@ class SubmitErrorReportUseCase:
             reported_by=str(error_report.reported_by),
             metadata=error_report.metadata,
         )
-
-        await self._event_publisher.publish_error_reported(event)
@@ -0,0 +1,103 @@
+"""
+Submit Error Reports Bulk Use Case
+
+This use case handles the submission of batches of error reports, such as
+historical backfills. Reports are validated in one pass, persisted in
+chunks with one bulk write per chunk, and announced with a single batched
+event publish.
+"""
+
+from typing import List, Optional, Tuple
+
+from error_reporting_service.application.dto.requests import (
+    SubmitErrorReportsBulkRequest,
+)
+from error_reporting_service.application.dto.responses import (
+    BulkSubmissionItemResult,
+    SubmitErrorReportsBulkResponse,
+)
+from error_reporting_service.application.use_cases.submit_error_report import (
+    SubmitErrorReportUseCase,
+)
+from error_reporting_service.domain.entities.error_report import ErrorReport
+
+
+class SubmitErrorReportsBulkUseCase(SubmitErrorReportUseCase):
+    """
+    Use case for submitting batches of error reports.
+
+    Builds and validates reports exactly like SubmitErrorReportUseCase, but
+    reports the outcome per item instead of failing the whole batch: invalid
+    reports are skipped, and a chunk that cannot be persisted marks only its
+    own reports as failed.
+    """
+
+    async def execute(
+        self, request: SubmitErrorReportsBulkRequest
+    ) -> SubmitErrorReportsBulkResponse:
+        """
+        Execute the bulk submission use case.
+
+        Args:
+            request: The bulk submission request
+
+        Returns:
+            Response with one result per submitted report
+
+        Raises:
+            EventPublishingError: If event publishing fails
+        """
+        results: List[Optional[BulkSubmissionItemResult]] = [None] * len(
+            request.reports
+        )
+
+        # 1. Create and validate domain entities in one pass
+        valid_reports: List[Tuple[int, ErrorReport]] = []
+        for index, report_request in enumerate(request.reports):
+            try:
+                error_report = self._create_error_report_from_request(report_request)
+                self._validate_error_report(error_report)
+            except (TypeError, ValueError) as e:
+                results[index] = _failed(index, str(e))
+                continue
+            valid_reports.append((index, error_report))
+
+        # 2. Persist valid reports with one bulk write per chunk, then count
+        #    each saved chunk into the dashboard rollups
+        saved_reports: List[ErrorReport] = []
+        for start in range(0, len(valid_reports), request.chunk_size):
+            chunk = valid_reports[start : start + request.chunk_size]
+            try:
+                saved_chunk = await self._repository.save_many(
+                    [error_report for _, error_report in chunk]
+                )
+            except Exception as e:
+                for index, _ in chunk:
+                    results[index] = _failed(index, f"Failed to save error report: {e}")
+                continue
+
+            for (index, _), saved_error in zip(chunk, saved_chunk):
+                results[index] = BulkSubmissionItemResult(
+                    index=index, status="success", error_id=str(saved_error.error_id)
+                )
+            saved_reports.extend(saved_chunk)
+            await self._update_rollups(saved_chunk)
+
+        # 3. Publish domain events for all saved reports at once
+        if saved_reports:
+            await self._event_publisher.publish_errors_reported(
+                [self._build_error_reported_event(report) for report in saved_reports]
+            )
+
+        # 4. Return per-item results
+        succeeded = len(saved_reports)
+        return SubmitErrorReportsBulkResponse(
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results,
+        )
+
+
+def _failed(index: int, error: str) -> BulkSubmissionItemResult:
+    return BulkSubmissionItemResult(index=index, status="failed", error=error)
@@ -4,9 +4,11 @@ Verification Workflow Use Case
 Handles the verification of error corrections through InstaNote Database integration.
 """
 
+import asyncio
+import logging
 import uuid
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 
 from error_reporting_service.domain.entities.verification_job import (
     VerificationJob,
@@ -24,6 +26,23 @@ from error_reporting_service.application.dto.requests import (
 from error_reporting_service.application.dto.responses import (
     VerificationJobResponse,
 )
+from error_reporting_service.application.use_cases.batch_scheduling import (
+    ServiceLimiter,
+)
+from error_reporting_service.domain.ports.verification_batch_checkpoint_repository import (
+    VerificationBatchCheckpointRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default limits for calls to the downstream services
+INSTANOTE_MAX_CONCURRENCY = 8
+INSTANOTE_RATE_PER_SECOND = 20.0
+RAG_MAX_CONCURRENCY = 4
+RAG_RATE_PER_SECOND = 10.0
+
+# job_metadata key recording the batch that pulled a verification job
+BATCH_ID_METADATA_KEY = "verification_batch_id"
 
 
 class VerificationWorkflowUseCase:
@@ -34,32 +53,81 @@ class VerificationWorkflowUseCase:
         verification_job_repository: VerificationJobRepository,
         instanote_service,  # External service for InstaNote Database
         rag_service,  # RAG system service
+        checkpoint_repository: Optional[VerificationBatchCheckpointRepository] = None,
+        instanote_limiter: Optional[ServiceLimiter] = None,
+        rag_limiter: Optional[ServiceLimiter] = None,
     ):
         self._verification_job_repository = verification_job_repository
         self._instanote_service = instanote_service
         self._rag_service = rag_service
+        # Batch progress is checkpointed per speaker when a repository is given
+        self._checkpoint_repository = checkpoint_repository
+        # Every call to a downstream service goes through its limiter
+        self._instanote_limiter = instanote_limiter or ServiceLimiter(
+            "InstaNote", INSTANOTE_MAX_CONCURRENCY, INSTANOTE_RATE_PER_SECOND
+        )
+        self._rag_limiter = rag_limiter or ServiceLimiter(
+            "RAG", RAG_MAX_CONCURRENCY, RAG_RATE_PER_SECOND
+        )
 
     async def pull_verification_jobs(
         self, request: PullVerificationJobsRequest
     ) -> List[VerificationJobResponse]:
         """Pull jobs from InstaNote Database for verification"""
         
+        return [
+            self._to_response(job) for job in await self._pull_jobs(request)
+        ]
+
+    async def _pull_jobs(
+        self, request: PullVerificationJobsRequest, batch_id: Optional[str] = None
+    ) -> List[VerificationJob]:
+        """
+        Pull jobs from InstaNote Database and save them as verification jobs
+
+        With a batch_id the pull is idempotent: jobs are tagged with the
+        batch, and a job the batch already pulled is returned as stored
+        instead of being saved again.
+        """
+        
         # Parse date range
         start_date = datetime.fromisoformat(request.date_range["start_date"])
         end_date = datetime.fromisoformat(request.date_range["end_date"])
         
         # Pull jobs from InstaNote Database
-        instanote_jobs = await self._instanote_service.get_jobs_for_speaker(
-            speaker_id=request.speaker_id,
-            start_date=start_date,
-            end_date=end_date,
-            error_types=request.error_types,
-            limit=request.max_jobs
+        instanote_jobs = await self._instanote_limiter.call(
+            lambda: self._instanote_service.get_jobs_for_speaker(
+                speaker_id=request.speaker_id,
+                start_date=start_date,
+                end_date=end_date,
+                error_types=request.error_types,
+                limit=request.max_jobs
+            )
         )
         
+        # Only the pulled jobs, bounded by the date range and max_jobs, are
+        # looked up; the speaker's full job history is never loaded
+        existing: Dict[str, VerificationJob] = {}
+        if batch_id is not None and instanote_jobs:
+            existing = {
+                job.job_id: job
+                for job in await self._verification_job_repository.get_by_job_ids(
+                    [job["job_id"] for job in instanote_jobs]
+                )
+                if job.job_metadata.get(BATCH_ID_METADATA_KEY) == batch_id
+            }
+        
         verification_jobs = []
         
         for job in instanote_jobs:
+            if job["job_id"] in existing:
+                verification_jobs.append(existing[job["job_id"]])
+                continue
+            
+            job_metadata = job.get("metadata", {})
+            if batch_id is not None:
+                job_metadata = {**job_metadata, BATCH_ID_METADATA_KEY: batch_id}
+            
             # Create verification job entity
             verification_job = VerificationJob(
                 verification_id=uuid.uuid4(),
@@ -67,7 +135,7 @@ class VerificationWorkflowUseCase:
                 speaker_id=uuid.UUID(request.speaker_id),
                 original_draft=job["original_draft"],
                 retrieval_timestamp=datetime.utcnow(),
-                job_metadata=job.get("metadata", {}),
+                job_metadata=job_metadata,
                 created_at=datetime.utcnow(),
             )
             
@@ -75,25 +143,27 @@ class VerificationWorkflowUseCase:
             saved_job = await self._verification_job_repository.save_verification_job(
                 verification_job
             )
-            
-            verification_jobs.append(
-                VerificationJobResponse(
-                    verification_id=str(saved_job.verification_id),
-                    job_id=saved_job.job_id,
-                    speaker_id=str(saved_job.speaker_id),
-                    verification_status=saved_job.verification_status.value,
-                    verification_result=saved_job.verification_result.value if saved_job.verification_result else None,
-                    corrections_count=saved_job.get_correction_count(),
-                    average_confidence=saved_job.calculate_average_confidence(),
-                    needs_manual_review=saved_job.needs_manual_review(),
-                    verified_by=str(saved_job.verified_by) if saved_job.verified_by else None,
-                    verified_at=saved_job.verified_at,
-                    has_qa_comments=bool(saved_job.qa_comments),
-                )
-            )
+            verification_jobs.append(saved_job)
         
         return verification_jobs
 
+    @staticmethod
+    def _to_response(verification_job: VerificationJob) -> VerificationJobResponse:
+        """Map a verification job to its response DTO"""
+        return VerificationJobResponse(
+            verification_id=str(verification_job.verification_id),
+            job_id=verification_job.job_id,
+            speaker_id=str(verification_job.speaker_id),
+            verification_status=verification_job.verification_status.value,
+            verification_result=verification_job.verification_result.value if verification_job.verification_result else None,
+            corrections_count=verification_job.get_correction_count(),
+            average_confidence=verification_job.calculate_average_confidence(),
+            needs_manual_review=verification_job.needs_manual_review(),
+            verified_by=str(verification_job.verified_by) if verification_job.verified_by else None,
+            verified_at=verification_job.verified_at,
+            has_qa_comments=bool(verification_job.qa_comments),
+        )
+
     async def apply_rag_corrections(self, verification_id: str) -> VerificationJobResponse:
         """Apply RAG system corrections to a verification job"""
         
@@ -106,10 +176,12 @@ class VerificationWorkflowUseCase:
             raise ValueError(f"Verification job {verification_id} not found")
         
         # Apply RAG corrections
-        rag_result = await self._rag_service.apply_corrections(
-            original_text=verification_job.original_draft,
-            speaker_id=str(verification_job.speaker_id),
-            job_metadata=verification_job.job_metadata
+        rag_result = await self._rag_limiter.call(
+            lambda: self._rag_service.apply_corrections(
+                original_text=verification_job.original_draft,
+                speaker_id=str(verification_job.speaker_id),
+                job_metadata=verification_job.job_metadata
+            )
         )
         
         # Create correction objects
@@ -262,58 +334,146 @@ class VerificationWorkflowUseCase:
         # )
 
     async def batch_process_verification_jobs(
-        self, speaker_ids: List[str], max_jobs_per_speaker: int = 5
+        self,
+        speaker_ids: List[str],
+        max_jobs_per_speaker: int = 5,
+        batch_id: Optional[str] = None,
+        max_concurrent_speakers: int = 16,
     ) -> dict:
-        """Batch process verification jobs for multiple speakers"""
-        
+        """
+        Batch process verification jobs for multiple speakers
+
+        Speakers are processed concurrently by max_concurrent_speakers
+        workers, and each speaker's jobs are corrected concurrently; the
+        InstaNote and RAG limiters bound the load on each service. Every
+        speaker whose jobs all succeeded is checkpointed under batch_id, and
+        running the batch again with the same batch_id skips those speakers.
+        Other speakers are processed again: jobs the batch already pulled are
+        reused instead of pulled twice, and only jobs without RAG corrections
+        are corrected.
+        """
+        if max_concurrent_speakers <= 0:
+            raise ValueError("max_concurrent_speakers must be positive")
+
+        batch_id = batch_id or str(uuid.uuid4())
+        completed: Dict[str, Dict[str, Any]] = {}
+        if self._checkpoint_repository is not None:
+            completed = await self._checkpoint_repository.get_completed_speakers(
+                batch_id
+            )
+
         results = {
+            "batch_id": batch_id,
             "processed_speakers": 0,
+            "resumed_speakers": 0,
             "total_jobs_pulled": 0,
             "jobs_with_corrections": 0,
             "jobs_needing_review": 0,
             "errors": [],
         }
-        
-        for speaker_id in speaker_ids:
-            try:
-                # Pull jobs for speaker
-                request = PullVerificationJobsRequest(
-                    speaker_id=speaker_id,
-                    date_range={
-                        "start_date": (datetime.utcnow() - datetime.timedelta(days=7)).isoformat(),
-                        "end_date": datetime.utcnow().isoformat(),
-                    },
-                    max_jobs=max_jobs_per_speaker,
-                    requested_by="system"
-                )
-                
-                jobs = await self.pull_verification_jobs(request)
-                results["total_jobs_pulled"] += len(jobs)
-                
-                # Apply RAG corrections to each job
-                for job in jobs:
-                    try:
-                        corrected_job = await self.apply_rag_corrections(job.verification_id)
-                        
-                        if corrected_job.corrections_count > 0:
-                            results["jobs_with_corrections"] += 1
-                        
-                        if corrected_job.needs_manual_review:
-                            results["jobs_needing_review"] += 1
-                            
-                    except Exception as e:
-                        results["errors"].append({
-                            "job_id": job.verification_id,
-                            "speaker_id": speaker_id,
-                            "error": str(e)
-                        })
-                
-                results["processed_speakers"] += 1
-                
-            except Exception as e:
-                results["errors"].append({
+
+        def add_speaker_result(speaker_result: Dict[str, Any]) -> None:
+            results["processed_speakers"] += 1
+            results["total_jobs_pulled"] += speaker_result["jobs_pulled"]
+            results["jobs_with_corrections"] += speaker_result["jobs_with_corrections"]
+            results["jobs_needing_review"] += speaker_result["jobs_needing_review"]
+            results["errors"].extend(speaker_result["errors"])
+
+        pending: asyncio.Queue = asyncio.Queue()
+        for speaker_id in dict.fromkeys(speaker_ids):
+            if speaker_id in completed:
+                results["resumed_speakers"] += 1
+                add_speaker_result(completed[speaker_id])
+            else:
+                pending.put_nowait(speaker_id)
+
+        async def worker() -> None:
+            while not pending.empty():
+                speaker_id = pending.get_nowait()
+                try:
+                    speaker_result = await self._process_speaker_jobs(
+                        speaker_id, max_jobs_per_speaker, batch_id
+                    )
+                except Exception as e:
+                    # Not checkpointed, so a resumed batch retries the speaker
+                    results["errors"].append({
+                        "speaker_id": speaker_id,
+                        "error": str(e)
+                    })
+                    continue
+
+                # Speakers with failed jobs are retried when the batch resumes
+                if (
+                    self._checkpoint_repository is not None
+                    and not speaker_result["errors"]
+                ):
+                    await self._checkpoint_repository.save_speaker_result(
+                        batch_id, speaker_id, speaker_result
+                    )
+                add_speaker_result(speaker_result)
+
+        workers = min(max_concurrent_speakers, pending.qsize())
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        logger.info(
+            f"Verification batch {batch_id}: {results['processed_speakers']} "
+            f"speakers processed ({results['resumed_speakers']} from checkpoints), "
+            f"{len(results['errors'])} errors"
+        )
+        return results
+
+    async def _process_speaker_jobs(
+        self, speaker_id: str, max_jobs_per_speaker: int, batch_id: str
+    ) -> Dict[str, Any]:
+        """
+        Pull one speaker's jobs and apply RAG corrections to them concurrently
+
+        Jobs the batch already corrected are counted without calling RAG again.
+        """
+        now = datetime.utcnow()
+        request = PullVerificationJobsRequest(
+            speaker_id=speaker_id,
+            date_range={
+                "start_date": (now - timedelta(days=7)).isoformat(),
+                "end_date": now.isoformat(),
+            },
+            max_jobs=max_jobs_per_speaker,
+            requested_by="system"
+        )
+
+        jobs = await self._pull_jobs(request, batch_id)
+        corrected_jobs = await asyncio.gather(
+            *(self._correct_once(job) for job in jobs),
+            return_exceptions=True,
+        )
+
+        speaker_result = {
+            "jobs_pulled": len(jobs),
+            "jobs_with_corrections": 0,
+            "jobs_needing_review": 0,
+            "errors": [],
+        }
+        for job, corrected_job in zip(jobs, corrected_jobs):
+            if isinstance(corrected_job, Exception):
+                speaker_result["errors"].append({
+                    "job_id": str(job.verification_id),
                     "speaker_id": speaker_id,
-                    "error": str(e)
+                    "error": str(corrected_job)
                 })
-        
-        return results
+                continue
+
+            if corrected_job.corrections_count > 0:
+                speaker_result["jobs_with_corrections"] += 1
+
+            if corrected_job.needs_manual_review:
+                speaker_result["jobs_needing_review"] += 1
+
+        return speaker_result
+
+    async def _correct_once(
+        self, verification_job: VerificationJob
+    ) -> VerificationJobResponse:
+        """Apply RAG corrections unless the job already has them"""
+        if verification_job.rag_corrected_draft is not None:
+            return self._to_response(verification_job)
+        return await self.apply_rag_corrections(str(verification_job.verification_id))
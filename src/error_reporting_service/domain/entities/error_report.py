@@ -97,6 +97,47 @@ class EnhancedMetadata:
             raise ValueError("additional_notes cannot exceed 1000 characters")
 
 
+def calculate_complexity_score(
+    bucket_type: BucketType, enhanced_metadata: EnhancedMetadata
+) -> float:
+    """
+    Calculate error complexity score from bucket type and metadata.
+
+    Depends only on the metadata dimensions, so it can be computed for a
+    group of reports sharing them as well as for a single report.
+    """
+    score = 0.0
+
+    # Base score from bucket type
+    bucket_scores = {
+        BucketType.NO_TOUCH: 1.0,
+        BucketType.LOW_TOUCH: 2.0,
+        BucketType.MEDIUM_TOUCH: 3.0,
+        BucketType.HIGH_TOUCH: 4.0
+    }
+    score += bucket_scores.get(bucket_type, 2.0)
+
+    # Audio quality impact
+    if enhanced_metadata.audio_quality == AudioQuality.POOR:
+        score += 1.0
+    elif enhanced_metadata.audio_quality == AudioQuality.FAIR:
+        score += 0.5
+
+    # Multiple speakers complexity
+    if enhanced_metadata.number_of_speakers != NumberOfSpeakers.ONE:
+        score += 0.5
+
+    # Overlapping speech complexity
+    if enhanced_metadata.overlapping_speech:
+        score += 0.5
+
+    # Specialized knowledge requirement
+    if enhanced_metadata.requires_specialized_knowledge:
+        score += 0.5
+
+    return min(score, 5.0)  # Cap at 5.0
+
+
 @dataclass(frozen=True)
 class ErrorReport:
     """
@@ -277,36 +318,7 @@ class ErrorReport:
 
     def calculate_complexity_score(self) -> float:
         """Calculate error complexity score based on metadata"""
-        score = 0.0
-
-        # Base score from bucket type
-        bucket_scores = {
-            BucketType.NO_TOUCH: 1.0,
-            BucketType.LOW_TOUCH: 2.0,
-            BucketType.MEDIUM_TOUCH: 3.0,
-            BucketType.HIGH_TOUCH: 4.0
-        }
-        score += bucket_scores.get(self.bucket_type, 2.0)
-
-        # Audio quality impact
-        if self.enhanced_metadata.audio_quality == AudioQuality.POOR:
-            score += 1.0
-        elif self.enhanced_metadata.audio_quality == AudioQuality.FAIR:
-            score += 0.5
-
-        # Multiple speakers complexity
-        if self.is_multi_speaker():
-            score += 0.5
-
-        # Overlapping speech complexity
-        if self.has_overlapping_speech():
-            score += 0.5
-
-        # Specialized knowledge requirement
-        if self.requires_specialized_knowledge():
-            score += 0.5
-
-        return min(score, 5.0)  # Cap at 5.0
+        return calculate_complexity_score(self.bucket_type, self.enhanced_metadata)
 
     def with_status(self, new_status: ErrorStatus) -> "ErrorReport":
         """Create a new ErrorReport with updated status (immutable update)"""
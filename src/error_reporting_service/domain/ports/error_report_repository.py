@@ -0,0 +1,24 @@
+"""
+Error Report Repository Port
+
+Defines the read interface the dashboard uses for raw error reports.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from error_reporting_service.domain.entities.error_report import ErrorReport
+
+
+class ErrorReportRepository(ABC):
+    """Abstract repository for error report queries"""
+
+    @abstractmethod
+    async def search_errors(self, query: Dict[str, Any]) -> List[ErrorReport]:
+        """
+        Search error reports matching the criteria (e.g. date_from, date_to).
+
+        Pages are requested with "limit", and "sort_direction" plus "after"
+        continue in (reported_at, error_id) keyset order.
+        """
+        pass
@@ -0,0 +1,44 @@
+"""
+Error Report Rollup Repository Port
+
+Defines the interface for pre-aggregated error report counts.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from error_reporting_service.domain.entities.error_report import ErrorReport
+from error_reporting_service.domain.value_objects.error_report_rollup import (
+    ErrorReportRollup,
+    RollupGranularity,
+)
+
+
+class ErrorReportRollupRepository(ABC):
+    """Abstract repository for hourly and daily error report rollups"""
+
+    @abstractmethod
+    async def add_reports(self, error_reports: List[ErrorReport]) -> None:
+        """Count newly submitted reports into their hourly and daily rollups"""
+        pass
+
+    @abstractmethod
+    async def get_rollups(
+        self,
+        granularity: RollupGranularity,
+        period_from: datetime,
+        period_to: datetime,
+    ) -> List[ErrorReportRollup]:
+        """Get rollups with period_from <= period_start < period_to"""
+        pass
+
+    @abstractmethod
+    async def rebuild(self, date_from: datetime, date_to: datetime) -> int:
+        """
+        Recompute rollups from the raw error reports.
+
+        Covers the whole days overlapping [date_from, date_to), replacing
+        their hourly and daily rollups. Returns the number of reports counted.
+        """
+        pass
@@ -0,0 +1,25 @@
+"""
+Verification Batch Checkpoint Repository Port
+
+Defines the interface for recording per-speaker progress of verification
+batches, so an interrupted batch can resume where it stopped.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class VerificationBatchCheckpointRepository(ABC):
+    """Abstract repository for verification batch checkpoints"""
+
+    @abstractmethod
+    async def save_speaker_result(
+        self, batch_id: str, speaker_id: str, result: Dict[str, Any]
+    ) -> None:
+        """Record that a speaker of the batch is done, with its result counts"""
+        pass
+
+    @abstractmethod
+    async def get_completed_speakers(self, batch_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get the recorded result of every completed speaker of the batch"""
+        pass
@@ -34,6 +34,11 @@ class VerificationJobRepository(ABC):
         """Get a verification job by InstaNote job ID"""
         pass
 
+    @abstractmethod
+    async def get_by_job_ids(self, job_ids: List[str]) -> List[VerificationJob]:
+        """Get the verification jobs for a set of InstaNote job IDs"""
+        pass
+
     @abstractmethod
     async def get_jobs_by_speaker(
         self, 
@@ -0,0 +1,242 @@
+"""
+Metadata Aggregation Service
+
+Computes the dashboard's enhanced metadata insights in a single pass.
+
+Reports (or pre-aggregated rollups) are encoded once into columnar arrays
+of small integer codes, one column per metadata dimension. One bincount
+over the combined code of all dimensions yields the joint count table;
+every distribution, frequency and complexity level is then read off that
+table, whose size is fixed no matter how many reports were counted. Chunks
+can be added one at a time, so memory stays bounded for long windows.
+"""
+
+from itertools import product
+from typing import AsyncIterable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..entities.error_report import (
+    AudioQuality,
+    BackgroundNoise,
+    BucketType,
+    EnhancedMetadata,
+    ErrorReport,
+    NumberOfSpeakers,
+    SpeakerClarity,
+    calculate_complexity_score,
+)
+from ..value_objects.error_report_rollup import ErrorReportRollup
+
+# Enum dimensions, coded by declaration order (best to worst for the
+# ordinal scales), followed by the two boolean flags
+_ENUM_DIMENSIONS = (
+    BucketType,
+    AudioQuality,
+    SpeakerClarity,
+    BackgroundNoise,
+    NumberOfSpeakers,
+)
+_CODES = tuple(
+    {member: code for code, member in enumerate(enum)} for enum in _ENUM_DIMENSIONS
+)
+_SHAPE = tuple(len(enum) for enum in _ENUM_DIMENSIONS) + (2, 2)
+(
+    _BUCKET_AXIS,
+    _AUDIO_AXIS,
+    _CLARITY_AXIS,
+    _NOISE_AXIS,
+    _SPEAKERS_AXIS,
+    _OVERLAP_AXIS,
+    _SPECIALIZED_AXIS,
+) = range(len(_SHAPE))
+
+COMPLEXITY_LEVELS = ("low", "medium", "high", "very_high")
+
+
+def _complexity_scores() -> np.ndarray:
+    """Complexity score of every cell of the joint table"""
+    buckets, audio_qualities, clarities, noises, speaker_counts = (
+        list(enum) for enum in _ENUM_DIMENSIONS
+    )
+    scores = np.empty(_SHAPE, dtype=np.float64)
+    for cell in product(*(range(size) for size in _SHAPE)):
+        bucket, audio, clarity, noise, speakers, overlap, specialized = cell
+        scores[cell] = calculate_complexity_score(
+            buckets[bucket],
+            EnhancedMetadata(
+                audio_quality=audio_qualities[audio],
+                speaker_clarity=clarities[clarity],
+                background_noise=noises[noise],
+                number_of_speakers=speaker_counts[speakers],
+                overlapping_speech=bool(overlap),
+                requires_specialized_knowledge=bool(specialized),
+            ),
+        )
+    return scores
+
+
+_COMPLEXITY_SCORES = _complexity_scores()
+# low <= 2.0 < medium <= 3.5 < high <= 4.5 < very_high
+_COMPLEXITY_LEVEL_CODES = np.searchsorted(
+    np.array([2.0, 3.5, 4.5]), _COMPLEXITY_SCORES, side="left"
+)
+
+
+def _metadata_codes(bucket_type: BucketType, metadata: EnhancedMetadata) -> Tuple:
+    return (
+        _CODES[_BUCKET_AXIS][bucket_type],
+        _CODES[_AUDIO_AXIS][metadata.audio_quality],
+        _CODES[_CLARITY_AXIS][metadata.speaker_clarity],
+        _CODES[_NOISE_AXIS][metadata.background_noise],
+        _CODES[_SPEAKERS_AXIS][metadata.number_of_speakers],
+        int(metadata.overlapping_speech),
+        int(metadata.requires_specialized_knowledge),
+    )
+
+
+def encode_reports(error_reports: Iterable[ErrorReport]) -> np.ndarray:
+    """Encode reports as an (n, 7) uint8 array of metadata dimension codes"""
+    codes = [
+        _metadata_codes(report.bucket_type, report.enhanced_metadata)
+        for report in error_reports
+    ]
+    return np.array(codes, dtype=np.uint8).reshape(-1, len(_SHAPE))
+
+
+def encode_rollups(
+    rollups: Iterable[ErrorReportRollup],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode rollups as dimension codes plus their report counts as weights"""
+    rollups = list(rollups)
+    codes = np.array(
+        [
+            _metadata_codes(rollup.bucket_type, rollup.enhanced_metadata)
+            for rollup in rollups
+        ],
+        dtype=np.uint8,
+    ).reshape(-1, len(_SHAPE))
+    weights = np.array([rollup.error_count for rollup in rollups], dtype=np.int64)
+    return codes, weights
+
+
+class MetadataAggregator:
+    """
+    Accumulates the joint count table of metadata dimensions.
+
+    Feed it reports, rollups or encoded chunks in any mix and order; the
+    insights only depend on the total counts per cell.
+    """
+
+    def __init__(self):
+        self._counts = np.zeros(int(np.prod(_SHAPE)), dtype=np.int64)
+
+    @property
+    def total(self) -> int:
+        """Number of reports counted so far"""
+        return int(self._counts.sum())
+
+    def add_codes(
+        self, codes: np.ndarray, weights: Optional[np.ndarray] = None
+    ) -> None:
+        """Count encoded rows, each standing for weights[i] reports (default 1)"""
+        if not len(codes):
+            return
+        cells = np.ravel_multi_index(codes.T.astype(np.intp), _SHAPE)
+        if weights is None:
+            self._counts += np.bincount(cells, minlength=self._counts.size)
+        else:
+            np.add.at(self._counts, cells, weights.astype(np.int64))
+
+    def add_reports(self, error_reports: Iterable[ErrorReport]) -> None:
+        """Count raw error reports"""
+        self.add_codes(encode_reports(error_reports))
+
+    def add_rollups(self, rollups: Iterable[ErrorReportRollup]) -> None:
+        """Count pre-aggregated rollups"""
+        self.add_codes(*encode_rollups(rollups))
+
+    async def add_report_chunks(
+        self, chunks: AsyncIterable[Sequence[ErrorReport]]
+    ) -> None:
+        """Count reports from an async stream of chunks, one chunk at a time"""
+        async for chunk in chunks:
+            self.add_reports(chunk)
+
+    def insights(self) -> Dict:
+        """Metadata insights for everything counted so far"""
+        table = self._counts.reshape(_SHAPE)
+        total = int(table.sum())
+
+        return {
+            "total_errors_analyzed": total,
+            "audio_quality_distribution": self._distribution(table, _AUDIO_AXIS, total),
+            "speaker_clarity_distribution": self._distribution(
+                table, _CLARITY_AXIS, total
+            ),
+            "background_noise_distribution": self._distribution(
+                table, _NOISE_AXIS, total
+            ),
+            "speaker_count_distribution": self._distribution(
+                table, _SPEAKERS_AXIS, total
+            ),
+            "overlapping_speech_frequency": self._frequency(
+                table, _OVERLAP_AXIS, total
+            ),
+            "specialized_knowledge_frequency": self._frequency(
+                table, _SPECIALIZED_AXIS, total
+            ),
+            "metadata_correlations": self._correlations(),
+            "complexity_score_distribution": self._complexity_distribution(
+                table, total
+            ),
+        }
+
+    @staticmethod
+    def _marginal(table: np.ndarray, axis: int) -> np.ndarray:
+        other_axes = tuple(i for i in range(table.ndim) if i != axis)
+        return table.sum(axis=other_axes)
+
+    def _distribution(self, table: np.ndarray, axis: int, total: int) -> Dict:
+        counts = self._marginal(table, axis)
+        return {
+            member.value: _count_and_percentage(int(count), total)
+            for member, count in zip(_ENUM_DIMENSIONS[axis], counts)
+        }
+
+    def _frequency(self, table: np.ndarray, axis: int, total: int) -> float:
+        if not total:
+            return 0.0
+        flagged = int(self._marginal(table, axis)[1])
+        return round((flagged / total) * 100, 2)
+
+    def _complexity_distribution(self, table: np.ndarray, total: int) -> Dict:
+        if not total:
+            return {level: 0 for level in COMPLEXITY_LEVELS}
+
+        counts = np.bincount(
+            _COMPLEXITY_LEVEL_CODES.ravel(),
+            weights=table.ravel(),
+            minlength=len(COMPLEXITY_LEVELS),
+        )
+        return {
+            level: _count_and_percentage(int(round(count)), total)
+            for level, count in zip(COMPLEXITY_LEVELS, counts)
+        }
+
+    @staticmethod
+    def _correlations() -> Dict:
+        """Correlations between metadata fields (placeholders for now)"""
+        return {
+            "audio_quality_vs_rectification": 0.0,
+            "speaker_clarity_vs_complexity": 0.0,
+            "background_noise_vs_errors": 0.0,
+            "overlapping_speech_vs_difficulty": 0.0,
+        }
+
+
+def _count_and_percentage(count: int, total: int) -> Dict:
+    return {
+        "count": count,
+        "percentage": round((count / total) * 100, 2) if total > 0 else 0,
+    }
@@ -0,0 +1,136 @@
+"""
+Error Report Rollup Value Object
+Pre-aggregated error report counts per time period and metadata dimensions
+"""
+
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Iterable, List, Tuple
+from uuid import UUID
+
+from error_reporting_service.domain.entities.error_report import (
+    BucketType,
+    EnhancedMetadata,
+    ErrorReport,
+)
+
+
+class RollupGranularity(str, Enum):
+    """Length of the period a rollup counts reports for"""
+
+    HOUR = "hour"
+    DAY = "day"
+
+    def truncate(self, moment: datetime) -> datetime:
+        """Start of the period containing the given moment"""
+        if self == RollupGranularity.HOUR:
+            return moment.replace(minute=0, second=0, microsecond=0)
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@dataclass(frozen=True)
+class ErrorReportRollup:
+    """
+    Immutable count of error reports sharing a period and metadata dimensions.
+
+    Every metadata insight shown on the dashboard depends only on these
+    dimensions, so insights computed from rollups equal those computed from
+    the raw reports. Free-text additional_notes are not a dimension and are
+    always None here.
+    """
+
+    granularity: RollupGranularity
+    period_start: datetime
+    bucket_type: BucketType
+    client_id: UUID
+    enhanced_metadata: EnhancedMetadata
+    error_count: int
+
+    def __post_init__(self):
+        """Validate rollup data"""
+        if self.error_count < 0:
+            raise ValueError("Error count cannot be negative")
+
+        if self.granularity.truncate(self.period_start) != self.period_start:
+            raise ValueError("Period start must be aligned to the granularity")
+
+    @property
+    def key(self) -> Tuple:
+        """Identity of the rollup row: period and dimensions"""
+        return (
+            self.granularity,
+            self.period_start,
+            self.bucket_type,
+            self.client_id,
+            self.enhanced_metadata,
+        )
+
+    @classmethod
+    def from_reports(
+        cls, error_reports: Iterable[ErrorReport], granularity: RollupGranularity
+    ) -> List["ErrorReportRollup"]:
+        """Group reports into rollups of the given granularity"""
+        counts = Counter(
+            (
+                granularity.truncate(report.reported_at),
+                report.bucket_type,
+                report.client_id,
+                replace(report.enhanced_metadata, additional_notes=None),
+            )
+            for report in error_reports
+        )
+        return [
+            cls(
+                granularity=granularity,
+                period_start=period_start,
+                bucket_type=bucket_type,
+                client_id=client_id,
+                enhanced_metadata=enhanced_metadata,
+                error_count=count,
+            )
+            for (
+                period_start,
+                bucket_type,
+                client_id,
+                enhanced_metadata,
+            ), count in counts.items()
+        ]
+
+
+def rollup_ranges(
+    date_from: datetime, date_to: datetime
+) -> List[Tuple[RollupGranularity, datetime, datetime]]:
+    """
+    Cover [date_from, date_to) with as few rollup rows as possible.
+
+    Whole days are read from daily rollups and the partial days at either
+    end from hourly rollups. date_from must be aligned to an hour; the
+    hourly rollup containing date_to counts its whole hour, so date_to
+    should be aligned to an hour or be the current time.
+
+    Returns:
+        (granularity, period_from, period_to) ranges; a rollup belongs to a
+        range when period_from <= period_start < period_to
+    """
+    if RollupGranularity.HOUR.truncate(date_from) != date_from:
+        raise ValueError("date_from must be aligned to an hour")
+    if date_to <= date_from:
+        return []
+
+    first_day = RollupGranularity.DAY.truncate(date_from)
+    if first_day < date_from:
+        first_day += timedelta(days=1)
+    last_day = RollupGranularity.DAY.truncate(date_to)
+
+    if first_day >= last_day:
+        return [(RollupGranularity.HOUR, date_from, date_to)]
+
+    ranges = []
+    if date_from < first_day:
+        ranges.append((RollupGranularity.HOUR, date_from, first_day))
+    ranges.append((RollupGranularity.DAY, first_day, last_day))
+    if last_day < date_to:
+        ranges.append((RollupGranularity.HOUR, last_day, date_to))
+    return ranges
@@ -7,9 +7,12 @@ while maintaining consistent behavior.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from error_reporting_service.application.ports.secondary.repository_port import (
+    PAGINATION_KEYS,
+)
 from error_reporting_service.domain.entities.error_report import ErrorReport
 
 
@@ -37,6 +40,28 @@ class IDatabaseAdapter(ABC):
         """
         pass
 
+    async def save_error_reports(
+        self, error_reports: List[ErrorReport]
+    ) -> List[ErrorReport]:
+        """
+        Save a batch of error reports in one transaction.
+
+        Adapters should override this default, which saves the reports one
+        at a time.
+
+        Args:
+            error_reports: The error reports to save
+
+        Returns:
+            The saved error reports, in input order
+
+        Raises:
+            DatabaseError: If the save operation fails
+        """
+        return [
+            await self.save_error_report(error_report) for error_report in error_reports
+        ]
+
     @abstractmethod
     async def find_error_by_id(self, error_id: UUID) -> Optional[ErrorReport]:
         """
@@ -143,6 +168,34 @@ class IDatabaseAdapter(ABC):
         """
         pass
 
+    async def search_errors_page(
+        self, query: Dict[str, Any]
+    ) -> Tuple[List[ErrorReport], Optional[int]]:
+        """
+        Search one page of errors and optionally count all matches.
+
+        Accepts the search_errors criteria plus "include_total". Adapters
+        should override this default, which counts with a second unpaginated
+        search.
+
+        Args:
+            query: Search criteria dictionary
+
+        Returns:
+            Tuple of (error reports, total matching count or None)
+
+        Raises:
+            DatabaseError: If the search operation fails
+        """
+        error_reports = await self.search_errors(query)
+        if not query.get("include_total", True):
+            return error_reports, None
+
+        filters = {
+            key: value for key, value in query.items() if key not in PAGINATION_KEYS
+        }
+        return error_reports, len(await self.search_errors(filters))
+
     @abstractmethod
     async def begin_transaction(self) -> Any:
         """
@@ -5,16 +5,98 @@ This module contains an in-memory implementation of the IDatabaseAdapter interfa
 for testing and demonstration purposes.
 """
 
-import asyncio
-from copy import deepcopy
-from typing import Any, Dict, List, Optional
+import re
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
+from error_reporting_service.application.ports.secondary.repository_port import (
+    orders_by_relevance,
+)
 from error_reporting_service.domain.entities.error_report import ErrorReport
 from error_reporting_service.infrastructure.adapters.database.abstract.database_adapter import (
     IDatabaseAdapter,
 )
 
+# Error report attributes with a hash index: name -> value accessor
+INDEXED_FIELDS = {
+    "speaker_id": lambda report: report.speaker_id,
+    "job_id": lambda report: report.job_id,
+    "status": lambda report: report.status.value,
+    "severity_level": lambda report: report.severity_level.value,
+    "bucket_type": lambda report: report.bucket_type.value,
+}
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Undo log entry: (error_id, snapshot before the change or None if it was absent)
+UndoEntry = Tuple[UUID, Optional[ErrorReport]]
+
+
+class _FrozenList(list):
+    """List that rejects mutation; copies and pickles as a plain list."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("stored error reports are immutable snapshots")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+class _FrozenDict(dict):
+    """Dict that rejects mutation; copies and pickles as a plain dict."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("stored error reports are immutable snapshots")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    update = setdefault = pop = popitem = clear = _immutable
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert lists and dicts into immutable equivalents."""
+    if isinstance(value, (_FrozenList, _FrozenDict)):
+        return value
+    if isinstance(value, dict):
+        return _FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+def _snapshot(error_report: ErrorReport) -> ErrorReport:
+    """Create an immutable snapshot of an error report (shared, never copied)."""
+    if isinstance(error_report.error_categories, _FrozenList) and isinstance(
+        error_report.metadata, _FrozenDict
+    ):
+        return error_report
+    return replace(
+        error_report,
+        error_categories=_freeze(list(error_report.error_categories)),
+        metadata=_freeze(dict(error_report.metadata or {})),
+    )
+
+
+def _keyset(error_report: ErrorReport) -> Tuple[datetime, UUID]:
+    return error_report.reported_at, error_report.error_id
+
+
+def _words(text: str) -> Set[str]:
+    return set(WORD_PATTERN.findall(text.lower()))
+
+
+def _relevance(error_report: ErrorReport, search_words: Set[str]) -> int:
+    """Number of occurrences of the search words in the report text"""
+    text = f"{error_report.original_text} {error_report.corrected_text}".lower()
+    return sum(1 for word in WORD_PATTERN.findall(text) if word in search_words)
+
 
 class InMemoryDatabaseAdapter(IDatabaseAdapter):
     """
@@ -22,67 +104,62 @@ class InMemoryDatabaseAdapter(IDatabaseAdapter):
 
     Stores data in memory for testing and demonstration purposes.
     Not suitable for production use.
+
+    Reports are stored as immutable snapshots and returned without copying.
+    Hash indexes on speaker, job, status, severity and bucket plus an
+    inverted word index for text search avoid full scans, and transactions
+    keep an undo log instead of copying the whole store.
     """
 
     def __init__(self):
         """Initialize the in-memory adapter"""
         self._error_reports: Dict[UUID, ErrorReport] = {}
-        self._transaction_data: Optional[Dict[UUID, ErrorReport]] = None
+        self._insertion_order: Dict[UUID, int] = {}
+        self._next_sequence = 0
+        self._indexes: Dict[str, Dict[Any, Set[UUID]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+        self._word_index: Dict[str, Set[UUID]] = {}
+        self._undo_log: Optional[List[UndoEntry]] = None
 
     async def save_error_report(self, error_report: ErrorReport) -> ErrorReport:
         """Save error report to in-memory storage"""
-        if self._transaction_data is not None:
-            # We're in a transaction
-            self._transaction_data[error_report.error_id] = deepcopy(error_report)
-        else:
-            self._error_reports[error_report.error_id] = deepcopy(error_report)
+        snapshot = _snapshot(error_report)
+        self._put(snapshot)
+        return snapshot
 
-        return deepcopy(error_report)
+    async def save_error_reports(
+        self, error_reports: List[ErrorReport]
+    ) -> List[ErrorReport]:
+        """Save a batch of error reports; snapshots are built before any write"""
+        snapshots = [_snapshot(error_report) for error_report in error_reports]
+        for snapshot in snapshots:
+            self._put(snapshot)
+        return snapshots
 
     async def find_error_by_id(self, error_id: UUID) -> Optional[ErrorReport]:
         """Find error report by ID in in-memory storage"""
-        storage = (
-            self._transaction_data
-            if self._transaction_data is not None
-            else self._error_reports
-        )
-        error_report = storage.get(error_id)
-        return deepcopy(error_report) if error_report else None
+        return self._error_reports.get(error_id)
 
     async def find_errors_by_speaker(
         self, speaker_id: UUID, filters: Optional[Dict] = None
     ) -> List[ErrorReport]:
         """Find all error reports for a speaker in in-memory storage"""
-        storage = (
-            self._transaction_data
-            if self._transaction_data is not None
-            else self._error_reports
-        )
-
-        results = []
-        for error_report in storage.values():
-            if error_report.speaker_id == speaker_id:
-                # Apply filters if provided
-                if filters:
-                    if (
-                        "severity_level" in filters
-                        and error_report.severity_level.value
-                        != filters["severity_level"]
-                    ):
-                        continue
-                    if (
-                        "status" in filters
-                        and error_report.status.value != filters["status"]
-                    ):
-                        continue
-                    if "categories" in filters:
-                        if not any(
-                            cat in error_report.error_categories
-                            for cat in filters["categories"]
-                        ):
-                            continue
-
-                results.append(deepcopy(error_report))
+        criteria = {"speaker_id": speaker_id}
+        filters = filters or {}
+        for name in ("severity_level", "status"):
+            if name in filters:
+                criteria[name] = filters[name]
+
+        results = self._lookup(criteria)
+
+        if "categories" in filters:
+            categories = filters["categories"]
+            results = [
+                report
+                for report in results
+                if any(category in report.error_categories for category in categories)
+            ]
 
         return results
 
@@ -90,119 +167,123 @@ class InMemoryDatabaseAdapter(IDatabaseAdapter):
         self, job_id: UUID, filters: Optional[Dict] = None
     ) -> List[ErrorReport]:
         """Find all error reports for a job in in-memory storage"""
-        storage = (
-            self._transaction_data
-            if self._transaction_data is not None
-            else self._error_reports
-        )
-
-        results = []
-        for error_report in storage.values():
-            if error_report.job_id == job_id:
-                # Apply filters if provided
-                if filters:
-                    if (
-                        "severity_level" in filters
-                        and error_report.severity_level.value
-                        != filters["severity_level"]
-                    ):
-                        continue
-                    if (
-                        "status" in filters
-                        and error_report.status.value != filters["status"]
-                    ):
-                        continue
-
-                results.append(deepcopy(error_report))
+        criteria = {"job_id": job_id}
+        filters = filters or {}
+        for name in ("severity_level", "status"):
+            if name in filters:
+                criteria[name] = filters[name]
 
-        return results
+        return self._lookup(criteria)
 
     async def update_error_report(
         self, error_id: UUID, updates: Dict[str, Any]
     ) -> ErrorReport:
         """Update existing error report in in-memory storage"""
-        storage = (
-            self._transaction_data
-            if self._transaction_data is not None
-            else self._error_reports
-        )
-
-        if error_id not in storage:
+        if error_id not in self._error_reports:
             raise ValueError(f"Error report with ID {error_id} not found")
 
-        error_report = storage[error_id]
+        error_report = self._error_reports[error_id]
 
         # Create a new error report with updates (immutable pattern)
-        updated_report = ErrorReport(
-            error_id=error_report.error_id,
-            job_id=error_report.job_id,
-            speaker_id=error_report.speaker_id,
-            reported_by=error_report.reported_by,
-            original_text=error_report.original_text,
-            corrected_text=error_report.corrected_text,
-            error_categories=error_report.error_categories,
-            severity_level=error_report.severity_level,
-            start_position=error_report.start_position,
-            end_position=error_report.end_position,
-            context_notes=updates.get("context_notes", error_report.context_notes),
-            error_timestamp=error_report.error_timestamp,
-            reported_at=error_report.reported_at,
-            status=updates.get("status", error_report.status),
-            metadata=updates.get("metadata", error_report.metadata),
+        updated_report = _snapshot(
+            replace(
+                error_report,
+                context_notes=updates.get("context_notes", error_report.context_notes),
+                status=updates.get("status", error_report.status),
+                metadata=updates.get("metadata", error_report.metadata),
+            )
         )
 
-        storage[error_id] = updated_report
-        return deepcopy(updated_report)
+        self._put(updated_report)
+        return updated_report
 
     async def delete_error_report(self, error_id: UUID) -> bool:
         """Delete error report from in-memory storage"""
-        storage = (
-            self._transaction_data
-            if self._transaction_data is not None
-            else self._error_reports
-        )
+        if error_id not in self._error_reports:
+            return False
 
-        if error_id in storage:
-            del storage[error_id]
-            return True
-        return False
+        self._remove(error_id)
+        return True
 
     async def search_errors(self, query: Dict[str, Any]) -> List[ErrorReport]:
         """Search errors with complex criteria in in-memory storage"""
-        storage = (
-            self._transaction_data
-            if self._transaction_data is not None
-            else self._error_reports
-        )
-
-        results = []
-        for error_report in storage.values():
-            match = True
-
-            # Apply search criteria
-            if "speaker_id" in query and error_report.speaker_id != UUID(
-                query["speaker_id"]
-            ):
-                match = False
-            if "job_id" in query and error_report.job_id != UUID(query["job_id"]):
-                match = False
-            if (
-                "severity_level" in query
-                and error_report.severity_level.value != query["severity_level"]
-            ):
-                match = False
-            if "status" in query and error_report.status.value != query["status"]:
-                match = False
-            if "text_search" in query:
-                search_term = query["text_search"].lower()
-                if (
-                    search_term not in error_report.original_text.lower()
-                    and search_term not in error_report.corrected_text.lower()
-                ):
-                    match = False
-
-            if match:
-                results.append(deepcopy(error_report))
+        return self._search(query)[0]
+
+    async def search_errors_page(
+        self, query: Dict[str, Any]
+    ) -> Tuple[List[ErrorReport], Optional[int]]:
+        """Search one page of errors, counting matches in the same pass"""
+        results, total = self._search(query)
+        return results, total if query.get("include_total", True) else None
+
+    def _search(self, query: Dict[str, Any]) -> Tuple[List[ErrorReport], int]:
+        """
+        Run a search, returning the requested page and the total match count.
+
+        text_search matches reports containing the term as a substring or
+        all of its words, like the PostgreSQL adapter's trigram/full-text
+        match, and ranks them by how often the words occur. Other results
+        keep insertion order unless "sort_direction" or "after" is given, in
+        which case they follow the (reported_at, error_id) keyset order used
+        by the PostgreSQL adapter.
+        """
+        criteria: Dict[str, Any] = {}
+        if "speaker_id" in query:
+            criteria["speaker_id"] = UUID(str(query["speaker_id"]))
+        if "job_id" in query:
+            criteria["job_id"] = UUID(str(query["job_id"]))
+        for name in ("severity_level", "status", "bucket_type"):
+            if name in query:
+                criteria[name] = query[name]
+
+        text_candidates = None
+        search_term = None
+        if "text_search" in query:
+            search_term = query["text_search"].lower()
+            search_words = _words(search_term)
+            text_candidates = self._text_candidates(search_term)
+            word_matches: Set[UUID] = set()
+            if search_words:
+                word_matches = set.intersection(
+                    *(self._word_index.get(word, set()) for word in search_words)
+                )
+                text_candidates |= word_matches
+
+        results = self._lookup(criteria, text_candidates)
+
+        if search_term is not None:
+            results = [
+                report
+                for report in results
+                if report.error_id in word_matches
+                or search_term in report.original_text.lower()
+                or search_term in report.corrected_text.lower()
+            ]
+
+        if "date_from" in query:
+            results = [r for r in results if r.reported_at >= query["date_from"]]
+        if "date_to" in query:
+            results = [r for r in results if r.reported_at <= query["date_to"]]
+
+        total = len(results)
+
+        if orders_by_relevance(query):
+            if "after" in query:
+                raise ValueError("Relevance-ranked results cannot be paged by cursor")
+            descending = query.get("sort_direction", "desc") != "asc"
+            results.sort(key=_keyset, reverse=descending)
+            results.sort(key=lambda r: _relevance(r, search_words), reverse=True)
+        elif "sort_direction" in query or "after" in query:
+            descending = query.get("sort_direction", "desc") != "asc"
+            results.sort(key=_keyset, reverse=descending)
+
+            if "after" in query:
+                reported_at, error_id = query["after"]
+                position = (reported_at, UUID(str(error_id)))
+                if descending:
+                    results = [r for r in results if _keyset(r) < position]
+                else:
+                    results = [r for r in results if _keyset(r) > position]
 
         # Apply pagination
         if "limit" in query:
@@ -210,22 +291,28 @@ class InMemoryDatabaseAdapter(IDatabaseAdapter):
             offset = query.get("offset", 0)
             results = results[offset : offset + limit]
 
-        return results
+        return results, total
 
-    async def begin_transaction(self) -> Dict[UUID, ErrorReport]:
+    async def begin_transaction(self) -> List[UndoEntry]:
         """Begin in-memory transaction"""
-        self._transaction_data = deepcopy(self._error_reports)
-        return self._transaction_data
+        self._undo_log = []
+        return self._undo_log
 
-    async def commit_transaction(self, transaction: Dict[UUID, ErrorReport]) -> None:
+    async def commit_transaction(self, transaction: List[UndoEntry]) -> None:
         """Commit in-memory transaction"""
-        if self._transaction_data is not None:
-            self._error_reports = deepcopy(self._transaction_data)
-            self._transaction_data = None
+        self._undo_log = None
 
-    async def rollback_transaction(self, transaction: Dict[UUID, ErrorReport]) -> None:
+    async def rollback_transaction(self, transaction: List[UndoEntry]) -> None:
         """Rollback in-memory transaction"""
-        self._transaction_data = None
+        if self._undo_log is None:
+            return
+
+        undo_log, self._undo_log = self._undo_log, None
+        for error_id, previous in reversed(undo_log):
+            if previous is None:
+                self._remove(error_id)
+            else:
+                self._put(previous)
 
     async def health_check(self) -> bool:
         """Check in-memory storage health (always healthy)"""
@@ -236,10 +323,136 @@ class InMemoryDatabaseAdapter(IDatabaseAdapter):
         return {
             "adapter_type": "in_memory",
             "total_records": len(self._error_reports),
-            "in_transaction": self._transaction_data is not None,
+            "in_transaction": self._undo_log is not None,
         }
 
     def clear_all_data(self) -> None:
         """Clear all data (for testing)"""
         self._error_reports.clear()
-        self._transaction_data = None
+        self._insertion_order.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._word_index.clear()
+        self._undo_log = None
+
+    def _lookup(
+        self, criteria: Dict[str, Any], candidates: Optional[Set[UUID]] = None
+    ) -> List[ErrorReport]:
+        """
+        Intersect index postings for the criteria, smallest first.
+
+        Args:
+            criteria: Indexed field name to required value
+            candidates: Optional pre-computed candidate IDs to intersect with
+
+        Returns:
+            Matching reports in insertion order
+        """
+        postings = [
+            self._indexes[name].get(value, set()) for name, value in criteria.items()
+        ]
+        if candidates is not None:
+            postings.append(candidates)
+
+        if not postings:
+            return list(self._error_reports.values())
+
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches &= posting
+
+        return [
+            self._error_reports[error_id]
+            for error_id in sorted(matches, key=self._insertion_order.__getitem__)
+        ]
+
+    def _text_candidates(self, search_term: str) -> Optional[Set[UUID]]:
+        """
+        Get reports that may contain a lower-cased substring.
+
+        A word of the search term bounded by non-word characters on both
+        sides must appear as a whole word in the text; a word touching either
+        end of the term may be part of a longer word, so any indexed word
+        containing it qualifies. The result is a superset that callers
+        confirm with a substring check.
+
+        Args:
+            search_term: Lower-cased search term
+
+        Returns:
+            Candidate report IDs, or None if the term has no word characters
+        """
+        fragments = list(WORD_PATTERN.finditer(search_term))
+        if not fragments:
+            return None
+
+        whole_words = [
+            match.group()
+            for match in fragments
+            if match.start() > 0 and match.end() < len(search_term)
+        ]
+        if whole_words:
+            return set.intersection(
+                *(self._word_index.get(word, set()) for word in whole_words)
+            )
+
+        fragment = max((match.group() for match in fragments), key=len)
+        candidates: Set[UUID] = set()
+        for word, error_ids in self._word_index.items():
+            if fragment in word:
+                candidates |= error_ids
+        return candidates
+
+    def _put(self, error_report: ErrorReport) -> None:
+        """Insert or replace a snapshot, maintaining indexes and undo log."""
+        error_id = error_report.error_id
+        previous = self._error_reports.get(error_id)
+        if self._undo_log is not None:
+            self._undo_log.append((error_id, previous))
+
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._insertion_order[error_id] = self._next_sequence
+            self._next_sequence += 1
+
+        self._error_reports[error_id] = error_report
+        self._index(error_report)
+
+    def _remove(self, error_id: UUID) -> None:
+        """Remove a snapshot, maintaining indexes and undo log."""
+        previous = self._error_reports.pop(error_id)
+        if self._undo_log is not None:
+            self._undo_log.append((error_id, previous))
+
+        self._unindex(previous)
+        del self._insertion_order[error_id]
+
+    def _index(self, error_report: ErrorReport) -> None:
+        error_id = error_report.error_id
+        for name, accessor in INDEXED_FIELDS.items():
+            self._indexes[name].setdefault(accessor(error_report), set()).add(error_id)
+        for word in self._report_words(error_report):
+            self._word_index.setdefault(word, set()).add(error_id)
+
+    def _unindex(self, error_report: ErrorReport) -> None:
+        error_id = error_report.error_id
+        for name, accessor in INDEXED_FIELDS.items():
+            self._discard(self._indexes[name], accessor(error_report), error_id)
+        for word in self._report_words(error_report):
+            self._discard(self._word_index, word, error_id)
+
+    @staticmethod
+    def _report_words(error_report: ErrorReport) -> Iterable[str]:
+        return _words(error_report.original_text) | _words(error_report.corrected_text)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[UUID]], key: Any, error_id: UUID) -> None:
+        posting = index.get(key)
+        if posting is not None:
+            posting.discard(error_id)
+            if not posting:
+                del index[key]
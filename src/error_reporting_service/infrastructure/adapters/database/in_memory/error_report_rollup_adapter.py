@@ -0,0 +1,87 @@
+"""
+In-Memory Error Report Rollup Repository Implementation
+For testing and development purposes
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from error_reporting_service.domain.entities.error_report import ErrorReport
+from error_reporting_service.domain.ports.error_report_repository import (
+    ErrorReportRepository,
+)
+from error_reporting_service.domain.ports.error_report_rollup_repository import (
+    ErrorReportRollupRepository,
+)
+from error_reporting_service.domain.value_objects.error_report_rollup import (
+    ErrorReportRollup,
+    RollupGranularity,
+)
+
+
+class InMemoryErrorReportRollupAdapter(ErrorReportRollupRepository):
+    """
+    In-memory implementation of error report rollup repository
+
+    Rebuilds read the raw reports from the given error report repository.
+    """
+
+    def __init__(self, error_report_repository: ErrorReportRepository):
+        self._error_report_repository = error_report_repository
+        self._rollups: Dict[Tuple, ErrorReportRollup] = {}
+
+    async def add_reports(self, error_reports: List[ErrorReport]) -> None:
+        """Increment hourly and daily rollups"""
+        for granularity in RollupGranularity:
+            for rollup in ErrorReportRollup.from_reports(error_reports, granularity):
+                self._add(rollup)
+
+    async def get_rollups(
+        self,
+        granularity: RollupGranularity,
+        period_from: datetime,
+        period_to: datetime,
+    ) -> List[ErrorReportRollup]:
+        """Get rollups of one granularity within a period range"""
+        return [
+            rollup
+            for rollup in self._rollups.values()
+            if rollup.granularity == granularity
+            and period_from <= rollup.period_start < period_to
+        ]
+
+    async def rebuild(self, date_from: datetime, date_to: datetime) -> int:
+        """Replace rollups for whole days from the raw reports"""
+        day_from = RollupGranularity.DAY.truncate(date_from)
+        day_to = RollupGranularity.DAY.truncate(date_to)
+        if day_to < date_to:
+            day_to += timedelta(days=1)
+
+        error_reports = [
+            report
+            for report in await self._error_report_repository.search_errors(
+                {"date_from": day_from, "date_to": day_to}
+            )
+            if report.reported_at < day_to
+        ]
+
+        self._rollups = {
+            key: rollup
+            for key, rollup in self._rollups.items()
+            if not day_from <= rollup.period_start < day_to
+        }
+        await self.add_reports(error_reports)
+        return len(error_reports)
+
+    def clear_all_data(self) -> None:
+        """Clear all data (for testing)"""
+        self._rollups.clear()
+
+    def _add(self, rollup: ErrorReportRollup) -> None:
+        existing = self._rollups.get(rollup.key)
+        if existing is not None:
+            rollup = replace(
+                rollup, error_count=existing.error_count + rollup.error_count
+            )
+        self._rollups[rollup.key] = rollup
@@ -0,0 +1,32 @@
+"""
+In-Memory Verification Batch Checkpoint Repository Implementation
+For testing and development purposes
+"""
+
+from copy import deepcopy
+from typing import Any, Dict
+
+from error_reporting_service.domain.ports.verification_batch_checkpoint_repository import (
+    VerificationBatchCheckpointRepository,
+)
+
+
+class InMemoryVerificationBatchCheckpointAdapter(VerificationBatchCheckpointRepository):
+    """In-memory implementation of verification batch checkpoint repository"""
+
+    def __init__(self):
+        self._checkpoints: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    async def save_speaker_result(
+        self, batch_id: str, speaker_id: str, result: Dict[str, Any]
+    ) -> None:
+        """Record that a speaker of the batch is done"""
+        self._checkpoints.setdefault(batch_id, {})[speaker_id] = deepcopy(result)
+
+    async def get_completed_speakers(self, batch_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get the recorded result of every completed speaker of the batch"""
+        return deepcopy(self._checkpoints.get(batch_id, {}))
+
+    def clear_all_data(self) -> None:
+        """Clear all data (for testing)"""
+        self._checkpoints.clear()
@@ -0,0 +1,9 @@
+-- Keyset Pagination Index for Error Report Search
+-- Migration: 002_error_reports_keyset_index
+-- Date: 2026-10-16
+-- Description: Composite index on the (reported_at, error_id) search order so
+-- cursor-based pages seek directly to their start instead of skipping rows
+
+-- CONCURRENTLY cannot run inside a transaction block, so no BEGIN/COMMIT here
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_error_reports_reported_at_error_id
+    ON error_reports (reported_at, error_id);
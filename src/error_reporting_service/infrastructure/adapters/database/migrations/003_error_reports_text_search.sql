@@ -0,0 +1,34 @@
+-- Full-Text and Trigram Search for Error Report Text
+-- Migration: 003_error_reports_text_search
+-- Date: 2026-10-16
+-- Description: Generated tsvector column with GIN index for word matches and
+-- relevance ranking, plus trigram indexes for ILIKE substring matches
+
+BEGIN;
+
+-- 'simple' lowercases without stemming or stop words, matching the
+-- in-memory adapter's word index
+ALTER TABLE error_reports ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    to_tsvector('simple',
+                coalesce(original_text, '') || ' ' || coalesce(corrected_text, ''))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_error_reports_search_vector
+    ON error_reports USING gin (search_vector);
+
+-- Trigram indexes are skipped when the pg_trgm extension is not installed
+-- on the server
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS idx_error_reports_original_text_trgm
+            ON error_reports USING gin (original_text gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_error_reports_corrected_text_trgm
+            ON error_reports USING gin (corrected_text gin_trgm_ops);
+    END IF;
+END
+$$;
+
+COMMIT;
@@ -0,0 +1,32 @@
+-- Composite and Partial Indexes for Dashboard and Bucket Queries
+-- Migration: 004_query_shape_indexes
+-- Date: 2026-10-16
+-- Description: Indexes matched to the filter combinations the repositories
+-- emit, checked by tests/integration/test_query_index_advisor.py
+
+-- CONCURRENTLY cannot run inside a transaction block, so no BEGIN/COMMIT here
+
+-- A speaker's reports by status, newest first in keyset order
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_error_reports_speaker_status_reported_at
+    ON error_reports (speaker_id, status, reported_at, error_id);
+
+-- Dashboard bucket breakdowns over a reporting window
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_error_reports_bucket_type_reported_at
+    ON error_reports (bucket_type, reported_at);
+
+-- A speaker's assignments in date order (history, current bucket)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_speaker_bucket_history_speaker_assigned_date
+    ON speaker_bucket_history (speaker_id, assigned_date);
+
+-- Assignment counts per bucket over a date range
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_speaker_bucket_history_bucket_assigned_date
+    ON speaker_bucket_history (bucket_type, assigned_date);
+
+-- Speakers due for reassessment: overdue or never assessed ...
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_speaker_performance_metrics_last_assessment_date
+    ON speaker_performance_metrics (last_assessment_date);
+
+-- ... or declining, which only a small share of speakers are
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_speaker_performance_metrics_declining
+    ON speaker_performance_metrics (last_assessment_date)
+    WHERE quality_trend = 'declining';
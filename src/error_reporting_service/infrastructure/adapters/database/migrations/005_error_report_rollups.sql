@@ -0,0 +1,41 @@
+-- Error Report Rollups for Dashboard Metadata Insights
+-- Migration: 005_error_report_rollups
+-- Date: 2026-10-16
+-- Description: Hourly and daily error report counts per bucket, client and
+-- metadata dimensions, read by the dashboard instead of the raw reports.
+-- Rows are incremented on submission and rebuilt from error_reports by the
+-- rollup refresh job.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS error_report_rollups (
+    granularity VARCHAR(10) NOT NULL CHECK (granularity IN ('hour', 'day')),
+    period_start TIMESTAMP NOT NULL,
+    bucket_type VARCHAR(20) NOT NULL,
+    client_id UUID NOT NULL,
+    audio_quality VARCHAR(20) NOT NULL,
+    speaker_clarity VARCHAR(30) NOT NULL,
+    background_noise VARCHAR(20) NOT NULL,
+    number_of_speakers VARCHAR(10) NOT NULL,
+    overlapping_speech BOOLEAN NOT NULL,
+    requires_specialized_knowledge BOOLEAN NOT NULL,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    -- Leading (granularity, period_start) serves the dashboard's range reads
+    PRIMARY KEY (
+        granularity, period_start, bucket_type, client_id, audio_quality,
+        speaker_clarity, background_noise, number_of_speakers,
+        overlapping_speech, requires_specialized_knowledge
+    )
+);
+
+-- Backfill from existing reports
+INSERT INTO error_report_rollups
+SELECT granularity, date_trunc(granularity, reported_at), bucket_type, client_id,
+       audio_quality, speaker_clarity, background_noise, number_of_speakers,
+       overlapping_speech, requires_specialized_knowledge, count(*)
+FROM error_reports
+CROSS JOIN (VALUES ('hour'), ('day')) AS granularities (granularity)
+GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10
+ON CONFLICT DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Verification Batch Checkpoints
+-- Migration: 006_verification_batch_checkpoints
+-- Date: 2026-10-16
+-- Description: Per-speaker progress of verification batches. A batch run
+-- with the same batch_id skips speakers recorded here, so an interrupted
+-- nightly batch resumes instead of starting over.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS verification_batch_checkpoints (
+    batch_id VARCHAR(100) NOT NULL,
+    speaker_id VARCHAR(100) NOT NULL,
+    result JSONB NOT NULL,
+    completed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (batch_id, speaker_id)
+);
+
+COMMIT;
@@ -5,10 +5,24 @@ This module contains the PostgreSQL implementation of the IDatabaseAdapter inter
 using SQLAlchemy with async support.
 """
 
-from typing import Any, Dict, List, Optional
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import delete, select, text, update
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Select,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
 
@@ -23,11 +37,14 @@ from error_reporting_service.domain.entities.error_report import (
     NumberOfSpeakers,
     EnhancedMetadata,
 )
+from error_reporting_service.application.ports.secondary.repository_port import (
+    orders_by_relevance,
+)
 from error_reporting_service.infrastructure.adapters.database.abstract.database_adapter import (
     IDatabaseAdapter,
 )
 
-from .models import Base, ErrorReportModel
+from .models import SEARCH_VECTOR, TEXT_SEARCH_CONFIG, Base, ErrorReportModel
 
 
 class PostgreSQLAdapter(IDatabaseAdapter):
@@ -57,43 +74,15 @@ class PostgreSQLAdapter(IDatabaseAdapter):
         self._session_factory = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
+        # Full-text search relies on the PostgreSQL-only search_vector column
+        self._full_text_search = self.engine.dialect.name == "postgresql"
+        # Bulk saves stream rows with COPY when the driver exposes it
+        self._copy_supported = self.engine.dialect.driver == "asyncpg"
 
     async def save_error_report(self, error_report: ErrorReport) -> ErrorReport:
         """Save error report with enhanced metadata to PostgreSQL database"""
         async with self._session_factory() as session:
-            model = ErrorReportModel(
-                error_id=error_report.error_id,
-                job_id=error_report.job_id,
-                speaker_id=error_report.speaker_id,
-                client_id=error_report.client_id,
-                reported_by=error_report.reported_by,
-                original_text=error_report.original_text,
-                corrected_text=error_report.corrected_text,
-                error_categories=error_report.error_categories,
-                severity_level=error_report.severity_level.value,
-                start_position=error_report.start_position,
-                end_position=error_report.end_position,
-                context_notes=error_report.context_notes,
-                error_timestamp=error_report.error_timestamp,
-                reported_at=error_report.reported_at,
-
-                # Quality-based bucket management
-                bucket_type=error_report.bucket_type.value,
-
-                # Enhanced metadata fields
-                audio_quality=error_report.enhanced_metadata.audio_quality.value,
-                speaker_clarity=error_report.enhanced_metadata.speaker_clarity.value,
-                background_noise=error_report.enhanced_metadata.background_noise.value,
-                number_of_speakers=error_report.enhanced_metadata.number_of_speakers.value,
-                overlapping_speech=error_report.enhanced_metadata.overlapping_speech,
-                requires_specialized_knowledge=error_report.enhanced_metadata.requires_specialized_knowledge,
-                additional_notes=error_report.enhanced_metadata.additional_notes,
-
-                # System fields
-                status=error_report.status.value,
-                vector_db_id=error_report.vector_db_id,
-                error_metadata=error_report.metadata,
-            )
+            model = ErrorReportModel(**self._entity_to_values(error_report))
 
             session.add(model)
             await session.commit()
@@ -101,6 +90,57 @@ class PostgreSQLAdapter(IDatabaseAdapter):
 
             return self._model_to_entity(model)
 
+    async def save_error_reports(
+        self, error_reports: List[ErrorReport]
+    ) -> List[ErrorReport]:
+        """
+        Save a batch of error reports in one transaction.
+
+        With the asyncpg driver the rows are streamed with COPY; other drivers
+        insert them with one executemany INSERT. Nothing is generated by the
+        database, so the reports are returned as given instead of being read
+        back.
+        """
+        if not error_reports:
+            return []
+
+        now = datetime.utcnow()
+        rows = [
+            dict(self._entity_to_values(error_report), created_at=now, updated_at=now)
+            for error_report in error_reports
+        ]
+
+        async with self._session_factory() as session:
+            if self._copy_supported:
+                await self._copy_rows(session, rows)
+            else:
+                await session.execute(insert(ErrorReportModel), rows)
+            await session.commit()
+
+        return list(error_reports)
+
+    async def _copy_rows(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """Stream rows into error_reports with asyncpg's COPY FROM STDIN"""
+        columns = [ErrorReportModel.__mapper__.columns[key] for key in rows[0]]
+        json_keys = {
+            key for key, column in zip(rows[0], columns) if isinstance(column.type, JSON)
+        }
+        records = [
+            tuple(
+                json.dumps(value) if key in json_keys else value
+                for key, value in row.items()
+            )
+            for row in rows
+        ]
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            ErrorReportModel.__tablename__,
+            records=records,
+            columns=[column.name for column in columns],
+        )
+
     async def find_error_by_id(self, error_id: UUID) -> Optional[ErrorReport]:
         """Find error report by ID in PostgreSQL database"""
         async with self._session_factory() as session:
@@ -206,40 +246,144 @@ class PostgreSQLAdapter(IDatabaseAdapter):
     async def search_errors(self, query: Dict[str, Any]) -> List[ErrorReport]:
         """Search errors with complex criteria in PostgreSQL database"""
         async with self._session_factory() as session:
-            stmt = select(ErrorReportModel)
-
-            # Build dynamic query based on search criteria
-            if "speaker_id" in query:
-                stmt = stmt.where(
-                    ErrorReportModel.speaker_id == UUID(query["speaker_id"])
-                )
-            if "job_id" in query:
-                stmt = stmt.where(ErrorReportModel.job_id == UUID(query["job_id"]))
-            if "severity_level" in query:
-                stmt = stmt.where(
-                    ErrorReportModel.severity_level == query["severity_level"]
-                )
-            if "status" in query:
-                stmt = stmt.where(ErrorReportModel.status == query["status"])
-            if "text_search" in query:
-                # Full-text search on original and corrected text
-                search_term = f"%{query['text_search']}%"
-                stmt = stmt.where(
-                    ErrorReportModel.original_text.ilike(search_term)
-                    | ErrorReportModel.corrected_text.ilike(search_term)
-                )
-
-            # Add pagination if specified
-            if "limit" in query:
-                stmt = stmt.limit(query["limit"])
-            if "offset" in query:
-                stmt = stmt.offset(query["offset"])
-
-            result = await session.execute(stmt)
+            result = await session.execute(self._search_statement(query))
             models = result.scalars().all()
 
             return [self._model_to_entity(model) for model in models]
 
+    async def search_errors_page(
+        self, query: Dict[str, Any]
+    ) -> Tuple[List[ErrorReport], Optional[int]]:
+        """
+        Search one page of errors and count all matches in a single query.
+
+        The total comes from a COUNT(*) OVER () window on the filtered rows.
+        When continuing from a keyset position the window would only see the
+        remaining rows, so the total is taken from a scalar subquery over the
+        filters instead.
+        """
+        if not query.get("include_total", True):
+            return await self.search_errors(query), None
+
+        filtered = self._filtered_statement(query)
+        if "after" in query:
+            total_count = (
+                select(func.count())
+                .select_from(filtered.subquery())
+                .scalar_subquery()
+            )
+        else:
+            total_count = func.count().over()
+
+        stmt = self._paginate(
+            self._filtered_statement(query).add_columns(total_count.label("total")),
+            query,
+        )
+
+        async with self._session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+            if rows:
+                total = rows[0].total
+            elif query.get("offset") or "after" in query:
+                # Past the last page: no row carries the window count
+                count_stmt = select(func.count()).select_from(filtered.subquery())
+                total = (await session.execute(count_stmt)).scalar_one()
+            else:
+                total = 0
+
+        return [self._model_to_entity(row[0]) for row in rows], total
+
+    def _search_statement(self, query: Dict[str, Any]) -> Select:
+        """Build the paginated search statement for the query"""
+        return self._paginate(self._filtered_statement(query), query)
+
+    def _filtered_statement(self, query: Dict[str, Any]) -> Select:
+        """Build a statement applying the search criteria (no pagination)"""
+        stmt = select(ErrorReportModel)
+
+        # Build dynamic query based on search criteria
+        if "speaker_id" in query:
+            stmt = stmt.where(
+                ErrorReportModel.speaker_id == UUID(query["speaker_id"])
+            )
+        if "job_id" in query:
+            stmt = stmt.where(ErrorReportModel.job_id == UUID(query["job_id"]))
+        if "severity_level" in query:
+            stmt = stmt.where(
+                ErrorReportModel.severity_level == query["severity_level"]
+            )
+        if "status" in query:
+            stmt = stmt.where(ErrorReportModel.status == query["status"])
+        if "bucket_type" in query:
+            stmt = stmt.where(ErrorReportModel.bucket_type == query["bucket_type"])
+        if "date_from" in query:
+            stmt = stmt.where(ErrorReportModel.reported_at >= query["date_from"])
+        if "date_to" in query:
+            stmt = stmt.where(ErrorReportModel.reported_at <= query["date_to"])
+        if "text_search" in query:
+            stmt = stmt.where(self._text_match(query["text_search"]))
+
+        return stmt
+
+    def _text_match(self, term: str) -> ColumnElement:
+        """
+        Match reports whose text contains the term or all of its words.
+
+        Substring matches (ILIKE) are served by the pg_trgm indexes and word
+        matches by the GIN index on search_vector; the planner combines both
+        with a bitmap OR. Other dialects fall back to substring matching.
+        """
+        search_term = f"%{term}%"
+        match = ErrorReportModel.original_text.ilike(
+            search_term
+        ) | ErrorReportModel.corrected_text.ilike(search_term)
+        if self._full_text_search:
+            match = match | SEARCH_VECTOR.op("@@")(_ts_query(term))
+        return match
+
+    def _paginate(self, stmt: Select, query: Dict[str, Any]) -> Select:
+        """
+        Order by the (reported_at, error_id) keyset and apply pagination.
+
+        "after" continues strictly after a (reported_at, error_id) position,
+        which the composite keyset index serves without scanning skipped rows.
+        "offset" is still honoured for page-number pagination. Text searches
+        rank by ts_rank_cd first when ordered by relevance.
+        """
+        descending = query.get("sort_direction", "desc") != "asc"
+        keyset = tuple_(ErrorReportModel.reported_at, ErrorReportModel.error_id)
+
+        if self._full_text_search and orders_by_relevance(query):
+            if "after" in query:
+                raise ValueError("Relevance-ranked results cannot be paged by cursor")
+            rank = func.ts_rank_cd(SEARCH_VECTOR, _ts_query(query["text_search"]))
+            stmt = stmt.order_by(rank.desc())
+
+        if "after" in query:
+            reported_at, error_id = query["after"]
+            position = tuple_(
+                literal(reported_at, ErrorReportModel.reported_at.type),
+                literal(UUID(str(error_id)), ErrorReportModel.error_id.type),
+            )
+            stmt = stmt.where(keyset < position if descending else keyset > position)
+
+        if descending:
+            stmt = stmt.order_by(
+                ErrorReportModel.reported_at.desc(), ErrorReportModel.error_id.desc()
+            )
+        else:
+            stmt = stmt.order_by(
+                ErrorReportModel.reported_at.asc(), ErrorReportModel.error_id.asc()
+            )
+
+        # Add pagination if specified
+        if "limit" in query:
+            stmt = stmt.limit(query["limit"])
+        if "offset" in query:
+            stmt = stmt.offset(query["offset"])
+
+        return stmt
+
     async def begin_transaction(self) -> AsyncSession:
         """Begin PostgreSQL transaction"""
         session = self._session_factory()
@@ -279,6 +423,42 @@ class PostgreSQLAdapter(IDatabaseAdapter):
             },
         }
 
+    def _entity_to_values(self, error_report: ErrorReport) -> Dict[str, Any]:
+        """Convert domain entity to ErrorReportModel attribute values"""
+        return {
+            "error_id": error_report.error_id,
+            "job_id": error_report.job_id,
+            "speaker_id": error_report.speaker_id,
+            "client_id": error_report.client_id,
+            "reported_by": error_report.reported_by,
+            "original_text": error_report.original_text,
+            "corrected_text": error_report.corrected_text,
+            "error_categories": error_report.error_categories,
+            "severity_level": error_report.severity_level.value,
+            "start_position": error_report.start_position,
+            "end_position": error_report.end_position,
+            "context_notes": error_report.context_notes,
+            "error_timestamp": error_report.error_timestamp,
+            "reported_at": error_report.reported_at,
+
+            # Quality-based bucket management
+            "bucket_type": error_report.bucket_type.value,
+
+            # Enhanced metadata fields
+            "audio_quality": error_report.enhanced_metadata.audio_quality.value,
+            "speaker_clarity": error_report.enhanced_metadata.speaker_clarity.value,
+            "background_noise": error_report.enhanced_metadata.background_noise.value,
+            "number_of_speakers": error_report.enhanced_metadata.number_of_speakers.value,
+            "overlapping_speech": error_report.enhanced_metadata.overlapping_speech,
+            "requires_specialized_knowledge": error_report.enhanced_metadata.requires_specialized_knowledge,
+            "additional_notes": error_report.enhanced_metadata.additional_notes,
+
+            # System fields
+            "status": error_report.status.value,
+            "vector_db_id": error_report.vector_db_id,
+            "error_metadata": error_report.metadata,
+        }
+
     def _model_to_entity(self, model: ErrorReportModel) -> ErrorReport:
         """Convert SQLAlchemy model to domain entity with enhanced metadata"""
         # Create enhanced metadata object
@@ -323,3 +503,8 @@ class PostgreSQLAdapter(IDatabaseAdapter):
         """Drop database tables (for testing/cleanup)"""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
+
+
+def _ts_query(term: str) -> ColumnElement:
+    """tsquery requiring every word of the term"""
+    return func.plainto_tsquery(TEXT_SEARCH_CONFIG, term)
@@ -0,0 +1,200 @@
+"""
+PostgreSQL adapter for Error Report Rollup repository
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from error_reporting_service.domain.entities.error_report import (
+    AudioQuality,
+    BackgroundNoise,
+    BucketType,
+    EnhancedMetadata,
+    ErrorReport,
+    NumberOfSpeakers,
+    SpeakerClarity,
+)
+from error_reporting_service.domain.ports.error_report_rollup_repository import (
+    ErrorReportRollupRepository,
+)
+from error_reporting_service.domain.value_objects.error_report_rollup import (
+    ErrorReportRollup,
+    RollupGranularity,
+)
+from error_reporting_service.infrastructure.adapters.database.postgresql.models import (
+    ErrorReportModel,
+    ErrorReportRollupModel,
+)
+
+# Columns identifying a rollup row besides its period, shared with error_reports
+DIMENSION_COLUMNS = [
+    "bucket_type",
+    "client_id",
+    "audio_quality",
+    "speaker_clarity",
+    "background_noise",
+    "number_of_speakers",
+    "overlapping_speech",
+    "requires_specialized_knowledge",
+]
+
+# SQLite stores DateTime as text in this format (used when testing on SQLite)
+SQLITE_PERIOD_FORMATS = {
+    RollupGranularity.HOUR: "%Y-%m-%d %H:00:00.000000",
+    RollupGranularity.DAY: "%Y-%m-%d 00:00:00.000000",
+}
+
+
+class PostgreSQLErrorReportRollupRepository(ErrorReportRollupRepository):
+    """PostgreSQL implementation of Error Report Rollup repository"""
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+    async def add_reports(self, error_reports: List[ErrorReport]) -> None:
+        """Increment hourly and daily rollups with one upsert"""
+        rollups = ErrorReportRollup.from_reports(
+            error_reports, RollupGranularity.HOUR
+        ) + ErrorReportRollup.from_reports(error_reports, RollupGranularity.DAY)
+        if not rollups:
+            return
+
+        async with self._session_factory() as session:
+            upsert = self._insert(session)
+            stmt = upsert.on_conflict_do_update(
+                index_elements=["granularity", "period_start", *DIMENSION_COLUMNS],
+                set_={
+                    "error_count": ErrorReportRollupModel.error_count
+                    + upsert.excluded.error_count
+                },
+            )
+            await session.execute(stmt, [self._entity_to_values(r) for r in rollups])
+            await session.commit()
+
+    async def get_rollups(
+        self,
+        granularity: RollupGranularity,
+        period_from: datetime,
+        period_to: datetime,
+    ) -> List[ErrorReportRollup]:
+        """Get rollups of one granularity within a period range"""
+        async with self._session_factory() as session:
+            stmt = select(ErrorReportRollupModel).where(
+                ErrorReportRollupModel.granularity == granularity.value,
+                ErrorReportRollupModel.period_start >= period_from,
+                ErrorReportRollupModel.period_start < period_to,
+            )
+
+            result = await session.execute(stmt)
+            models = result.scalars().all()
+
+            return [self._model_to_entity(model) for model in models]
+
+    async def rebuild(self, date_from: datetime, date_to: datetime) -> int:
+        """Replace rollups for whole days from error_reports in one transaction"""
+        day_from = RollupGranularity.DAY.truncate(date_from)
+        day_to = RollupGranularity.DAY.truncate(date_to)
+        if day_to < date_to:
+            day_to += timedelta(days=1)
+
+        in_range = (
+            ErrorReportModel.reported_at >= day_from,
+            ErrorReportModel.reported_at < day_to,
+        )
+        dimensions = [getattr(ErrorReportModel, name) for name in DIMENSION_COLUMNS]
+
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(ErrorReportRollupModel).where(
+                    ErrorReportRollupModel.period_start >= day_from,
+                    ErrorReportRollupModel.period_start < day_to,
+                )
+            )
+
+            for granularity in RollupGranularity:
+                period_start = self._period_start(session, granularity)
+                counts = (
+                    select(
+                        literal(
+                            granularity.value, ErrorReportRollupModel.granularity.type
+                        ),
+                        period_start,
+                        *dimensions,
+                        func.count(),
+                    )
+                    .where(*in_range)
+                    .group_by(period_start, *dimensions)
+                )
+                await session.execute(
+                    insert(ErrorReportRollupModel).from_select(
+                        [
+                            "granularity",
+                            "period_start",
+                            *DIMENSION_COLUMNS,
+                            "error_count",
+                        ],
+                        counts,
+                    )
+                )
+
+            counted = await session.execute(
+                select(func.count()).select_from(ErrorReportModel).where(*in_range)
+            )
+            await session.commit()
+
+            return counted.scalar_one()
+
+    @staticmethod
+    def _insert(session: AsyncSession):
+        """Dialect-specific INSERT supporting ON CONFLICT"""
+        if session.bind.dialect.name == "sqlite":
+            return sqlite.insert(ErrorReportRollupModel)
+        return postgresql.insert(ErrorReportRollupModel)
+
+    @staticmethod
+    def _period_start(session: AsyncSession, granularity: RollupGranularity):
+        """reported_at truncated to the start of its period"""
+        if session.bind.dialect.name == "sqlite":
+            return func.strftime(
+                SQLITE_PERIOD_FORMATS[granularity], ErrorReportModel.reported_at
+            )
+        return func.date_trunc(granularity.value, ErrorReportModel.reported_at)
+
+    def _entity_to_values(self, rollup: ErrorReportRollup) -> Dict[str, Any]:
+        """Convert domain value object to rollup row values"""
+        metadata = rollup.enhanced_metadata
+        return {
+            "granularity": rollup.granularity.value,
+            "period_start": rollup.period_start,
+            "bucket_type": rollup.bucket_type.value,
+            "client_id": rollup.client_id,
+            "audio_quality": metadata.audio_quality.value,
+            "speaker_clarity": metadata.speaker_clarity.value,
+            "background_noise": metadata.background_noise.value,
+            "number_of_speakers": metadata.number_of_speakers.value,
+            "overlapping_speech": metadata.overlapping_speech,
+            "requires_specialized_knowledge": metadata.requires_specialized_knowledge,
+            "error_count": rollup.error_count,
+        }
+
+    def _model_to_entity(self, model: ErrorReportRollupModel) -> ErrorReportRollup:
+        """Convert SQLAlchemy model to domain value object"""
+        return ErrorReportRollup(
+            granularity=RollupGranularity(model.granularity),
+            period_start=model.period_start,
+            bucket_type=BucketType(model.bucket_type),
+            client_id=model.client_id,
+            enhanced_metadata=EnhancedMetadata(
+                audio_quality=AudioQuality(model.audio_quality),
+                speaker_clarity=SpeakerClarity(model.speaker_clarity),
+                background_noise=BackgroundNoise(model.background_noise),
+                number_of_speakers=NumberOfSpeakers(model.number_of_speakers),
+                overlapping_speech=model.overlapping_speech,
+                requires_specialized_knowledge=model.requires_specialized_knowledge,
+            ),
+            error_count=model.error_count,
+        )
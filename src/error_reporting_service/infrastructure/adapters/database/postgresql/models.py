@@ -7,8 +7,22 @@ This module contains SQLAlchemy ORM models for the PostgreSQL database.
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    literal_column,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -61,6 +75,87 @@ class ErrorReportModel(Base):
     audit_logs = relationship("ErrorAuditLogModel", back_populates="error_report")
     validations = relationship("ErrorValidationModel", back_populates="error_report")
 
+    __table_args__ = (
+        # Keyset pagination order for search (see PostgreSQLAdapter._paginate)
+        Index("idx_error_reports_reported_at_error_id", "reported_at", "error_id"),
+        # A speaker's reports by status, newest first in keyset order
+        Index(
+            "idx_error_reports_speaker_status_reported_at",
+            "speaker_id",
+            "status",
+            "reported_at",
+            "error_id",
+        ),
+        # Dashboard bucket breakdowns over a reporting window
+        Index("idx_error_reports_bucket_type_reported_at", "bucket_type", "reported_at"),
+    )
+
+
+# Text search configuration for error report text. "simple" lowercases words
+# without stemming or stop words, so matches agree with the in-memory
+# adapter's word index and medical terms are not altered by English stemming.
+TEXT_SEARCH_CONFIG = "simple"
+
+# Generated tsvector over original and corrected text. It only exists on
+# PostgreSQL (created below and by SQL migration 003), so it is not a
+# mapped column and the table can still be created on other dialects.
+SEARCH_VECTOR = literal_column("error_reports.search_vector", TSVECTOR)
+
+ERROR_REPORT_SEARCH_DDL = [
+    f"""
+    ALTER TABLE error_reports ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('{TEXT_SEARCH_CONFIG}',
+                    coalesce(original_text, '') || ' ' || coalesce(corrected_text, ''))
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_error_reports_search_vector "
+    "ON error_reports USING gin (search_vector)",
+    # Trigram indexes serve ILIKE '%term%' substring matches when pg_trgm is available
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+            CREATE INDEX IF NOT EXISTS idx_error_reports_original_text_trgm
+                ON error_reports USING gin (original_text gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_error_reports_corrected_text_trgm
+                ON error_reports USING gin (corrected_text gin_trgm_ops);
+        END IF;
+    END
+    $$
+    """,
+]
+
+for _statement in ERROR_REPORT_SEARCH_DDL:
+    event.listen(
+        ErrorReportModel.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+
+
+class ErrorReportRollupModel(Base):
+    """SQLAlchemy model for hourly and daily error report counts"""
+
+    __tablename__ = "error_report_rollups"
+
+    # Period: granularity is "hour" or "day", period_start is truncated to it
+    granularity = Column(String(10), primary_key=True)
+    period_start = Column(DateTime, primary_key=True)
+
+    # Dimensions
+    bucket_type = Column(String(20), primary_key=True)
+    client_id = Column(UUID(as_uuid=True), primary_key=True)
+    audio_quality = Column(String(20), primary_key=True)
+    speaker_clarity = Column(String(30), primary_key=True)
+    background_noise = Column(String(20), primary_key=True)
+    number_of_speakers = Column(String(10), primary_key=True)
+    overlapping_speech = Column(Boolean, primary_key=True)
+    requires_specialized_knowledge = Column(Boolean, primary_key=True)
+
+    error_count = Column(Integer, nullable=False, default=0)
+
 
 class SpeakerBucketHistoryModel(Base):
     """SQLAlchemy model for speaker bucket history"""
@@ -84,6 +179,21 @@ class SpeakerBucketHistoryModel(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # A speaker's assignments in date order (history, current bucket)
+        Index(
+            "idx_speaker_bucket_history_speaker_assigned_date",
+            "speaker_id",
+            "assigned_date",
+        ),
+        # Assignment counts per bucket over a date range
+        Index(
+            "idx_speaker_bucket_history_bucket_assigned_date",
+            "bucket_type",
+            "assigned_date",
+        ),
+    )
+
 
 class SpeakerPerformanceMetricsModel(Base):
     """SQLAlchemy model for speaker performance metrics"""
@@ -108,7 +218,7 @@ class SpeakerPerformanceMetricsModel(Base):
 
     # Performance trends
     quality_trend = Column(String(20))
-    last_assessment_date = Column(DateTime)
+    last_assessment_date = Column(DateTime, index=True)
     next_assessment_date = Column(DateTime)
 
     # Time metrics (stored as total seconds)
@@ -118,6 +228,17 @@ class SpeakerPerformanceMetricsModel(Base):
     calculated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Declining speakers are few; together with the last_assessment_date
+        # index this lets reassessment queries use a bitmap OR of index scans
+        Index(
+            "idx_speaker_performance_metrics_declining",
+            "last_assessment_date",
+            postgresql_where=text("quality_trend = 'declining'"),
+            sqlite_where=text("quality_trend = 'declining'"),
+        ),
+    )
+
 
 class VerificationJobModel(Base):
     """SQLAlchemy model for verification jobs"""
@@ -151,6 +272,17 @@ class VerificationJobModel(Base):
     error_report = relationship("ErrorReportModel")
 
 
+class VerificationBatchCheckpointModel(Base):
+    """SQLAlchemy model for per-speaker progress of verification batches"""
+
+    __tablename__ = "verification_batch_checkpoints"
+
+    batch_id = Column(String(100), primary_key=True)
+    speaker_id = Column(String(100), primary_key=True)
+    result = Column(JSON, nullable=False)
+    completed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class ErrorAuditLogModel(Base):
     """SQLAlchemy model for error audit logs"""
 
@@ -2,7 +2,7 @@
 PostgreSQL adapter for Speaker Bucket History repository
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 from uuid import UUID
 
@@ -116,7 +116,7 @@ class PostgreSQLSpeakerBucketHistoryRepository(SpeakerBucketHistoryRepository):
     ) -> List[SpeakerBucketHistory]:
         """Get recent bucket assignments"""
         async with self._session_factory() as session:
-            cutoff_date = datetime.utcnow() - datetime.timedelta(days=days)
+            cutoff_date = datetime.utcnow() - timedelta(days=days)
             
             stmt = select(SpeakerBucketHistoryModel).where(
                 SpeakerBucketHistoryModel.assigned_date >= cutoff_date
@@ -210,7 +210,7 @@ class PostgreSQLSpeakerBucketHistoryRepository(SpeakerBucketHistoryRepository):
     async def get_assignment_trends(self, days: int = 30) -> dict:
         """Get bucket assignment trends over time"""
         async with self._session_factory() as session:
-            cutoff_date = datetime.utcnow() - datetime.timedelta(days=days)
+            cutoff_date = datetime.utcnow() - timedelta(days=days)
             
             stmt = select(
                 func.date_trunc('day', SpeakerBucketHistoryModel.assigned_date).label('date'),
@@ -0,0 +1,58 @@
+"""
+PostgreSQL adapter for Verification Batch Checkpoint repository
+"""
+
+from typing import Any, Dict
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from error_reporting_service.domain.ports.verification_batch_checkpoint_repository import (
+    VerificationBatchCheckpointRepository,
+)
+from error_reporting_service.infrastructure.adapters.database.postgresql.models import (
+    VerificationBatchCheckpointModel,
+)
+
+
+class PostgreSQLVerificationBatchCheckpointRepository(
+    VerificationBatchCheckpointRepository
+):
+    """PostgreSQL implementation of Verification Batch Checkpoint repository"""
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+    async def save_speaker_result(
+        self, batch_id: str, speaker_id: str, result: Dict[str, Any]
+    ) -> None:
+        """Upsert the speaker's checkpoint"""
+        async with self._session_factory() as session:
+            upsert = self._insert(session).values(
+                batch_id=batch_id, speaker_id=speaker_id, result=result
+            )
+            stmt = upsert.on_conflict_do_update(
+                index_elements=["batch_id", "speaker_id"],
+                set_={"result": upsert.excluded.result},
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_completed_speakers(self, batch_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get the recorded result of every completed speaker of the batch"""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(
+                    VerificationBatchCheckpointModel.speaker_id,
+                    VerificationBatchCheckpointModel.result,
+                ).where(VerificationBatchCheckpointModel.batch_id == batch_id)
+            )
+            return {speaker_id: speaker_result for speaker_id, speaker_result in result}
+
+    @staticmethod
+    def _insert(session: AsyncSession):
+        """Dialect-specific INSERT supporting ON CONFLICT"""
+        if session.bind.dialect.name == "sqlite":
+            return sqlite.insert(VerificationBatchCheckpointModel)
+        return postgresql.insert(VerificationBatchCheckpointModel)
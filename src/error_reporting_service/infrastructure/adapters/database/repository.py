@@ -0,0 +1,74 @@
+"""
+Database-backed Error Report Repository
+
+Implements the ErrorReportRepository port on top of any IDatabaseAdapter,
+so use cases can persist through whichever database adapter is configured.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from error_reporting_service.application.ports.secondary.repository_port import (
+    ErrorReportRepository,
+)
+from error_reporting_service.domain.entities.error_report import ErrorReport
+from error_reporting_service.infrastructure.adapters.database.abstract.database_adapter import (
+    IDatabaseAdapter,
+)
+
+
+class DatabaseErrorReportRepository(ErrorReportRepository):
+    """Error report repository delegating to a database adapter."""
+
+    def __init__(self, db_adapter: IDatabaseAdapter):
+        """
+        Initialize the repository.
+
+        Args:
+            db_adapter: Database adapter used for persistence
+        """
+        self._db_adapter = db_adapter
+
+    async def save(self, error_report: ErrorReport) -> ErrorReport:
+        return await self._db_adapter.save_error_report(error_report)
+
+    async def save_many(self, error_reports: List[ErrorReport]) -> List[ErrorReport]:
+        return await self._db_adapter.save_error_reports(error_reports)
+
+    async def find_by_id(self, error_id: UUID) -> Optional[ErrorReport]:
+        return await self._db_adapter.find_error_by_id(error_id)
+
+    async def find_by_speaker(
+        self, speaker_id: UUID, filters: Optional[Dict[str, Any]] = None
+    ) -> List[ErrorReport]:
+        return await self._db_adapter.find_errors_by_speaker(speaker_id, filters)
+
+    async def find_by_job(
+        self, job_id: UUID, filters: Optional[Dict[str, Any]] = None
+    ) -> List[ErrorReport]:
+        return await self._db_adapter.find_errors_by_job(job_id, filters)
+
+    async def update(self, error_id: UUID, updates: Dict[str, Any]) -> ErrorReport:
+        return await self._db_adapter.update_error_report(error_id, updates)
+
+    async def delete(self, error_id: UUID) -> bool:
+        return await self._db_adapter.delete_error_report(error_id)
+
+    async def search(
+        self, criteria: Dict[str, Any], page: int = 1, limit: int = 20
+    ) -> List[ErrorReport]:
+        query = dict(criteria)
+        query.setdefault("limit", limit)
+        query.setdefault("offset", (page - 1) * limit)
+        return await self._db_adapter.search_errors(query)
+
+    async def search_page(
+        self, criteria: Dict[str, Any]
+    ) -> Tuple[List[ErrorReport], Optional[int]]:
+        return await self._db_adapter.search_errors_page(criteria)
+
+    async def count(self, criteria: Optional[Dict[str, Any]] = None) -> int:
+        # Any page carries the total; fetch the smallest non-empty one
+        query = dict(criteria or {}, limit=1, include_total=True)
+        _, total = await self._db_adapter.search_errors_page(query)
+        return total
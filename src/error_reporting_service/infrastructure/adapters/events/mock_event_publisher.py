@@ -4,6 +4,8 @@ Mock Event Publisher Implementation
 Simple mock implementation of the EventPublisher interface for testing and development.
 """
 
+from typing import List
+
 from error_reporting_service.application.ports.secondary.event_publisher_port import EventPublisher
 from error_reporting_service.domain.events.domain_events import (
     ErrorDeletedEvent,
@@ -38,6 +40,19 @@ class MockEventPublisher(EventPublisher):
         })
         print(f"Mock: Published error reported event for error {event.error_id}")
 
+    async def publish_errors_reported(self, events: List[ErrorReportedEvent]) -> None:
+        """
+        Publish a batch of error reported events (mock implementation).
+
+        Args:
+            events: The error reported events to publish
+        """
+        self._published_events.extend(
+            {"type": "error_reported", "event": event, "timestamp": event.timestamp}
+            for event in events
+        )
+        print(f"Mock: Published {len(events)} error reported events")
+
     async def publish_error_updated(self, event: ErrorUpdatedEvent) -> None:
         """
         Publish an error updated event (mock implementation).
@@ -6,16 +6,21 @@ Handles HTTP requests and responses for error reporting operations.
 """
 
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from error_reporting_service.application.dto.requests import (
+    EnhancedMetadataRequest,
     GetErrorReportRequest,
+    PageCursor,
     SearchErrorsRequest,
     SubmitErrorReportRequest,
+    SubmitErrorReportsBulkRequest,
 )
 from error_reporting_service.application.dto.responses import (
+    BulkSubmissionItemResult,
     GetErrorReportResponse,
     SearchErrorsResponse,
     SubmitErrorReportResponse,
@@ -23,6 +28,16 @@ from error_reporting_service.application.dto.responses import (
 from error_reporting_service.application.use_cases.submit_error_report import (
     SubmitErrorReportUseCase,
 )
+from error_reporting_service.application.use_cases.submit_error_reports_bulk import (
+    SubmitErrorReportsBulkUseCase,
+)
+from error_reporting_service.infrastructure.adapters.database.factory import (
+    DatabaseAdapterFactory,
+)
+from error_reporting_service.infrastructure.adapters.database.repository import (
+    DatabaseErrorReportRepository,
+)
+from error_reporting_service.infrastructure.config.settings import settings
 from error_reporting_service.infrastructure.adapters.database.postgresql.adapter import (
     PostgreSQLAdapter,
 )
@@ -156,11 +171,27 @@ bucket_evaluation_use_case = EvaluateBucketProgressionUseCase(
     progression_service=progression_service
 )
 
+# Bulk submission persists through the configured database adapter
+_bulk_submit_use_case: Optional[SubmitErrorReportsBulkUseCase] = None
+
 # Placeholder dependency for authentication
 async def get_current_user():
     """Get current authenticated user (placeholder)"""
     return {"user_id": str(uuid.uuid4()), "username": "test_user"}
 
+async def get_bulk_submit_use_case() -> SubmitErrorReportsBulkUseCase:
+    """Get the bulk submission use case, creating its adapters on first use"""
+    global _bulk_submit_use_case
+    if _bulk_submit_use_case is None:
+        db_adapter = await DatabaseAdapterFactory.create(settings.database)
+        _bulk_submit_use_case = SubmitErrorReportsBulkUseCase(
+            repository=DatabaseErrorReportRepository(db_adapter),
+            event_publisher=MockEventPublisher(),
+            validation_service=ErrorValidationService(),
+            categorization_service=ErrorCategorizationService(),
+        )
+    return _bulk_submit_use_case
+
 # Helper function to generate error report ID
 def generate_error_id():
     """Generate a unique error report ID"""
@@ -255,6 +286,116 @@ async def submit_error_report(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/errors/bulk")
+async def submit_error_reports_bulk(
+    request_data: dict,
+    chunk_size: int = 1000,
+    current_user: dict = Depends(get_current_user),
+    use_case: SubmitErrorReportsBulkUseCase = Depends(get_bulk_submit_use_case),
+) -> dict:
+    """
+    Submit a batch of error reports.
+
+    Body: {"reports": [...]} where each report has the fields of a single
+    submission plus an "enhanced_metadata" object. Reports are validated in
+    one pass and saved chunk_size at a time; the response gives the outcome
+    of each report by its position in the batch.
+
+    Args:
+        request_data: Bulk submission data with a "reports" list
+        chunk_size: Number of reports persisted per database write
+        current_user: Current authenticated user
+
+    Returns:
+        Totals and per-report results
+    """
+    reports = request_data.get("reports")
+    if not isinstance(reports, list):
+        raise HTTPException(status_code=400, detail="reports must be a list")
+    if chunk_size <= 0:
+        raise HTTPException(status_code=400, detail="chunk_size must be positive")
+
+    results: List[Optional[BulkSubmissionItemResult]] = [None] * len(reports)
+    positions: List[int] = []
+    report_requests: List[SubmitErrorReportRequest] = []
+    for index, item in enumerate(reports):
+        try:
+            report_requests.append(
+                _bulk_report_request(item, current_user["user_id"])
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            results[index] = BulkSubmissionItemResult(
+                index=index, status="failed", error=f"Invalid report: {e}"
+            )
+            continue
+        positions.append(index)
+
+    try:
+        response = await use_case.execute(
+            SubmitErrorReportsBulkRequest(
+                reports=report_requests, chunk_size=chunk_size
+            )
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    # Map use case results back to positions in the submitted batch
+    for result in response.results:
+        index = positions[result.index]
+        results[index] = BulkSubmissionItemResult(
+            index=index,
+            status=result.status,
+            error_id=result.error_id,
+            error=result.error,
+        )
+
+    return {
+        "total": len(results),
+        "succeeded": response.succeeded,
+        "failed": len(results) - response.succeeded,
+        "results": [
+            {
+                "index": result.index,
+                "status": result.status,
+                "errorId": result.error_id,
+                "error": result.error,
+            }
+            for result in results
+        ],
+    }
+
+
+def _bulk_report_request(item: Dict[str, Any], reported_by: str) -> SubmitErrorReportRequest:
+    """Build a submission request from one report of a bulk body"""
+    enhanced_metadata = item.get("enhanced_metadata") or {}
+    return SubmitErrorReportRequest(
+        job_id=item["job_id"],
+        speaker_id=item["speaker_id"],
+        client_id=item.get("client_id") or item.get("metadata", {})["client_id"],
+        original_text=item["original_text"],
+        corrected_text=item["corrected_text"],
+        error_categories=item.get("error_categories", []),
+        severity_level=item.get("severity_level", "medium"),
+        start_position=item.get("start_position", 0),
+        end_position=item.get("end_position", 0),
+        reported_by=item.get("reported_by", reported_by),
+        bucket_type=item.get("bucket_type", "medium_touch"),
+        enhanced_metadata=EnhancedMetadataRequest(
+            audio_quality=enhanced_metadata.get("audio_quality", "good"),
+            speaker_clarity=enhanced_metadata.get("speaker_clarity", "clear"),
+            background_noise=enhanced_metadata.get("background_noise", "none"),
+            number_of_speakers=enhanced_metadata.get("number_of_speakers", "one"),
+            overlapping_speech=enhanced_metadata.get("overlapping_speech", False),
+            requires_specialized_knowledge=enhanced_metadata.get(
+                "requires_specialized_knowledge", False
+            ),
+            additional_notes=enhanced_metadata.get("additional_notes"),
+        ),
+        context_notes=item.get("context_notes"),
+        metadata=item.get("metadata", {}),
+    )
+
+
 @router.get("/errors/{error_id}")
 async def get_error_report(
     error_id: str, current_user: dict = Depends(get_current_user)
@@ -390,19 +531,26 @@ async def search_errors(
     search: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     current_user: dict = Depends(get_current_user),
 ) -> dict:
     """
     Search error reports.
 
+    Results are ordered newest first. Pass the returned next_cursor as
+    `cursor` to fetch the following page by keyset instead of by number.
+
     Args:
-        page: Page number
+        page: Page number (ignored when cursor is given)
         size: Page size
         severity_level: Filter by severity level
         categories: Filter by categories
         job_id: Filter by job ID
         speaker_id: Filter by speaker ID
         status: Filter by status
+        cursor: Opaque cursor from the previous page's next_cursor
+        include_total: Whether to compute the total match count
         current_user: Current authenticated user
 
     Returns:
@@ -436,11 +584,42 @@ async def search_errors(
                           or search_lower in r.get("id", "").lower()]
 
     # Apply pagination
+    filtered_reports.sort(key=_report_keyset, reverse=True)
     total = len(filtered_reports)
-    start_idx = (page - 1) * size
-    end_idx = start_idx + size
-    items = filtered_reports[start_idx:end_idx]
+    if cursor:
+        try:
+            position = PageCursor.decode(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+        after = (position.reported_at, position.error_id)
+        items = [r for r in filtered_reports if _report_keyset(r) < after][:size]
+    else:
+        start_idx = (page - 1) * size
+        end_idx = start_idx + size
+        items = filtered_reports[start_idx:end_idx]
+
+    next_cursor = None
+    if len(items) == size:
+        reported_at, report_id = _report_keyset(items[-1])
+        next_cursor = PageCursor(
+            reported_at=reported_at, error_id=report_id, total=total
+        ).encode()
+
+    if not include_total:
+        total = None
+    pages = (total + size - 1) // size if total is not None and size > 0 else 0
+
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "size": size,
+        "pages": pages,
+        "next_cursor": next_cursor,
+    }
 
-    pages = (total + size - 1) // size if size > 0 else 0
 
-    return {"items": items, "total": total, "page": page, "size": size, "pages": pages}
+def _report_keyset(report: dict) -> Tuple[datetime, str]:
+    """(created_at, id) sort key used for keyset pagination of stored reports"""
+    created_at = datetime.fromisoformat(report["created_at"].replace("Z", "+00:00"))
+    return created_at, report["id"]
@@ -6,9 +6,11 @@ error pattern matching, and speaker profiling.
 """
 
 import asyncio
+import functools
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from uuid import UUID, uuid4
 
 import numpy as np
@@ -29,6 +31,20 @@ class VectorDatabaseConfig(BaseModel):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     vector_size: int = Field(default=768, description="Vector embedding size")
     distance_metric: str = Field(default="cosine", description="Distance metric for similarity")
+    scroll_page_size: int = Field(default=1000, description="Points fetched per scroll page")
+    write_batch_size: int = Field(default=256, description="Maximum points per bulk upsert")
+    write_flush_interval: float = Field(default=0.5, description="Maximum seconds a buffered point waits before flushing")
+    write_buffer_max_size: int = Field(default=10000, description="Buffered points before enqueueing applies backpressure")
+    write_max_retries: int = Field(default=3, description="Retries of a failed buffered upsert before its points are reported")
+    write_retry_backoff: float = Field(default=0.2, description="Seconds before the first retry of a buffered upsert, doubling per retry")
+
+
+class BufferedWriteError(Exception):
+    """Buffered error embeddings could not be written to the vector database"""
+    
+    def __init__(self, points: List[PointStruct]):
+        self.points = points
+        super().__init__(f"Failed to write {len(points)} buffered error embeddings")
 
 
 class ErrorEmbedding(BaseModel):
@@ -68,14 +84,32 @@ class SimilarityResult(BaseModel):
     metadata: Dict[str, Any] = Field(..., description="Additional metadata")
 
 
+# Payload fields read by analyze_error_trends; other fields are not transferred
+TREND_PAYLOAD_FIELDS = [
+    "bucket_type",
+    "error_categories",
+    "complexity_score",
+    "audio_quality",
+    "speaker_clarity",
+    "overlapping_speech",
+    "requires_specialized_knowledge",
+]
+
+
 class EnhancedVectorDatabaseService:
     """Service for enhanced vector database operations"""
 
-    def __init__(self, config: VectorDatabaseConfig):
+    def __init__(self, config: VectorDatabaseConfig, client: Optional[QdrantClient] = None):
         self.config = config
-        self.client: Optional[QdrantClient] = None
+        self.client: Optional[QdrantClient] = client
+        self._collections_ready = False
         self.collection_name = "error_embeddings"
         self.speaker_collection_name = "speaker_profiles"
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._failed_points: List[PointStruct] = []
+        self.failed_writes = 0
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -95,23 +129,41 @@ class EnhancedVectorDatabaseService:
                 api_key=self.config.api_key,
                 timeout=self.config.timeout
             )
+        if not self._collections_ready:
             await self._ensure_collections()
+            self._collections_ready = True
 
     async def _close_client(self):
-        """Close Qdrant client"""
-        if self.client:
-            self.client.close()
-            self.client = None
+        """
+        Flush buffered writes and close Qdrant client.
+        
+        Raises:
+            BufferedWriteError: If buffered points could not be written; the
+                client is closed regardless
+        """
+        try:
+            await self._stop_write_buffer()
+        finally:
+            if self.client:
+                await self._run_sync(self.client.close)
+                self.client = None
+                self._collections_ready = False
+
+    async def _run_sync(self, func, *args, **kwargs):
+        """Run a blocking Qdrant client call in the default executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
     async def _ensure_collections(self):
         """Ensure required collections exist"""
         try:
             # Create error embeddings collection
-            collections = self.client.get_collections().collections
+            collections = (await self._run_sync(self.client.get_collections)).collections
             collection_names = [c.name for c in collections]
             
             if self.collection_name not in collection_names:
-                self.client.create_collection(
+                await self._run_sync(
+                    self.client.create_collection,
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
                         size=self.config.vector_size,
@@ -122,7 +174,8 @@ class EnhancedVectorDatabaseService:
             
             # Create speaker profiles collection
             if self.speaker_collection_name not in collection_names:
-                self.client.create_collection(
+                await self._run_sync(
+                    self.client.create_collection,
                     collection_name=self.speaker_collection_name,
                     vectors_config=VectorParams(
                         size=self.config.vector_size,
@@ -148,33 +201,7 @@ class EnhancedVectorDatabaseService:
         await self._ensure_client()
         
         try:
-            point = PointStruct(
-                id=str(uuid4()),
-                vector=error_embedding.embedding_vector,
-                payload={
-                    "error_id": error_embedding.error_id,
-                    "speaker_id": error_embedding.speaker_id,
-                    "client_id": error_embedding.client_id,
-                    "bucket_type": error_embedding.bucket_type,
-                    "error_categories": error_embedding.error_categories,
-                    "original_text": error_embedding.original_text,
-                    "corrected_text": error_embedding.corrected_text,
-                    "audio_quality": error_embedding.audio_quality,
-                    "speaker_clarity": error_embedding.speaker_clarity,
-                    "background_noise": error_embedding.background_noise,
-                    "number_of_speakers": error_embedding.number_of_speakers,
-                    "overlapping_speech": error_embedding.overlapping_speech,
-                    "requires_specialized_knowledge": error_embedding.requires_specialized_knowledge,
-                    "complexity_score": error_embedding.complexity_score,
-                    "created_at": error_embedding.created_at.isoformat(),
-                    "updated_at": error_embedding.updated_at.isoformat(),
-                }
-            )
-            
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=[point]
-            )
+            await self._upsert_points([self._to_point(error_embedding)])
             
             logger.info(f"Stored error embedding for error {error_embedding.error_id}")
             return True
@@ -183,6 +210,189 @@ class EnhancedVectorDatabaseService:
             logger.error(f"Failed to store error embedding: {e}")
             return False
 
+    async def store_error_embeddings_batch(
+        self,
+        error_embeddings: Iterable[ErrorEmbedding],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Store error embeddings with bulk upserts.
+        
+        Args:
+            error_embeddings: Error embeddings to store
+            batch_size: Points per upsert (defaults to config.write_batch_size)
+            
+        Returns:
+            Number of embeddings stored successfully
+        """
+        await self._ensure_client()
+        
+        batch_size = batch_size or self.config.write_batch_size
+        points = [self._to_point(embedding) for embedding in error_embeddings]
+        stored = 0
+        
+        for start in range(0, len(points), batch_size):
+            batch = points[start:start + batch_size]
+            try:
+                await self._upsert_points(batch)
+                stored += len(batch)
+            except Exception as e:
+                logger.error(f"Failed to store batch of {len(batch)} error embeddings: {e}")
+        
+        logger.info(f"Stored {stored} of {len(points)} error embeddings")
+        return stored
+
+    async def enqueue_error_embedding(self, error_embedding: ErrorEmbedding) -> None:
+        """
+        Buffer an error embedding for a write-behind bulk upsert.
+        
+        Buffered points are flushed when write_batch_size points have
+        accumulated or write_flush_interval has elapsed, whichever comes
+        first. When write_buffer_max_size points are pending this waits for
+        the buffer to drain, so producers slow down instead of growing memory.
+        Failed upserts are retried with backoff; points that still cannot be
+        written are reported by flush().
+        
+        Args:
+            error_embedding: Error embedding to store
+        """
+        await self._ensure_client()
+        self._start_write_buffer()
+        await self._write_queue.put(self._to_point(error_embedding))
+        
+        if self._write_queue.qsize() >= self.config.write_batch_size or self._write_queue.full():
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        """
+        Write buffered embeddings now and wait until they are stored.
+        
+        Raises:
+            BufferedWriteError: If buffered points could not be written after
+                retrying. The error carries those points, which are no longer
+                buffered, so the caller can store them again.
+        """
+        if self._write_queue is not None:
+            self._flush_requested.set()
+            await self._write_queue.join()
+        
+        if self._failed_points:
+            failed, self._failed_points = self._failed_points, []
+            raise BufferedWriteError(failed)
+
+    def _start_write_buffer(self):
+        """Start the background flusher on first use"""
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue(maxsize=self.config.write_buffer_max_size)
+            self._flush_requested = asyncio.Event()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _stop_write_buffer(self):
+        """Drain buffered writes and stop the background flusher"""
+        if self._flush_task is None:
+            return
+        
+        try:
+            if not self._flush_task.done():
+                await self.flush()
+        finally:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+    async def _flush_loop(self):
+        """Coalesce buffered points by size and time window and upsert them"""
+        loop = asyncio.get_running_loop()
+        queue = self._write_queue
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.config.write_flush_interval
+            
+            # Wait for a full batch, an explicit flush or the end of the window
+            while True:
+                while not queue.empty() and len(batch) < self.config.write_batch_size:
+                    batch.append(queue.get_nowait())
+                remaining = deadline - loop.time()
+                if (
+                    len(batch) >= self.config.write_batch_size
+                    or remaining <= 0
+                    or self._flush_requested.is_set()
+                ):
+                    break
+                try:
+                    await asyncio.wait_for(self._flush_requested.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            
+            if queue.empty():
+                self._flush_requested.clear()
+            
+            try:
+                await self._upsert_with_retry(batch)
+                logger.debug(f"Flushed {len(batch)} buffered error embeddings")
+            except Exception as e:
+                # Kept for flush() to report instead of being dropped
+                self._failed_points.extend(batch)
+                self.failed_writes += len(batch)
+                logger.error(f"Failed to flush {len(batch)} buffered error embeddings: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _upsert_with_retry(self, points: List[PointStruct]):
+        """Upsert points, retrying failures with bounded exponential backoff"""
+        for attempt in range(self.config.write_max_retries + 1):
+            try:
+                await self._upsert_points(points)
+                return
+            except Exception as e:
+                if attempt == self.config.write_max_retries:
+                    raise
+                delay = self.config.write_retry_backoff * 2 ** attempt
+                logger.warning(
+                    f"Upsert of {len(points)} buffered error embeddings failed, "
+                    f"retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _upsert_points(self, points: List[PointStruct]):
+        """Upsert points without blocking the event loop"""
+        await self._run_sync(
+            self.client.upsert,
+            collection_name=self.collection_name,
+            points=points
+        )
+
+    def _to_point(self, error_embedding: ErrorEmbedding) -> PointStruct:
+        """Convert an error embedding to a Qdrant point"""
+        return PointStruct(
+            id=str(uuid4()),
+            vector=error_embedding.embedding_vector,
+            payload={
+                "error_id": error_embedding.error_id,
+                "speaker_id": error_embedding.speaker_id,
+                "client_id": error_embedding.client_id,
+                "bucket_type": error_embedding.bucket_type,
+                "error_categories": error_embedding.error_categories,
+                "original_text": error_embedding.original_text,
+                "corrected_text": error_embedding.corrected_text,
+                "audio_quality": error_embedding.audio_quality,
+                "speaker_clarity": error_embedding.speaker_clarity,
+                "background_noise": error_embedding.background_noise,
+                "number_of_speakers": error_embedding.number_of_speakers,
+                "overlapping_speech": error_embedding.overlapping_speech,
+                "requires_specialized_knowledge": error_embedding.requires_specialized_knowledge,
+                "complexity_score": error_embedding.complexity_score,
+                "created_at": error_embedding.created_at.isoformat(),
+                "updated_at": error_embedding.updated_at.isoformat(),
+            }
+        )
+
     async def find_similar_errors(
         self,
         query_vector: List[float],
@@ -223,7 +433,8 @@ class EnhancedVectorDatabaseService:
             search_filter = Filter(must=filter_conditions) if filter_conditions else None
             
             # Perform similarity search
-            search_results = self.client.search(
+            search_results = await self._run_sync(
+                self.client.search,
                 collection_name=self.collection_name,
                 query_vector=query_vector,
                 query_filter=search_filter,
@@ -313,7 +524,8 @@ class EnhancedVectorDatabaseService:
                 must=[FieldCondition(key="speaker_id", match=MatchValue(value=speaker_id))]
             )
             
-            search_results = self.client.scroll(
+            search_results = await self._run_sync(
+                self.client.scroll,
                 collection_name=self.collection_name,
                 scroll_filter=filter_condition,
                 limit=limit
@@ -383,69 +595,66 @@ class EnhancedVectorDatabaseService:
             
             search_filter = Filter(must=filter_conditions) if filter_conditions else None
             
-            # Get all matching points
-            search_results = self.client.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=search_filter,
-                limit=10000  # Large limit to get all results
-            )
+            total = 0
+            bucket_counts = Counter()
+            category_counts = Counter()
+            complexity_counts = Counter({"low": 0, "medium": 0, "high": 0})
+            audio_quality_counts = Counter()
+            speaker_clarity_counts = Counter()
+            overlapping_speech = 0
+            specialized_knowledge = 0
+            
+            # Follow next_page_offset so every matching point is counted
+            # while only one page of trimmed payloads is held at a time
+            page_offset = None
+            while True:
+                points, page_offset = await self._run_sync(
+                    self.client.scroll,
+                    collection_name=self.collection_name,
+                    scroll_filter=search_filter,
+                    limit=self.config.scroll_page_size,
+                    offset=page_offset,
+                    with_payload=TREND_PAYLOAD_FIELDS,
+                    with_vectors=False
+                )
+                payloads = [point.payload for point in points]
+                
+                total += len(payloads)
+                bucket_counts.update(p.get("bucket_type", "unknown") for p in payloads)
+                for payload in payloads:
+                    category_counts.update(payload.get("error_categories", []))
+                complexity_counts.update(
+                    self._complexity_level(p.get("complexity_score", 0)) for p in payloads
+                )
+                audio_quality_counts.update(p.get("audio_quality", "unknown") for p in payloads)
+                speaker_clarity_counts.update(p.get("speaker_clarity", "unknown") for p in payloads)
+                overlapping_speech += sum(1 for p in payloads if p.get("overlapping_speech", False))
+                specialized_knowledge += sum(
+                    1 for p in payloads if p.get("requires_specialized_knowledge", False)
+                )
+                
+                if page_offset is None:
+                    break
             
-            # Analyze trends
             trends = {
-                "total_errors": len(search_results[0]),
-                "bucket_distribution": {},
-                "category_distribution": {},
-                "complexity_distribution": {"low": 0, "medium": 0, "high": 0},
+                "total_errors": total,
+                "bucket_distribution": dict(bucket_counts),
+                "category_distribution": dict(category_counts),
+                "complexity_distribution": dict(complexity_counts),
                 "metadata_patterns": {
-                    "audio_quality": {},
-                    "speaker_clarity": {},
-                    "overlapping_speech_frequency": 0,
-                    "specialized_knowledge_frequency": 0,
+                    "audio_quality": dict(audio_quality_counts),
+                    "speaker_clarity": dict(speaker_clarity_counts),
+                    "overlapping_speech_frequency": overlapping_speech,
+                    "specialized_knowledge_frequency": specialized_knowledge,
                 }
             }
             
-            for point in search_results[0]:
-                payload = point.payload
-                
-                # Bucket distribution
-                bucket = payload.get("bucket_type", "unknown")
-                trends["bucket_distribution"][bucket] = trends["bucket_distribution"].get(bucket, 0) + 1
-                
-                # Category distribution
-                for category in payload.get("error_categories", []):
-                    trends["category_distribution"][category] = trends["category_distribution"].get(category, 0) + 1
-                
-                # Complexity distribution
-                complexity = payload.get("complexity_score", 0)
-                if complexity <= 2.0:
-                    trends["complexity_distribution"]["low"] += 1
-                elif complexity <= 4.0:
-                    trends["complexity_distribution"]["medium"] += 1
-                else:
-                    trends["complexity_distribution"]["high"] += 1
-                
-                # Metadata patterns
-                audio_quality = payload.get("audio_quality", "unknown")
-                trends["metadata_patterns"]["audio_quality"][audio_quality] = \
-                    trends["metadata_patterns"]["audio_quality"].get(audio_quality, 0) + 1
-                
-                speaker_clarity = payload.get("speaker_clarity", "unknown")
-                trends["metadata_patterns"]["speaker_clarity"][speaker_clarity] = \
-                    trends["metadata_patterns"]["speaker_clarity"].get(speaker_clarity, 0) + 1
-                
-                if payload.get("overlapping_speech", False):
-                    trends["metadata_patterns"]["overlapping_speech_frequency"] += 1
-                
-                if payload.get("requires_specialized_knowledge", False):
-                    trends["metadata_patterns"]["specialized_knowledge_frequency"] += 1
-            
             # Calculate percentages
-            total = trends["total_errors"]
             if total > 0:
                 trends["metadata_patterns"]["overlapping_speech_frequency"] = \
-                    (trends["metadata_patterns"]["overlapping_speech_frequency"] / total) * 100
+                    (overlapping_speech / total) * 100
                 trends["metadata_patterns"]["specialized_knowledge_frequency"] = \
-                    (trends["metadata_patterns"]["specialized_knowledge_frequency"] / total) * 100
+                    (specialized_knowledge / total) * 100
             
             logger.info(f"Analyzed trends for {total} errors")
             return trends
@@ -454,6 +663,15 @@ class EnhancedVectorDatabaseService:
             logger.error(f"Failed to analyze error trends: {e}")
             return {}
 
+    @staticmethod
+    def _complexity_level(complexity: float) -> str:
+        """Map a complexity score to its trend bucket"""
+        if complexity <= 2.0:
+            return "low"
+        elif complexity <= 4.0:
+            return "medium"
+        return "high"
+
     async def get_collection_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the vector database collections.
@@ -465,7 +683,7 @@ class EnhancedVectorDatabaseService:
         
         try:
             # Get collection info
-            collection_info = self.client.get_collection(self.collection_name)
+            collection_info = await self._run_sync(self.client.get_collection, self.collection_name)
             
             stats = {
                 "collection_name": self.collection_name,
@@ -492,7 +710,7 @@ class EnhancedVectorDatabaseService:
         """
         try:
             await self._ensure_client()
-            collections = self.client.get_collections()
+            collections = await self._run_sync(self.client.get_collections)
             return len(collections.collections) > 0
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -45,6 +45,8 @@ class BatchEmbeddingResponse:
     failure_count: int
     failures: List[Dict[str, Any]]
     status: str = "success"
+    cache_hit_ratio: float = 0.0
+    stage_timings: Optional[Dict[str, float]] = None
 
     def __post_init__(self):
         """Set default values and validate consistency."""
@@ -54,6 +56,9 @@ class BatchEmbeddingResponse:
         if not hasattr(self, "failures") or self.failures is None:
             object.__setattr__(self, "failures", [])
 
+        if self.stage_timings is None:
+            object.__setattr__(self, "stage_timings", {})
+
         # Validate consistency
         if self.success_count + self.failure_count != self.batch_size:
             raise ValueError("success_count + failure_count must equal batch_size")
@@ -319,6 +324,8 @@ class ErrorCorrectionPairResponse:
     has_context: bool
     suitable_for_training: bool
     created_at: Optional[datetime] = None
+    error_start_offset: Optional[int] = None
+    error_end_offset: Optional[int] = None
 
     def __post_init__(self):
         """Set default values."""
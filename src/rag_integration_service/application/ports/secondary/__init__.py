@@ -5,6 +5,7 @@ This module contains secondary ports (outbound) for the RAG integration service.
 """
 
 from .cache_port import CachePort
+from .historical_data_source_port import IHistoricalDataSourcePort
 from .ml_model_port import MLModelPort
 from .speaker_rag_repository_port import ISpeakerRAGRepositoryPort
 from .vector_storage_port import VectorStoragePort
@@ -14,4 +15,5 @@ __all__ = [
     "MLModelPort",
     "VectorStoragePort",
     "ISpeakerRAGRepositoryPort",
+    "IHistoricalDataSourcePort",
 ]
@@ -104,6 +104,37 @@ class CachePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_embeddings_batch(
+        self, text_hashes: List[str]
+    ) -> List[Optional[VectorEmbedding]]:
+        """
+        Retrieve many vector embeddings from cache with one multi-get.
+
+        Args:
+            text_hashes: Hashes of the texts
+
+        Returns:
+            List of embeddings in text_hashes order (None for misses)
+        """
+        pass
+
+    @abstractmethod
+    async def set_embeddings_batch(
+        self, embeddings: List[VectorEmbedding], ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Store many vector embeddings in cache with one multi-set.
+
+        Args:
+            embeddings: Embeddings to cache, keyed by their text hash
+            ttl: Time to live in seconds (optional)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+
     @abstractmethod
     async def get_search_results(self, query_hash: str) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,50 @@
+"""
+Historical Data Source Secondary Port
+
+Secondary port interface for reading a speaker's historical ASR data.
+This is a driven port that defines the contract for historical data adapters.
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from ...dto.requests import HistoricalDataItem
+
+
+class IHistoricalDataSourcePort(ABC):
+    """
+    Secondary port for reading speaker historical data.
+
+    Records must be returned in a stable order, so that an offset identifies
+    the same record across reads and interrupted jobs can resume from it.
+    """
+
+    @abstractmethod
+    async def count_records(self, speaker_id: UUID) -> Optional[int]:
+        """
+        Count the historical records of a speaker.
+
+        Args:
+            speaker_id: Speaker identifier
+
+        Returns:
+            Number of records, or None if the source cannot count cheaply
+        """
+        pass
+
+    @abstractmethod
+    def iterate_records(
+        self, speaker_id: UUID, start_offset: int = 0
+    ) -> AsyncIterator[HistoricalDataItem]:
+        """
+        Stream the historical records of a speaker in a stable order.
+
+        Args:
+            speaker_id: Speaker identifier
+            start_offset: Number of leading records to skip
+
+        Returns:
+            Async iterator over historical records
+        """
+        pass
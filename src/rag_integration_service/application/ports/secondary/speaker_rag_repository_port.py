@@ -7,7 +7,7 @@ Defines the contract for speaker RAG repository implementations.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ....domain.entities.speaker_error_correction_pair import SpeakerErrorCorrectionPair
@@ -266,6 +266,22 @@ class ISpeakerRAGRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def batch_link_embeddings_to_speaker(
+        self, speaker_id: UUID, links: List[Tuple[UUID, UUID]]
+    ) -> int:
+        """
+        Link many embeddings to a speaker and their error-correction pairs.
+
+        Args:
+            speaker_id: Speaker identifier
+            links: (embedding_id, error_correction_pair_id) tuples
+
+        Returns:
+            Number of links created
+        """
+        pass
+
     @abstractmethod
     async def get_speaker_embeddings(
         self, speaker_id: UUID, limit: Optional[int] = None
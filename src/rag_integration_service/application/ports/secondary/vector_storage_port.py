@@ -68,6 +68,19 @@ class VectorStoragePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_text_hashes(self, text_hashes: List[str]) -> Dict[str, UUID]:
+        """
+        Find stored embeddings by the hash of their source text.
+
+        Args:
+            text_hashes: Text hashes to look up
+
+        Returns:
+            Mapping of text hash to embedding ID for hashes already stored
+        """
+        pass
+
     @abstractmethod
     async def find_similar(
         self,
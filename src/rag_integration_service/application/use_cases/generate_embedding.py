@@ -8,17 +8,19 @@ It coordinates ML model operations, caching, and vector storage.
 import hashlib
 import time
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
 
-from ..dto.requests import EmbeddingRequest
-from ..dto.responses import EmbeddingResponse
+from ..dto.requests import BatchEmbeddingRequest, EmbeddingRequest
+from ..dto.responses import BatchEmbeddingResponse, EmbeddingResponse
 from ..ports.secondary.cache_port import CachePort
 from ..ports.secondary.ml_model_port import MLModelPort
 from ..ports.secondary.vector_storage_port import VectorStoragePort
 
+EMBEDDING_CACHE_TTL = 3600
+
 
 class GenerateEmbeddingUseCase:
     """
@@ -96,6 +98,191 @@ class GenerateEmbeddingUseCase:
         processing_time = time.time() - start_time
         return self._create_response(embedding, processing_time)
 
+    async def execute_batch(
+        self, request: BatchEmbeddingRequest
+    ) -> BatchEmbeddingResponse:
+        """
+        Execute the generate embedding use case for a batch of texts.
+
+        Texts are deduplicated by hash and looked up with a single cache
+        multi-get; only the misses are sent to the model, in chunks of
+        the model's maximum batch size, and the new embeddings are written
+        to the vector store and the cache in bulk.
+
+        Args:
+            request: Batch embedding generation request
+
+        Returns:
+            Response with one embedding per successfully processed input text,
+            the cache hit ratio and per-stage timings in seconds
+
+        Raises:
+            ValueError: If request is invalid
+            Exception: If vector storage fails
+        """
+        start_time = time.time()
+        stage_timings: Dict[str, float] = {}
+
+        # 1. Deduplicate texts by hash, keeping first occurrences in order
+        text_hashes = [
+            self._generate_text_hash(text, request.embedding_type)
+            for text in request.texts
+        ]
+        unique_texts: Dict[str, str] = {}
+        for text, text_hash in zip(request.texts, text_hashes):
+            unique_texts.setdefault(text_hash, text)
+
+        # 2. Look up every unique text with a single cache round trip
+        stage_start = time.time()
+        embeddings_by_hash = await self._get_batch_from_cache(list(unique_texts))
+        stage_timings["cache_lookup"] = time.time() - stage_start
+        cache_hits = len(embeddings_by_hash)
+
+        # 3. Generate embeddings for cache misses in model-sized chunks
+        misses = [
+            (text_hash, text)
+            for text_hash, text in unique_texts.items()
+            if text_hash not in embeddings_by_hash
+        ]
+        stage_start = time.time()
+        new_embeddings, chunk_failures = await self._generate_missing_embeddings(
+            misses, request
+        )
+        stage_timings["model_inference"] = time.time() - stage_start
+
+        # 4. Write new embeddings through to storage and cache in bulk
+        if new_embeddings:
+            stage_start = time.time()
+            await self._vector_storage.store_batch_embeddings(new_embeddings)
+            stage_timings["vector_storage"] = time.time() - stage_start
+
+            stage_start = time.time()
+            await self._cache_embeddings_batch(new_embeddings)
+            stage_timings["cache_write"] = time.time() - stage_start
+
+            embeddings_by_hash.update(
+                (embedding.text_hash, embedding) for embedding in new_embeddings
+            )
+
+        # 5. Map results back onto the original (possibly duplicated) texts
+        embeddings = []
+        failures = []
+        for index, text_hash in enumerate(text_hashes):
+            if text_hash in embeddings_by_hash:
+                embeddings.append(embeddings_by_hash[text_hash])
+            else:
+                failures.append(
+                    {
+                        "index": index,
+                        "text_hash": text_hash,
+                        "error": chunk_failures.get(
+                            text_hash, "embedding not generated"
+                        ),
+                    }
+                )
+
+        processing_time = time.time() - start_time
+        return BatchEmbeddingResponse(
+            embeddings=embeddings,
+            processing_time=processing_time,
+            model_info={
+                "name": self._ml_model.get_model_name(),
+                "version": request.model_version or self._ml_model.get_model_version(),
+                "dimensions": self._ml_model.get_embedding_dimension(),
+            },
+            batch_size=len(request.texts),
+            success_count=len(embeddings),
+            failure_count=len(failures),
+            failures=failures,
+            status="success" if not failures else "partial_success",
+            cache_hit_ratio=cache_hits / len(unique_texts),
+            stage_timings=stage_timings,
+        )
+
+    async def _get_batch_from_cache(
+        self, text_hashes: List[str]
+    ) -> Dict[str, VectorEmbedding]:
+        """
+        Retrieve cached embeddings for many hashes with one multi-get.
+
+        Args:
+            text_hashes: Hashes to look up
+
+        Returns:
+            Mapping of text hash to cached embedding for cache hits
+        """
+        try:
+            values = await self._cache.get_embeddings_batch(text_hashes)
+        except Exception:
+            # Cache errors should not break the flow
+            return {}
+
+        return {
+            text_hash: value
+            for text_hash, value in zip(text_hashes, values)
+            if value is not None
+        }
+
+    async def _generate_missing_embeddings(
+        self, misses: List[Tuple[str, str]], request: BatchEmbeddingRequest
+    ) -> Tuple[List[VectorEmbedding], Dict[str, str]]:
+        """
+        Generate embeddings for cache misses in chunks of the model batch size.
+
+        A failing chunk is recorded and does not abort the other chunks.
+
+        Args:
+            misses: (text_hash, text) pairs to embed
+            request: Batch embedding generation request
+
+        Returns:
+            Tuple of (new embeddings, error message by text hash)
+        """
+        chunk_size = max(1, self._ml_model.get_max_batch_size())
+        embeddings: List[VectorEmbedding] = []
+        failures: Dict[str, str] = {}
+
+        for start in range(0, len(misses), chunk_size):
+            chunk = misses[start : start + chunk_size]
+            try:
+                vectors = await self._ml_model.generate_batch_embeddings(
+                    [text for _, text in chunk], request.embedding_type
+                )
+                if len(vectors) != len(chunk):
+                    raise ValueError(
+                        f"model returned {len(vectors)} vectors for {len(chunk)} texts"
+                    )
+            except Exception as e:
+                failures.update((text_hash, str(e)) for text_hash, _ in chunk)
+                continue
+
+            embeddings.extend(
+                self._create_embedding_entity(
+                    vector=vector,
+                    text=text,
+                    text_hash=text_hash,
+                    embedding_type=request.embedding_type,
+                    metadata=dict(request.metadata or {}),
+                    model_version=request.model_version,
+                )
+                for (text_hash, text), vector in zip(chunk, vectors)
+            )
+
+        return embeddings, failures
+
+    async def _cache_embeddings_batch(self, embeddings: List[VectorEmbedding]) -> None:
+        """
+        Cache many embeddings with one multi-set.
+
+        Args:
+            embeddings: Embeddings to cache
+        """
+        try:
+            await self._cache.set_embeddings_batch(embeddings, ttl=EMBEDDING_CACHE_TTL)
+        except Exception:
+            # Cache errors should not break the flow
+            pass
+
     def _generate_text_hash(self, text: str, embedding_type) -> str:
         """
         Generate a hash for the text and embedding type combination.
@@ -173,7 +360,9 @@ class GenerateEmbeddingUseCase:
         """
         try:
             # Cache for 1 hour by default
-            await self._cache.set_embedding(text_hash, embedding, ttl=3600)
+            await self._cache.set_embedding(
+                text_hash, embedding, ttl=EMBEDDING_CACHE_TTL
+            )
         except Exception:
             # Cache errors should not break the flow
             pass
@@ -0,0 +1,125 @@
+"""
+Historical Data Pipeline
+
+Building blocks for streaming speaker historical data through
+error-correction pair extraction: pipeline settings, the extraction task run
+in the worker pool, and a throttle for job progress writes.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from ...domain.entities.speaker_error_correction_pair import SpeakerErrorCorrectionPair
+from ...domain.entities.speaker_rag_processing_job import SpeakerRAGProcessingJob
+from ...domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from ..dto.requests import HistoricalDataItem
+
+# Extracted pairs of one record, or the error that prevented extraction
+RecordOutcome = Tuple[List[SpeakerErrorCorrectionPair], Optional[str]]
+
+
+@dataclass(frozen=True)
+class HistoricalProcessingSettings:
+    """Tuning for streaming historical data processing."""
+
+    # Worker processes running the CPU-bound pair extraction
+    extraction_workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    # Records sent to a worker per task, amortizing inter-process overhead
+    records_per_task: int = 32
+    # Tasks buffered between pipeline stages; bounds memory for any input size
+    queue_size: int = 8
+    # Pairs persisted per batch_create_error_correction_pairs call
+    pair_batch_size: int = 500
+    # Job progress is written at most this often...
+    progress_interval_seconds: float = 5.0
+    # ...unless progress advanced by at least this many percentage points
+    progress_step_percentage: float = 5.0
+    # Record errors kept in job metadata; later ones are only counted
+    max_recorded_errors: int = 100
+
+
+def extract_record_chunk(
+    rag_service: SpeakerRAGProcessingService,
+    speaker_id: UUID,
+    records: List[HistoricalDataItem],
+    context_window: int,
+) -> List[RecordOutcome]:
+    """
+    Extract error-correction pairs from a chunk of historical records.
+
+    Runs in a worker process, so a failing record is reported in its
+    outcome instead of failing the chunk.
+
+    Args:
+        rag_service: Domain service performing the extraction
+        speaker_id: Speaker identifier
+        records: Historical records to process
+        context_window: Context window size in characters
+
+    Returns:
+        One (pairs, error) outcome per record, in record order
+    """
+    outcomes = []
+    for record in records:
+        try:
+            pairs = rag_service.extract_error_correction_pairs(
+                asr_text=record.asr_text,
+                final_text=record.final_text,
+                speaker_id=speaker_id,
+                historical_data_id=record.historical_data_id,
+                context_window=context_window,
+            )
+            outcomes.append((pairs, None))
+        except Exception as e:
+            outcomes.append(([], str(e)))
+    return outcomes
+
+
+async def iterate_records(
+    records: Iterable[HistoricalDataItem],
+) -> AsyncIterator[HistoricalDataItem]:
+    """Adapt an in-memory collection of records to the streaming pipeline."""
+    for record in records:
+        yield record
+
+
+class ProgressThrottle:
+    """
+    Decides when job progress is worth persisting.
+
+    A write is due when the interval has passed since the last write or
+    progress has advanced by the configured step, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        step_percentage: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._interval_seconds = interval_seconds
+        self._step_percentage = Decimal(str(step_percentage))
+        self._clock = clock
+        self._last_written_at = clock()
+        self._last_percentage = Decimal("0")
+
+    def should_write(self, job: SpeakerRAGProcessingJob) -> bool:
+        """Check whether the job's progress should be written now."""
+        if (
+            self._clock() - self._last_written_at >= self._interval_seconds
+            or job.progress_percentage - self._last_percentage >= self._step_percentage
+        ):
+            self.record_write(job)
+            return True
+        return False
+
+    def record_write(self, job: SpeakerRAGProcessingJob) -> None:
+        """Note a job write made for another reason, restarting the cadence."""
+        self._last_written_at = self._clock()
+        self._last_percentage = job.progress_percentage
@@ -6,21 +6,32 @@ Orchestrates error-correction pair generation, vectorization, and speaker-specif
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import hashlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterable, Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from ...domain.entities.speaker_error_correction_pair import SpeakerErrorCorrectionPair
 from ...domain.entities.speaker_rag_processing_job import (
     JobStatus,
     JobType,
     SpeakerRAGProcessingJob,
 )
+from ...domain.entities.vector_embedding import VectorEmbedding
+from ...domain.services.speaker_error_statistics import (
+    SpeakerErrorFrequencyAccumulator,
+)
 from ...domain.services.speaker_rag_processing_service import (
     SpeakerRAGProcessingService,
 )
+from ...domain.value_objects.embedding_type import EmbeddingType
 from ..dto.requests import (
     CreateSpeakerRAGJobRequest,
     GenerateErrorCorrectionPairsRequest,
+    HistoricalDataItem,
     ProcessSpeakerHistoricalDataRequest,
 )
 from ..dto.responses import (
@@ -28,8 +39,17 @@ from ..dto.responses import (
     ProcessingJobResponse,
     SpeakerRAGProcessingResponse,
 )
+from ..ports.secondary.historical_data_source_port import IHistoricalDataSourcePort
+from ..ports.secondary.ml_model_port import MLModelPort
 from ..ports.secondary.speaker_rag_repository_port import ISpeakerRAGRepositoryPort
 from ..ports.secondary.vector_storage_port import VectorStoragePort
+from .historical_data_pipeline import (
+    HistoricalProcessingSettings,
+    ProgressThrottle,
+    RecordOutcome,
+    extract_record_chunk,
+    iterate_records,
+)
 
 
 class ProcessSpeakerRAGDataUseCase:
@@ -45,6 +65,10 @@ class ProcessSpeakerRAGDataUseCase:
         speaker_rag_repository: ISpeakerRAGRepositoryPort,
         vector_storage: VectorStoragePort,
         rag_processing_service: SpeakerRAGProcessingService,
+        extraction_executor: Optional[Executor] = None,
+        historical_settings: Optional[HistoricalProcessingSettings] = None,
+        ml_model: Optional[MLModelPort] = None,
+        historical_data_source: Optional[IHistoricalDataSourcePort] = None,
     ):
         """
         Initialize the use case with required dependencies.
@@ -53,10 +77,22 @@ class ProcessSpeakerRAGDataUseCase:
             speaker_rag_repository: Repository for speaker RAG data
             vector_storage: Vector storage for embeddings
             rag_processing_service: Domain service for RAG processing
+            extraction_executor: Worker pool for pair extraction; a process
+                pool is created per run when not given
+            historical_settings: Tuning for historical data processing
+            ml_model: Embedding model used to vectorize error-correction pairs
+            historical_data_source: Source of speaker historical data for
+                historical analysis jobs run in the background
         """
         self._speaker_rag_repo = speaker_rag_repository
         self._vector_storage = vector_storage
         self._rag_service = rag_processing_service
+        self._extraction_executor = extraction_executor
+        self._historical_settings = (
+            historical_settings or HistoricalProcessingSettings()
+        )
+        self._ml_model = ml_model
+        self._historical_data_source = historical_data_source
 
     async def process_speaker_historical_data(
         self, request: ProcessSpeakerHistoricalDataRequest
@@ -70,12 +106,43 @@ class ProcessSpeakerRAGDataUseCase:
         Returns:
             Processing response with results
         """
-        # Create processing job
+        return await self.process_speaker_historical_stream(
+            speaker_id=request.speaker_id,
+            records=iterate_records(request.historical_data_items),
+            context_window=request.context_window,
+            total_records=len(request.historical_data_items),
+        )
+
+    async def process_speaker_historical_stream(
+        self,
+        speaker_id: UUID,
+        records: AsyncIterable[HistoricalDataItem],
+        context_window: int = 50,
+        total_records: Optional[int] = None,
+    ) -> SpeakerRAGProcessingResponse:
+        """
+        Process a stream of historical data for a speaker.
+
+        Records are extracted in the worker pool while later records are
+        still being read, with bounded queues between the stages, so memory
+        stays constant however many records the speaker has. Pairs are
+        persisted in batches and job progress is written on a time and
+        percentage cadence rather than per record.
+
+        Args:
+            speaker_id: Speaker identifier
+            records: Historical records, read once
+            context_window: Context window size in characters
+            total_records: Number of records, if known, for progress reporting
+
+        Returns:
+            Processing response with results
+        """
         job = SpeakerRAGProcessingJob(
             id=uuid4(),
-            speaker_id=request.speaker_id,
+            speaker_id=speaker_id,
             job_type=JobType.HISTORICAL_ANALYSIS,
-            total_records=len(request.historical_data_items),
+            total_records=total_records,
         )
 
         created_job = await self._speaker_rag_repo.create_processing_job(job)
@@ -85,53 +152,23 @@ class ProcessSpeakerRAGDataUseCase:
             created_job.start_job()
             await self._speaker_rag_repo.update_processing_job(created_job)
 
-            # Process each historical data item
-            all_pairs = []
-            processed_count = 0
-            error_count = 0
-
-            for data_item in request.historical_data_items:
-                try:
-                    # Extract error-correction pairs
-                    pairs = self._rag_service.extract_error_correction_pairs(
-                        asr_text=data_item.asr_text,
-                        final_text=data_item.final_text,
-                        speaker_id=request.speaker_id,
-                        historical_data_id=data_item.historical_data_id,
-                        context_window=request.context_window,
-                    )
-
-                    # Save pairs to repository
-                    if pairs:
-                        saved_pairs = await self._speaker_rag_repo.batch_create_error_correction_pairs(
-                            pairs
-                        )
-                        all_pairs.extend(saved_pairs)
-
-                    processed_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    created_job.add_metadata(f"error_{error_count}", str(e))
-
-                # Update job progress
-                created_job.update_progress(processed_count, error_count)
-                await self._speaker_rag_repo.update_processing_job(created_job)
+            statistics = await self._run_historical_pipeline(
+                created_job, records, context_window
+            )
 
             # Complete the job
+            if created_job.total_records is None:
+                created_job.set_total_records(
+                    created_job.processed_records + created_job.error_records
+                )
             created_job.complete_job()
             await self._speaker_rag_repo.update_processing_job(created_job)
 
-            # Generate statistics
-            error_statistics = self._rag_service.calculate_speaker_error_frequency(
-                all_pairs
-            )
-
             return SpeakerRAGProcessingResponse(
                 job_id=created_job.id,
-                speaker_id=request.speaker_id,
-                total_pairs_generated=len(all_pairs),
-                error_statistics=error_statistics,
+                speaker_id=speaker_id,
+                total_pairs_generated=statistics.total_pairs,
+                error_statistics=statistics.statistics(),
                 processing_summary=created_job.get_job_summary(),
             )
 
@@ -178,66 +215,87 @@ class ProcessSpeakerRAGDataUseCase:
         """
         Vectorize error-correction pairs for a speaker.
 
+        Each pair's training example is embedded with the ML model, stored in
+        vector storage and linked to the pair. Pairs whose training example is
+        already embedded are linked to the existing embedding instead.
+
         Args:
             speaker_id: Speaker identifier
-            batch_size: Batch size for vectorization
+            batch_size: Pairs stored and linked per batch
 
         Returns:
             Processing job response
+
+        Raises:
+            ValueError: If the use case has no ML model
         """
+        if self._ml_model is None:
+            raise ValueError("vectorization requires an ML model")
+
         # Create vectorization job
         job = SpeakerRAGProcessingJob(
-            id=uuid4(), speaker_id=speaker_id, job_type=JobType.VECTORIZATION
+            id=uuid4(),
+            speaker_id=speaker_id,
+            job_type=JobType.VECTORIZATION,
+            job_metadata={"batch_size": batch_size},
         )
 
         created_job = await self._speaker_rag_repo.create_processing_job(job)
+        await self.run_processing_job(created_job)
+        return self._job_to_response(created_job)
 
-        try:
-            # Get error-correction pairs for speaker
-            pairs = await self._speaker_rag_repo.get_error_correction_pairs_by_speaker(
-                speaker_id=speaker_id,
-                min_confidence=0.3,  # Only vectorize high-confidence pairs
-            )
-
-            if not pairs:
-                created_job.complete_job()
-                await self._speaker_rag_repo.update_processing_job(created_job)
-                return self._job_to_response(created_job)
-
-            # Set total records and start job
-            created_job.set_total_records(len(pairs))
-            created_job.start_job()
-            await self._speaker_rag_repo.update_processing_job(created_job)
+    def get_runnable_job_types(self) -> Set[JobType]:
+        """
+        Get the job types that run_processing_job can execute.
 
-            # Process pairs in batches
-            processed_count = 0
-            error_count = 0
+        Returns:
+            Runnable job types; historical analysis requires a historical
+            data source, vectorization an ML model
+        """
+        job_types = set()
+        if self._ml_model is not None:
+            job_types.add(JobType.VECTORIZATION)
+        if self._historical_data_source is not None:
+            job_types.add(JobType.HISTORICAL_ANALYSIS)
+        return job_types
+
+    async def run_processing_job(
+        self, job: SpeakerRAGProcessingJob
+    ) -> SpeakerRAGProcessingJob:
+        """
+        Execute a pending job, or resume an interrupted running job.
 
-            for i in range(0, len(pairs), batch_size):
-                batch = pairs[i : i + batch_size]
+        An interrupted job restarts from its last checkpoint: the input
+        records before the checkpoint offset are skipped and the progress
+        counters are restored from it. A checkpoint is recorded whenever the
+        results of all records before it are persisted.
 
-                try:
-                    # Vectorize batch
-                    await self._vectorize_pair_batch(batch, speaker_id)
-                    processed_count += len(batch)
+        Args:
+            job: Pending job, or running job whose execution was interrupted
 
-                except Exception as e:
-                    error_count += len(batch)
-                    created_job.add_metadata(f"batch_error_{i}", str(e))
+        Returns:
+            The finished job
 
-                # Update progress
-                created_job.update_progress(processed_count, error_count)
-                await self._speaker_rag_repo.update_processing_job(created_job)
+        Raises:
+            ValueError: If the job type cannot be run by this use case
+        """
+        if job.job_type not in self.get_runnable_job_types():
+            raise ValueError(f"{job.job_type.value} jobs cannot be run")
 
-            # Complete job
-            created_job.complete_job()
-            await self._speaker_rag_repo.update_processing_job(created_job)
+        start_offset = job.resume_from_checkpoint() if job.is_running() else 0
+        if job.is_pending():
+            job.start_job()
 
-            return self._job_to_response(created_job)
+        try:
+            if job.job_type == JobType.VECTORIZATION:
+                await self._run_vectorization_job(job, start_offset)
+            else:
+                await self._run_historical_analysis_job(job, start_offset)
+            return job
 
         except Exception as e:
-            created_job.fail_job(str(e))
-            await self._speaker_rag_repo.update_processing_job(created_job)
+            job.fail_job(str(e))
+            await self._speaker_rag_repo.update_processing_job(job)
             raise
 
     async def get_speaker_error_patterns(self, speaker_id: UUID) -> Dict[str, Any]:
@@ -286,6 +344,9 @@ class ProcessSpeakerRAGDataUseCase:
         """
         Create a new speaker RAG processing job.
 
+        The job is created pending; runnable job types are executed by the
+        background job runner.
+
         Args:
             request: Job creation request
 
@@ -294,7 +355,7 @@ class ProcessSpeakerRAGDataUseCase:
         """
         job = SpeakerRAGProcessingJob(
             id=uuid4(),
-            speaker_id=request.speaker_id,
+            speaker_id=UUID(str(request.speaker_id)),
             job_type=request.job_type,
             job_metadata=request.metadata or {},
         )
@@ -320,29 +381,354 @@ class ProcessSpeakerRAGDataUseCase:
 
         return self._job_to_response(job)
 
+    async def _run_vectorization_job(
+        self, job: SpeakerRAGProcessingJob, start_offset: int
+    ) -> None:
+        """
+        Vectorize a speaker's error-correction pairs from a pair offset.
+
+        Args:
+            job: Running vectorization job
+            start_offset: Number of leading pairs already vectorized
+        """
+        batch_size = job.job_metadata.get("batch_size", 100)
+
+        # Get error-correction pairs for speaker
+        pairs = await self._speaker_rag_repo.get_error_correction_pairs_by_speaker(
+            speaker_id=job.speaker_id,
+            min_confidence=0.3,  # Only vectorize high-confidence pairs
+        )
+        job.set_total_records(len(pairs))
+        await self._speaker_rag_repo.update_processing_job(job)
+
+        processed_count = job.processed_records
+        error_count = job.error_records
+        embeddings_created = job.get_checkpoint().get("embeddings_created", 0)
+
+        # Process pairs in batches
+        for i in range(start_offset, len(pairs), batch_size):
+            batch = pairs[i : i + batch_size]
+
+            try:
+                embeddings_created += await self._vectorize_pair_batch(
+                    batch, job.speaker_id
+                )
+                processed_count += len(batch)
+
+            except Exception as e:
+                error_count += len(batch)
+                job.add_metadata(f"batch_error_{i}", str(e))
+
+            # Update progress; the batch's embeddings and links are persisted
+            job.update_progress(processed_count, error_count)
+            job.record_checkpoint(i + len(batch), embeddings_created=embeddings_created)
+            await self._speaker_rag_repo.update_processing_job(job)
+
+        # Complete job
+        job.add_metadata("embeddings_created", embeddings_created)
+        job.add_metadata("embeddings_reused", processed_count - embeddings_created)
+        job.complete_job()
+        await self._speaker_rag_repo.update_processing_job(job)
+
+    async def _run_historical_analysis_job(
+        self, job: SpeakerRAGProcessingJob, start_offset: int
+    ) -> None:
+        """
+        Process a speaker's historical data from a record offset.
+
+        Args:
+            job: Running historical analysis job
+            start_offset: Number of leading records already processed
+        """
+        if job.total_records is None:
+            total_records = await self._historical_data_source.count_records(
+                job.speaker_id
+            )
+            if total_records is not None:
+                job.set_total_records(total_records)
+        await self._speaker_rag_repo.update_processing_job(job)
+
+        statistics = await self._run_historical_pipeline(
+            job,
+            self._historical_data_source.iterate_records(job.speaker_id, start_offset),
+            job.job_metadata.get("context_window", 50),
+            start_offset,
+        )
+
+        if job.total_records is None:
+            job.set_total_records(job.processed_records + job.error_records)
+        job.add_metadata(
+            "pairs_generated", job.get_checkpoint().get("pairs_generated", 0)
+        )
+        # Statistics cover the pairs persisted since the job last (re)started
+        job.add_metadata("error_statistics", statistics.statistics())
+        job.complete_job()
+        await self._speaker_rag_repo.update_processing_job(job)
+
+    async def _run_historical_pipeline(
+        self,
+        job: SpeakerRAGProcessingJob,
+        records: AsyncIterable[HistoricalDataItem],
+        context_window: int,
+        start_offset: int = 0,
+    ) -> SpeakerErrorFrequencyAccumulator:
+        """
+        Read, extract and persist historical records as a pipeline.
+
+        Chunks are extracted concurrently but their outcomes are consumed in
+        record order, so after every pair batch is persisted the job can be
+        checkpointed at the offset of the last consumed record.
+
+        Args:
+            job: Running job whose progress is updated
+            records: Historical records, starting at `start_offset`
+            context_window: Context window size in characters
+            start_offset: Offset of the first record within the job's input
+
+        Returns:
+            Error frequency statistics of the pairs persisted by this run
+        """
+        settings = self._historical_settings
+        workers = max(1, settings.extraction_workers)
+        executor = self._extraction_executor or ProcessPoolExecutor(max_workers=workers)
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=settings.queue_size)
+        outcomes: asyncio.Queue = asyncio.Queue(maxsize=settings.queue_size)
+        # Bounds chunks awaiting in-order consumption behind a slow chunk
+        in_flight = asyncio.Semaphore(settings.queue_size + workers)
+
+        async def read_records() -> None:
+            try:
+                sequence = 0
+                chunk = []
+                async for record in records:
+                    chunk.append(record)
+                    if len(chunk) >= settings.records_per_task:
+                        await in_flight.acquire()
+                        await chunks.put((sequence, chunk))
+                        sequence += 1
+                        chunk = []
+                if chunk:
+                    await in_flight.acquire()
+                    await chunks.put((sequence, chunk))
+                for _ in range(workers):
+                    await chunks.put(None)
+            except Exception as e:
+                await outcomes.put(e)
+
+        async def extract_chunks() -> None:
+            try:
+                while (item := await chunks.get()) is not None:
+                    sequence, chunk = item
+                    outcome = await loop.run_in_executor(
+                        executor,
+                        extract_record_chunk,
+                        self._rag_service,
+                        job.speaker_id,
+                        chunk,
+                        context_window,
+                    )
+                    await outcomes.put((sequence, outcome))
+                await outcomes.put(None)
+            except Exception as e:
+                await outcomes.put(e)
+
+        tasks = [asyncio.create_task(read_records())] + [
+            asyncio.create_task(extract_chunks()) for _ in range(workers)
+        ]
+        statistics = SpeakerErrorFrequencyAccumulator()
+        throttle = ProgressThrottle(
+            settings.progress_interval_seconds, settings.progress_step_percentage
+        )
+        pending_pairs: List[SpeakerErrorCorrectionPair] = []
+        processed_count = job.processed_records
+        error_count = job.error_records
+        offset = start_offset
+        persisted_pairs = job.get_checkpoint().get("pairs_generated", 0)
+        ready: Dict[int, List[RecordOutcome]] = {}
+        next_sequence = 0
+
+        try:
+            finished_workers = 0
+            while finished_workers < workers:
+                item = await outcomes.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+
+                sequence, outcome = item
+                ready[sequence] = outcome
+                while next_sequence in ready:
+                    outcome = ready.pop(next_sequence)
+                    next_sequence += 1
+                    in_flight.release()
+
+                    for pairs, error in outcome:
+                        if error is None:
+                            processed_count += 1
+                            pending_pairs.extend(pairs)
+                        else:
+                            error_count += 1
+                            if error_count <= settings.max_recorded_errors:
+                                job.add_metadata(f"error_{error_count}", error)
+                    offset += len(outcome)
+                    job.update_progress(processed_count, error_count)
+
+                    if len(pending_pairs) >= settings.pair_batch_size:
+                        await self._save_pair_batch(pending_pairs, statistics)
+                        persisted_pairs += len(pending_pairs)
+                        pending_pairs = []
+                        job.record_checkpoint(offset, pairs_generated=persisted_pairs)
+                        throttle.record_write(job)
+                        await self._speaker_rag_repo.update_processing_job(job)
+                    elif throttle.should_write(job):
+                        # Without unsaved pairs every consumed record is persisted
+                        if not pending_pairs:
+                            job.record_checkpoint(
+                                offset, pairs_generated=persisted_pairs
+                            )
+                        await self._speaker_rag_repo.update_processing_job(job)
+
+            if pending_pairs:
+                await self._save_pair_batch(pending_pairs, statistics)
+                persisted_pairs += len(pending_pairs)
+            job.record_checkpoint(offset, pairs_generated=persisted_pairs)
+
+            return statistics
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._extraction_executor is None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _save_pair_batch(
+        self,
+        pairs: List[SpeakerErrorCorrectionPair],
+        statistics: SpeakerErrorFrequencyAccumulator,
+    ) -> None:
+        """Persist a batch of pairs and add them to the statistics."""
+        saved_pairs = await self._speaker_rag_repo.batch_create_error_correction_pairs(
+            pairs
+        )
+        statistics.add(saved_pairs)
+
     async def _vectorize_pair_batch(
         self, pairs: List[SpeakerErrorCorrectionPair], speaker_id: UUID
-    ) -> None:
+    ) -> int:
         """
         Vectorize a batch of error-correction pairs.
 
+        Training examples are deduplicated by content hash; only hashes not
+        yet in vector storage are embedded, in chunks of the model batch size.
+        New embeddings are stored with one write and all pairs are linked with
+        one bulk link.
+
         Args:
             pairs: List of error-correction pairs
             speaker_id: Speaker identifier
+
+        Returns:
+            Number of embeddings created
         """
+        examples: Dict[str, Tuple[SpeakerErrorCorrectionPair, Dict[str, str]]] = {}
+        pair_hashes: List[Tuple[UUID, str]] = []
         for pair in pairs:
-            # Create training example
             training_example = pair.get_training_example()
+            content_hash = self._generate_content_hash(training_example)
+            examples.setdefault(content_hash, (pair, training_example))
+            pair_hashes.append((pair.id, content_hash))
+
+        embedding_ids = await self._vector_storage.find_by_text_hashes(list(examples))
+        missing = [
+            (content_hash, pair, training_example)
+            for content_hash, (pair, training_example) in examples.items()
+            if content_hash not in embedding_ids
+        ]
+
+        embeddings: List[VectorEmbedding] = []
+        chunk_size = max(1, self._ml_model.get_max_batch_size())
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            vectors = await self._ml_model.generate_batch_embeddings(
+                [training_example["input"] for _, _, training_example in chunk],
+                EmbeddingType.ERROR,
+            )
+            if len(vectors) != len(chunk):
+                raise ValueError(
+                    f"model returned {len(vectors)} vectors for {len(chunk)} texts"
+                )
+            embeddings.extend(
+                self._create_pair_embedding(vector, *item)
+                for vector, item in zip(vectors, chunk)
+            )
 
-            # Generate embedding for the input context
-            # Note: This would integrate with the existing embedding generation
-            # For now, we'll just link the pair to speaker-specific embeddings
-            await self._speaker_rag_repo.link_embedding_to_speaker(
-                embedding_id=uuid4(),  # Placeholder - would be actual embedding ID
-                speaker_id=speaker_id,
-                error_correction_pair_id=pair.id,
+        if embeddings:
+            await self._vector_storage.store_batch_embeddings(embeddings)
+            embedding_ids.update(
+                (embedding.text_hash, embedding.id) for embedding in embeddings
             )
 
+        await self._speaker_rag_repo.batch_link_embeddings_to_speaker(
+            speaker_id,
+            [
+                (embedding_ids[content_hash], pair_id)
+                for pair_id, content_hash in pair_hashes
+            ],
+        )
+        return len(embeddings)
+
+    def _create_pair_embedding(
+        self,
+        vector: List[float],
+        content_hash: str,
+        pair: SpeakerErrorCorrectionPair,
+        training_example: Dict[str, str],
+    ) -> VectorEmbedding:
+        """Create the embedding entity of a pair's training example."""
+        return VectorEmbedding.from_array(
+            np.asarray(vector, dtype=np.float32),
+            id=uuid4(),
+            text=training_example["input"],
+            text_hash=content_hash,
+            embedding_type=EmbeddingType.ERROR,
+            model_version=self._ml_model.get_model_version(),
+            model_name=self._ml_model.get_model_name(),
+            metadata={
+                "speaker_id": training_example["speaker_id"],
+                "category": training_example["error_type"],
+                "target": training_example["target"],
+                "error_correction_pair_id": str(pair.id),
+            },
+            created_at=datetime.utcnow(),
+        )
+
+    def _generate_content_hash(self, training_example: Dict[str, str]) -> str:
+        """
+        Generate the content hash of a training example.
+
+        The hash covers the speaker, input and target, so identical examples
+        of one speaker share an embedding.
+
+        Args:
+            training_example: Training example of an error-correction pair
+
+        Returns:
+            SHA256 hash string
+        """
+        content = ":".join(
+            (
+                training_example["speaker_id"],
+                training_example["input"],
+                training_example["target"],
+                EmbeddingType.ERROR.value,
+            )
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     def _pair_to_response(
         self, pair: SpeakerErrorCorrectionPair
     ) -> ErrorCorrectionPairResponse:
@@ -360,6 +746,8 @@ class ProcessSpeakerRAGDataUseCase:
             has_context=summary["has_context"],
             suitable_for_training=summary["suitable_for_training"],
             created_at=pair.created_at,
+            error_start_offset=pair.error_start_offset,
+            error_end_offset=pair.error_end_offset,
         )
 
     def _job_to_response(self, job: SpeakerRAGProcessingJob) -> ProcessingJobResponse:
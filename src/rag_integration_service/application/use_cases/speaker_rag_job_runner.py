@@ -0,0 +1,238 @@
+"""
+Speaker RAG Job Runner
+
+Executes speaker RAG processing jobs in the background instead of inside
+the request that created them. The runner claims pending jobs, and running
+jobs whose runner stopped renewing its lease, and executes them in a pool of
+workers. Jobs checkpoint their progress, so an interrupted job resumes from
+its last checkpoint rather than from the start.
+"""
+
+import asyncio
+import logging
+import socket
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from ...domain.entities.speaker_rag_processing_job import SpeakerRAGProcessingJob
+from ..ports.secondary.speaker_rag_repository_port import ISpeakerRAGRepositoryPort
+from .process_speaker_rag_data_use_case import ProcessSpeakerRAGDataUseCase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JobRunnerSettings:
+    """Tuning for background job execution."""
+
+    # Jobs executed at the same time
+    concurrency: int = 2
+    # Repository poll interval while no worker slot frees up
+    poll_interval_seconds: float = 5.0
+    # A job whose lease is not renewed within this time counts as interrupted
+    lease_seconds: float = 60.0
+
+
+class SpeakerRAGJobRunner:
+    """
+    Background worker pool for speaker RAG processing jobs.
+
+    Claims are not atomic: the lease is written with a plain job update, so
+    a repository should be served by a single runner.
+    """
+
+    def __init__(
+        self,
+        use_case: ProcessSpeakerRAGDataUseCase,
+        speaker_rag_repository: ISpeakerRAGRepositoryPort,
+        settings: Optional[JobRunnerSettings] = None,
+        runner_id: Optional[str] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            use_case: Use case executing the jobs
+            speaker_rag_repository: Repository the jobs are claimed from
+            settings: Runner tuning
+            runner_id: Lease owner identifier; unique per process by default
+        """
+        self._use_case = use_case
+        self._speaker_rag_repo = speaker_rag_repository
+        self._settings = settings or JobRunnerSettings()
+        self._runner_id = runner_id or f"{socket.gethostname()}-{uuid4().hex[:8]}"
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._active: Dict[UUID, SpeakerRAGProcessingJob] = {}
+        self._slot_freed = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        self._poller: Optional[asyncio.Task] = None
+        self._unclaimed_jobs = 0
+        self._completed_jobs = 0
+        self._failed_jobs = 0
+
+    async def start(self) -> None:
+        """Start the workers and the repository poller."""
+        if self._poller is not None:
+            return
+        self._start_workers()
+        self._poller = asyncio.create_task(self._poll())
+
+    async def stop(self) -> None:
+        """
+        Stop the runner.
+
+        Interrupted jobs keep their checkpoint and have their lease released,
+        so the next runner resumes them without waiting for the lease to
+        expire.
+        """
+        if self._poller is not None:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+            self._poller = None
+        await self._stop_workers()
+
+    async def run_until_idle(self) -> None:
+        """Claim and execute jobs until no claimable job is left."""
+        started_workers = not self._workers
+        if started_workers:
+            self._start_workers()
+
+        try:
+            while True:
+                self._slot_freed.clear()
+                claimed = await self.claim_jobs()
+                if not claimed and not self._active and self._queue.empty():
+                    return
+                await self._slot_freed.wait()
+        finally:
+            if started_workers:
+                await self._stop_workers()
+
+    async def claim_jobs(self) -> int:
+        """
+        Claim jobs for the free worker slots.
+
+        Returns:
+            Number of jobs claimed
+        """
+        now = datetime.utcnow()
+        runnable_types = self._use_case.get_runnable_job_types()
+        candidates = [
+            job
+            for job in (
+                await self._speaker_rag_repo.get_running_processing_jobs()
+                + await self._speaker_rag_repo.get_pending_processing_jobs()
+            )
+            if job.job_type in runnable_types
+            and job.id not in self._active
+            and job.can_be_claimed(now)
+        ]
+
+        free_slots = max(
+            0, self._settings.concurrency - len(self._active) - self._queue.qsize()
+        )
+        claimed = candidates[:free_slots]
+        for job in claimed:
+            job.acquire_lease(self._runner_id, self._settings.lease_seconds, now)
+            await self._speaker_rag_repo.update_processing_job(job)
+            self._queue.put_nowait(job)
+
+        self._unclaimed_jobs = len(candidates) - len(claimed)
+        return len(claimed)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get runner metrics.
+
+        Returns:
+            Queue depth, job counters, and per-job throughput in records per
+            minute with the estimated completion time
+        """
+        jobs = []
+        for job in self._active.values():
+            estimated_completion = job.get_estimated_completion_time()
+            jobs.append(
+                {
+                    "job_id": str(job.id),
+                    "speaker_id": str(job.speaker_id),
+                    "job_type": job.job_type.value,
+                    "progress_percentage": float(job.progress_percentage),
+                    "records_per_minute": job.get_processing_rate(),
+                    "estimated_completion": (
+                        estimated_completion.isoformat()
+                        if estimated_completion
+                        else None
+                    ),
+                }
+            )
+
+        return {
+            "runner_id": self._runner_id,
+            "concurrency": self._settings.concurrency,
+            "queue_depth": self._unclaimed_jobs + self._queue.qsize(),
+            "active_jobs": len(self._active),
+            "completed_jobs": self._completed_jobs,
+            "failed_jobs": self._failed_jobs,
+            "records_per_minute": sum(job["records_per_minute"] or 0 for job in jobs),
+            "jobs": jobs,
+        }
+
+    def _start_workers(self) -> None:
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._settings.concurrency)
+        ]
+
+    async def _stop_workers(self) -> None:
+        interrupted = list(self._active.values())
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while not self._queue.empty():
+            interrupted.append(self._queue.get_nowait())
+        for job in interrupted:
+            if not job.is_finished():
+                job.release_lease()
+                await self._speaker_rag_repo.update_processing_job(job)
+
+    async def _poll(self) -> None:
+        while True:
+            self._slot_freed.clear()
+            try:
+                await self.claim_jobs()
+            except Exception as e:
+                logger.error(f"Failed to claim speaker RAG jobs: {e}")
+            try:
+                await asyncio.wait_for(
+                    self._slot_freed.wait(), self._settings.poll_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self._active[job.id] = job
+            heartbeat = asyncio.create_task(self._renew_lease(job))
+            try:
+                await self._use_case.run_processing_job(job)
+                self._completed_jobs += 1
+            except Exception as e:
+                self._failed_jobs += 1
+                logger.error(f"Speaker RAG job {job.id} failed: {e}")
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+                del self._active[job.id]
+                self._slot_freed.set()
+
+    async def _renew_lease(self, job: SpeakerRAGProcessingJob) -> None:
+        """Renew the job's lease until cancelled."""
+        while True:
+            await asyncio.sleep(self._settings.lease_seconds / 3)
+            job.acquire_lease(self._runner_id, self._settings.lease_seconds)
+            await self._speaker_rag_repo.update_processing_job(job)
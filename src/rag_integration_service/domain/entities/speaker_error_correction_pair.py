@@ -8,7 +8,7 @@ Core domain entity for speaker-specific RAG processing.
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 
@@ -33,12 +33,16 @@ class SpeakerErrorCorrectionPair:
     embedding_id: Optional[UUID] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: Optional[datetime] = None
+    # Character offsets [start, end) of the error phrase in the ASR text
+    error_start_offset: Optional[int] = None
+    error_end_offset: Optional[int] = None
 
     def __post_init__(self):
         """Validate the error-correction pair after initialization."""
         self._validate_required_fields()
         self._validate_text_content()
         self._validate_confidence_score()
+        self._validate_offsets()
         self._set_defaults()
 
     def _validate_required_fields(self) -> None:
@@ -81,6 +85,17 @@ class SpeakerErrorCorrectionPair:
             if self.confidence_score < 0 or self.confidence_score > 1:
                 raise ValueError("confidence_score must be between 0 and 1")
 
+    def _validate_offsets(self) -> None:
+        """Validate error offset fields."""
+        if (self.error_start_offset is None) != (self.error_end_offset is None):
+            raise ValueError("error offsets must be given together")
+
+        if self.error_start_offset is not None:
+            if self.error_start_offset < 0:
+                raise ValueError("error_start_offset cannot be negative")
+            if self.error_end_offset <= self.error_start_offset:
+                raise ValueError("error_end_offset must be after error_start_offset")
+
     def _set_defaults(self) -> None:
         """Set default values for optional fields."""
         if self.created_at is None:
@@ -125,6 +140,18 @@ class SpeakerErrorCorrectionPair:
 
         return len(self.correction_text) / len(self.error_text)
 
+    def get_error_span(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the position of the error phrase in the ASR text.
+
+        Returns:
+            (start, end) character offsets, or None if not known
+        """
+        if self.error_start_offset is None:
+            return None
+
+        return self.error_start_offset, self.error_end_offset
+
     def has_context(self) -> bool:
         """
         Check if this pair has context information.
@@ -277,6 +304,8 @@ class SpeakerErrorCorrectionPair:
             "is_high_confidence": self.is_high_confidence(),
             "suitable_for_training": self.is_suitable_for_training(),
             "embedding_id": str(self.embedding_id) if self.embedding_id else None,
+            "error_start_offset": self.error_start_offset,
+            "error_end_offset": self.error_end_offset,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
 
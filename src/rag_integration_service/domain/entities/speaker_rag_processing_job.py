@@ -6,12 +6,16 @@ Core domain entity for managing RAG processing workflows.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+# job_metadata keys for resumable execution
+CHECKPOINT_METADATA_KEY = "checkpoint"
+LEASE_METADATA_KEY = "lease"
+
 
 class JobType(str, Enum):
     """Enumeration for RAG processing job types"""
@@ -228,7 +232,10 @@ class SpeakerRAGProcessingJob:
         self.processed_records = processed
         self.error_records = errors
 
-        # Calculate progress percentage
+        self._recalculate_progress()
+
+    def _recalculate_progress(self) -> None:
+        """Calculate progress percentage from the record counters."""
         if self.total_records and self.total_records > 0:
             total_processed = self.processed_records + self.error_records
             self.progress_percentage = Decimal(
@@ -309,7 +316,7 @@ class SpeakerRAGProcessingJob:
             return datetime.utcnow()
 
         estimated_minutes = remaining_records / rate
-        return datetime.utcnow() + datetime.timedelta(minutes=estimated_minutes)
+        return datetime.utcnow() + timedelta(minutes=estimated_minutes)
 
     def add_metadata(self, key: str, value: Any) -> None:
         """
@@ -321,6 +328,103 @@ class SpeakerRAGProcessingJob:
         """
         self.job_metadata[key] = value
 
+    def record_checkpoint(self, offset: int, **state: Any) -> None:
+        """
+        Record that the results of the first `offset` input records are persisted.
+
+        The checkpoint captures the record counters at that point, so an
+        interrupted job can be resumed from it without reprocessing records.
+
+        Args:
+            offset: Number of input records whose results are persisted
+            **state: Additional resume state, such as running totals
+
+        Raises:
+            ValueError: If the offset is invalid
+        """
+        if offset < 0:
+            raise ValueError("Checkpoint offset cannot be negative")
+
+        self.job_metadata[CHECKPOINT_METADATA_KEY] = {
+            **state,
+            "offset": offset,
+            "processed_records": self.processed_records,
+            "error_records": self.error_records,
+            "recorded_at": datetime.utcnow().isoformat(),
+        }
+
+    def get_checkpoint(self) -> Dict[str, Any]:
+        """
+        Get the last recorded checkpoint.
+
+        Returns:
+            Checkpoint with offset and record counters; offset 0 if none
+        """
+        checkpoint = self.job_metadata.get(CHECKPOINT_METADATA_KEY)
+        if not checkpoint:
+            return {"offset": 0, "processed_records": 0, "error_records": 0}
+        return dict(checkpoint)
+
+    def resume_from_checkpoint(self) -> int:
+        """
+        Roll progress back to the last checkpoint to restart an interrupted job.
+
+        Records processed after the checkpoint were not persisted, so the
+        counters are restored from it.
+
+        Returns:
+            Offset of the first input record to process
+
+        Raises:
+            ValueError: If job is not running
+        """
+        if not self.is_running():
+            raise ValueError(f"Job cannot be resumed from status: {self.status}")
+
+        checkpoint = self.get_checkpoint()
+        self.processed_records = checkpoint["processed_records"]
+        self.error_records = checkpoint["error_records"]
+        self._recalculate_progress()
+        self.job_metadata["resume_count"] = self.job_metadata.get("resume_count", 0) + 1
+        return checkpoint["offset"]
+
+    def acquire_lease(
+        self, owner: str, duration_seconds: float, now: Optional[datetime] = None
+    ) -> None:
+        """
+        Mark the job as executed by a runner until the lease expires.
+
+        A runner renews its lease while the job makes progress; a job whose
+        lease expired was interrupted and can be claimed again.
+
+        Args:
+            owner: Identifier of the runner executing the job
+            duration_seconds: Lease duration
+            now: Current time, defaults to utcnow
+        """
+        now = now or datetime.utcnow()
+        self.job_metadata[LEASE_METADATA_KEY] = {
+            "owner": owner,
+            "expires_at": (now + timedelta(seconds=duration_seconds)).isoformat(),
+        }
+
+    def release_lease(self) -> None:
+        """Release the job's lease so another runner can claim it at once."""
+        self.job_metadata.pop(LEASE_METADATA_KEY, None)
+
+    def has_active_lease(self, now: Optional[datetime] = None) -> bool:
+        """Check if a runner holds an unexpired lease on the job."""
+        lease = self.job_metadata.get(LEASE_METADATA_KEY)
+        if not lease:
+            return False
+        return datetime.fromisoformat(lease["expires_at"]) > (now or datetime.utcnow())
+
+    def can_be_claimed(self, now: Optional[datetime] = None) -> bool:
+        """Check if a runner can claim the job: pending, or interrupted while running."""
+        if self.is_pending():
+            return True
+        return self.is_running() and not self.has_active_lease(now)
+
     def get_job_summary(self) -> Dict[str, Any]:
         """
         Get comprehensive summary of the processing job.
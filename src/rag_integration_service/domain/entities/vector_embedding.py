@@ -5,13 +5,19 @@ Core domain entity representing a vector embedding in the RAG Integration Servic
 Contains business logic for vector operations and validation.
 """
 
-import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 
+import numpy as np
+
 from ..value_objects.embedding_type import EmbeddingType
+from ..value_objects.embedding_vector import (
+    EmbeddingVector,
+    VectorLike,
+    cosine_similarities,
+)
 
 
 @dataclass
@@ -21,10 +27,15 @@ class VectorEmbedding:
 
     This entity encapsulates the core business logic for vector embeddings,
     including validation, mathematical operations, and business rules.
+
+    `vector` keeps the values as supplied (a list for existing callers, or
+    a read-only float32 array when built with `from_array`); the math
+    methods run on a cached read-only float32 `EmbeddingVector`, so the
+    vector must be replaced rather than mutated in place.
     """
 
     id: UUID
-    vector: List[float]
+    vector: Union[List[float], np.ndarray]
     text: str
     text_hash: str
     embedding_type: EmbeddingType
@@ -32,6 +43,10 @@ class VectorEmbedding:
     model_name: str
     metadata: Dict[str, Any]
     created_at: datetime
+    _embedding_vector: Optional[EmbeddingVector] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _vector_source: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate the vector embedding after initialization."""
@@ -39,6 +54,16 @@ class VectorEmbedding:
         self._validate_vector()
         self._validate_metadata()
 
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field, comparing vectors element-wise."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return np.array_equal(self.vector, other.vector) and all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(self)
+            if f.compare and f.name != "vector"
+        )
+
     def _validate_text(self) -> None:
         """Validate text field requirements."""
         if not self.text or not self.text.strip():
@@ -49,15 +74,15 @@ class VectorEmbedding:
 
     def _validate_vector(self) -> None:
         """Validate vector field requirements."""
-        if not self.vector:
+        if self.vector is None or len(self.vector) == 0:
             raise ValueError("vector cannot be empty")
 
         if len(self.vector) != 1536:
             raise ValueError("vector must be 1536-dimensional")
 
-        # Validate that all elements are numeric
-        if not all(isinstance(x, (int, float)) for x in self.vector):
-            raise ValueError("vector must contain only numeric values")
+        # Converting to the float32 representation validates all elements at once
+        self._embedding_vector = EmbeddingVector.from_values(self.vector)
+        self._vector_source = self.vector
 
     def _validate_metadata(self) -> None:
         """Validate metadata field requirements."""
@@ -67,6 +92,34 @@ class VectorEmbedding:
         if not isinstance(self.metadata, dict):
             raise ValueError("metadata must be a dictionary")
 
+    @classmethod
+    def from_array(cls, vector: np.ndarray, **fields: Any) -> "VectorEmbedding":
+        """
+        Create a VectorEmbedding that keeps its vector as a float32 array.
+
+        Avoids materializing a list of 1536 Python floats; `vector` is stored
+        as a read-only array instead.
+
+        Args:
+            vector: Embedding values
+            **fields: Remaining VectorEmbedding fields
+
+        Returns:
+            VectorEmbedding instance
+        """
+        return cls(vector=EmbeddingVector.from_values(vector).values, **fields)
+
+    @property
+    def embedding_vector(self) -> EmbeddingVector:
+        """Read-only float32 view of the vector with a cached norm."""
+        if self._vector_source is not self.vector:
+            self._validate_vector()
+        return self._embedding_vector
+
+    def as_array(self) -> np.ndarray:
+        """Get the vector as a read-only float32 array without copying."""
+        return self.embedding_vector.values
+
     def validate_dimensions(self, expected_dim: int = 1536) -> bool:
         """
         Validate vector dimensions against expected size.
@@ -86,7 +139,7 @@ class VectorEmbedding:
         Returns:
             Vector magnitude as float
         """
-        return math.sqrt(sum(x * x for x in self.vector))
+        return self.embedding_vector.norm
 
     def normalize(self) -> List[float]:
         """
@@ -95,15 +148,13 @@ class VectorEmbedding:
         Returns:
             Normalized vector as list of floats
         """
-        magnitude = self.calculate_magnitude()
-
         # Handle zero vector case
-        if magnitude == 0.0:
-            return self.vector.copy()
+        if self.calculate_magnitude() == 0.0:
+            return list(self.vector)
 
-        return [x / magnitude for x in self.vector]
+        return self.embedding_vector.normalized().tolist()
 
-    def dot_product(self, other_vector: List[float]) -> float:
+    def dot_product(self, other_vector: VectorLike) -> float:
         """
         Calculate dot product with another vector.
 
@@ -116,12 +167,9 @@ class VectorEmbedding:
         Raises:
             ValueError: If vectors have different dimensions
         """
-        if len(other_vector) != len(self.vector):
-            raise ValueError("Vectors must have same dimensions for dot product")
-
-        return sum(a * b for a, b in zip(self.vector, other_vector))
+        return self.embedding_vector.dot(other_vector)
 
-    def cosine_similarity(self, other_vector: List[float]) -> float:
+    def cosine_similarity(self, other_vector: VectorLike) -> float:
         """
         Calculate cosine similarity with another vector.
 
@@ -134,20 +182,23 @@ class VectorEmbedding:
         Raises:
             ValueError: If vectors have different dimensions
         """
-        if len(other_vector) != len(self.vector):
-            raise ValueError("Vectors must have same dimensions for cosine similarity")
+        return self.embedding_vector.cosine_similarity(other_vector)
 
-        dot_prod = self.dot_product(other_vector)
-        magnitude_self = self.calculate_magnitude()
-        magnitude_other = math.sqrt(sum(x * x for x in other_vector))
+    def cosine_similarities(self, others: Sequence["VectorEmbedding"]) -> np.ndarray:
+        """
+        Calculate cosine similarity with many embeddings in one vectorized call.
 
-        # Handle zero vector cases
-        if magnitude_self == 0.0 or magnitude_other == 0.0:
-            return 0.0
+        Args:
+            others: Embeddings to compare with
 
-        return dot_prod / (magnitude_self * magnitude_other)
+        Returns:
+            Array of cosine similarities, one per embedding
+        """
+        return cosine_similarities(
+            self.embedding_vector, [other.embedding_vector for other in others]
+        )
 
-    def euclidean_distance(self, other_vector: List[float]) -> float:
+    def euclidean_distance(self, other_vector: VectorLike) -> float:
         """
         Calculate Euclidean distance to another vector.
 
@@ -160,12 +211,9 @@ class VectorEmbedding:
         Raises:
             ValueError: If vectors have different dimensions
         """
-        if len(other_vector) != len(self.vector):
-            raise ValueError("Vectors must have same dimensions for Euclidean distance")
-
-        return math.sqrt(sum((a - b) ** 2 for a, b in zip(self.vector, other_vector)))
+        return self.embedding_vector.euclidean_distance(other_vector)
 
-    def is_similar_to(self, other_vector: List[float], threshold: float = 0.7) -> bool:
+    def is_similar_to(self, other_vector: VectorLike, threshold: float = 0.7) -> bool:
         """
         Check if this vector is similar to another vector based on cosine similarity.
 
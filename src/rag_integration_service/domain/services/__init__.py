@@ -6,5 +6,6 @@ for the RAG integration service domain.
 """
 
 from .speaker_rag_processing_service import SpeakerRAGProcessingService
+from .transcript_aligner import TranscriptAligner
 
-__all__ = ["SpeakerRAGProcessingService"]
+__all__ = ["SpeakerRAGProcessingService", "TranscriptAligner"]
@@ -0,0 +1,96 @@
+"""
+Speaker Error Statistics
+
+Incremental error frequency statistics for error-correction pairs, so a
+speaker's statistics can be computed while pairs stream through extraction
+without keeping every pair in memory.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ..entities.speaker_error_correction_pair import SpeakerErrorCorrectionPair
+
+TOP_EXAMPLES = 5
+
+
+class SpeakerErrorFrequencyAccumulator:
+    """
+    Accumulates per-error-type counts, confidences and top examples.
+
+    Memory is bounded by the number of error types; each type keeps only its
+    highest-confidence examples.
+    """
+
+    def __init__(self, top_examples: int = TOP_EXAMPLES):
+        self._top_examples = top_examples
+        self._total = 0
+        self._types: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def total_pairs(self) -> int:
+        """Number of pairs added so far."""
+        return self._total
+
+    def add(self, pairs: Iterable[SpeakerErrorCorrectionPair]) -> None:
+        """
+        Add error-correction pairs to the statistics.
+
+        Args:
+            pairs: Error-correction pairs
+        """
+        for pair in pairs:
+            error_type = pair.categorize_error_type()
+            data = self._types.get(error_type)
+            if data is None:
+                data = {"count": 0, "confidence_sum": 0.0, "confident": 0, "top": []}
+                self._types[error_type] = data
+
+            confidence = float(pair.confidence_score) if pair.confidence_score else 0.0
+            data["count"] += 1
+            if confidence > 0:
+                data["confidence_sum"] += confidence
+                data["confident"] += 1
+
+            # Earlier examples win ties, as with a stable sort
+            entry: Tuple[float, int, Dict[str, Any]] = (
+                confidence,
+                -self._total,
+                {
+                    "error": pair.error_text,
+                    "correction": pair.correction_text,
+                    "confidence": confidence,
+                },
+            )
+            if len(data["top"]) < self._top_examples:
+                heapq.heappush(data["top"], entry)
+            elif entry[:2] > data["top"][0][:2]:
+                heapq.heapreplace(data["top"], entry)
+
+            self._total += 1
+
+    def statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get error frequency statistics for the pairs added so far.
+
+        Returns:
+            Dictionary mapping error types to count, frequency, percentage,
+            average confidence and top examples
+        """
+        statistics = {}
+        for error_type, data in self._types.items():
+            examples: List[Dict[str, Any]] = [
+                example for _, _, example in sorted(data["top"], reverse=True)
+            ]
+            statistics[error_type] = {
+                "count": data["count"],
+                "examples": examples,
+                "avg_confidence": (
+                    data["confidence_sum"] / data["confident"]
+                    if data["confident"]
+                    else 0.0
+                ),
+                "frequency": data["count"] / self._total,
+                "percentage": (data["count"] / self._total) * 100,
+            }
+        return statistics
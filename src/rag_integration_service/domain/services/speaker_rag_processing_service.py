@@ -8,10 +8,14 @@ Implements business logic for error-correction pair generation and speaker-speci
 import re
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
+
+from src.domain.text_normalization import TokenSpan, split_sentence_tokens
 
 from ..entities.speaker_error_correction_pair import SpeakerErrorCorrectionPair
 from ..entities.speaker_rag_processing_job import JobType, SpeakerRAGProcessingJob
+from .speaker_error_statistics import SpeakerErrorFrequencyAccumulator
+from .transcript_aligner import TranscriptAligner
 
 
 class SpeakerRAGProcessingService:
@@ -22,9 +26,14 @@ class SpeakerRAGProcessingService:
     extracting error-correction pairs, and preparing data for speaker-specific RAG training.
     """
 
-    def __init__(self):
-        """Initialize the speaker RAG processing service."""
-        pass
+    def __init__(self, aligner: Optional[TranscriptAligner] = None):
+        """
+        Initialize the speaker RAG processing service.
+
+        Args:
+            aligner: Sentence and word aligner for ASR and final text
+        """
+        self._aligner = aligner or TranscriptAligner()
 
     def extract_error_correction_pairs(
         self,
@@ -47,41 +56,47 @@ class SpeakerRAGProcessingService:
         Returns:
             List of error-correction pairs
         """
-        # Normalize texts for processing
-        asr_normalized = self._normalize_text(asr_text)
-        final_normalized = self._normalize_text(final_text)
-
-        # Tokenize texts into sentences
-        asr_sentences = self._tokenize_sentences(asr_normalized)
-        final_sentences = self._tokenize_sentences(final_normalized)
+        # Tokenize texts into sentences of words with their offsets
+        asr_sentences = self._tokenize_sentences(asr_text)
+        final_sentences = self._tokenize_sentences(final_text)
 
         # Align sentences and extract differences
         pairs = []
         aligned_sentences = self._align_sentences(asr_sentences, final_sentences)
 
-        for asr_sent, final_sent, alignment_score in aligned_sentences:
+        for asr_tokens, final_tokens, alignment_score in aligned_sentences:
+            asr_words = [token.text for token in asr_tokens]
+            final_words = [token.text for token in final_tokens]
+
             if (
-                asr_sent != final_sent and alignment_score > 0.3
+                asr_words != final_words and alignment_score > 0.3
             ):  # Threshold for meaningful alignment
                 # Extract word-level differences
-                word_pairs = self._extract_word_level_differences(asr_sent, final_sent)
+                word_ranges = self._extract_word_level_differences(
+                    asr_words, final_words
+                )
+
+                for i1, i2, j1, j2, confidence in word_ranges:
+                    error_start = asr_tokens[i1].start
+                    error_end = asr_tokens[i2 - 1].end
 
-                for error_phrase, correction_phrase, confidence in word_pairs:
                     # Get context around the error
                     context_before, context_after = self._extract_context(
-                        asr_text, error_phrase, context_window
+                        asr_text, error_start, error_end, context_window
                     )
 
                     # Create error-correction pair
                     pair = SpeakerErrorCorrectionPair(
-                        id=UUID(),  # Will be generated by repository
+                        id=uuid4(),
                         speaker_id=speaker_id,
                         historical_data_id=historical_data_id,
-                        error_text=error_phrase,
-                        correction_text=correction_phrase,
+                        error_text=" ".join(asr_words[i1:i2]),
+                        correction_text=" ".join(final_words[j1:j2]),
                         context_before=context_before,
                         context_after=context_after,
                         confidence_score=Decimal(str(confidence)),
+                        error_start_offset=error_start,
+                        error_end_offset=error_end,
                     )
 
                     # Only include if suitable for training
@@ -155,91 +170,29 @@ class SpeakerRAGProcessingService:
         Returns:
             Dictionary with error frequency statistics
         """
-        if not error_correction_pairs:
-            return {}
-
-        # Count errors by type
-        error_counts = {}
-        total_pairs = len(error_correction_pairs)
-
-        for pair in error_correction_pairs:
-            error_type = pair.categorize_error_type()
-            if error_type not in error_counts:
-                error_counts[error_type] = {
-                    "count": 0,
-                    "examples": [],
-                    "avg_confidence": 0.0,
-                }
-
-            error_counts[error_type]["count"] += 1
-            error_counts[error_type]["examples"].append(
-                {
-                    "error": pair.error_text,
-                    "correction": pair.correction_text,
-                    "confidence": (
-                        float(pair.confidence_score) if pair.confidence_score else 0.0
-                    ),
-                }
-            )
-
-        # Calculate statistics
-        for error_type, data in error_counts.items():
-            data["frequency"] = data["count"] / total_pairs
-            data["percentage"] = (data["count"] / total_pairs) * 100
-
-            # Calculate average confidence
-            confidences = [
-                ex["confidence"] for ex in data["examples"] if ex["confidence"] > 0
-            ]
-            data["avg_confidence"] = (
-                sum(confidences) / len(confidences) if confidences else 0.0
-            )
-
-            # Keep only top examples
-            data["examples"] = sorted(
-                data["examples"], key=lambda x: x["confidence"], reverse=True
-            )[:5]
-
-        return error_counts
-
-    def _normalize_text(self, text: str) -> str:
-        """
-        Normalize text for processing.
-
-        Args:
-            text: Input text
+        accumulator = SpeakerErrorFrequencyAccumulator()
+        accumulator.add(error_correction_pairs)
+        return accumulator.statistics()
 
-        Returns:
-            Normalized text
+    def _tokenize_sentences(self, text: str) -> List[List[TokenSpan]]:
         """
-        if not text:
-            return ""
-
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        Tokenize text into sentences of words.
 
-        # Normalize punctuation spacing
-        text = re.sub(r"\s*([.!?])\s*", r"\1 ", text)
-
-        return text.strip()
-
-    def _tokenize_sentences(self, text: str) -> List[str]:
-        """
-        Tokenize text into sentences.
+        Words keep their character offsets in the original text.
 
         Args:
             text: Input text
 
         Returns:
-            List of sentences
+            List of sentences, each a list of word spans
         """
-        # Simple sentence tokenization
-        sentences = re.split(r"[.!?]+", text)
-        return [s.strip() for s in sentences if s.strip()]
+        return split_sentence_tokens(text)
 
     def _align_sentences(
-        self, asr_sentences: List[str], final_sentences: List[str]
-    ) -> List[Tuple[str, str, float]]:
+        self,
+        asr_sentences: List[List[TokenSpan]],
+        final_sentences: List[List[TokenSpan]],
+    ) -> List[Tuple[List[TokenSpan], List[TokenSpan], float]]:
         """
         Align sentences between ASR and final text.
 
@@ -248,118 +201,60 @@ class SpeakerRAGProcessingService:
             final_sentences: Final sentences
 
         Returns:
-            List of (asr_sentence, final_sentence, alignment_score) tuples
+            List of (asr_tokens, final_tokens, alignment_score) tuples; a side
+            aligned with two sentences has their tokens concatenated
         """
-        aligned = []
-
-        # Simple alignment based on sentence position and similarity
-        max_len = max(len(asr_sentences), len(final_sentences))
-
-        for i in range(max_len):
-            asr_sent = asr_sentences[i] if i < len(asr_sentences) else ""
-            final_sent = final_sentences[i] if i < len(final_sentences) else ""
-
-            # Calculate simple similarity score
-            similarity = self._calculate_sentence_similarity(asr_sent, final_sent)
-            aligned.append((asr_sent, final_sent, similarity))
-
-        return aligned
-
-    def _calculate_sentence_similarity(self, sent1: str, sent2: str) -> float:
-        """
-        Calculate similarity between two sentences.
-
-        Args:
-            sent1: First sentence
-            sent2: Second sentence
-
-        Returns:
-            Similarity score (0.0 to 1.0)
-        """
-        if not sent1 and not sent2:
-            return 1.0
-
-        if not sent1 or not sent2:
-            return 0.0
-
-        words1 = set(sent1.lower().split())
-        words2 = set(sent2.lower().split())
-
-        if not words1 and not words2:
-            return 1.0
-
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union) if union else 0.0
+        ranges = self._aligner.align_sentence_ranges(
+            [" ".join(token.text for token in sentence) for sentence in asr_sentences],
+            [
+                " ".join(token.text for token in sentence)
+                for sentence in final_sentences
+            ],
+        )
+        return [
+            (
+                [token for sentence in asr_sentences[i1:i2] for token in sentence],
+                [token for sentence in final_sentences[j1:j2] for token in sentence],
+                alignment_score,
+            )
+            for i1, i2, j1, j2, alignment_score in ranges
+        ]
 
     def _extract_word_level_differences(
-        self, asr_sentence: str, final_sentence: str
-    ) -> List[Tuple[str, str, float]]:
+        self, asr_words: List[str], final_words: List[str]
+    ) -> List[Tuple[int, int, int, int, float]]:
         """
-        Extract word-level differences between sentences.
+        Extract word-level differences between aligned sentences.
 
         Args:
-            asr_sentence: ASR sentence
-            final_sentence: Final sentence
+            asr_words: ASR words
+            final_words: Final words
 
         Returns:
-            List of (error_phrase, correction_phrase, confidence) tuples
+            List of (asr_start, asr_end, final_start, final_end, confidence)
+            tuples with half-open word ranges
         """
-        differences = []
-
-        asr_words = asr_sentence.split()
-        final_words = final_sentence.split()
-
-        # Simple word-by-word comparison
-        max_len = max(len(asr_words), len(final_words))
-
-        i = 0
-        while i < max_len:
-            if i >= len(asr_words):
-                # Insertion in final text
-                differences.append(("", final_words[i], 0.8))
-            elif i >= len(final_words):
-                # Deletion from ASR text
-                differences.append((asr_words[i], "", 0.8))
-            elif asr_words[i] != final_words[i]:
-                # Substitution
-                differences.append((asr_words[i], final_words[i], 0.9))
-
-            i += 1
-
-        return differences
+        return self._aligner.word_difference_ranges(asr_words, final_words)
 
     def _extract_context(
-        self, full_text: str, error_phrase: str, context_window: int
+        self, full_text: str, error_start: int, error_end: int, context_window: int
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         Extract context around an error phrase.
 
         Args:
             full_text: Full text containing the error
-            error_phrase: Error phrase to find context for
+            error_start: Offset of the first character of the error phrase
+            error_end: Offset just past the last character of the error phrase
             context_window: Context window size in characters
 
         Returns:
             Tuple of (context_before, context_after)
         """
-        if not error_phrase or error_phrase not in full_text:
-            return None, None
-
-        error_pos = full_text.find(error_phrase)
+        context_before = full_text[max(0, error_start - context_window) : error_start]
+        context_after = full_text[error_end : error_end + context_window]
 
-        # Extract context before
-        start_pos = max(0, error_pos - context_window)
-        context_before = full_text[start_pos:error_pos].strip()
-
-        # Extract context after
-        end_pos = min(len(full_text), error_pos + len(error_phrase) + context_window)
-        context_after = full_text[error_pos + len(error_phrase) : end_pos].strip()
-
-        return context_before if context_before else None, (
-            context_after if context_after else None
-        )
+        return context_before.strip() or None, context_after.strip() or None
 
     def _classify_error_type(self, error_text: str, correction_text: str) -> str:
         """
@@ -0,0 +1,257 @@
+"""
+Transcript Aligner
+
+Aligns ASR output with the final transcript for error-correction pair
+extraction. Sentences are matched with a similarity-weighted dynamic
+program that tolerates dropped, inserted, split and merged sentences, and
+words are diffed with difflib opcodes so an inserted or deleted word does
+not shift every following word into a spurious substitution.
+"""
+
+from difflib import SequenceMatcher
+from typing import FrozenSet, List, Sequence, Tuple
+
+# Alignment moves: (ASR sentences consumed, final sentences consumed)
+_SENTENCE_MOVES = ((1, 1), (1, 0), (0, 1), (2, 1), (1, 2))
+
+
+class TranscriptAligner:
+    """
+    Sentence and word alignment between ASR and final transcripts.
+
+    Identical sentences anchor the alignment. Between anchors, sentences are
+    aligned to maximize the summed word-set similarity of aligned pairs;
+    pairing one sentence with two adjacent sentences of the other side
+    covers sentence boundaries that ASR punctuation moved. The search is
+    limited to a band around the diagonal, which keeps long changed regions
+    linear in practice.
+    """
+
+    def __init__(
+        self,
+        band_width: int = 8,
+        max_phrase_words: int = 6,
+        substitution_confidence: float = 0.9,
+        indel_confidence: float = 0.8,
+        min_confidence: float = 0.5,
+    ):
+        """
+        Initialize the aligner.
+
+        Args:
+            band_width: Sentences the alignment may drift off the diagonal,
+                in addition to the difference in sentence counts
+            max_phrase_words: Phrase length above which confidence bottoms out
+            substitution_confidence: Confidence of a single-word substitution
+            indel_confidence: Confidence of an anchored insertion or deletion
+            min_confidence: Confidence floor for long phrase substitutions
+        """
+        self._band_width = band_width
+        self._max_phrase_words = max_phrase_words
+        self._substitution_confidence = substitution_confidence
+        self._indel_confidence = indel_confidence
+        self._min_confidence = min_confidence
+
+    def align_sentences(
+        self, asr_sentences: Sequence[str], final_sentences: Sequence[str]
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Align sentences between ASR and final text.
+
+        Args:
+            asr_sentences: ASR sentences
+            final_sentences: Final sentences
+
+        Returns:
+            List of (asr_sentence, final_sentence, alignment_score) tuples in
+            document order; unmatched sentences are paired with "" and score 0.0
+        """
+        return [
+            (
+                " ".join(asr_sentences[i1:i2]),
+                " ".join(final_sentences[j1:j2]),
+                similarity,
+            )
+            for i1, i2, j1, j2, similarity in self.align_sentence_ranges(
+                asr_sentences, final_sentences
+            )
+        ]
+
+    def align_sentence_ranges(
+        self, asr_sentences: Sequence[str], final_sentences: Sequence[str]
+    ) -> List[Tuple[int, int, int, int, float]]:
+        """
+        Align sentences between ASR and final text by index.
+
+        Args:
+            asr_sentences: ASR sentences
+            final_sentences: Final sentences
+
+        Returns:
+            List of (asr_start, asr_end, final_start, final_end, alignment_score)
+            tuples in document order; the ranges are half-open and one of
+            them is empty for an unmatched sentence
+        """
+        # Unchanged sentences anchor the alignment; only the regions between
+        # them need the similarity search
+        matcher = SequenceMatcher(None, asr_sentences, final_sentences, autojunk=False)
+        aligned = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                aligned.extend(
+                    (i, i + 1, j, j + 1, 1.0)
+                    for i, j in zip(range(i1, i2), range(j1, j2))
+                )
+            else:
+                aligned.extend(
+                    (i1 + a1, i1 + a2, j1 + b1, j1 + b2, similarity)
+                    for a1, a2, b1, b2, similarity in self._align_region(
+                        asr_sentences[i1:i2], final_sentences[j1:j2]
+                    )
+                )
+        return aligned
+
+    def _align_region(
+        self, asr_sentences: Sequence[str], final_sentences: Sequence[str]
+    ) -> List[Tuple[int, int, int, int, float]]:
+        """Align sentences of a changed region by maximizing summed similarity."""
+        n, m = len(asr_sentences), len(final_sentences)
+        asr_words = [_word_set(sentence) for sentence in asr_sentences]
+        final_words = [_word_set(sentence) for sentence in final_sentences]
+        band = self._band_width + abs(n - m)
+
+        def in_band(i: int, j: int) -> bool:
+            return abs(i * m - j * n) <= band * max(n, m, 1)
+
+        # best[(i, j)] = (score, move, similarity) of the best alignment
+        # of the first i ASR and first j final sentences
+        best = {(0, 0): (0.0, None, 0.0)}
+        for i in range(n + 1):
+            for j in range(m + 1):
+                if (i, j) == (0, 0) or not in_band(i, j):
+                    continue
+                candidate = None
+                for di, dj in _SENTENCE_MOVES:
+                    previous = best.get((i - di, j - dj))
+                    if previous is None:
+                        continue
+                    similarity = (
+                        _jaccard(
+                            _span_words(asr_words, i - di, i),
+                            _span_words(final_words, j - dj, j),
+                        )
+                        if di and dj
+                        else 0.0
+                    )
+                    score = previous[0] + similarity
+                    if candidate is None or score > candidate[0]:
+                        candidate = (score, (di, dj), similarity)
+                if candidate is not None:
+                    best[(i, j)] = candidate
+
+        aligned = []
+        i, j = n, m
+        while (i, j) != (0, 0):
+            _, (di, dj), similarity = best[(i, j)]
+            aligned.append((i - di, i, j - dj, j, similarity))
+            i, j = i - di, j - dj
+
+        aligned.reverse()
+        return aligned
+
+    def word_differences(
+        self, asr_sentence: str, final_sentence: str
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Extract phrase-level differences between two aligned sentences.
+
+        Args:
+            asr_sentence: ASR sentence
+            final_sentence: Final sentence
+
+        Returns:
+            List of (error_phrase, correction_phrase, confidence) tuples
+        """
+        asr_words = asr_sentence.split()
+        final_words = final_sentence.split()
+        return [
+            (" ".join(asr_words[i1:i2]), " ".join(final_words[j1:j2]), confidence)
+            for i1, i2, j1, j2, confidence in self.word_difference_ranges(
+                asr_words, final_words
+            )
+        ]
+
+    def word_difference_ranges(
+        self, asr_words: Sequence[str], final_words: Sequence[str]
+    ) -> List[Tuple[int, int, int, int, float]]:
+        """
+        Extract phrase-level differences between two aligned word sequences.
+
+        Consecutive changed words become one phrase pair. Insertions and
+        deletions are anchored on the neighbouring unchanged words, so both
+        sides of every pair are non-empty.
+
+        Args:
+            asr_words: ASR words
+            final_words: Final words
+
+        Returns:
+            List of (asr_start, asr_end, final_start, final_end, confidence)
+            tuples with half-open word ranges
+        """
+        matcher = SequenceMatcher(None, asr_words, final_words, autojunk=False)
+
+        differences = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+
+            if tag == "replace":
+                confidence = self._phrase_confidence(max(i2 - i1, j2 - j1))
+            else:
+                # Anchor on the unchanged words either side of the gap
+                anchors = 0
+                if i1 > 0 and j1 > 0:
+                    i1, j1, anchors = i1 - 1, j1 - 1, anchors + 1
+                if i2 < len(asr_words) and j2 < len(final_words):
+                    i2, j2, anchors = i2 + 1, j2 + 1, anchors + 1
+                if not anchors:
+                    continue
+                confidence = min(
+                    self._indel_confidence,
+                    self._phrase_confidence(max(i2 - i1, j2 - j1) - anchors),
+                )
+
+            differences.append((i1, i2, j1, j2, confidence))
+
+        return differences
+
+    def _phrase_confidence(self, phrase_words: int) -> float:
+        """Confidence of a substitution, lower for longer rewritten phrases."""
+        if phrase_words <= 1:
+            return self._substitution_confidence
+        span = max(1, self._max_phrase_words - 1)
+        fraction = min(1.0, (phrase_words - 1) / span)
+        confidence = self._substitution_confidence - fraction * (
+            self._substitution_confidence - self._min_confidence
+        )
+        return round(confidence, 2)
+
+
+def _word_set(sentence: str) -> FrozenSet[str]:
+    return frozenset(sentence.lower().split())
+
+
+def _span_words(
+    word_sets: Sequence[FrozenSet[str]], start: int, end: int
+) -> FrozenSet[str]:
+    if end - start == 1:
+        return word_sets[start]
+    return frozenset().union(*word_sets[start:end])
+
+
+def _jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+    union = words1 | words2
+    if not union:
+        return 1.0
+    return len(words1 & words2) / len(union)
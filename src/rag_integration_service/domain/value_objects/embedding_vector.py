@@ -0,0 +1,167 @@
+"""
+Embedding Vector Value Object
+
+Compact, immutable representation of an embedding vector backed by a
+read-only float32 NumPy array with a cached norm. Provides vectorized
+similarity helpers that score one query against many vectors at once.
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Union
+
+import numpy as np
+
+VectorLike = Union["EmbeddingVector", np.ndarray, Sequence[float]]
+
+
+@dataclass(frozen=True, eq=False)
+class EmbeddingVector:
+    """
+    Immutable float32 embedding vector.
+
+    The underlying array is marked read-only, so views handed out by
+    `values` and `normalized` can be shared without copying.
+    """
+
+    values: np.ndarray
+    norm: float
+
+    @classmethod
+    def from_values(cls, values: VectorLike) -> "EmbeddingVector":
+        """
+        Create an EmbeddingVector, validating that all values are numeric.
+
+        Read-only float32 arrays are wrapped without copying; anything else
+        is copied into a new read-only float32 array.
+
+        Args:
+            values: Vector values (list, array or EmbeddingVector)
+
+        Returns:
+            EmbeddingVector instance
+
+        Raises:
+            ValueError: If the values are not a flat numeric sequence
+        """
+        if isinstance(values, EmbeddingVector):
+            return values
+
+        if (
+            isinstance(values, np.ndarray)
+            and values.dtype == np.float32
+            and not values.flags.writeable
+        ):
+            array = values
+        else:
+            array = np.asarray(values)
+            if array.ndim != 1 or array.dtype.kind not in "biuf":
+                raise ValueError("vector must contain only numeric values")
+            array = np.array(array, dtype=np.float32)
+            array.flags.writeable = False
+
+        if array.ndim != 1:
+            raise ValueError("vector must be one-dimensional")
+
+        return cls(values=array, norm=float(np.linalg.norm(array)))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmbeddingVector):
+            return NotImplemented
+        return np.array_equal(self.values, other.values)
+
+    __hash__ = None
+
+    def to_list(self) -> List[float]:
+        """Get the values as a list of Python floats."""
+        return self.values.tolist()
+
+    def normalized(self) -> np.ndarray:
+        """Get the unit-length vector (the vector itself if its norm is 0)."""
+        if self.norm == 0.0:
+            return self.values
+        unit = self.values / np.float32(self.norm)
+        unit.flags.writeable = False
+        return unit
+
+    def dot(self, other: VectorLike) -> float:
+        """Dot product with another vector of the same dimension."""
+        other_values = _as_array(other)
+        if other_values.shape != self.values.shape:
+            raise ValueError("Vectors must have same dimensions for dot product")
+        return float(np.dot(self.values, other_values))
+
+    def cosine_similarity(self, other: VectorLike) -> float:
+        """Cosine similarity with another vector (0.0 if either is zero)."""
+        other_vector = EmbeddingVector.from_values(other)
+        if other_vector.values.shape != self.values.shape:
+            raise ValueError("Vectors must have same dimensions for cosine similarity")
+        if self.norm == 0.0 or other_vector.norm == 0.0:
+            return 0.0
+        return float(np.dot(self.values, other_vector.values)) / (
+            self.norm * other_vector.norm
+        )
+
+    def euclidean_distance(self, other: VectorLike) -> float:
+        """Euclidean distance to another vector of the same dimension."""
+        other_values = _as_array(other)
+        if other_values.shape != self.values.shape:
+            raise ValueError("Vectors must have same dimensions for Euclidean distance")
+        return float(np.linalg.norm(self.values - other_values))
+
+
+def stack_vectors(vectors: Sequence[VectorLike]) -> np.ndarray:
+    """
+    Stack vectors into an (N, D) float32 matrix.
+
+    Args:
+        vectors: Vectors of equal dimension
+
+    Returns:
+        float32 matrix with one row per vector
+    """
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([_as_array(vector) for vector in vectors])
+
+
+def cosine_similarities(
+    query: VectorLike, vectors: Union[np.ndarray, Sequence[VectorLike]]
+) -> np.ndarray:
+    """
+    Score one query against N vectors with a single matrix-vector product.
+
+    Args:
+        query: Query vector
+        vectors: (N, D) matrix or sequence of N vectors
+
+    Returns:
+        Array of N cosine similarities (0.0 where either vector is zero)
+    """
+    query_vector = EmbeddingVector.from_values(query)
+    matrix = vectors if isinstance(vectors, np.ndarray) else stack_vectors(vectors)
+    if len(matrix) == 0:
+        return np.empty(0, dtype=np.float32)
+    if matrix.shape[1] != len(query_vector):
+        raise ValueError("Vectors must have same dimensions for cosine similarity")
+
+    if not isinstance(vectors, np.ndarray) and all(
+        isinstance(vector, EmbeddingVector) for vector in vectors
+    ):
+        # Reuse cached norms instead of recomputing them from the matrix
+        norms = np.fromiter(
+            (vector.norm for vector in vectors), np.float32, len(vectors)
+        )
+    else:
+        norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    norms = norms * np.float32(query_vector.norm)
+    dots = matrix @ query_vector.values
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+
+
+def _as_array(vector: VectorLike) -> np.ndarray:
+    if isinstance(vector, EmbeddingVector):
+        return vector.values
+    return np.asarray(vector, dtype=np.float32)
@@ -0,0 +1,9 @@
+"""
+Cache Adapters
+
+This module contains cache adapters for the RAG integration service.
+"""
+
+from .in_memory_cache_adapter import InMemoryCacheAdapter
+
+__all__ = ["InMemoryCacheAdapter"]
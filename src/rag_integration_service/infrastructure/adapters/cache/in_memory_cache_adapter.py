@@ -0,0 +1,172 @@
+"""
+In-Memory Cache Adapter
+
+Implementation of CachePort that keeps entries in process memory with
+per-key expiry. Used for development and tests until a Redis adapter is
+configured.
+"""
+
+import fnmatch
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from rag_integration_service.application.ports.secondary.cache_port import CachePort
+from rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+
+EMBEDDING_KEY_PREFIX = "embedding:"
+SEARCH_RESULTS_KEY_PREFIX = "search:"
+
+
+class InMemoryCacheAdapter(CachePort):
+    """
+    In-memory implementation of the cache port.
+
+    Entries are stored as (value, expires_at) tuples; expired entries are
+    removed when they are read.
+    """
+
+    def __init__(self, default_ttl: Optional[int] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            default_ttl: TTL in seconds for entries stored without one;
+                entries never expire by default
+        """
+        self._default_ttl = default_ttl
+        self._entries: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value from cache by key."""
+        entry = self._live_entry(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry[0]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Store a value in cache with optional TTL."""
+        ttl = ttl if ttl is not None else self._default_ttl
+        self._entries[key] = (value, time.monotonic() + ttl if ttl else None)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete a value from cache."""
+        return self._entries.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists in cache."""
+        return self._live_entry(key) is not None
+
+    async def get_embedding(self, text_hash: str) -> Optional[VectorEmbedding]:
+        """Retrieve a vector embedding from cache by text hash."""
+        return await self.get(EMBEDDING_KEY_PREFIX + text_hash)
+
+    async def set_embedding(
+        self, text_hash: str, embedding: VectorEmbedding, ttl: Optional[int] = None
+    ) -> bool:
+        """Store a vector embedding in cache."""
+        return await self.set(EMBEDDING_KEY_PREFIX + text_hash, embedding, ttl)
+
+    async def get_embeddings_batch(
+        self, text_hashes: List[str]
+    ) -> List[Optional[VectorEmbedding]]:
+        """Retrieve many vector embeddings from cache by text hash."""
+        return await self.get_batch(
+            [EMBEDDING_KEY_PREFIX + text_hash for text_hash in text_hashes]
+        )
+
+    async def set_embeddings_batch(
+        self, embeddings: List[VectorEmbedding], ttl: Optional[int] = None
+    ) -> bool:
+        """Store many vector embeddings in cache, keyed by text hash."""
+        return await self.set_batch(
+            [
+                (EMBEDDING_KEY_PREFIX + embedding.text_hash, embedding)
+                for embedding in embeddings
+            ],
+            ttl,
+        )
+
+    async def get_search_results(self, query_hash: str) -> Optional[Dict[str, Any]]:
+        """Retrieve search results from cache."""
+        return await self.get(SEARCH_RESULTS_KEY_PREFIX + query_hash)
+
+    async def set_search_results(
+        self, query_hash: str, results: Dict[str, Any], ttl: Optional[int] = None
+    ) -> bool:
+        """Store search results in cache."""
+        return await self.set(SEARCH_RESULTS_KEY_PREFIX + query_hash, results, ttl)
+
+    async def invalidate_by_pattern(self, pattern: str) -> int:
+        """Invalidate cache entries matching a glob pattern."""
+        keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    async def get_batch(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve multiple values from cache."""
+        return [await self.get(key) for key in keys]
+
+    async def set_batch(self, items: List[tuple], ttl: Optional[int] = None) -> bool:
+        """Store multiple values in cache."""
+        for key, value in items:
+            await self.set(key, value, ttl)
+        return True
+
+    async def health_check(self) -> bool:
+        """Check if the cache is healthy and responsive."""
+        return True
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics and metrics."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+        }
+
+    async def clear_all(self) -> bool:
+        """Clear all cache entries."""
+        self._entries.clear()
+        return True
+
+    async def get_ttl(self, key: str) -> Optional[int]:
+        """Get the remaining time to live for a cache key."""
+        entry = self._live_entry(key)
+        if entry is None or entry[1] is None:
+            return None
+        return max(0, int(entry[1] - time.monotonic()))
+
+    async def extend_ttl(self, key: str, ttl: int) -> bool:
+        """Set a new time to live for a cache key."""
+        entry = self._live_entry(key)
+        if entry is None:
+            return False
+        self._entries[key] = (entry[0], time.monotonic() + ttl)
+        return True
+
+    async def increment(self, key: str, amount: int = 1) -> int:
+        """Increment a numeric value in cache, keeping its expiry."""
+        entry = self._live_entry(key)
+        value, expires_at = entry if entry is not None else (0, None)
+        self._entries[key] = (value + amount, expires_at)
+        return value + amount
+
+    async def decrement(self, key: str, amount: int = 1) -> int:
+        """Decrement a numeric value in cache, keeping its expiry."""
+        return await self.increment(key, -amount)
+
+    def _live_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Return the entry for key, dropping it first if it has expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
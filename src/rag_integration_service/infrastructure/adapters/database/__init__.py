@@ -0,0 +1,14 @@
+"""
+Database Adapters
+
+This module contains speaker RAG repository adapters for the RAG integration
+service.
+"""
+
+from .in_memory import InMemorySpeakerRAGRepositoryAdapter
+from .postgresql import PostgreSQLSpeakerRAGRepositoryAdapter
+
+__all__ = [
+    "InMemorySpeakerRAGRepositoryAdapter",
+    "PostgreSQLSpeakerRAGRepositoryAdapter",
+]
@@ -0,0 +1,10 @@
+"""
+In-Memory Database Adapter
+
+This module contains an in-memory implementation of the speaker RAG
+repository for testing and development purposes.
+"""
+
+from .speaker_rag_repository_adapter import InMemorySpeakerRAGRepositoryAdapter
+
+__all__ = ["InMemorySpeakerRAGRepositoryAdapter"]
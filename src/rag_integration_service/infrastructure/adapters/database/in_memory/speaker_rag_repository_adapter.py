@@ -0,0 +1,275 @@
+"""
+In-Memory Speaker RAG Repository
+
+Implementation of ISpeakerRAGRepositoryPort that keeps error-correction
+pairs, processing jobs and embedding links in process memory. Used for
+development and tests until a persistent repository is configured.
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from .....application.ports.secondary.speaker_rag_repository_port import (
+    ISpeakerRAGRepositoryPort,
+)
+from .....domain.entities.speaker_error_correction_pair import (
+    SpeakerErrorCorrectionPair,
+)
+from .....domain.entities.speaker_rag_processing_job import (
+    JobStatus,
+    JobType,
+    SpeakerRAGProcessingJob,
+)
+
+
+class InMemorySpeakerRAGRepositoryAdapter(ISpeakerRAGRepositoryPort):
+    """
+    In-memory implementation of the speaker RAG repository.
+
+    Jobs are stored by reference, so a job object handed out by the
+    repository and later passed to update_processing_job stays the single
+    copy of that job.
+    """
+
+    def __init__(self):
+        self._pairs: Dict[UUID, SpeakerErrorCorrectionPair] = {}
+        self._jobs: Dict[UUID, SpeakerRAGProcessingJob] = {}
+        # speaker_id -> [(embedding_id, error_correction_pair_id)]
+        self._speaker_embeddings: Dict[UUID, List[Tuple[UUID, Optional[UUID]]]] = (
+            defaultdict(list)
+        )
+
+    # Error-Correction Pair operations
+
+    async def create_error_correction_pair(
+        self, pair: SpeakerErrorCorrectionPair
+    ) -> SpeakerErrorCorrectionPair:
+        """Create a new error-correction pair."""
+        self._pairs[pair.id] = pair
+        return pair
+
+    async def get_error_correction_pair_by_id(
+        self, pair_id: UUID
+    ) -> Optional[SpeakerErrorCorrectionPair]:
+        """Get error-correction pair by ID."""
+        return self._pairs.get(pair_id)
+
+    async def get_error_correction_pairs_by_speaker(
+        self,
+        speaker_id: UUID,
+        error_type: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[SpeakerErrorCorrectionPair]:
+        """Get error-correction pairs for a speaker."""
+        pairs = [
+            pair
+            for pair in self._pairs.values()
+            if pair.speaker_id == speaker_id
+            and (error_type is None or pair.error_type == error_type)
+            and (
+                min_confidence is None
+                or (
+                    pair.confidence_score is not None
+                    and float(pair.confidence_score) >= min_confidence
+                )
+            )
+        ]
+        return pairs[:limit] if limit is not None else pairs
+
+    async def get_error_correction_pairs_by_historical_data(
+        self, historical_data_id: UUID
+    ) -> List[SpeakerErrorCorrectionPair]:
+        """Get error-correction pairs for specific historical data."""
+        return [
+            pair
+            for pair in self._pairs.values()
+            if pair.historical_data_id == historical_data_id
+        ]
+
+    async def update_error_correction_pair(
+        self, pair: SpeakerErrorCorrectionPair
+    ) -> SpeakerErrorCorrectionPair:
+        """Update an error-correction pair."""
+        if pair.id not in self._pairs:
+            raise ValueError(f"Error-correction pair {pair.id} not found")
+        self._pairs[pair.id] = pair
+        return pair
+
+    async def delete_error_correction_pair(self, pair_id: UUID) -> bool:
+        """Delete an error-correction pair."""
+        return self._pairs.pop(pair_id, None) is not None
+
+    async def batch_create_error_correction_pairs(
+        self, pairs: List[SpeakerErrorCorrectionPair]
+    ) -> List[SpeakerErrorCorrectionPair]:
+        """Create multiple error-correction pairs in batch."""
+        for pair in pairs:
+            self._pairs[pair.id] = pair
+        return pairs
+
+    # Processing Job operations
+
+    async def create_processing_job(
+        self, job: SpeakerRAGProcessingJob
+    ) -> SpeakerRAGProcessingJob:
+        """Create a new processing job."""
+        self._jobs[job.id] = job
+        return job
+
+    async def get_processing_job_by_id(
+        self, job_id: UUID
+    ) -> Optional[SpeakerRAGProcessingJob]:
+        """Get processing job by ID."""
+        return self._jobs.get(job_id)
+
+    async def get_processing_jobs_by_speaker(
+        self,
+        speaker_id: UUID,
+        job_type: Optional[JobType] = None,
+        status: Optional[JobStatus] = None,
+    ) -> List[SpeakerRAGProcessingJob]:
+        """Get processing jobs for a speaker."""
+        return [
+            job
+            for job in self._jobs.values()
+            if job.speaker_id == speaker_id
+            and (job_type is None or job.job_type == job_type)
+            and (status is None or job.status == status)
+        ]
+
+    async def get_pending_processing_jobs(self) -> List[SpeakerRAGProcessingJob]:
+        """Get all pending processing jobs, oldest first."""
+        return self._jobs_with_status(JobStatus.PENDING)
+
+    async def get_running_processing_jobs(self) -> List[SpeakerRAGProcessingJob]:
+        """Get all running processing jobs, oldest first."""
+        return self._jobs_with_status(JobStatus.RUNNING)
+
+    async def update_processing_job(
+        self, job: SpeakerRAGProcessingJob
+    ) -> SpeakerRAGProcessingJob:
+        """Update a processing job."""
+        self._jobs[job.id] = job
+        return job
+
+    async def delete_processing_job(self, job_id: UUID) -> bool:
+        """Delete a processing job."""
+        return self._jobs.pop(job_id, None) is not None
+
+    # Speaker-specific embedding operations
+
+    async def link_embedding_to_speaker(
+        self,
+        embedding_id: UUID,
+        speaker_id: UUID,
+        error_correction_pair_id: Optional[UUID] = None,
+    ) -> bool:
+        """Link an embedding to a speaker and optionally to a pair."""
+        self._speaker_embeddings[speaker_id].append(
+            (embedding_id, error_correction_pair_id)
+        )
+        return True
+
+    async def batch_link_embeddings_to_speaker(
+        self, speaker_id: UUID, links: List[Tuple[UUID, UUID]]
+    ) -> int:
+        """Link many embeddings to a speaker and their pairs."""
+        self._speaker_embeddings[speaker_id].extend(links)
+        return len(links)
+
+    async def get_speaker_embeddings(
+        self, speaker_id: UUID, limit: Optional[int] = None
+    ) -> List[UUID]:
+        """Get embedding IDs for a speaker."""
+        embedding_ids = list(
+            dict.fromkeys(
+                embedding_id
+                for embedding_id, _ in self._speaker_embeddings.get(speaker_id, [])
+            )
+        )
+        return embedding_ids[:limit] if limit is not None else embedding_ids
+
+    async def get_embeddings_by_error_correction_pair(
+        self, pair_id: UUID
+    ) -> List[UUID]:
+        """Get embedding IDs for an error-correction pair."""
+        return list(
+            dict.fromkeys(
+                embedding_id
+                for links in self._speaker_embeddings.values()
+                for embedding_id, linked_pair_id in links
+                if linked_pair_id == pair_id
+            )
+        )
+
+    # Statistics and analytics operations
+
+    async def get_speaker_error_statistics(self, speaker_id: UUID) -> Dict[str, Any]:
+        """Get error statistics for a speaker."""
+        pairs = await self.get_error_correction_pairs_by_speaker(speaker_id)
+        confidences = [
+            float(pair.confidence_score)
+            for pair in pairs
+            if pair.confidence_score is not None
+        ]
+        return {
+            "speaker_id": str(speaker_id),
+            "total_pairs": len(pairs),
+            "error_type_distribution": await self.get_error_type_distribution(
+                speaker_id
+            ),
+            "average_confidence": (
+                sum(confidences) / len(confidences) if confidences else 0.0
+            ),
+            "total_embeddings": len(await self.get_speaker_embeddings(speaker_id)),
+        }
+
+    async def get_error_type_distribution(
+        self, speaker_id: Optional[UUID] = None
+    ) -> Dict[str, int]:
+        """Get distribution of error types."""
+        return dict(
+            Counter(
+                pair.error_type or "unknown"
+                for pair in self._pairs.values()
+                if speaker_id is None or pair.speaker_id == speaker_id
+            )
+        )
+
+    async def get_processing_job_statistics(self) -> Dict[str, Any]:
+        """Get processing job statistics."""
+        return {
+            "total_jobs": len(self._jobs),
+            "jobs_by_status": dict(
+                Counter(job.status.value for job in self._jobs.values())
+            ),
+            "jobs_by_type": dict(
+                Counter(job.job_type.value for job in self._jobs.values())
+            ),
+        }
+
+    async def cleanup_old_jobs(
+        self, older_than_days: int = 30, keep_failed_jobs: bool = True
+    ) -> int:
+        """Clean up old finished processing jobs."""
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        expired = [
+            job.id
+            for job in self._jobs.values()
+            if job.is_finished()
+            and job.created_at is not None
+            and job.created_at < cutoff
+            and not (keep_failed_jobs and job.status == JobStatus.FAILED)
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+    def _jobs_with_status(self, status: JobStatus) -> List[SpeakerRAGProcessingJob]:
+        return sorted(
+            (job for job in self._jobs.values() if job.status == status),
+            key=lambda job: job.created_at or datetime.min,
+        )
@@ -0,0 +1,10 @@
+"""
+PostgreSQL Database Adapter
+
+This module contains the SQLAlchemy implementation of the speaker RAG
+repository.
+"""
+
+from .speaker_rag_repository_adapter import PostgreSQLSpeakerRAGRepositoryAdapter
+
+__all__ = ["PostgreSQLSpeakerRAGRepositoryAdapter"]
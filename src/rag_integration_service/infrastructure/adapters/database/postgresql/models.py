@@ -0,0 +1,82 @@
+"""
+SQLAlchemy Models for the Speaker RAG Repository
+
+This module contains SQLAlchemy ORM models for speaker error-correction
+pairs, RAG processing jobs and speaker embedding links.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class SpeakerErrorCorrectionPairModel(Base):
+    """SQLAlchemy model for speaker error-correction pairs"""
+
+    __tablename__ = "speaker_error_correction_pairs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    speaker_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    historical_data_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    error_text = Column(Text, nullable=False)
+    correction_text = Column(Text, nullable=False)
+    error_type = Column(String(100), index=True)
+    context_before = Column(Text)
+    context_after = Column(Text)
+    confidence_score = Column(Numeric(5, 4))
+    embedding_id = Column(UUID(as_uuid=True))
+    pair_metadata = Column("metadata", JSON, default={})
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    error_start_offset = Column(Integer)
+    error_end_offset = Column(Integer)
+
+
+class SpeakerRAGProcessingJobModel(Base):
+    """SQLAlchemy model for speaker RAG processing jobs"""
+
+    __tablename__ = "speaker_rag_processing_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    speaker_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    job_type = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)
+    total_records = Column(Integer)
+    processed_records = Column(Integer, nullable=False, default=0)
+    error_records = Column(Integer, nullable=False, default=0)
+    progress_percentage = Column(Numeric(5, 2), nullable=False, default=0)
+    error_message = Column(Text)
+    # Holds the job's checkpoint and lease, so interrupted jobs can resume
+    job_metadata = Column(JSON, default={})
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Claimable jobs are polled by status, oldest first
+        Index("idx_speaker_rag_jobs_status_created", "status", "created_at"),
+    )
+
+
+class SpeakerEmbeddingLinkModel(Base):
+    """SQLAlchemy model linking embeddings to speakers and their pairs"""
+
+    __tablename__ = "speaker_embedding_links"
+
+    # Autoincrementing key keeps links in insertion order
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    speaker_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    embedding_id = Column(UUID(as_uuid=True), nullable=False)
+    error_correction_pair_id = Column(UUID(as_uuid=True), index=True)
@@ -0,0 +1,510 @@
+"""
+PostgreSQL Speaker RAG Repository
+
+Implementation of ISpeakerRAGRepositoryPort on SQLAlchemy's async engine.
+Processing jobs, including their checkpoints and leases, survive restarts,
+so interrupted jobs are resumed by the next job runner.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from .....application.ports.secondary.speaker_rag_repository_port import (
+    ISpeakerRAGRepositoryPort,
+)
+from .....domain.entities.speaker_error_correction_pair import (
+    SpeakerErrorCorrectionPair,
+)
+from .....domain.entities.speaker_rag_processing_job import (
+    JobStatus,
+    JobType,
+    SpeakerRAGProcessingJob,
+)
+from .models import (
+    Base,
+    SpeakerEmbeddingLinkModel,
+    SpeakerErrorCorrectionPairModel,
+    SpeakerRAGProcessingJobModel,
+)
+
+FINISHED_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class PostgreSQLSpeakerRAGRepositoryAdapter(ISpeakerRAGRepositoryPort):
+    """
+    PostgreSQL implementation of the speaker RAG repository.
+
+    Every call returns fresh entities; changes to a job are stored only
+    when it is passed to update_processing_job.
+    """
+
+    def __init__(self, connection_string: str):
+        """
+        Initialize the repository.
+
+        Args:
+            connection_string: SQLAlchemy async database URL; plain
+                postgresql:// URLs are served through asyncpg
+        """
+        self.connection_string = connection_string
+        url, connect_args = _async_engine_url(connection_string)
+        self.engine = create_async_engine(
+            url,
+            connect_args=connect_args,
+            echo=False,
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=30,
+            pool_recycle=3600,
+        )
+        self._session_factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+    async def create_tables(self) -> None:
+        """Create the repository's tables if they do not exist"""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def close(self) -> None:
+        """Close all pooled connections"""
+        await self.engine.dispose()
+
+    # Error-Correction Pair operations
+
+    async def create_error_correction_pair(
+        self, pair: SpeakerErrorCorrectionPair
+    ) -> SpeakerErrorCorrectionPair:
+        """Create a new error-correction pair."""
+        await self.batch_create_error_correction_pairs([pair])
+        return pair
+
+    async def get_error_correction_pair_by_id(
+        self, pair_id: UUID
+    ) -> Optional[SpeakerErrorCorrectionPair]:
+        """Get error-correction pair by ID."""
+        async with self._session_factory() as session:
+            model = await session.get(SpeakerErrorCorrectionPairModel, pair_id)
+            return self._model_to_pair(model) if model is not None else None
+
+    async def get_error_correction_pairs_by_speaker(
+        self,
+        speaker_id: UUID,
+        error_type: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[SpeakerErrorCorrectionPair]:
+        """Get error-correction pairs for a speaker."""
+        stmt = (
+            select(SpeakerErrorCorrectionPairModel)
+            .where(SpeakerErrorCorrectionPairModel.speaker_id == speaker_id)
+            .order_by(SpeakerErrorCorrectionPairModel.created_at)
+            .limit(limit)
+        )
+        if error_type is not None:
+            stmt = stmt.where(SpeakerErrorCorrectionPairModel.error_type == error_type)
+        if min_confidence is not None:
+            stmt = stmt.where(
+                SpeakerErrorCorrectionPairModel.confidence_score >= min_confidence
+            )
+        return await self._select_pairs(stmt)
+
+    async def get_error_correction_pairs_by_historical_data(
+        self, historical_data_id: UUID
+    ) -> List[SpeakerErrorCorrectionPair]:
+        """Get error-correction pairs for specific historical data."""
+        return await self._select_pairs(
+            select(SpeakerErrorCorrectionPairModel)
+            .where(
+                SpeakerErrorCorrectionPairModel.historical_data_id == historical_data_id
+            )
+            .order_by(SpeakerErrorCorrectionPairModel.created_at)
+        )
+
+    async def update_error_correction_pair(
+        self, pair: SpeakerErrorCorrectionPair
+    ) -> SpeakerErrorCorrectionPair:
+        """Update an error-correction pair."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(SpeakerErrorCorrectionPairModel)
+                .where(SpeakerErrorCorrectionPairModel.id == pair.id)
+                .values(**self._pair_to_values(pair))
+            )
+            if result.rowcount == 0:
+                raise ValueError(f"Error-correction pair {pair.id} not found")
+            await session.commit()
+        return pair
+
+    async def delete_error_correction_pair(self, pair_id: UUID) -> bool:
+        """Delete an error-correction pair."""
+        return await self._delete(
+            SpeakerErrorCorrectionPairModel, SpeakerErrorCorrectionPairModel.id, pair_id
+        )
+
+    async def batch_create_error_correction_pairs(
+        self, pairs: List[SpeakerErrorCorrectionPair]
+    ) -> List[SpeakerErrorCorrectionPair]:
+        """Create multiple error-correction pairs in one transaction."""
+        if pairs:
+            async with self._session_factory() as session:
+                await session.execute(
+                    insert(SpeakerErrorCorrectionPairModel),
+                    [self._pair_to_values(pair) for pair in pairs],
+                )
+                await session.commit()
+        return pairs
+
+    # Processing Job operations
+
+    async def create_processing_job(
+        self, job: SpeakerRAGProcessingJob
+    ) -> SpeakerRAGProcessingJob:
+        """Create a new processing job."""
+        async with self._session_factory() as session:
+            session.add(SpeakerRAGProcessingJobModel(**self._job_to_values(job)))
+            await session.commit()
+        return job
+
+    async def get_processing_job_by_id(
+        self, job_id: UUID
+    ) -> Optional[SpeakerRAGProcessingJob]:
+        """Get processing job by ID."""
+        async with self._session_factory() as session:
+            model = await session.get(SpeakerRAGProcessingJobModel, job_id)
+            return self._model_to_job(model) if model is not None else None
+
+    async def get_processing_jobs_by_speaker(
+        self,
+        speaker_id: UUID,
+        job_type: Optional[JobType] = None,
+        status: Optional[JobStatus] = None,
+    ) -> List[SpeakerRAGProcessingJob]:
+        """Get processing jobs for a speaker."""
+        stmt = (
+            select(SpeakerRAGProcessingJobModel)
+            .where(SpeakerRAGProcessingJobModel.speaker_id == speaker_id)
+            .order_by(SpeakerRAGProcessingJobModel.created_at)
+        )
+        if job_type is not None:
+            stmt = stmt.where(SpeakerRAGProcessingJobModel.job_type == job_type.value)
+        if status is not None:
+            stmt = stmt.where(SpeakerRAGProcessingJobModel.status == status.value)
+        return await self._select_jobs(stmt)
+
+    async def get_pending_processing_jobs(self) -> List[SpeakerRAGProcessingJob]:
+        """Get all pending processing jobs, oldest first."""
+        return await self._jobs_with_status(JobStatus.PENDING)
+
+    async def get_running_processing_jobs(self) -> List[SpeakerRAGProcessingJob]:
+        """Get all running processing jobs, oldest first."""
+        return await self._jobs_with_status(JobStatus.RUNNING)
+
+    async def update_processing_job(
+        self, job: SpeakerRAGProcessingJob
+    ) -> SpeakerRAGProcessingJob:
+        """Update a processing job, creating it if it does not exist."""
+        async with self._session_factory() as session:
+            await session.merge(
+                SpeakerRAGProcessingJobModel(**self._job_to_values(job))
+            )
+            await session.commit()
+        return job
+
+    async def delete_processing_job(self, job_id: UUID) -> bool:
+        """Delete a processing job."""
+        return await self._delete(
+            SpeakerRAGProcessingJobModel, SpeakerRAGProcessingJobModel.id, job_id
+        )
+
+    # Speaker-specific embedding operations
+
+    async def link_embedding_to_speaker(
+        self,
+        embedding_id: UUID,
+        speaker_id: UUID,
+        error_correction_pair_id: Optional[UUID] = None,
+    ) -> bool:
+        """Link an embedding to a speaker and optionally to a pair."""
+        await self.batch_link_embeddings_to_speaker(
+            speaker_id, [(embedding_id, error_correction_pair_id)]
+        )
+        return True
+
+    async def batch_link_embeddings_to_speaker(
+        self, speaker_id: UUID, links: List[Tuple[UUID, UUID]]
+    ) -> int:
+        """Link many embeddings to a speaker and their pairs in one insert."""
+        if links:
+            async with self._session_factory() as session:
+                await session.execute(
+                    insert(SpeakerEmbeddingLinkModel),
+                    [
+                        {
+                            "speaker_id": speaker_id,
+                            "embedding_id": embedding_id,
+                            "error_correction_pair_id": pair_id,
+                        }
+                        for embedding_id, pair_id in links
+                    ],
+                )
+                await session.commit()
+        return len(links)
+
+    async def get_speaker_embeddings(
+        self, speaker_id: UUID, limit: Optional[int] = None
+    ) -> List[UUID]:
+        """Get embedding IDs for a speaker, in the order they were linked."""
+        return await self._linked_embeddings(
+            SpeakerEmbeddingLinkModel.speaker_id == speaker_id, limit
+        )
+
+    async def get_embeddings_by_error_correction_pair(
+        self, pair_id: UUID
+    ) -> List[UUID]:
+        """Get embedding IDs for an error-correction pair."""
+        return await self._linked_embeddings(
+            SpeakerEmbeddingLinkModel.error_correction_pair_id == pair_id
+        )
+
+    # Statistics and analytics operations
+
+    async def get_speaker_error_statistics(self, speaker_id: UUID) -> Dict[str, Any]:
+        """Get error statistics for a speaker."""
+        async with self._session_factory() as session:
+            total_pairs, average_confidence = (
+                await session.execute(
+                    select(
+                        func.count(),
+                        func.avg(SpeakerErrorCorrectionPairModel.confidence_score),
+                    ).where(SpeakerErrorCorrectionPairModel.speaker_id == speaker_id)
+                )
+            ).one()
+            total_embeddings = await session.scalar(
+                select(
+                    func.count(func.distinct(SpeakerEmbeddingLinkModel.embedding_id))
+                ).where(SpeakerEmbeddingLinkModel.speaker_id == speaker_id)
+            )
+
+        return {
+            "speaker_id": str(speaker_id),
+            "total_pairs": total_pairs,
+            "error_type_distribution": await self.get_error_type_distribution(
+                speaker_id
+            ),
+            "average_confidence": (
+                float(average_confidence) if average_confidence is not None else 0.0
+            ),
+            "total_embeddings": total_embeddings,
+        }
+
+    async def get_error_type_distribution(
+        self, speaker_id: Optional[UUID] = None
+    ) -> Dict[str, int]:
+        """Get distribution of error types."""
+        error_type = func.coalesce(
+            SpeakerErrorCorrectionPairModel.error_type, "unknown"
+        )
+        stmt = select(error_type, func.count()).group_by(error_type)
+        if speaker_id is not None:
+            stmt = stmt.where(SpeakerErrorCorrectionPairModel.speaker_id == speaker_id)
+
+        async with self._session_factory() as session:
+            return dict((await session.execute(stmt)).all())
+
+    async def get_processing_job_statistics(self) -> Dict[str, Any]:
+        """Get processing job statistics."""
+        async with self._session_factory() as session:
+            jobs_by_status = dict(
+                (
+                    await session.execute(
+                        select(
+                            SpeakerRAGProcessingJobModel.status, func.count()
+                        ).group_by(SpeakerRAGProcessingJobModel.status)
+                    )
+                ).all()
+            )
+            jobs_by_type = dict(
+                (
+                    await session.execute(
+                        select(
+                            SpeakerRAGProcessingJobModel.job_type, func.count()
+                        ).group_by(SpeakerRAGProcessingJobModel.job_type)
+                    )
+                ).all()
+            )
+
+        return {
+            "total_jobs": sum(jobs_by_status.values()),
+            "jobs_by_status": jobs_by_status,
+            "jobs_by_type": jobs_by_type,
+        }
+
+    async def cleanup_old_jobs(
+        self, older_than_days: int = 30, keep_failed_jobs: bool = True
+    ) -> int:
+        """Clean up old finished processing jobs."""
+        statuses = [
+            status.value
+            for status in FINISHED_JOB_STATUSES
+            if not (keep_failed_jobs and status == JobStatus.FAILED)
+        ]
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(SpeakerRAGProcessingJobModel).where(
+                    SpeakerRAGProcessingJobModel.status.in_(statuses),
+                    SpeakerRAGProcessingJobModel.created_at < cutoff,
+                )
+            )
+            await session.commit()
+            return result.rowcount
+
+    # Helpers
+
+    async def _select_pairs(self, stmt) -> List[SpeakerErrorCorrectionPair]:
+        async with self._session_factory() as session:
+            models = (await session.scalars(stmt)).all()
+            return [self._model_to_pair(model) for model in models]
+
+    async def _select_jobs(self, stmt) -> List[SpeakerRAGProcessingJob]:
+        async with self._session_factory() as session:
+            models = (await session.scalars(stmt)).all()
+            return [self._model_to_job(model) for model in models]
+
+    async def _jobs_with_status(
+        self, status: JobStatus
+    ) -> List[SpeakerRAGProcessingJob]:
+        return await self._select_jobs(
+            select(SpeakerRAGProcessingJobModel)
+            .where(SpeakerRAGProcessingJobModel.status == status.value)
+            .order_by(SpeakerRAGProcessingJobModel.created_at)
+        )
+
+    async def _linked_embeddings(
+        self, condition, limit: Optional[int] = None
+    ) -> List[UUID]:
+        """Distinct linked embedding IDs, ordered by their first link"""
+        stmt = (
+            select(SpeakerEmbeddingLinkModel.embedding_id)
+            .where(condition)
+            .group_by(SpeakerEmbeddingLinkModel.embedding_id)
+            .order_by(func.min(SpeakerEmbeddingLinkModel.id))
+            .limit(limit)
+        )
+        async with self._session_factory() as session:
+            return list((await session.scalars(stmt)).all())
+
+    async def _delete(self, model, key_column, key: UUID) -> bool:
+        async with self._session_factory() as session:
+            result = await session.execute(delete(model).where(key_column == key))
+            await session.commit()
+            return result.rowcount > 0
+
+    @staticmethod
+    def _pair_to_values(pair: SpeakerErrorCorrectionPair) -> Dict[str, Any]:
+        return {
+            "id": pair.id,
+            "speaker_id": pair.speaker_id,
+            "historical_data_id": pair.historical_data_id,
+            "error_text": pair.error_text,
+            "correction_text": pair.correction_text,
+            "error_type": pair.error_type,
+            "context_before": pair.context_before,
+            "context_after": pair.context_after,
+            "confidence_score": pair.confidence_score,
+            "embedding_id": pair.embedding_id,
+            "pair_metadata": pair.metadata,
+            "created_at": pair.created_at,
+            "error_start_offset": pair.error_start_offset,
+            "error_end_offset": pair.error_end_offset,
+        }
+
+    @staticmethod
+    def _model_to_pair(
+        model: SpeakerErrorCorrectionPairModel,
+    ) -> SpeakerErrorCorrectionPair:
+        return SpeakerErrorCorrectionPair(
+            id=model.id,
+            speaker_id=model.speaker_id,
+            historical_data_id=model.historical_data_id,
+            error_text=model.error_text,
+            correction_text=model.correction_text,
+            error_type=model.error_type,
+            context_before=model.context_before,
+            context_after=model.context_after,
+            confidence_score=model.confidence_score,
+            embedding_id=model.embedding_id,
+            metadata=dict(model.pair_metadata or {}),
+            created_at=model.created_at,
+            error_start_offset=model.error_start_offset,
+            error_end_offset=model.error_end_offset,
+        )
+
+    @staticmethod
+    def _job_to_values(job: SpeakerRAGProcessingJob) -> Dict[str, Any]:
+        return {
+            "id": job.id,
+            "speaker_id": job.speaker_id,
+            "job_type": job.job_type.value,
+            "status": job.status.value,
+            "total_records": job.total_records,
+            "processed_records": job.processed_records,
+            "error_records": job.error_records,
+            "progress_percentage": job.progress_percentage,
+            "error_message": job.error_message,
+            "job_metadata": job.job_metadata,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "created_at": job.created_at,
+        }
+
+    @staticmethod
+    def _model_to_job(model: SpeakerRAGProcessingJobModel) -> SpeakerRAGProcessingJob:
+        return SpeakerRAGProcessingJob(
+            id=model.id,
+            speaker_id=model.speaker_id,
+            job_type=JobType(model.job_type),
+            status=JobStatus(model.status),
+            total_records=model.total_records,
+            processed_records=model.processed_records,
+            error_records=model.error_records,
+            progress_percentage=model.progress_percentage,
+            error_message=model.error_message,
+            job_metadata=dict(model.job_metadata or {}),
+            started_at=model.started_at,
+            completed_at=model.completed_at,
+            created_at=model.created_at,
+        )
+
+
+def _async_engine_url(connection_string: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Adapt a libpq-style PostgreSQL URL to the asyncpg driver.
+
+    asyncpg does not accept the libpq `options` parameter, so its
+    `-c name=value` settings are passed as server settings instead.
+    """
+    url = make_url(connection_string)
+    if url.drivername != "postgresql":
+        return url, {}
+
+    query = dict(url.query)
+    server_settings = {}
+    for option in str(query.pop("options", "")).split():
+        if option.startswith("-c") and "=" in option:
+            name, value = option[2:].split("=", 1)
+            server_settings[name] = value
+
+    url = url.set(drivername="postgresql+asyncpg", query=query)
+    return url, {"server_settings": server_settings} if server_settings else {}
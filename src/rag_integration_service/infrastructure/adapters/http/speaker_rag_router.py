@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from fastapi.responses import JSONResponse
 
 from ....application.dto.requests import (
@@ -31,6 +31,7 @@ from ....application.dto.responses import (
 from ....application.use_cases.process_speaker_rag_data_use_case import (
     ProcessSpeakerRAGDataUseCase,
 )
+from ....application.use_cases.speaker_rag_job_runner import SpeakerRAGJobRunner
 from ....domain.entities.speaker_rag_processing_job import JobType
 
 logger = logging.getLogger(__name__)
@@ -39,13 +40,25 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/speaker-rag", tags=["Speaker RAG Processing"])
 
 
-# Dependency injection placeholder
-async def get_speaker_rag_use_case() -> ProcessSpeakerRAGDataUseCase:
+# Dependency injection: instances are built in the application lifespan
+async def get_speaker_rag_use_case(request: Request) -> ProcessSpeakerRAGDataUseCase:
     """Get speaker RAG processing use case instance."""
-    # TODO: Implement proper dependency injection
-    raise HTTPException(
-        status_code=501, detail="Speaker RAG processing use case not implemented"
-    )
+    use_case = getattr(request.app.state, "speaker_rag_use_case", None)
+    if use_case is None:
+        raise HTTPException(
+            status_code=503, detail="Speaker RAG processing use case not initialized"
+        )
+    return use_case
+
+
+async def get_speaker_rag_job_runner(request: Request) -> SpeakerRAGJobRunner:
+    """Get the background speaker RAG job runner instance."""
+    runner = getattr(request.app.state, "speaker_rag_job_runner", None)
+    if runner is None:
+        raise HTTPException(
+            status_code=503, detail="Speaker RAG job runner not initialized"
+        )
+    return runner
 
 
 @router.post(
@@ -118,13 +131,19 @@ async def vectorize_speaker_error_pairs(
     """
     Vectorize error-correction pairs for a speaker.
 
-    Creates vector embeddings for speaker-specific error-correction pairs
-    to enable similarity search and RAG-based corrections.
+    Queues a vectorization job that creates vector embeddings for
+    speaker-specific error-correction pairs to enable similarity search and
+    RAG-based corrections. The background job runner executes the job; its
+    progress is available from the job status endpoint.
     """
     try:
-        logger.info(f"Starting vectorization for speaker: {request.speaker_id}")
-        response = await use_case.vectorize_speaker_error_pairs(
-            UUID(request.speaker_id), request.batch_size
+        logger.info(f"Queueing vectorization for speaker: {request.speaker_id}")
+        response = await use_case.create_processing_job(
+            CreateSpeakerRAGJobRequest(
+                speaker_id=request.speaker_id,
+                job_type=JobType.VECTORIZATION,
+                metadata={**(request.metadata or {}), "batch_size": request.batch_size},
+            )
         )
         logger.info(f"Vectorization job created: {response.job_id}")
         return response
@@ -222,6 +241,25 @@ async def create_processing_job(
         raise HTTPException(status_code=500, detail="Failed to create processing job")
 
 
+@router.get("/jobs/metrics", response_model=dict)
+async def get_job_runner_metrics(
+    runner: SpeakerRAGJobRunner = Depends(get_speaker_rag_job_runner),
+):
+    """
+    Get background job runner metrics.
+
+    Returns the queue depth of claimable jobs, job counters, and the
+    throughput and estimated completion time of each running job.
+    """
+    try:
+        metrics = runner.get_metrics()
+        return {"metrics": metrics, "timestamp": datetime.utcnow().isoformat()}
+
+    except Exception as e:
+        logger.error(f"Failed to get job runner metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get job runner metrics")
+
+
 @router.get("/jobs/{job_id}", response_model=ProcessingJobResponse)
 async def get_processing_job_status(
     job_id: UUID = Path(..., description="Processing job ID"),
@@ -403,5 +441,6 @@ async def speaker_rag_health():
             "error_patterns": "GET /api/v1/speaker-rag/speaker/{speaker_id}/error-patterns",
             "create_job": "POST /api/v1/speaker-rag/jobs",
             "job_status": "GET /api/v1/speaker-rag/jobs/{job_id}",
+            "job_metrics": "GET /api/v1/speaker-rag/jobs/metrics",
         },
     }
@@ -0,0 +1,10 @@
+"""
+ML Model Adapters
+
+This module contains embedding model adapters for the RAG integration service.
+"""
+
+from .hashing_embedding_model import HashingEmbeddingModel
+from .openai_embedding_model import OpenAIEmbeddingModel
+
+__all__ = ["HashingEmbeddingModel", "OpenAIEmbeddingModel"]
@@ -0,0 +1,172 @@
+"""
+Hashing Embedding Model Adapter
+
+Deterministic, dependency-free implementation of MLModelPort. Texts are
+embedded by feature hashing: lower-cased words and word bigrams are hashed
+into signed buckets of a fixed-size vector, which is then L2-normalized.
+Identical texts always produce identical vectors, and texts sharing words
+are similar, which makes the adapter suitable for offline benchmarks, tests
+and local development without a model server.
+"""
+
+import asyncio
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from rag_integration_service.application.ports.secondary.ml_model_port import (
+    MLModelPort,
+)
+from rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+
+DEFAULT_DIMENSION = 1536
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_SEQUENCE_LENGTH = 8192
+
+MODEL_NAME = "local-hashing-embedding"
+MODEL_VERSION = "1.0"
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=65536)
+def _feature_bucket(feature: str, dimension: int) -> Tuple[int, float]:
+    """Hash a feature to a (bucket, sign) pair, stable across processes."""
+    digest = int.from_bytes(
+        hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+    return (digest >> 1) % dimension, 1.0 if digest & 1 else -1.0
+
+
+class HashingEmbeddingModel(MLModelPort):
+    """
+    Local feature-hashing embedding model.
+
+    Each embedding type hashes into its own feature space, so the same text
+    embedded as different types yields different vectors. An optional
+    per-call latency simulates the round trip to a remote model.
+    """
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_DIMENSION,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        call_latency_seconds: float = 0.0,
+    ):
+        """
+        Initialize the model.
+
+        Args:
+            dimension: Embedding dimension
+            max_batch_size: Maximum texts per generate_batch_embeddings call
+            call_latency_seconds: Simulated latency added to every model call
+        """
+        self._dimension = dimension
+        self._max_batch_size = max_batch_size
+        self._call_latency_seconds = call_latency_seconds
+        self.call_count = 0
+
+    async def generate_embedding(
+        self, text: str, embedding_type: EmbeddingType = EmbeddingType.ERROR
+    ) -> List[float]:
+        """Generate the embedding of a single text."""
+        embeddings = await self.generate_batch_embeddings([text], embedding_type)
+        return embeddings[0]
+
+    async def generate_batch_embeddings(
+        self, texts: List[str], embedding_type: EmbeddingType = EmbeddingType.ERROR
+    ) -> List[List[float]]:
+        """Generate embeddings for a batch of texts with one model call."""
+        if len(texts) > self._max_batch_size:
+            raise ValueError(
+                f"batch of {len(texts)} texts exceeds maximum of {self._max_batch_size}"
+            )
+
+        self.call_count += 1
+        if self._call_latency_seconds:
+            await asyncio.sleep(self._call_latency_seconds)
+
+        return self.embed(texts, embedding_type).tolist()
+
+    def embed(
+        self, texts: List[str], embedding_type: EmbeddingType = EmbeddingType.ERROR
+    ) -> np.ndarray:
+        """
+        Embed texts into a float32 matrix of unit vectors.
+
+        Args:
+            texts: Input texts
+            embedding_type: Type of embeddings to generate
+
+        Returns:
+            Matrix with one row per text; rows of texts without words are zero
+        """
+        matrix = np.zeros((len(texts), self._dimension), np.float32)
+        prefix = f"{embedding_type.value}:"
+
+        for row, text in enumerate(texts):
+            words = WORD_PATTERN.findall(text.lower())
+            features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+            for feature in features:
+                bucket, sign = _feature_bucket(prefix + feature, self._dimension)
+                matrix[row, bucket] += sign
+
+        norms = np.linalg.norm(matrix, axis=1)
+        matrix /= np.where(norms == 0, 1, norms)[:, None]
+        return matrix
+
+    def get_embedding_dimension(self) -> int:
+        """Get the embedding dimension."""
+        return self._dimension
+
+    def get_model_name(self) -> str:
+        """Get the model name."""
+        return MODEL_NAME
+
+    def get_model_version(self) -> str:
+        """Get the model version."""
+        return MODEL_VERSION
+
+    def get_max_sequence_length(self) -> int:
+        """Get the maximum sequence length in tokens."""
+        return DEFAULT_MAX_SEQUENCE_LENGTH
+
+    def get_max_batch_size(self) -> int:
+        """Get the maximum batch size."""
+        return self._max_batch_size
+
+    async def preprocess_text(self, text: str) -> str:
+        """Collapse whitespace; case is folded during embedding."""
+        return " ".join(text.split())
+
+    async def validate_text(self, text: str) -> bool:
+        """Text is valid when it contains at least one word."""
+        return bool(WORD_PATTERN.search(text))
+
+    async def estimate_tokens(self, text: str) -> int:
+        """Estimate tokens as the number of words."""
+        return len(WORD_PATTERN.findall(text))
+
+    async def health_check(self) -> bool:
+        """The local model is always available."""
+        return True
+
+    async def get_model_info(self) -> Dict[str, Any]:
+        """Get model information."""
+        return {
+            "model_name": MODEL_NAME,
+            "model_version": MODEL_VERSION,
+            "dimension": self._dimension,
+            "max_batch_size": self._max_batch_size,
+            "max_sequence_length": DEFAULT_MAX_SEQUENCE_LENGTH,
+            "deterministic": True,
+        }
+
+    async def warm_up(self) -> bool:
+        """Nothing to load; always ready."""
+        return True
@@ -0,0 +1,165 @@
+"""
+OpenAI Embedding Model Adapter
+
+Implementation of MLModelPort backed by the OpenAI embeddings API. A batch
+of texts is embedded with a single API request.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from openai import AsyncOpenAI
+
+from rag_integration_service.application.ports.secondary.ml_model_port import (
+    MLModelPort,
+)
+from rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+
+DEFAULT_MODEL = "text-embedding-ada-002"
+DEFAULT_DIMENSION = 1536
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_TOKENS = 8191
+
+# Rough English average used to estimate tokens without a tokenizer
+CHARACTERS_PER_TOKEN = 4
+
+
+class OpenAIEmbeddingModel(MLModelPort):
+    """
+    OpenAI embeddings API model.
+
+    Embeddings do not depend on the embedding type; the type only
+    describes how the stored vector is used.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_MODEL,
+        dimension: int = DEFAULT_DIMENSION,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        client: Optional[AsyncOpenAI] = None,
+    ):
+        """
+        Initialize the model.
+
+        Args:
+            api_key: OpenAI API key
+            model: Embedding model name
+            dimension: Dimension of the vectors the model returns
+            max_batch_size: Maximum texts per generate_batch_embeddings call
+            max_tokens: Maximum tokens per text
+            client: Preconfigured API client; created from api_key by default
+        """
+        if client is None and not api_key:
+            raise ValueError("api_key is required for the OpenAI embedding model")
+
+        self._client = client or AsyncOpenAI(api_key=api_key)
+        self._model = model
+        self._dimension = dimension
+        self._max_batch_size = max_batch_size
+        self._max_tokens = max_tokens
+        self._request_count = 0
+        self._total_latency = 0.0
+
+    async def generate_embedding(
+        self, text: str, embedding_type: EmbeddingType = EmbeddingType.ERROR
+    ) -> List[float]:
+        """Generate the embedding of a single text."""
+        embeddings = await self.generate_batch_embeddings([text], embedding_type)
+        return embeddings[0]
+
+    async def generate_batch_embeddings(
+        self, texts: List[str], embedding_type: EmbeddingType = EmbeddingType.ERROR
+    ) -> List[List[float]]:
+        """Generate embeddings for a batch of texts with one API request."""
+        if len(texts) > self._max_batch_size:
+            raise ValueError(
+                f"batch of {len(texts)} texts exceeds maximum of {self._max_batch_size}"
+            )
+        if not texts:
+            return []
+
+        start_time = time.perf_counter()
+        response = await self._client.embeddings.create(
+            model=self._model, input=[await self.preprocess_text(t) for t in texts]
+        )
+        self._request_count += 1
+        self._total_latency += time.perf_counter() - start_time
+
+        embeddings = [
+            item.embedding for item in sorted(response.data, key=lambda d: d.index)
+        ]
+        for embedding in embeddings:
+            if len(embedding) != self._dimension:
+                raise ValueError(
+                    f"model {self._model} returned a {len(embedding)}-dimensional"
+                    f" embedding, expected {self._dimension}"
+                )
+        return embeddings
+
+    def get_embedding_dimension(self) -> int:
+        """Get the embedding dimension."""
+        return self._dimension
+
+    def get_model_name(self) -> str:
+        """Get the model name."""
+        return self._model
+
+    def get_model_version(self) -> str:
+        """OpenAI versions embedding models by name."""
+        return self._model
+
+    def get_max_sequence_length(self) -> int:
+        """Get the maximum sequence length in tokens."""
+        return self._max_tokens
+
+    def get_max_batch_size(self) -> int:
+        """Get the maximum batch size."""
+        return self._max_batch_size
+
+    async def preprocess_text(self, text: str) -> str:
+        """Collapse whitespace, including the newlines the API handles poorly."""
+        return " ".join(text.split())
+
+    async def validate_text(self, text: str) -> bool:
+        """Text is valid when it is non-blank and within the token limit."""
+        return bool(text.strip()) and (
+            await self.estimate_tokens(text) <= self._max_tokens
+        )
+
+    async def estimate_tokens(self, text: str) -> int:
+        """Estimate tokens from the text length."""
+        return -(-len(text) // CHARACTERS_PER_TOKEN)
+
+    async def health_check(self) -> bool:
+        """Check that the API answers an embedding request."""
+        try:
+            await self.generate_embedding("health check")
+            return True
+        except Exception:
+            return False
+
+    async def get_model_info(self) -> Dict[str, Any]:
+        """Get model information."""
+        return {
+            "model_name": self._model,
+            "model_version": self._model,
+            "dimension": self._dimension,
+            "max_batch_size": self._max_batch_size,
+            "max_sequence_length": self._max_tokens,
+            "requests": self._request_count,
+            "average_latency_seconds": (
+                self._total_latency / self._request_count
+                if self._request_count
+                else 0.0
+            ),
+            "deterministic": False,
+        }
+
+    async def warm_up(self) -> bool:
+        """Nothing to load; the model is served remotely."""
+        return True
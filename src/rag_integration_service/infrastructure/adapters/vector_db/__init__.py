@@ -0,0 +1,10 @@
+"""
+Vector Database Adapters
+
+This module contains vector storage adapters for the RAG integration service.
+"""
+
+from .in_process_vector_storage import InProcessVectorStorageAdapter
+from .ivf_index import IVFIndex
+
+__all__ = ["InProcessVectorStorageAdapter", "IVFIndex"]
@@ -0,0 +1,601 @@
+"""
+In-Process Vector Storage Adapter
+
+Server-free implementation of VectorStoragePort backed by a NumPy float32
+matrix. Exact search is a single matrix-vector product; an optional IVF
+index provides approximate search for large collections. Collections can be
+saved to disk and reopened as memory-mapped arrays, which makes the adapter
+usable for edge deployments as well as a fast test double.
+"""
+
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+import numpy as np
+
+from rag_integration_service.application.ports.secondary.ml_model_port import (
+    MLModelPort,
+)
+from rag_integration_service.application.ports.secondary.vector_storage_port import (
+    VectorStoragePort,
+)
+from rag_integration_service.domain.entities.similarity_result import (
+    SimilarityResult,
+)
+from rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from rag_integration_service.domain.value_objects.embedding_type import EmbeddingType
+
+from .ivf_index import DEFAULT_NLIST, DEFAULT_NPROBE, IVFIndex
+
+# Metadata fields with an inverted index for pre-filtering
+INDEXED_METADATA_FIELDS = ("speaker_id", "job_id", "category")
+
+DEFAULT_DIMENSION = 1536
+DEFAULT_INITIAL_CAPACITY = 1024
+# Filtered queries matching at most this many rows skip the ANN index
+DEFAULT_EXACT_SEARCH_LIMIT = 20000
+
+VECTORS_FILE = "vectors.npy"
+NORMS_FILE = "norms.npy"
+RECORDS_FILE = "records.json"
+
+
+class InProcessVectorStorageAdapter(VectorStoragePort):
+    """
+    In-process vector storage adapter.
+
+    Vectors are stored unit-normalized in a contiguous float32 matrix with
+    their norms kept alongside, so cosine similarity is a dot product and the
+    original vectors can be reconstructed (at float32 precision). Deleted rows
+    are tombstoned and reclaimed by compaction.
+    """
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_DIMENSION,
+        ml_model: Optional[MLModelPort] = None,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        exact_search_limit: int = DEFAULT_EXACT_SEARCH_LIMIT,
+    ):
+        """
+        Initialize an empty collection.
+
+        Args:
+            dimension: Vector dimension
+            ml_model: Model used by find_similar_by_text to embed query text
+            initial_capacity: Rows allocated up front
+            exact_search_limit: Filtered queries matching at most this many
+                rows are answered exactly even when an ANN index exists
+        """
+        self._dimension = dimension
+        self._ml_model = ml_model
+        self._exact_search_limit = exact_search_limit
+
+        self._vectors = np.zeros((max(initial_capacity, 1), dimension), np.float32)
+        self._norms = np.zeros(len(self._vectors), np.float32)
+        self._active = np.zeros(len(self._vectors), bool)
+        self._size = 0
+        self._deleted = 0
+
+        self._row_ids: List[UUID] = []
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._rows: Dict[UUID, int] = {}
+        self._field_index: Dict[str, Dict[Any, Set[int]]] = {
+            field: defaultdict(set) for field in INDEXED_METADATA_FIELDS
+        }
+        self._hash_index: Dict[str, Set[int]] = defaultdict(set)
+
+        self._index_config: Dict[str, Any] = {"type": "flat"}
+        self._ann: Optional[IVFIndex] = None
+
+    async def store_embedding(self, embedding: VectorEmbedding) -> bool:
+        """Store a vector embedding, replacing any embedding with the same ID."""
+        return await self.store_batch_embeddings([embedding])
+
+    async def store_batch_embeddings(self, embeddings: List[VectorEmbedding]) -> bool:
+        """Store multiple vector embeddings with a single matrix write."""
+        if not embeddings:
+            return True
+
+        # The last occurrence of a repeated ID wins, as with sequential stores
+        embeddings = list(
+            {embedding.id: embedding for embedding in embeddings}.values()
+        )
+        matrix = np.stack([embedding.as_array() for embedding in embeddings])
+        if matrix.shape[1] != self._dimension:
+            raise ValueError(f"embeddings must be {self._dimension}-dimensional")
+
+        for embedding in embeddings:
+            if embedding.id in self._rows:
+                self._delete_row(self._rows[embedding.id])
+
+        norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+        units = matrix / np.where(norms == 0, 1, norms)[:, None]
+
+        start = self._size
+        end = start + len(embeddings)
+        self._reserve(end)
+        self._vectors[start:end] = units
+        self._norms[start:end] = norms
+        self._active[start:end] = True
+        self._size = end
+
+        for row, embedding in enumerate(embeddings, start):
+            record = _to_record(embedding)
+            self._row_ids.append(embedding.id)
+            self._records.append(record)
+            self._rows[embedding.id] = row
+            self._index_record(row, record)
+
+        if self._ann is not None:
+            self._ann.add(units, np.arange(start, end))
+        elif self._index_config["type"] == "ivf":
+            self._build_index()
+
+        return True
+
+    async def find_embedding(self, embedding_id: UUID) -> Optional[VectorEmbedding]:
+        """Find a vector embedding by ID."""
+        row = self._rows.get(embedding_id)
+        if row is None:
+            return None
+        return _from_record(self._records[row], self._vectors[row] * self._norms[row])
+
+    async def find_by_text_hashes(self, text_hashes: List[str]) -> Dict[str, UUID]:
+        """Find stored embeddings by text hash through the hash index."""
+        found = {}
+        for text_hash in text_hashes:
+            rows = self._hash_index.get(text_hash)
+            if rows:
+                found[text_hash] = self._row_ids[min(rows)]
+        return found
+
+    async def find_similar(
+        self,
+        query_vector: List[float],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        threshold: float = 0.7,
+    ) -> List[SimilarityResult]:
+        """Find similar vectors, pre-filtered by metadata."""
+        return self._search(query_vector, top_k, filters, threshold)
+
+    async def find_similar_by_text(
+        self,
+        query_text: str,
+        embedding_type: str,
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        threshold: float = 0.7,
+    ) -> List[SimilarityResult]:
+        """Find similar vectors by embedding the query text with the ML model."""
+        if self._ml_model is None:
+            raise ValueError("find_similar_by_text requires an ML model")
+
+        query_vector = await self._ml_model.generate_embedding(
+            query_text, EmbeddingType.from_string(embedding_type)
+        )
+        return self._search(query_vector, top_k, filters, threshold)
+
+    async def find_by_speaker(
+        self,
+        speaker_id: str,
+        query_vector: List[float],
+        top_k: int = 10,
+        threshold: float = 0.7,
+    ) -> List[SimilarityResult]:
+        """Find similar vectors for a specific speaker."""
+        return self._search(query_vector, top_k, {"speaker_id": speaker_id}, threshold)
+
+    async def find_by_job(
+        self,
+        job_id: str,
+        query_vector: List[float],
+        top_k: int = 10,
+        threshold: float = 0.7,
+    ) -> List[SimilarityResult]:
+        """Find similar vectors for a specific job."""
+        return self._search(query_vector, top_k, {"job_id": job_id}, threshold)
+
+    async def find_by_category(
+        self,
+        category: str,
+        query_vector: List[float],
+        top_k: int = 10,
+        threshold: float = 0.7,
+    ) -> List[SimilarityResult]:
+        """Find similar vectors for a specific error category."""
+        return self._search(query_vector, top_k, {"category": category}, threshold)
+
+    async def delete_embedding(self, embedding_id: UUID) -> bool:
+        """Delete a vector embedding."""
+        row = self._rows.get(embedding_id)
+        if row is None:
+            return False
+        self._delete_row(row)
+        self._maybe_compact()
+        return True
+
+    async def delete_embeddings_by_job(self, job_id: str) -> int:
+        """Delete all embeddings for a specific job."""
+        rows = list(self._field_index["job_id"].get(job_id, ()))
+        for row in rows:
+            self._delete_row(row)
+        self._maybe_compact()
+        return len(rows)
+
+    async def get_embedding_count(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Get count of embeddings matching filters."""
+        if not filters:
+            return len(self._rows)
+        return int(np.count_nonzero(self._filter_mask(filters)))
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get collection statistics."""
+        return {
+            "total_embeddings": len(self._rows),
+            "dimension": self._dimension,
+            "capacity": len(self._vectors),
+            "deleted_rows": self._deleted,
+            "index": dict(self._index_config),
+            "index_trained": self._ann is not None,
+            "memory_bytes": int(self._vectors.nbytes + self._norms.nbytes),
+            "memory_mapped": isinstance(self._vectors, np.memmap),
+        }
+
+    async def health_check(self) -> bool:
+        """In-process storage is always available."""
+        return True
+
+    async def create_index(self, index_config: Dict[str, Any]) -> bool:
+        """
+        Create or drop the approximate search index.
+
+        An IVF index is trained once the collection holds at least `nlist`
+        rows; until then searches are exact.
+
+        Args:
+            index_config: {"type": "ivf", "nlist": int, "nprobe": int} builds
+                an IVF index; {"type": "flat"} uses exact search only
+
+        Returns:
+            True if the index configuration was applied
+        """
+        index_type = index_config.get("type", "flat")
+        if index_type not in ("flat", "ivf"):
+            raise ValueError(f"Unsupported index type: {index_type}")
+
+        self._index_config = dict(index_config, type=index_type)
+        self._build_index()
+        return True
+
+    def save(self, directory: str) -> None:
+        """
+        Persist the collection to a directory.
+
+        Vectors and norms are written as .npy files so that `load` can map
+        them into memory instead of reading them. Each file is replaced
+        atomically, so a collection mapped from the same directory keeps
+        reading the previous version.
+
+        Args:
+            directory: Target directory (created if missing)
+        """
+        self.compact()
+        os.makedirs(directory, exist_ok=True)
+
+        _replace_file(
+            os.path.join(directory, VECTORS_FILE),
+            "wb",
+            lambda file: np.save(file, self._vectors[: self._size]),
+        )
+        _replace_file(
+            os.path.join(directory, NORMS_FILE),
+            "wb",
+            lambda file: np.save(file, self._norms[: self._size]),
+        )
+        _replace_file(
+            os.path.join(directory, RECORDS_FILE),
+            "w",
+            lambda file: json.dump(
+                {
+                    "dimension": self._dimension,
+                    "index": self._index_config,
+                    "records": self._records,
+                },
+                file,
+                default=str,
+            ),
+        )
+
+    @classmethod
+    def load(
+        cls,
+        directory: str,
+        ml_model: Optional[MLModelPort] = None,
+        mmap: bool = True,
+    ) -> "InProcessVectorStorageAdapter":
+        """
+        Open a collection written by `save`.
+
+        With `mmap` the vector matrix is memory-mapped read-only, so only the
+        pages touched by searches are loaded; the first write copies it into
+        memory.
+
+        Args:
+            directory: Directory written by `save`
+            ml_model: Model used by find_similar_by_text
+            mmap: Whether to memory-map the vector matrix
+
+        Returns:
+            InProcessVectorStorageAdapter instance
+        """
+        with open(os.path.join(directory, RECORDS_FILE)) as records_file:
+            data = json.load(records_file)
+
+        adapter = cls(
+            dimension=data["dimension"], ml_model=ml_model, initial_capacity=1
+        )
+        adapter._vectors = np.load(
+            os.path.join(directory, VECTORS_FILE), mmap_mode="r" if mmap else None
+        )
+        adapter._norms = np.load(os.path.join(directory, NORMS_FILE))
+        adapter._size = len(adapter._norms)
+        adapter._active = np.ones(adapter._size, bool)
+
+        for row, record in enumerate(data["records"]):
+            embedding_id = UUID(record["id"])
+            record["id"] = embedding_id
+            adapter._row_ids.append(embedding_id)
+            adapter._records.append(record)
+            adapter._rows[embedding_id] = row
+            adapter._index_record(row, record)
+
+        adapter._index_config = data["index"]
+        adapter._build_index()
+        return adapter
+
+    @classmethod
+    def open(
+        cls,
+        directory: str,
+        dimension: int = DEFAULT_DIMENSION,
+        ml_model: Optional[MLModelPort] = None,
+    ) -> "InProcessVectorStorageAdapter":
+        """
+        Load the collection saved in a directory, or start an empty one.
+
+        Args:
+            directory: Directory the collection is saved to
+            dimension: Vector dimension
+            ml_model: Model used by find_similar_by_text
+
+        Returns:
+            InProcessVectorStorageAdapter instance
+
+        Raises:
+            ValueError: If the saved collection has a different dimension
+        """
+        if not os.path.exists(os.path.join(directory, RECORDS_FILE)):
+            return cls(dimension=dimension, ml_model=ml_model)
+
+        adapter = cls.load(directory, ml_model=ml_model)
+        if adapter._dimension != dimension:
+            raise ValueError(
+                f"collection in {directory} is {adapter._dimension}-dimensional,"
+                f" expected {dimension}"
+            )
+        return adapter
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and rebuild the metadata and ANN indexes."""
+        if not self._deleted:
+            return
+
+        live = np.flatnonzero(self._active[: self._size])
+        self._vectors = np.ascontiguousarray(self._vectors[live])
+        self._norms = self._norms[live]
+        self._active = np.ones(len(live), bool)
+        self._size = len(live)
+        self._deleted = 0
+
+        self._row_ids = [self._row_ids[row] for row in live]
+        self._records = [self._records[row] for row in live]
+        self._rows = {
+            embedding_id: row for row, embedding_id in enumerate(self._row_ids)
+        }
+        self._field_index = {
+            field: defaultdict(set) for field in INDEXED_METADATA_FIELDS
+        }
+        self._hash_index = defaultdict(set)
+        for row, record in enumerate(self._records):
+            self._index_record(row, record)
+
+        self._build_index()
+
+    def _search(
+        self,
+        query_vector: Iterable[float],
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        threshold: float,
+    ) -> List[SimilarityResult]:
+        """Score candidate rows against a query and return the best matches."""
+        query = np.asarray(query_vector, dtype=np.float32)
+        if query.shape != (self._dimension,):
+            raise ValueError(f"query_vector must be {self._dimension}-dimensional")
+
+        query_norm = np.linalg.norm(query)
+        if not self._rows or query_norm == 0 or top_k <= 0:
+            return []
+        query = query / query_norm
+
+        mask = self._filter_mask(filters) if filters else self._active[: self._size]
+        candidate_count = int(np.count_nonzero(mask))
+        if candidate_count == 0:
+            return []
+
+        rows = None
+        if self._ann is not None and not (
+            filters and candidate_count <= self._exact_search_limit
+        ):
+            ann_rows = self._ann.candidates(query)
+            ann_rows = ann_rows[mask[ann_rows]]
+            if len(ann_rows) >= top_k:
+                rows = ann_rows
+
+        if rows is None:
+            if candidate_count == self._size:
+                rows = np.arange(self._size)
+                scores = self._vectors[: self._size] @ query
+            else:
+                rows = np.flatnonzero(mask)
+                scores = self._vectors[rows] @ query
+        else:
+            scores = self._vectors[rows] @ query
+
+        keep = scores >= threshold
+        rows, scores = rows[keep], scores[keep]
+        if len(rows) > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+            rows, scores = rows[best], scores[best]
+        order = np.argsort(-scores, kind="stable")
+
+        return [
+            SimilarityResult(
+                embedding_id=self._row_ids[rows[i]],
+                similarity_score=float(min(max(scores[i], 0.0), 1.0)),
+                text=self._records[rows[i]]["text"],
+                metadata=dict(self._records[rows[i]]["metadata"]),
+                distance_metric="cosine",
+            )
+            for i in order
+        ]
+
+    def _filter_mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Boolean mask of live rows whose metadata matches every filter."""
+        mask = self._active[: self._size].copy()
+
+        for key, value in filters.items():
+            accepted = value if isinstance(value, (list, tuple, set)) else [value]
+            key_mask = np.zeros(self._size, bool)
+
+            if key in self._field_index:
+                for accepted_value in accepted:
+                    rows = self._field_index[key].get(accepted_value)
+                    if rows:
+                        key_mask[list(rows)] = True
+            else:
+                for row in np.flatnonzero(mask):
+                    if _metadata_matches(
+                        self._records[row]["metadata"].get(key), accepted
+                    ):
+                        key_mask[row] = True
+
+            mask &= key_mask
+
+        return mask
+
+    def _index_record(self, row: int, record: Dict[str, Any]) -> None:
+        self._hash_index[record["text_hash"]].add(row)
+        metadata = record["metadata"]
+        for field in INDEXED_METADATA_FIELDS:
+            if field in metadata:
+                for value in _as_values(metadata[field]):
+                    self._field_index[field][value].add(row)
+
+    def _delete_row(self, row: int) -> None:
+        record = self._records[row]
+        self._hash_index[record["text_hash"]].discard(row)
+        for field in INDEXED_METADATA_FIELDS:
+            if field in record["metadata"]:
+                for value in _as_values(record["metadata"][field]):
+                    self._field_index[field][value].discard(row)
+
+        self._active[row] = False
+        del self._rows[self._row_ids[row]]
+        self._deleted += 1
+
+    def _maybe_compact(self) -> None:
+        if self._deleted > max(self._size // 2, DEFAULT_INITIAL_CAPACITY):
+            self.compact()
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix geometrically so appends are amortized O(1)."""
+        capacity = len(self._vectors)
+        if rows <= capacity and not isinstance(self._vectors, np.memmap):
+            return
+
+        new_capacity = max(rows, capacity * 2)
+        vectors = np.zeros((new_capacity, self._dimension), np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        norms = np.zeros(new_capacity, np.float32)
+        norms[: self._size] = self._norms[: self._size]
+        active = np.zeros(new_capacity, bool)
+        active[: self._size] = self._active[: self._size]
+        self._vectors, self._norms, self._active = vectors, norms, active
+
+    def _build_index(self) -> None:
+        """Train the IVF index, or leave it unset until there are enough rows."""
+        self._ann = None
+        if self._index_config.get("type") != "ivf":
+            return
+
+        nlist = self._index_config.get("nlist", DEFAULT_NLIST)
+        live = np.flatnonzero(self._active[: self._size])
+        if len(live) < nlist:
+            return
+
+        self._ann = IVFIndex(
+            nlist=nlist, nprobe=self._index_config.get("nprobe", DEFAULT_NPROBE)
+        )
+        self._ann.train(self._vectors[live], live)
+
+
+def _replace_file(path: str, mode: str, write: Callable[[IO], None]) -> None:
+    """Write a file next to `path` and move it into place atomically."""
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, mode) as file:
+        write(file)
+    os.replace(temporary_path, path)
+
+
+def _as_values(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _metadata_matches(value: Any, accepted: Iterable[Any]) -> bool:
+    return any(v in accepted for v in _as_values(value)) if value is not None else False
+
+
+def _to_record(embedding: VectorEmbedding) -> Dict[str, Any]:
+    return {
+        "id": embedding.id,
+        "text": embedding.text,
+        "text_hash": embedding.text_hash,
+        "embedding_type": str(embedding.embedding_type),
+        "model_version": embedding.model_version,
+        "model_name": embedding.model_name,
+        "metadata": dict(embedding.metadata),
+        "created_at": embedding.created_at.isoformat(),
+    }
+
+
+def _from_record(record: Dict[str, Any], vector: np.ndarray) -> VectorEmbedding:
+    return VectorEmbedding.from_array(
+        vector,
+        id=record["id"],
+        text=record["text"],
+        text_hash=record["text_hash"],
+        embedding_type=EmbeddingType(record["embedding_type"]),
+        model_version=record["model_version"],
+        model_name=record["model_name"],
+        metadata=dict(record["metadata"]),
+        created_at=datetime.fromisoformat(record["created_at"]),
+    )
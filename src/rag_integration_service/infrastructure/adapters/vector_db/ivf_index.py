@@ -0,0 +1,132 @@
+"""
+IVF Index
+
+Inverted-file approximate nearest neighbour index over unit vectors.
+A spherical k-means coarse quantizer assigns every row to its nearest
+centroid; queries only score the rows in the `nprobe` closest lists.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+DEFAULT_NLIST = 256
+DEFAULT_NPROBE = 8
+TRAINING_POINTS_PER_LIST = 64
+ASSIGNMENT_CHUNK_SIZE = 8192
+
+
+class IVFIndex:
+    """
+    Approximate search index mapping matrix rows to k-means clusters.
+
+    The index stores row numbers only; vectors stay in the owning matrix,
+    so building the index does not duplicate embedding memory.
+    """
+
+    def __init__(
+        self,
+        nlist: int = DEFAULT_NLIST,
+        nprobe: int = DEFAULT_NPROBE,
+        n_iter: int = 10,
+        seed: int = 0,
+    ):
+        """
+        Initialize an untrained index.
+
+        Args:
+            nlist: Number of clusters
+            nprobe: Clusters scored per query (higher = better recall, slower)
+            n_iter: k-means iterations used in training
+            seed: Random seed for centroid initialization
+        """
+        if nlist <= 0 or nprobe <= 0:
+            raise ValueError("nlist and nprobe must be positive")
+
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.n_iter = n_iter
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self._list_arrays: List[Optional[np.ndarray]] = []
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether centroids have been computed."""
+        return self.centroids is not None
+
+    def train(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        """
+        Compute centroids from unit vectors and assign the given rows.
+
+        Args:
+            vectors: Unit vectors, one per row in `rows`
+            rows: Matrix row numbers of `vectors`
+        """
+        rng = np.random.default_rng(self.seed)
+        nlist = min(self.nlist, len(vectors))
+        if nlist == 0:
+            raise ValueError("cannot train an IVF index without vectors")
+
+        sample_size = min(len(vectors), nlist * TRAINING_POINTS_PER_LIST)
+        sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(self.n_iter):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(
+                norms > 0, sums / np.where(norms > 0, norms, 1), centroids
+            )
+
+        self.centroids = centroids.astype(np.float32)
+        self._lists = [[] for _ in range(nlist)]
+        self._list_arrays = [None] * nlist
+        self.add(vectors, rows)
+
+    def add(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        """
+        Assign rows to their nearest clusters.
+
+        Args:
+            vectors: Unit vectors, one per row in `rows`
+            rows: Matrix row numbers of `vectors`
+        """
+        if not self.is_trained:
+            raise ValueError("IVF index must be trained before adding vectors")
+
+        for start in range(0, len(vectors), ASSIGNMENT_CHUNK_SIZE):
+            chunk = vectors[start : start + ASSIGNMENT_CHUNK_SIZE]
+            labels = np.argmax(chunk @ self.centroids.T, axis=1)
+            for row, label in zip(rows[start : start + ASSIGNMENT_CHUNK_SIZE], labels):
+                self._lists[label].append(int(row))
+                self._list_arrays[label] = None
+
+    def candidates(self, query: np.ndarray, nprobe: Optional[int] = None) -> np.ndarray:
+        """
+        Get the rows in the clusters closest to a unit query vector.
+
+        Args:
+            query: Unit query vector
+            nprobe: Override for the number of clusters to scan
+
+        Returns:
+            Array of candidate row numbers
+        """
+        nprobe = min(nprobe or self.nprobe, len(self._lists))
+        centroid_scores = self.centroids @ query
+        probes = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+
+        arrays = [self._list_array(label) for label in probes]
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
+
+    def _list_array(self, label: int) -> np.ndarray:
+        array = self._list_arrays[label]
+        if array is None:
+            array = np.asarray(self._lists[label], dtype=np.int64)
+            self._list_arrays[label] = array
+        return array
@@ -29,6 +29,9 @@ class Settings:
     # Vector Database settings
     vector_db: Dict[str, Any] = None
 
+    # Speaker RAG repository database settings
+    database: Dict[str, Any] = None
+
     # Redis settings
     redis: Dict[str, Any] = None
 
@@ -71,6 +74,10 @@ class Settings:
                 "cache_dir": os.getenv("HF_CACHE_DIR", "/tmp/huggingface_cache"),
                 "device": os.getenv("HF_DEVICE", "cpu"),
             },
+            # Feature-hashing model for development and tests only
+            "hashing": {
+                "batch_size": int(os.getenv("HASHING_MODEL_BATCH_SIZE", "256")),
+            },
         }
 
         # Vector Database configuration
@@ -97,6 +104,19 @@ class Settings:
                 ),
                 "vector_size": int(os.getenv("QDRANT_VECTOR_SIZE", "1536")),
             },
+            "local": {
+                "path": os.getenv("LOCAL_VECTOR_DB_PATH", "/tmp/rag_vectors"),
+                "dimension": int(os.getenv("LOCAL_VECTOR_DB_DIMENSION", "1536")),
+                "index_type": os.getenv("LOCAL_VECTOR_DB_INDEX_TYPE", "flat"),
+                "nlist": int(os.getenv("LOCAL_VECTOR_DB_NLIST", "256")),
+                "nprobe": int(os.getenv("LOCAL_VECTOR_DB_NPROBE", "8")),
+            },
+        }
+
+        # Speaker RAG repository configuration; jobs resume across restarts
+        # only with a persistent database, so there is no default URL
+        self.database = {
+            "url": os.getenv("DATABASE_URL", ""),
         }
 
         # Redis configuration
@@ -146,6 +166,11 @@ class Settings:
             "quality_metrics_window_days": int(
                 os.getenv("QUALITY_METRICS_WINDOW_DAYS", "7")
             ),
+            "job_runner_concurrency": int(os.getenv("JOB_RUNNER_CONCURRENCY", "2")),
+            "job_poll_interval_seconds": float(
+                os.getenv("JOB_POLL_INTERVAL_SECONDS", "5")
+            ),
+            "job_lease_seconds": float(os.getenv("JOB_LEASE_SECONDS", "60")),
         }
 
     def get_ml_model_config(self, model_name: str = None) -> Dict[str, Any]:
@@ -17,7 +17,28 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 
+from .application.ports.secondary.ml_model_port import MLModelPort
+from .application.ports.secondary.speaker_rag_repository_port import (
+    ISpeakerRAGRepositoryPort,
+)
+from .application.ports.secondary.vector_storage_port import VectorStoragePort
+from .application.use_cases.process_speaker_rag_data_use_case import (
+    ProcessSpeakerRAGDataUseCase,
+)
+from .application.use_cases.speaker_rag_job_runner import (
+    JobRunnerSettings,
+    SpeakerRAGJobRunner,
+)
+from .domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from .infrastructure.adapters.database import PostgreSQLSpeakerRAGRepositoryAdapter
 from .infrastructure.adapters.http.controllers import router as api_router
+from .infrastructure.adapters.ml_models import (
+    HashingEmbeddingModel,
+    OpenAIEmbeddingModel,
+)
+from .infrastructure.adapters.vector_db import InProcessVectorStorageAdapter
 
 # Application imports
 from .infrastructure.config.settings import settings
@@ -42,16 +63,29 @@ async def lifespan(app: FastAPI):
 
     try:
         # Initialize ML models
-        await initialize_ml_models()
+        ml_model = await initialize_ml_models()
 
         # Initialize vector database
-        await initialize_vector_database()
+        vector_storage = await initialize_vector_database(ml_model)
+        app.state.vector_storage = vector_storage
 
         # Initialize cache
         await initialize_cache()
 
+        # Wire the speaker RAG use case served by the speaker RAG router
+        speaker_rag_repository = await initialize_speaker_rag_repository()
+        app.state.speaker_rag_repository = speaker_rag_repository
+        app.state.speaker_rag_use_case = ProcessSpeakerRAGDataUseCase(
+            speaker_rag_repository=speaker_rag_repository,
+            vector_storage=vector_storage,
+            rag_processing_service=SpeakerRAGProcessingService(),
+            ml_model=ml_model,
+        )
+
         # Start background tasks
-        await start_background_tasks()
+        app.state.speaker_rag_job_runner = await start_background_tasks(
+            app.state.speaker_rag_use_case, speaker_rag_repository
+        )
 
         logger.info("RAG Integration Service startup completed successfully")
 
@@ -66,7 +100,7 @@ async def lifespan(app: FastAPI):
 
     try:
         # Cleanup resources
-        await cleanup_resources()
+        await cleanup_resources(app)
 
         logger.info("RAG Integration Service shutdown completed")
 
@@ -220,18 +254,62 @@ async def permission_error_handler(request: Request, exc: PermissionError):
 
 
 # Initialization functions
-async def initialize_ml_models():
-    """Initialize ML models for embedding generation"""
-    logger.info("Initializing ML models...")
-    # TODO: Implement ML model initialization
-    pass
+async def initialize_ml_models() -> MLModelPort:
+    """Initialize the embedding model selected by DEFAULT_ML_MODEL"""
+    model_name = settings.ml_models["default_model"]
+    logger.info(f"Initializing ML model {model_name}...")
+    config = settings.get_ml_model_config(model_name)
+    dimension = settings.vector_db["local"]["dimension"]
+
+    if model_name == "openai":
+        if not config["api_key"]:
+            raise RuntimeError("OPENAI_API_KEY must be set for the openai model")
+        return OpenAIEmbeddingModel(
+            api_key=config["api_key"],
+            model=config["model"],
+            dimension=dimension,
+            max_batch_size=config["batch_size"],
+            max_tokens=config["max_tokens"],
+        )
+    if model_name == "hashing":
+        logger.warning("Using the feature-hashing model; embeddings are not semantic")
+        return HashingEmbeddingModel(
+            dimension=dimension, max_batch_size=config["batch_size"]
+        )
+    raise RuntimeError(
+        f"Unsupported DEFAULT_ML_MODEL {model_name!r}; use openai or hashing"
+    )
 
 
-async def initialize_vector_database():
+async def initialize_vector_database(ml_model: MLModelPort) -> VectorStoragePort:
     """Initialize vector database connection"""
     logger.info("Initializing vector database...")
-    # TODO: Implement vector database initialization
-    pass
+    config = settings.vector_db["local"]
+    vector_storage = InProcessVectorStorageAdapter.open(
+        config["path"], dimension=config["dimension"], ml_model=ml_model
+    )
+    await vector_storage.create_index(
+        {
+            "type": config["index_type"],
+            "nlist": config["nlist"],
+            "nprobe": config["nprobe"],
+        }
+    )
+    return vector_storage
+
+
+async def initialize_speaker_rag_repository() -> PostgreSQLSpeakerRAGRepositoryAdapter:
+    """Initialize the persistent speaker RAG repository"""
+    logger.info("Initializing speaker RAG repository...")
+    database_url = settings.database["url"]
+    if not database_url:
+        raise RuntimeError(
+            "DATABASE_URL must be set; processing jobs resume from the database"
+        )
+
+    repository = PostgreSQLSpeakerRAGRepositoryAdapter(database_url)
+    await repository.create_tables()
+    return repository
 
 
 async def initialize_cache():
@@ -241,18 +319,40 @@ async def initialize_cache():
     pass
 
 
-async def start_background_tasks():
+async def start_background_tasks(
+    speaker_rag_use_case: ProcessSpeakerRAGDataUseCase,
+    speaker_rag_repository: ISpeakerRAGRepositoryPort,
+) -> SpeakerRAGJobRunner:
     """Start background tasks for event processing"""
     logger.info("Starting background tasks...")
-    # TODO: Implement background task startup
-    pass
+    runner = SpeakerRAGJobRunner(
+        speaker_rag_use_case,
+        speaker_rag_repository,
+        JobRunnerSettings(
+            concurrency=settings.processing["job_runner_concurrency"],
+            poll_interval_seconds=settings.processing["job_poll_interval_seconds"],
+            lease_seconds=settings.processing["job_lease_seconds"],
+        ),
+    )
+    await runner.start()
+    return runner
 
 
-async def cleanup_resources():
+async def cleanup_resources(app: FastAPI):
     """Cleanup resources during shutdown"""
     logger.info("Cleaning up resources...")
-    # TODO: Implement resource cleanup
-    pass
+    runner = getattr(app.state, "speaker_rag_job_runner", None)
+    if runner is not None:
+        await runner.stop()
+
+    # Persist the local collection so the next startup reopens it
+    vector_storage = getattr(app.state, "vector_storage", None)
+    if vector_storage is not None:
+        vector_storage.save(settings.vector_db["local"]["path"])
+
+    repository = getattr(app.state, "speaker_rag_repository", None)
+    if repository is not None:
+        await repository.close()
 
 
 if __name__ == "__main__":
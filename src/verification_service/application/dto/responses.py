@@ -217,8 +217,12 @@ class ValidationTestDataResponse:
             "original_asr_text": self.original_asr_text,
             "rag_corrected_text": self.rag_corrected_text,
             "final_reference_text": self.final_reference_text,
-            "original_ser_metrics": self.original_ser_metrics.to_dict(),
-            "corrected_ser_metrics": self.corrected_ser_metrics.to_dict(),
+            "original_ser_metrics": self.original_ser_metrics.to_dict(
+                include_edit_script=True
+            ),
+            "corrected_ser_metrics": self.corrected_ser_metrics.to_dict(
+                include_edit_script=True
+            ),
             "improvement_metrics": self.improvement_metrics,
             "metadata": self.metadata,
         }
@@ -6,9 +6,10 @@ Orchestrates SER calculation workflow and data persistence.
 """
 
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
+from ...domain.entities.speaker_ser_aggregate import SpeakerSERAggregate
 from ...domain.services.ser_calculation_service import SERCalculationService
 from ...domain.value_objects.ser_metrics import SERMetrics
 from ..dto.requests import BatchCalculateSERRequest, CalculateSERRequest
@@ -115,6 +116,63 @@ class CalculateSERMetricsUseCase:
             summary_statistics=summary_stats,
         )
 
+    async def stream_summary_statistics(
+        self,
+        text_pairs: Iterable[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64,
+    ) -> Dict[str, Any]:
+        """
+        Calculate summary statistics for a large set of text pairs.
+
+        Pairs are scored in worker processes and folded into running
+        aggregates as chunks complete, so the individual metrics are never
+        held in memory together (e.g. for speaker reassessment over history).
+
+        Args:
+            text_pairs: Iterable of (asr_text, reference_text) tuples
+            max_workers: Number of worker processes (defaults to CPU count)
+            chunk_size: Number of pairs sent to a worker per task
+
+        Returns:
+            Summary statistics in the same shape as batch responses
+        """
+        aggregate = SpeakerSERAggregate()
+
+        async for _, ser_metrics in self._ser_service.stream_batch_ser(
+            text_pairs, max_workers=max_workers, chunk_size=chunk_size
+        ):
+            aggregate.add(ser_metrics)
+
+        return self._summarize_aggregate(aggregate)
+
+    def update_speaker_aggregate(
+        self, aggregate: SpeakerSERAggregate, request: CalculateSERRequest
+    ) -> SERCalculationResponse:
+        """
+        Calculate SER for a new text pair and fold it into a speaker aggregate.
+
+        Args:
+            aggregate: Running aggregate for the request's speaker (updated in place)
+            request: SER calculation request
+
+        Returns:
+            SER calculation response for the new pair
+
+        Raises:
+            ValueError: If the request is invalid or belongs to another speaker
+        """
+        if (
+            aggregate.speaker_id
+            and request.speaker_id
+            and aggregate.speaker_id != request.speaker_id
+        ):
+            raise ValueError("request speaker_id does not match aggregate speaker_id")
+
+        response = self.execute(request)
+        aggregate.add(response.ser_metrics)
+        return response
+
     def compare_ser_results(
         self, original_ser: SERMetrics, corrected_ser: SERMetrics
     ) -> Dict[str, Any]:
@@ -219,28 +277,35 @@ class CalculateSERMetricsUseCase:
         Returns:
             Summary statistics
         """
-        if not ser_metrics_list:
+        return self._summarize_aggregate(
+            SpeakerSERAggregate.from_metrics(ser_metrics_list)
+        )
+
+    def _summarize_aggregate(self, aggregate: SpeakerSERAggregate) -> Dict[str, Any]:
+        """
+        Format an SER aggregate as summary statistics.
+
+        Args:
+            aggregate: Aggregate covering the batch
+
+        Returns:
+            Summary statistics
+        """
+        if not aggregate.count:
             return {}
 
-        ser_scores = [float(metrics.ser_score) for metrics in ser_metrics_list]
-        quality_distribution = self.get_quality_distribution(ser_metrics_list)
+        total_items = aggregate.count
+        quality_distribution = aggregate.get_quality_distribution()
 
         return {
-            "total_items": len(ser_metrics_list),
-            "average_ser": sum(ser_scores) / len(ser_scores),
-            "min_ser": min(ser_scores),
-            "max_ser": max(ser_scores),
+            "total_items": total_items,
+            "average_ser": float(aggregate.ser_sum / total_items),
+            "min_ser": float(aggregate.min_ser),
+            "max_ser": float(aggregate.max_ser),
             "quality_distribution": quality_distribution,
-            "high_quality_percentage": (
-                quality_distribution.get("high", 0) / len(ser_metrics_list)
-            )
-            * 100,
-            "medium_quality_percentage": (
-                quality_distribution.get("medium", 0) / len(ser_metrics_list)
-            )
+            "high_quality_percentage": (quality_distribution["high"] / total_items)
             * 100,
-            "low_quality_percentage": (
-                quality_distribution.get("low", 0) / len(ser_metrics_list)
-            )
+            "medium_quality_percentage": (quality_distribution["medium"] / total_items)
             * 100,
+            "low_quality_percentage": (quality_distribution["low"] / total_items) * 100,
         }
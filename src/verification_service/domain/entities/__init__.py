@@ -6,6 +6,7 @@ in the verification service domain.
 """
 
 from .mt_validation_feedback import ImprovementAssessment, MTValidationFeedback
+from .speaker_ser_aggregate import SpeakerSERAggregate
 from .validation_test_session import SessionStatus, ValidationTestSession
 from .verification_result import VerificationResult
 
@@ -15,4 +16,5 @@ __all__ = [
     "SessionStatus",
     "MTValidationFeedback",
     "ImprovementAssessment",
+    "SpeakerSERAggregate",
 ]
@@ -0,0 +1,207 @@
+"""
+Speaker SER Aggregate Domain Entity
+
+Running SER statistics for a speaker, updated in O(1) per new measurement.
+Lets bucket progression read current speaker stats without reloading history.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Deque, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from ..value_objects.ser_metrics import SERMetrics
+
+DEFAULT_RECENT_SCORES_SIZE = 50
+QUALITY_LEVELS = ("high", "medium", "low")
+
+
+@dataclass
+class SpeakerSERAggregate:
+    """
+    Domain entity holding incremental SER aggregates for a speaker.
+
+    Sums are kept as Decimals, so aggregates built on different shards merge
+    without floating point drift and the mean matches a full recomputation.
+    """
+
+    speaker_id: Optional[UUID] = None
+    count: int = 0
+    ser_sum: Decimal = Decimal("0")
+    ser_sum_of_squares: Decimal = Decimal("0")
+    min_ser: Optional[Decimal] = None
+    max_ser: Optional[Decimal] = None
+    quality_counts: Dict[str, int] = field(
+        default_factory=lambda: {level: 0 for level in QUALITY_LEVELS}
+    )
+    recent_scores_size: int = DEFAULT_RECENT_SCORES_SIZE
+    recent_scores: Deque[Decimal] = field(default_factory=deque)
+
+    def __post_init__(self):
+        """Validate the aggregate after initialization."""
+        if self.count < 0:
+            raise ValueError("count cannot be negative")
+
+        if self.recent_scores_size <= 0:
+            raise ValueError("recent_scores_size must be positive")
+
+        self.recent_scores = deque(self.recent_scores, maxlen=self.recent_scores_size)
+
+    @classmethod
+    def from_metrics(
+        cls,
+        ser_metrics: Iterable[SERMetrics],
+        speaker_id: Optional[UUID] = None,
+        recent_scores_size: int = DEFAULT_RECENT_SCORES_SIZE,
+    ) -> "SpeakerSERAggregate":
+        """
+        Build an aggregate from a sequence of SER metrics.
+
+        Args:
+            ser_metrics: SER metrics in chronological order
+            speaker_id: Speaker identifier
+            recent_scores_size: Number of recent scores to retain
+
+        Returns:
+            SpeakerSERAggregate instance
+        """
+        aggregate = cls(speaker_id=speaker_id, recent_scores_size=recent_scores_size)
+        for metrics in ser_metrics:
+            aggregate.add(metrics)
+        return aggregate
+
+    def add(self, metrics: SERMetrics) -> None:
+        """
+        Fold a new SER measurement into the aggregate in O(1).
+
+        Args:
+            metrics: SER metrics for one text pair
+        """
+        score = metrics.ser_score
+
+        self.count += 1
+        self.ser_sum += score
+        self.ser_sum_of_squares += score * score
+        self.min_ser = score if self.min_ser is None else min(self.min_ser, score)
+        self.max_ser = score if self.max_ser is None else max(self.max_ser, score)
+        self.quality_counts[metrics.get_quality_level()] += 1
+        self.recent_scores.append(score)
+
+    def merge(self, other: "SpeakerSERAggregate") -> "SpeakerSERAggregate":
+        """
+        Combine two aggregates, e.g. partial results from different shards.
+
+        Recent scores of `other` are treated as newer than those of this
+        aggregate.
+
+        Args:
+            other: Aggregate to merge with
+
+        Returns:
+            New aggregate covering both inputs
+
+        Raises:
+            ValueError: If the aggregates belong to different speakers
+        """
+        if self.speaker_id and other.speaker_id and self.speaker_id != other.speaker_id:
+            raise ValueError("Cannot merge aggregates of different speakers")
+
+        merged = SpeakerSERAggregate(
+            speaker_id=self.speaker_id or other.speaker_id,
+            count=self.count + other.count,
+            ser_sum=self.ser_sum + other.ser_sum,
+            ser_sum_of_squares=self.ser_sum_of_squares + other.ser_sum_of_squares,
+            min_ser=_optional_min(self.min_ser, other.min_ser),
+            max_ser=_optional_max(self.max_ser, other.max_ser),
+            quality_counts={
+                level: self.quality_counts[level] + other.quality_counts[level]
+                for level in QUALITY_LEVELS
+            },
+            recent_scores_size=self.recent_scores_size,
+            recent_scores=[*self.recent_scores, *other.recent_scores],
+        )
+        return merged
+
+    @property
+    def average_ser(self) -> Decimal:
+        """Mean SER score rounded to 2 decimal places (0 when empty)."""
+        if not self.count:
+            return Decimal("0")
+        return (self.ser_sum / self.count).quantize(Decimal("0.01"))
+
+    @property
+    def ser_variance(self) -> Decimal:
+        """Population variance of the SER scores (0 when empty)."""
+        if not self.count:
+            return Decimal("0")
+        mean = self.ser_sum / self.count
+        variance = self.ser_sum_of_squares / self.count - mean * mean
+        return max(variance, Decimal("0"))
+
+    @property
+    def ser_std_dev(self) -> Decimal:
+        """Population standard deviation of the SER scores."""
+        return self.ser_variance.sqrt()
+
+    def get_quality_distribution(self) -> Dict[str, int]:
+        """Get counts of high, medium and low quality measurements."""
+        return dict(self.quality_counts)
+
+    def get_recent_scores(self) -> List[Decimal]:
+        """Get the most recent SER scores, oldest first."""
+        return list(self.recent_scores)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "speaker_id": str(self.speaker_id) if self.speaker_id else None,
+            "count": self.count,
+            "ser_sum": str(self.ser_sum),
+            "ser_sum_of_squares": str(self.ser_sum_of_squares),
+            "min_ser": str(self.min_ser) if self.min_ser is not None else None,
+            "max_ser": str(self.max_ser) if self.max_ser is not None else None,
+            "quality_counts": self.get_quality_distribution(),
+            "recent_scores_size": self.recent_scores_size,
+            "recent_scores": [str(score) for score in self.recent_scores],
+            "average_ser": float(self.average_ser),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpeakerSERAggregate":
+        """Create SpeakerSERAggregate from dictionary."""
+        return cls(
+            speaker_id=UUID(data["speaker_id"]) if data.get("speaker_id") else None,
+            count=data["count"],
+            ser_sum=Decimal(data["ser_sum"]),
+            ser_sum_of_squares=Decimal(data["ser_sum_of_squares"]),
+            min_ser=(
+                Decimal(data["min_ser"]) if data.get("min_ser") is not None else None
+            ),
+            max_ser=(
+                Decimal(data["max_ser"]) if data.get("max_ser") is not None else None
+            ),
+            quality_counts=dict(data["quality_counts"]),
+            recent_scores_size=data["recent_scores_size"],
+            recent_scores=[Decimal(score) for score in data["recent_scores"]],
+        )
+
+
+def _optional_min(
+    first: Optional[Decimal], second: Optional[Decimal]
+) -> Optional[Decimal]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+def _optional_max(
+    first: Optional[Decimal], second: Optional[Decimal]
+) -> Optional[Decimal]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return max(first, second)
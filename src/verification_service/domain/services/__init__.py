@@ -5,6 +5,22 @@ This module contains domain services that implement business logic
 for the verification service domain.
 """
 
+from .alignment_engine import (
+    AlignmentEngineType,
+    BitParallelEngine,
+    DynamicProgrammingEngine,
+    EditDistanceEngine,
+    TwoRowEngine,
+    get_alignment_engine,
+)
 from .ser_calculation_service import SERCalculationService
 
-__all__ = ["SERCalculationService"]
+__all__ = [
+    "AlignmentEngineType",
+    "BitParallelEngine",
+    "DynamicProgrammingEngine",
+    "EditDistanceEngine",
+    "SERCalculationService",
+    "TwoRowEngine",
+    "get_alignment_engine",
+]
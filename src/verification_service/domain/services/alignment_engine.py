@@ -0,0 +1,417 @@
+"""
+Alignment Engines
+
+Pluggable token-level edit distance engines used by the SER calculation service.
+All engines return the same Levenshtein distance as the reference dynamic
+programming implementation; they differ only in time and memory characteristics.
+"""
+
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from src.domain.text_normalization import default_interner
+
+from ..value_objects.edit_script import EditOperation, EditScript, EditStep
+
+
+class AlignmentEngineType(str, Enum):
+    """Available edit distance engines."""
+
+    DYNAMIC_PROGRAMMING = "dynamic_programming"
+    TWO_ROW = "two_row"
+    BIT_PARALLEL = "bit_parallel"
+
+
+def intern_tokens(
+    tokens1: Sequence[Hashable], tokens2: Sequence[Hashable]
+) -> Tuple[List[int], List[int]]:
+    """
+    Map the tokens of two sequences onto shared integer IDs.
+
+    Integer comparisons are cheaper than string comparisons in the inner loops,
+    and the bit-parallel engine needs a compact alphabet to build its masks.
+
+    Args:
+        tokens1: First token sequence
+        tokens2: Second token sequence
+
+    Returns:
+        Tuple of integer ID sequences, one per input sequence
+    """
+    ids1, ids2 = default_interner.intern(tokens1, tokens2)
+    return ids1, ids2
+
+
+class EditDistanceEngine(ABC):
+    """
+    Base class for token-level Levenshtein distance engines.
+
+    Subclasses implement `distance`; `bounded_distance` defaults to an
+    Ukkonen-banded computation that stops as soon as the distance is known
+    to exceed the cutoff.
+    """
+
+    engine_type: AlignmentEngineType
+
+    @abstractmethod
+    def distance(self, tokens1: Sequence[Hashable], tokens2: Sequence[Hashable]) -> int:
+        """
+        Calculate the edit distance between two token sequences.
+
+        Args:
+            tokens1: First token sequence
+            tokens2: Second token sequence
+
+        Returns:
+            Edit distance
+        """
+
+    def bounded_distance(
+        self,
+        tokens1: Sequence[Hashable],
+        tokens2: Sequence[Hashable],
+        max_distance: int,
+    ) -> Optional[int]:
+        """
+        Calculate the edit distance only if it does not exceed a cutoff.
+
+        Only cells within `max_distance` of the main diagonal are evaluated,
+        giving O(max_distance · m) time instead of O(m · n).
+
+        Args:
+            tokens1: First token sequence
+            tokens2: Second token sequence
+            max_distance: Largest distance of interest
+
+        Returns:
+            Edit distance, or None if it exceeds max_distance
+        """
+        if max_distance < 0:
+            return None
+
+        m, n = len(tokens1), len(tokens2)
+        if abs(m - n) > max_distance:
+            return None
+        if m == 0 or n == 0:
+            return max(m, n)
+
+        seq1, seq2 = intern_tokens(tokens1, tokens2)
+        k = max_distance
+        infinity = k + 1
+
+        previous = [j if j <= k else infinity for j in range(n + 1)]
+        current = [infinity] * (n + 1)
+
+        for i in range(1, m + 1):
+            lo = max(1, i - k)
+            hi = min(n, i + k)
+            current[lo - 1] = i if lo == 1 else infinity
+            token = seq1[i - 1]
+            row_min = current[lo - 1]
+
+            for j in range(lo, hi + 1):
+                if seq2[j - 1] == token:
+                    value = previous[j - 1]
+                else:
+                    value = 1 + min(previous[j], current[j - 1], previous[j - 1])
+                if value > infinity:
+                    value = infinity
+                current[j] = value
+                if value < row_min:
+                    row_min = value
+
+            if hi < n:
+                current[hi + 1] = infinity
+            if row_min > k:
+                return None
+
+            previous, current = current, previous
+
+        result = previous[n]
+        return result if result <= k else None
+
+    def align(self, hypothesis: Sequence[str], reference: Sequence[str]) -> EditScript:
+        """
+        Compute a minimal edit script transforming hypothesis into reference.
+
+        The distance from `distance` bounds how far any optimal path can stray
+        from the diagonal, so the traceback table only covers that band:
+        O(distance · m) time and memory instead of O(m · n).
+
+        Args:
+            hypothesis: ASR hypothesis tokens
+            reference: Reference tokens
+
+        Returns:
+            EditScript with operations in token order
+        """
+        return EditScript.create(
+            _banded_traceback(
+                hypothesis, reference, self.distance(hypothesis, reference)
+            )
+        )
+
+
+def _banded_traceback(
+    hypothesis: Sequence[str], reference: Sequence[str], distance: int
+) -> List[EditStep]:
+    """
+    Rebuild an optimal alignment inside the band implied by a known distance.
+
+    A cell (i, j) can lie on a path of cost `distance` only if
+    |i - j| + |(m - n) - (i - j)| <= distance, which restricts the diagonal
+    offset i - j to a window of width distance + 1.
+    """
+    m, n = len(hypothesis), len(reference)
+    seq1, seq2 = intern_tokens(hypothesis, reference)
+    offset = m - n
+    min_diagonal = -((distance - offset) // 2)
+    max_diagonal = (distance + offset) // 2
+    infinity = distance + 1
+
+    lows: List[int] = []
+    rows: List[List[int]] = []
+
+    for i in range(m + 1):
+        lo = max(0, i - max_diagonal)
+        hi = min(n, i - min_diagonal)
+        row = [infinity] * (hi - lo + 1)
+
+        if i == 0:
+            for j in range(lo, hi + 1):
+                row[j - lo] = j
+        else:
+            previous = rows[i - 1]
+            previous_lo = lows[i - 1]
+            previous_hi = previous_lo + len(previous) - 1
+            token = seq1[i - 1]
+
+            for j in range(lo, hi + 1):
+                if j == 0:
+                    value = i
+                else:
+                    diagonal = previous[j - 1 - previous_lo]
+                    if seq2[j - 1] == token:
+                        value = diagonal
+                    else:
+                        up = previous[j - previous_lo] if j <= previous_hi else infinity
+                        left = row[j - 1 - lo] if j > lo else infinity
+                        value = 1 + min(up, left, diagonal)
+                row[j - lo] = value if value < infinity else infinity
+
+        lows.append(lo)
+        rows.append(row)
+
+    def cell(i: int, j: int) -> int:
+        lo = lows[i]
+        if lo <= j < lo + len(rows[i]):
+            return rows[i][j - lo]
+        return infinity
+
+    steps: List[EditStep] = []
+    i, j = m, n
+    while i > 0 or j > 0:
+        current = cell(i, j)
+        if (
+            i > 0
+            and j > 0
+            and seq1[i - 1] == seq2[j - 1]
+            and cell(i - 1, j - 1) == current
+        ):
+            operation = EditOperation.MATCH
+        elif i > 0 and j > 0 and cell(i - 1, j - 1) + 1 == current:
+            operation = EditOperation.SUBSTITUTION
+        elif i > 0 and cell(i - 1, j) + 1 == current:
+            operation = EditOperation.DELETION
+        else:
+            operation = EditOperation.INSERTION
+
+        consumes_hypothesis = operation != EditOperation.INSERTION
+        consumes_reference = operation != EditOperation.DELETION
+        steps.append(
+            EditStep(
+                operation=operation,
+                hypothesis_index=i - 1 if consumes_hypothesis else None,
+                reference_index=j - 1 if consumes_reference else None,
+                hypothesis_token=hypothesis[i - 1] if consumes_hypothesis else None,
+                reference_token=reference[j - 1] if consumes_reference else None,
+            )
+        )
+        if consumes_hypothesis:
+            i -= 1
+        if consumes_reference:
+            j -= 1
+
+    steps.reverse()
+    return steps
+
+
+class DynamicProgrammingEngine(EditDistanceEngine):
+    """Reference implementation building the full O(m·n) DP table."""
+
+    engine_type = AlignmentEngineType.DYNAMIC_PROGRAMMING
+
+    def distance(self, tokens1: Sequence[Hashable], tokens2: Sequence[Hashable]) -> int:
+        m, n = len(tokens1), len(tokens2)
+
+        # Create DP table
+        dp = [[0] * (n + 1) for _ in range(m + 1)]
+
+        # Initialize base cases
+        for i in range(m + 1):
+            dp[i][0] = i
+        for j in range(n + 1):
+            dp[0][j] = j
+
+        # Fill DP table
+        for i in range(1, m + 1):
+            for j in range(1, n + 1):
+                if tokens1[i - 1] == tokens2[j - 1]:
+                    dp[i][j] = dp[i - 1][j - 1]
+                else:
+                    dp[i][j] = 1 + min(
+                        dp[i - 1][j],  # deletion
+                        dp[i][j - 1],  # insertion
+                        dp[i - 1][j - 1],  # substitution
+                    )
+
+        return dp[m][n]
+
+
+class TwoRowEngine(EditDistanceEngine):
+    """Levenshtein over interned token IDs keeping only two DP rows."""
+
+    engine_type = AlignmentEngineType.TWO_ROW
+
+    def distance(self, tokens1: Sequence[Hashable], tokens2: Sequence[Hashable]) -> int:
+        seq1, seq2 = intern_tokens(tokens1, tokens2)
+
+        # Keep the shorter sequence as the row to minimise memory
+        if len(seq2) > len(seq1):
+            seq1, seq2 = seq2, seq1
+
+        n = len(seq2)
+        if n == 0:
+            return len(seq1)
+
+        previous = list(range(n + 1))
+        current = [0] * (n + 1)
+
+        for i, token in enumerate(seq1, start=1):
+            current[0] = i
+            for j in range(1, n + 1):
+                if seq2[j - 1] == token:
+                    current[j] = previous[j - 1]
+                else:
+                    current[j] = 1 + min(previous[j], current[j - 1], previous[j - 1])
+            previous, current = current, previous
+
+        return previous[n]
+
+
+class BitParallelEngine(EditDistanceEngine):
+    """
+    Myers/Hyyrö bit-parallel Levenshtein distance.
+
+    One sequence is encoded as per-token bitmasks and the DP column is
+    advanced with a constant number of integer operations per token of the
+    other sequence. Python integers are arbitrary precision, so there is no
+    word-size limit on sequence length.
+    """
+
+    engine_type = AlignmentEngineType.BIT_PARALLEL
+
+    def distance(self, tokens1: Sequence[Hashable], tokens2: Sequence[Hashable]) -> int:
+        return self._run(tokens1, tokens2, None)
+
+    def bounded_distance(
+        self,
+        tokens1: Sequence[Hashable],
+        tokens2: Sequence[Hashable],
+        max_distance: int,
+    ) -> Optional[int]:
+        if max_distance < 0 or abs(len(tokens1) - len(tokens2)) > max_distance:
+            return None
+
+        result = self._run(tokens1, tokens2, max_distance)
+        return result if result <= max_distance else None
+
+    def _run(
+        self,
+        tokens1: Sequence[Hashable],
+        tokens2: Sequence[Hashable],
+        max_distance: Optional[int],
+    ) -> int:
+        """Run the bit-vector recurrence, optionally stopping past a cutoff."""
+        m, n = len(tokens1), len(tokens2)
+        if m == 0 or n == 0:
+            return max(m, n)
+
+        # Build one bitmask per distinct token of the pattern (tokens1)
+        peq: Dict[Hashable, int] = {}
+        for position, token in enumerate(tokens1):
+            peq[token] = peq.get(token, 0) | (1 << position)
+
+        mask = (1 << m) - 1
+        high_bit = 1 << (m - 1)
+        pv = mask
+        mv = 0
+        score = m
+
+        for j, token in enumerate(tokens2, start=1):
+            eq = peq.get(token, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & mask)
+            mh = pv & xh
+
+            if ph & high_bit:
+                score += 1
+            elif mh & high_bit:
+                score -= 1
+
+            # The last row can drop by at most one per remaining column
+            if max_distance is not None and score - (n - j) > max_distance:
+                return max_distance + 1
+
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (~(xv | ph) & mask)
+            mv = ph & xv
+
+        return score
+
+
+_ENGINES: Dict[AlignmentEngineType, EditDistanceEngine] = {
+    AlignmentEngineType.DYNAMIC_PROGRAMMING: DynamicProgrammingEngine(),
+    AlignmentEngineType.TWO_ROW: TwoRowEngine(),
+    AlignmentEngineType.BIT_PARALLEL: BitParallelEngine(),
+}
+
+
+def get_alignment_engine(
+    engine: Union[AlignmentEngineType, str, EditDistanceEngine],
+) -> EditDistanceEngine:
+    """
+    Resolve an engine instance from a type, its string value or an instance.
+
+    Args:
+        engine: Engine type, engine type value, or engine instance
+
+    Returns:
+        Edit distance engine
+
+    Raises:
+        ValueError: If the engine type is not supported
+    """
+    if isinstance(engine, EditDistanceEngine):
+        return engine
+
+    try:
+        return _ENGINES[AlignmentEngineType(engine)]
+    except ValueError:
+        supported = ", ".join(engine_type.value for engine_type in AlignmentEngineType)
+        raise ValueError(
+            f"Unsupported alignment engine '{engine}'. Supported engines: {supported}"
+        )
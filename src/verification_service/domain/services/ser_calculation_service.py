@@ -5,11 +5,65 @@ Domain service for computing comprehensive SER metrics for quality assessment.
 Adapted from reference implementation with enhanced features for speaker bucket management.
 """
 
-import re
-from decimal import Decimal
-from typing import Any, Dict, List, Set, Tuple
-
+import asyncio
+import dataclasses
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from decimal import ROUND_FLOOR, Decimal
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from src.domain.text_normalization import normalize_for_scoring, tokenize_for_scoring
+
+from ..entities.speaker_ser_aggregate import SpeakerSERAggregate
 from ..value_objects.ser_metrics import SERMetrics
+from .alignment_engine import (
+    AlignmentEngineType,
+    EditDistanceEngine,
+    get_alignment_engine,
+)
+
+EngineSelector = Union[AlignmentEngineType, str, EditDistanceEngine]
+
+DEFAULT_BATCH_CHUNK_SIZE = 64
+
+
+def _score_chunk(
+    engine: EditDistanceEngine, text_pairs: List[Tuple[str, str]]
+) -> List[SERMetrics]:
+    """
+    Score a chunk of text pairs inside a worker process.
+
+    Edit scripts are dropped before results are sent back so that only the
+    compact metrics cross the process boundary.
+    """
+    service = SERCalculationService(alignment_engine=engine)
+    return [
+        dataclasses.replace(service.calculate_ser(asr_text, ref_text), edit_script=None)
+        for asr_text, ref_text in text_pairs
+    ]
+
+
+def _chunked(
+    text_pairs: Iterable[Tuple[str, str]], chunk_size: int
+) -> Iterator[List[Tuple[str, str]]]:
+    """Split an iterable of text pairs into lists of at most chunk_size."""
+    iterator = iter(text_pairs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class SERCalculationService:
@@ -20,11 +74,23 @@ class SERCalculationService:
     analysis of insertions, deletions, moves, and overall edit rates for ASR quality assessment.
     """
 
-    def __init__(self):
-        """Initialize SER calculation service."""
-        pass
+    def __init__(
+        self, alignment_engine: EngineSelector = AlignmentEngineType.BIT_PARALLEL
+    ):
+        """
+        Initialize SER calculation service.
 
-    def calculate_ser(self, asr_text: str, reference_text: str) -> SERMetrics:
+        Args:
+            alignment_engine: Default edit distance engine (type or instance)
+        """
+        self._alignment_engine = get_alignment_engine(alignment_engine)
+
+    def calculate_ser(
+        self,
+        asr_text: str,
+        reference_text: str,
+        engine: Optional[EngineSelector] = None,
+    ) -> SERMetrics:
         """
         Calculate comprehensive SER metrics for a text pair.
 
@@ -33,19 +99,21 @@ class SERCalculationService:
         Args:
             asr_text: ASR hypothesis text
             reference_text: Reference/corrected text
+            engine: Optional edit distance engine overriding the service default
 
         Returns:
             SERMetrics: Comprehensive metrics including SER, insertions, deletions, moves
         """
-        # Normalize and tokenize texts
-        asr_tokens = self._tokenize_text(self._normalize_text(asr_text))
-        ref_tokens = self._tokenize_text(self._normalize_text(reference_text))
+        # Normalize and tokenize texts (cached per distinct text)
+        asr_tokens = self._tokenize_text(asr_text)
+        ref_tokens = self._tokenize_text(reference_text)
 
-        # Calculate edit distance and individual operation counts
-        edit_distance = self._calculate_edit_distance(asr_tokens, ref_tokens)
-        insertions = self._count_insertions(asr_tokens, ref_tokens)
-        deletions = self._count_deletions(asr_tokens, ref_tokens)
-        moves = self._count_moves(asr_tokens, ref_tokens)
+        # Align once and derive every operation count from the edit script
+        edit_script = self._resolve_engine(engine).align(asr_tokens, ref_tokens)
+        edit_distance = edit_script.distance
+        insertions = edit_script.net_insertions
+        deletions = edit_script.net_deletions
+        moves = edit_script.move_count
 
         # Calculate lengths
         reference_length = len(ref_tokens) or 1  # Avoid division by zero
@@ -67,23 +135,144 @@ class SERCalculationService:
             edit_distance=edit_distance,
             reference_length=reference_length,
             hypothesis_length=hypothesis_length,
+            edit_script=edit_script,
+        )
+
+    def exceeds_ser_threshold(
+        self,
+        asr_text: str,
+        reference_text: str,
+        threshold: float,
+        engine: Optional[EngineSelector] = None,
+    ) -> bool:
+        """
+        Check whether the SER of a text pair exceeds a threshold.
+
+        Uses a banded edit distance that stops as soon as the distance is known
+        to be above the cutoff, so it is much cheaper than `calculate_ser` for
+        clearly good or clearly bad pairs.
+
+        Args:
+            asr_text: ASR hypothesis text
+            reference_text: Reference/corrected text
+            threshold: SER threshold in percent
+            engine: Optional edit distance engine overriding the service default
+
+        Returns:
+            True if the SER score is strictly greater than the threshold
+        """
+        asr_tokens = self._tokenize_text(asr_text)
+        ref_tokens = self._tokenize_text(reference_text)
+
+        reference_length = len(ref_tokens) or 1
+        max_distance = int(
+            (Decimal(str(threshold)) * reference_length / 100).to_integral_value(
+                rounding=ROUND_FLOOR
+            )
         )
 
+        selected = self._resolve_engine(engine)
+        return selected.bounded_distance(asr_tokens, ref_tokens, max_distance) is None
+
     def calculate_batch_ser(
-        self, text_pairs: List[Tuple[str, str]]
+        self,
+        text_pairs: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
     ) -> List[SERMetrics]:
         """
         Calculate SER metrics for multiple text pairs efficiently.
 
+        With max_workers greater than one (or an explicit executor), pairs are
+        sharded into chunks and scored in worker processes. Results are
+        returned in input order; edit scripts are not kept for pooled batches.
+
         Args:
             text_pairs: List of (asr_text, reference_text) tuples
+            max_workers: Number of worker processes (None or 1 scores in-process)
+            chunk_size: Number of pairs sent to a worker per task
+            executor: Optional executor to reuse instead of creating a pool
 
         Returns:
             List[SERMetrics]: SER metrics for each pair
         """
-        return [
-            self.calculate_ser(asr_text, ref_text) for asr_text, ref_text in text_pairs
-        ]
+        if executor is None and (max_workers is None or max_workers <= 1):
+            return [
+                self.calculate_ser(asr_text, ref_text)
+                for asr_text, ref_text in text_pairs
+            ]
+
+        chunks = list(_chunked(text_pairs, chunk_size))
+        engines = [self._alignment_engine] * len(chunks)
+
+        if executor is not None:
+            chunk_results = executor.map(_score_chunk, engines, chunks)
+            return [metrics for chunk in chunk_results for metrics in chunk]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            chunk_results = pool.map(_score_chunk, engines, chunks)
+            return [metrics for chunk in chunk_results for metrics in chunk]
+
+    async def stream_batch_ser(
+        self,
+        text_pairs: Iterable[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[Tuple[int, SERMetrics]]:
+        """
+        Score text pairs in worker processes, yielding results as chunks finish.
+
+        At most two chunks per worker are in flight, so neither the input
+        iterable nor the results are ever fully materialized.
+
+        Args:
+            text_pairs: Iterable of (asr_text, reference_text) tuples
+            max_workers: Number of worker processes (defaults to CPU count)
+            chunk_size: Number of pairs sent to a worker per task
+            executor: Optional executor to reuse instead of creating a pool
+
+        Yields:
+            (index, SERMetrics) tuples in completion order, where index is the
+            position of the pair in text_pairs
+        """
+        loop = asyncio.get_running_loop()
+        owns_executor = executor is None
+        pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+        max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+
+        chunks = enumerate(_chunked(text_pairs, chunk_size))
+        pending: Dict[asyncio.Future, int] = {}
+
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    next_chunk = next(chunks, None)
+                    if next_chunk is None:
+                        break
+                    chunk_index, chunk = next_chunk
+                    future = loop.run_in_executor(
+                        pool, _score_chunk, self._alignment_engine, chunk
+                    )
+                    pending[future] = chunk_index * chunk_size
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    offset = pending.pop(future)
+                    for position, metrics in enumerate(future.result()):
+                        yield offset + position, metrics
+        finally:
+            for future in pending:
+                future.cancel()
+            if owns_executor:
+                # Waiting for the workers to exit would block the event loop
+                pool.shutdown(wait=False, cancel_futures=True)
 
     def compare_ser_metrics(
         self, original_metrics: SERMetrics, corrected_metrics: SERMetrics
@@ -130,115 +319,25 @@ class SERCalculationService:
         Returns:
             Normalized text
         """
-        if not text:
-            return ""
-
-        # Convert to lowercase
-        text = text.lower()
+        return normalize_for_scoring(text)
 
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove punctuation for word-level comparison
-        text = re.sub(r"[^\w\s]", "", text)
-
-        return text.strip()
-
-    def _tokenize_text(self, text: str) -> List[str]:
+    def _tokenize_text(self, text: str) -> Tuple[str, ...]:
         """
-        Tokenize text into words.
+        Normalize and tokenize text into words.
 
         Args:
             text: Input text
 
         Returns:
-            List of tokens
-        """
-        if not text:
-            return []
-
-        return text.split()
-
-    def _calculate_edit_distance(self, tokens1: List[str], tokens2: List[str]) -> int:
-        """
-        Calculate edit distance between two token sequences using dynamic programming.
-
-        Args:
-            tokens1: First token sequence
-            tokens2: Second token sequence
-
-        Returns:
-            Edit distance
+            Tuple of tokens
         """
-        m, n = len(tokens1), len(tokens2)
-
-        # Create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i
-        for j in range(n + 1):
-            dp[0][j] = j
-
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if tokens1[i - 1] == tokens2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i - 1][j],  # deletion
-                        dp[i][j - 1],  # insertion
-                        dp[i - 1][j - 1],  # substitution
-                    )
+        return tokenize_for_scoring(text)
 
-        return dp[m][n]
-
-    def _count_insertions(self, asr_tokens: List[str], ref_tokens: List[str]) -> int:
-        """Count words that appear in reference but not in ASR (insertions)."""
-        asr_set = set(asr_tokens)
-        return len([word for word in ref_tokens if word not in asr_set])
-
-    def _count_deletions(self, asr_tokens: List[str], ref_tokens: List[str]) -> int:
-        """Count words that appear in ASR but not in reference (deletions)."""
-        ref_set = set(ref_tokens)
-        return len([word for word in asr_tokens if word not in ref_set])
-
-    def _count_moves(self, asr_tokens: List[str], ref_tokens: List[str]) -> int:
-        """
-        Count words that exist in both sentences but in different relative positions.
-
-        This implements a heuristic for detecting word reorderings.
-        """
-        common_words = set(asr_tokens) & set(ref_tokens)
-        moved_words = 0
-
-        for word in common_words:
-            # Get all positions of this word in both sentences
-            asr_positions = [i for i, w in enumerate(asr_tokens) if w == word]
-            ref_positions = [i for i, w in enumerate(ref_tokens) if w == word]
-
-            # For words that appear once in each sentence, check if position changed significantly
-            if len(asr_positions) == 1 and len(ref_positions) == 1:
-                # Calculate relative positions (0.0 to 1.0)
-                asr_rel_pos = (
-                    asr_positions[0] / len(asr_tokens) if len(asr_tokens) > 0 else 0
-                )
-                ref_rel_pos = (
-                    ref_positions[0] / len(ref_tokens) if len(ref_tokens) > 0 else 0
-                )
-
-                # If relative position changed by more than 10%, consider it a move
-                if abs(asr_rel_pos - ref_rel_pos) > 0.1:
-                    moved_words += 1
-
-            # For words with multiple occurrences, use frequency difference as proxy
-            elif len(asr_positions) > 1 or len(ref_positions) > 1:
-                if len(asr_positions) != len(ref_positions):
-                    moved_words += min(len(asr_positions), len(ref_positions))
-
-        return moved_words
+    def _resolve_engine(self, engine: Optional[EngineSelector]) -> EditDistanceEngine:
+        """Return the requested engine, falling back to the service default."""
+        if engine is None:
+            return self._alignment_engine
+        return get_alignment_engine(engine)
 
     def calculate_speaker_average_ser(
         self, ser_metrics_list: List[SERMetrics]
@@ -252,13 +351,7 @@ class SERCalculationService:
         Returns:
             Average SER score
         """
-        if not ser_metrics_list:
-            return Decimal("0")
-
-        total_ser = sum(metrics.ser_score for metrics in ser_metrics_list)
-        average_ser = total_ser / len(ser_metrics_list)
-
-        return average_ser.quantize(Decimal("0.01"))  # Round to 2 decimal places
+        return SpeakerSERAggregate.from_metrics(ser_metrics_list).average_ser
 
     def get_quality_distribution(
         self, ser_metrics_list: List[SERMetrics]
@@ -272,10 +365,6 @@ class SERCalculationService:
         Returns:
             Dictionary with quality level counts
         """
-        distribution = {"high": 0, "medium": 0, "low": 0}
-
-        for metrics in ser_metrics_list:
-            quality_level = metrics.get_quality_level()
-            distribution[quality_level] += 1
-
-        return distribution
+        return SpeakerSERAggregate.from_metrics(
+            ser_metrics_list
+        ).get_quality_distribution()
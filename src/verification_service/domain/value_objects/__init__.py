@@ -5,8 +5,16 @@ This module contains value objects that represent immutable concepts
 in the verification service domain.
 """
 
+from .edit_script import EditOperation, EditScript, EditStep
 from .quality_score import QualityScore
 from .ser_metrics import SERMetrics
 from .verification_status import VerificationStatus
 
-__all__ = ["QualityScore", "VerificationStatus", "SERMetrics"]
+__all__ = [
+    "EditOperation",
+    "EditScript",
+    "EditStep",
+    "QualityScore",
+    "VerificationStatus",
+    "SERMetrics",
+]
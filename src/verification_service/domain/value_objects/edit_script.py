@@ -0,0 +1,162 @@
+"""
+Edit Script Value Object
+
+Represents a token-level alignment between an ASR hypothesis and a reference text.
+Immutable value object following domain-driven design principles.
+"""
+
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+class EditOperation(str, Enum):
+    """Alignment operations, expressed as transforming hypothesis into reference."""
+
+    MATCH = "match"
+    SUBSTITUTION = "substitution"
+    INSERTION = "insertion"  # Reference token missing from the hypothesis
+    DELETION = "deletion"  # Hypothesis token absent from the reference
+
+
+@dataclass(frozen=True)
+class EditStep:
+    """
+    Single step of an edit script.
+
+    Indices are token positions; the index on the side not touched by the
+    operation is None (e.g. an insertion has no hypothesis index).
+    """
+
+    operation: EditOperation
+    hypothesis_index: Optional[int]
+    reference_index: Optional[int]
+    hypothesis_token: Optional[str]
+    reference_token: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "operation": self.operation.value,
+            "hypothesis_index": self.hypothesis_index,
+            "reference_index": self.reference_index,
+            "hypothesis_token": self.hypothesis_token,
+            "reference_token": self.reference_token,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EditStep":
+        """Create EditStep from dictionary."""
+        return cls(
+            operation=EditOperation(data["operation"]),
+            hypothesis_index=data.get("hypothesis_index"),
+            reference_index=data.get("reference_index"),
+            hypothesis_token=data.get("hypothesis_token"),
+            reference_token=data.get("reference_token"),
+        )
+
+
+@dataclass(frozen=True)
+class EditScript:
+    """
+    Value object holding a minimal edit script and the metrics derived from it.
+
+    A move is a word left unaligned on the reference side that also appears
+    unaligned on the hypothesis side, i.e. the ASR produced the word but at a
+    different position. Moved tokens are excluded from the net insertion and
+    deletion counts.
+    """
+
+    steps: Tuple[EditStep, ...]
+    moves: Tuple[Tuple[int, int], ...]  # (hypothesis_index, reference_index)
+    matches: int
+    substitutions: int
+    insertions: int
+    deletions: int
+
+    @property
+    def distance(self) -> int:
+        """Edit distance (substitutions + insertions + deletions)."""
+        return self.substitutions + self.insertions + self.deletions
+
+    @property
+    def move_count(self) -> int:
+        """Number of moved words."""
+        return len(self.moves)
+
+    @property
+    def net_insertions(self) -> int:
+        """Reference tokens missing from the hypothesis, excluding moves."""
+        return self.insertions + self.substitutions - self.move_count
+
+    @property
+    def net_deletions(self) -> int:
+        """Hypothesis tokens absent from the reference, excluding moves."""
+        return self.deletions + self.substitutions - self.move_count
+
+    @classmethod
+    def create(cls, steps: Sequence[EditStep]) -> "EditScript":
+        """
+        Create an EditScript, counting operations and detecting moves in one pass.
+
+        Args:
+            steps: Alignment steps in hypothesis/reference order
+
+        Returns:
+            EditScript instance
+        """
+        counts = {operation: 0 for operation in EditOperation}
+        unaligned_hypothesis: Dict[str, Deque[int]] = defaultdict(deque)
+        unaligned_reference: List[Tuple[str, int]] = []
+
+        for step in steps:
+            counts[step.operation] += 1
+            if step.operation == EditOperation.MATCH:
+                continue
+            if step.hypothesis_token is not None:
+                unaligned_hypothesis[step.hypothesis_token].append(
+                    step.hypothesis_index
+                )
+            if step.reference_token is not None:
+                unaligned_reference.append((step.reference_token, step.reference_index))
+
+        # Pair unaligned reference words with the same word elsewhere in the
+        # hypothesis, using the position index rather than rescanning tokens
+        moves: List[Tuple[int, int]] = []
+        for token, reference_index in unaligned_reference:
+            positions = unaligned_hypothesis.get(token)
+            if positions:
+                moves.append((positions.popleft(), reference_index))
+
+        return cls(
+            steps=tuple(steps),
+            moves=tuple(moves),
+            matches=counts[EditOperation.MATCH],
+            substitutions=counts[EditOperation.SUBSTITUTION],
+            insertions=counts[EditOperation.INSERTION],
+            deletions=counts[EditOperation.DELETION],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "steps": [step.to_dict() for step in self.steps],
+            "moves": [list(move) for move in self.moves],
+            "matches": self.matches,
+            "substitutions": self.substitutions,
+            "insertions": self.insertions,
+            "deletions": self.deletions,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EditScript":
+        """Create EditScript from dictionary."""
+        return cls(
+            steps=tuple(EditStep.from_dict(step) for step in data["steps"]),
+            moves=tuple(tuple(move) for move in data["moves"]),
+            matches=data["matches"],
+            substitutions=data["substitutions"],
+            insertions=data["insertions"],
+            deletions=data["deletions"],
+        )
@@ -5,9 +5,11 @@ Represents comprehensive SER calculation results with validation and analysis me
 Immutable value object following domain-driven design principles.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from .edit_script import EditScript
 
 
 @dataclass(frozen=True)
@@ -28,6 +30,7 @@ class SERMetrics:
     reference_length: int
     hypothesis_length: int
     quality_score: Decimal  # Derived quality score (100 - SER)
+    edit_script: Optional[EditScript] = field(default=None, compare=False, repr=False)
 
     def __post_init__(self):
         """Validate SER metrics after initialization."""
@@ -91,6 +94,7 @@ class SERMetrics:
         edit_distance: int,
         reference_length: int,
         hypothesis_length: int,
+        edit_script: Optional[EditScript] = None,
     ) -> "SERMetrics":
         """
         Create SERMetrics with automatic quality score calculation.
@@ -103,6 +107,7 @@ class SERMetrics:
             edit_distance: Raw edit distance
             reference_length: Length of reference text
             hypothesis_length: Length of hypothesis text
+            edit_script: Optional alignment the metrics were derived from
 
         Returns:
             SERMetrics instance
@@ -120,6 +125,7 @@ class SERMetrics:
             reference_length=reference_length,
             hypothesis_length=hypothesis_length,
             quality_score=quality_score,
+            edit_script=edit_script,
         )
 
     def is_high_quality(self) -> bool:
@@ -210,14 +216,17 @@ class SERMetrics:
         improvement = baseline.ser_score - self.ser_score
         return (improvement / baseline.ser_score) * Decimal("100")
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_edit_script: bool = False) -> Dict[str, Any]:
         """
         Convert to dictionary representation.
 
+        Args:
+            include_edit_script: Whether to include the token alignment
+
         Returns:
             Dictionary with all metrics
         """
-        return {
+        data = {
             "ser_score": float(self.ser_score),
             "insert_percentage": float(self.insert_percentage),
             "delete_percentage": float(self.delete_percentage),
@@ -231,6 +240,11 @@ class SERMetrics:
             "dominant_error_type": self.get_dominant_error_type(),
         }
 
+        if include_edit_script and self.edit_script is not None:
+            data["edit_script"] = self.edit_script.to_dict()
+
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SERMetrics":
         """
@@ -252,6 +266,11 @@ class SERMetrics:
             reference_length=data["reference_length"],
             hypothesis_length=data["hypothesis_length"],
             quality_score=Decimal(str(data["quality_score"])),
+            edit_script=(
+                EditScript.from_dict(data["edit_script"])
+                if data.get("edit_script")
+                else None
+            ),
         )
 
     def __str__(self) -> str:
@@ -2,25 +2,39 @@
 Test data factories for Error Reporting Service.
 
 This module provides factory classes for generating test data following
-the Factory Boy pattern for consistent and maintainable test data creation.
+the Factory Boy pattern for consistent and maintainable test data creation,
+plus plain builders shared by unit and performance tests.
 """
 
 import uuid
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
+from uuid import uuid4
 
 import factory
 from faker import Faker
 
 from src.error_reporting_service.application.dto.requests import (
+    EnhancedMetadataRequest,
     SubmitErrorReportRequest,
 )
 from src.error_reporting_service.domain.entities.error_report import (
+    AudioQuality,
+    BackgroundNoise,
+    BucketType,
+    EnhancedMetadata,
     ErrorReport,
     ErrorStatus,
+    NumberOfSpeakers,
     SeverityLevel,
+    SpeakerClarity,
 )
 from src.error_reporting_service.domain.events.domain_events import ErrorReportedEvent
+from src.rag_integration_service.application.dto.requests import HistoricalDataItem
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
 
 fake = Faker()
 
@@ -103,7 +117,7 @@ class ErrorReportFactory(factory.Factory):
     reported_at = factory.LazyFunction(datetime.utcnow)
 
     status = factory.Iterator(
-        [ErrorStatus.PENDING, ErrorStatus.PROCESSED, ErrorStatus.ARCHIVED]
+        [ErrorStatus.SUBMITTED, ErrorStatus.PROCESSING, ErrorStatus.RECTIFIED]
     )
 
     metadata = factory.LazyFunction(
@@ -296,3 +310,122 @@ def create_edge_case_error_report() -> ErrorReport:
         context_notes=None,
         metadata={},
     )
+
+
+def make_report(
+    speaker_id=None,
+    job_id=None,
+    original_text="The patient has diabetis",
+    corrected_text="The patient has diabetes",
+    severity_level=SeverityLevel.HIGH,
+    status=ErrorStatus.SUBMITTED,
+    bucket_type=BucketType.MEDIUM_TOUCH,
+    error_categories=None,
+) -> ErrorReport:
+    """Create an error report with fixed, fully populated metadata."""
+    return ErrorReport(
+        error_id=uuid4(),
+        job_id=job_id or uuid4(),
+        speaker_id=speaker_id or uuid4(),
+        client_id=uuid4(),
+        reported_by=uuid4(),
+        original_text=original_text,
+        corrected_text=corrected_text,
+        error_categories=error_categories or ["medical_terminology"],
+        severity_level=severity_level,
+        start_position=0,
+        end_position=3,
+        error_timestamp=datetime.utcnow(),
+        reported_at=datetime.utcnow(),
+        bucket_type=bucket_type,
+        enhanced_metadata=EnhancedMetadata(
+            audio_quality=AudioQuality.GOOD,
+            speaker_clarity=SpeakerClarity.CLEAR,
+            background_noise=BackgroundNoise.LOW,
+            number_of_speakers=NumberOfSpeakers.ONE,
+            overlapping_speech=False,
+            requires_specialized_knowledge=False,
+        ),
+        status=status,
+        metadata={"source": {"tool": "qa"}},
+    )
+
+
+def make_request(**overrides) -> SubmitErrorReportRequest:
+    """Create a valid submission request; keyword arguments override fields."""
+    fields = dict(
+        job_id=str(uuid4()),
+        speaker_id=str(uuid4()),
+        client_id=str(uuid4()),
+        original_text="The patient has diabetis",
+        corrected_text="The patient has diabetes",
+        error_categories=["medical_terminology"],
+        severity_level="high",
+        start_position=16,
+        end_position=24,
+        reported_by=str(uuid4()),
+        bucket_type="medium_touch",
+        enhanced_metadata=EnhancedMetadataRequest(
+            audio_quality="good",
+            speaker_clarity="clear",
+            background_noise="low",
+            number_of_speakers="one",
+            overlapping_speech=False,
+            requires_specialized_knowledge=False,
+        ),
+    )
+    fields.update(overrides)
+    return SubmitErrorReportRequest(**fields)
+
+
+def varied_reports(count: int, now: datetime) -> list:
+    """Reports spread over 40 days with every metadata dimension varying."""
+    clients = [uuid4() for _ in range(3)]
+    reports = []
+    for i in range(count):
+        report = make_report(bucket_type=list(BucketType)[i % 4])
+        reports.append(
+            replace(
+                report,
+                client_id=clients[i % 3],
+                reported_at=now - timedelta(hours=i * 7 % (40 * 24), minutes=i % 60),
+                enhanced_metadata=EnhancedMetadata(
+                    audio_quality=list(AudioQuality)[i % 3],
+                    speaker_clarity=list(SpeakerClarity)[i % 4],
+                    background_noise=list(BackgroundNoise)[i % 5 % 4],
+                    number_of_speakers=list(NumberOfSpeakers)[i % 5],
+                    overlapping_speech=i % 2 == 0,
+                    requires_specialized_knowledge=i % 3 == 0,
+                    additional_notes=f"note {i}",
+                ),
+            )
+        )
+    return reports
+
+
+# Speaker RAG builders
+
+
+def make_record(index: int, fail: bool = False) -> HistoricalDataItem:
+    """Create a historical record with two error-correction pairs."""
+    return HistoricalDataItem(
+        historical_data_id=str(uuid4()),
+        asr_text=f"Patient {index} has diabetis and hipertension.{' FAIL' if fail else ''}",
+        final_text=f"Patient {index} has diabetes and hypertension.",
+    )
+
+
+def extract_pairs(speaker_id, count, start=0):
+    """Extract the error-correction pairs of count historical records."""
+    service = SpeakerRAGProcessingService()
+    pairs = []
+    for i in range(start, start + count):
+        pairs.extend(
+            service.extract_error_correction_pairs(
+                asr_text=f"Patient {i} has diabetis and hipertension.",
+                final_text=f"Patient {i} has diabetes and hypertension.",
+                speaker_id=speaker_id,
+                historical_data_id=uuid4(),
+            )
+        )
+    return pairs
@@ -0,0 +1,128 @@
+"""
+API Gateway Fan-Out Benchmark
+
+Serves stub downstream services from a local uvicorn server and compares
+end-to-end latency of the dashboard overview fan-out (five downstream
+calls) made the previous way, sequentially with a new httpx.AsyncClient
+per call, against the pooled ServiceClient running the calls concurrently.
+
+Run with: pytest tests/performance/test_api_gateway_fanout_benchmark.py -s
+"""
+
+import asyncio
+import socket
+import statistics
+import threading
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI
+
+from src.api_gateway import speaker_bucket_management_router as gateway
+
+ITERATIONS = 100
+# Per-path latency of the stub services, in seconds
+STUB_LATENCIES = {
+    "speakers": 0.010,
+    "ser": 0.015,
+    "speaker-rag": 0.020,
+    "bucket-transitions": 0.010,
+    "mt-validation": 0.015,
+}
+
+
+def _stub_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/{service}/{path:path}")
+    async def stub(service: str, path: str):
+        await asyncio.sleep(STUB_LATENCIES.get(service, 0.01))
+        return {"service": service, "path": path}
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def stub_base_url():
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(_stub_app(), host="127.0.0.1", port=port, log_level="error")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join()
+
+
+def _dashboard_urls(base_url: str) -> dict:
+    return {
+        "speaker_statistics": f"{base_url}/api/v1/speakers/statistics/buckets",
+        "ser_metrics": f"{base_url}/api/v1/ser/metrics/summary",
+        "rag_processing": f"{base_url}/api/v1/speaker-rag/statistics/summary",
+        "transition_statistics": f"{base_url}/api/v1/bucket-transitions/statistics/summary",
+        "validation_statistics": f"{base_url}/api/v1/mt-validation/statistics/summary",
+    }
+
+
+async def _sequential_fresh_clients(urls: dict) -> dict:
+    """Reference: the previous ServiceClient, called once per service in turn"""
+    results = {}
+    for name, url in urls.items():
+        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            results[name] = response.json()
+    return results
+
+
+async def _latencies(fan_out, urls: dict) -> list:
+    await fan_out(urls)  # warm up connections
+    latencies = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        results = await fan_out(urls)
+        latencies.append(time.perf_counter() - start)
+        assert all(not isinstance(r, BaseException) for r in results.values())
+    return latencies
+
+
+def _percentiles(latencies: list) -> tuple:
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000
+
+
+@pytest.mark.slow
+def test_dashboard_fan_out_latency(stub_base_url):
+    urls = _dashboard_urls(stub_base_url)
+
+    async def run():
+        before = await _latencies(_sequential_fresh_clients, urls)
+        client = gateway.ServiceClient()
+        try:
+            after = await _latencies(client.get_many, urls)
+        finally:
+            await client.aclose()
+        return before, after
+
+    before, after = asyncio.run(run())
+
+    before_p50, before_p99 = _percentiles(before)
+    after_p50, after_p99 = _percentiles(after)
+    print(
+        f"\nDashboard fan-out over {ITERATIONS} requests: "
+        f"sequential fresh clients p50 {before_p50:.1f}ms p99 {before_p99:.1f}ms, "
+        f"pooled concurrent p50 {after_p50:.1f}ms p99 {after_p99:.1f}ms"
+    )
+    # Concurrent calls are bounded by the slowest service, not the sum
+    assert after_p50 < before_p50
@@ -0,0 +1,142 @@
+"""
+Bulk Ingest Benchmark
+
+Compares per-report submission (SubmitErrorReportUseCase, one session,
+commit and refresh per report) with SubmitErrorReportsBulkUseCase for a
+backfill of 100k reports.
+
+Writes to the database named by BULK_INGEST_BENCHMARK_DATABASE_URL (for
+example a disposable PostgreSQL test database, where the asyncpg driver
+uses COPY), or a temporary SQLite file when unset. Per-report submission
+is timed on a sample and extrapolated to the full backfill.
+
+Run with: pytest tests/performance/test_bulk_ingest_benchmark.py -s
+"""
+
+import asyncio
+import os
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.error_reporting_service.application.dto.requests import (
+    EnhancedMetadataRequest,
+    SubmitErrorReportRequest,
+    SubmitErrorReportsBulkRequest,
+)
+from src.error_reporting_service.application.use_cases.submit_error_report import (
+    SubmitErrorReportUseCase,
+)
+from src.error_reporting_service.application.use_cases.submit_error_reports_bulk import (
+    SubmitErrorReportsBulkUseCase,
+)
+from src.error_reporting_service.domain.services.categorization_service import (
+    ErrorCategorizationService,
+)
+from src.error_reporting_service.domain.services.validation_service import (
+    ErrorValidationService,
+)
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.adapter import (
+    PostgreSQLAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.repository import (
+    DatabaseErrorReportRepository,
+)
+from src.error_reporting_service.infrastructure.adapters.events.mock_event_publisher import (
+    MockEventPublisher,
+)
+
+REPORT_COUNT = 100_000
+SINGLE_SAMPLE = 1_000
+CHUNK_SIZES = [1_000, 5_000]
+
+
+def _requests(count: int) -> list:
+    speakers = [str(uuid4()) for _ in range(200)]
+    client_id = str(uuid4())
+    reported_by = str(uuid4())
+    enhanced_metadata = EnhancedMetadataRequest(
+        audio_quality="good",
+        speaker_clarity="clear",
+        background_noise="low",
+        number_of_speakers="one",
+        overlapping_speech=False,
+        requires_specialized_knowledge=False,
+    )
+    return [
+        SubmitErrorReportRequest(
+            job_id=str(uuid4()),
+            speaker_id=speakers[i % len(speakers)],
+            client_id=client_id,
+            original_text="patient has hypertention",
+            corrected_text="patient has hypertension",
+            error_categories=["medical_terminology"],
+            severity_level="medium",
+            start_position=12,
+            end_position=24,
+            reported_by=reported_by,
+            bucket_type="medium_touch",
+            enhanced_metadata=enhanced_metadata,
+        )
+        for i in range(count)
+    ]
+
+
+def _use_case(use_case_class, adapter: PostgreSQLAdapter):
+    return use_case_class(
+        repository=DatabaseErrorReportRepository(adapter),
+        event_publisher=MockEventPublisher(),
+        validation_service=ErrorValidationService(),
+        categorization_service=ErrorCategorizationService(),
+    )
+
+
+async def _reset(adapter: PostgreSQLAdapter) -> None:
+    await adapter.drop_tables()
+    await adapter.create_tables()
+
+
+async def _run(database_url: str) -> None:
+    adapter = PostgreSQLAdapter(database_url)
+    requests = _requests(REPORT_COUNT)
+
+    try:
+        await _reset(adapter)
+        single = _use_case(SubmitErrorReportUseCase, adapter)
+        start_time = time.perf_counter()
+        for request in requests[:SINGLE_SAMPLE]:
+            await single.execute(request)
+        single_s = (time.perf_counter() - start_time) * REPORT_COUNT / SINGLE_SAMPLE
+        print(f"\nper-report submission (extrapolated): {single_s:8.1f} s")
+
+        for chunk_size in CHUNK_SIZES:
+            await _reset(adapter)
+            bulk = _use_case(SubmitErrorReportsBulkUseCase, adapter)
+            start_time = time.perf_counter()
+            response = await bulk.execute(
+                SubmitErrorReportsBulkRequest(reports=requests, chunk_size=chunk_size)
+            )
+            bulk_s = time.perf_counter() - start_time
+            assert response.succeeded == REPORT_COUNT
+            print(
+                f"bulk submission, chunk_size={chunk_size:>5}: {bulk_s:8.1f} s "
+                f"({single_s / bulk_s:.0f}x)"
+            )
+    finally:
+        await adapter.drop_tables()
+        await adapter.engine.dispose()
+
+
+@pytest.mark.slow
+class TestBulkIngestBenchmark:
+    """Benchmark backfilling 100k error reports."""
+
+    def test_bulk_ingest_throughput(self, tmp_path):
+        """Report backfill time for per-report and bulk submission."""
+        database_url = os.environ.get("BULK_INGEST_BENCHMARK_DATABASE_URL")
+        if database_url is None:
+            pytest.importorskip("aiosqlite")
+            database_url = f"sqlite+aiosqlite:///{tmp_path / 'ingest.db'}"
+
+        asyncio.run(_run(database_url))
@@ -0,0 +1,129 @@
+"""
+In-Memory Database Adapter Benchmark
+
+Reports save throughput and per-query latency for the indexed in-memory
+adapter at load-test sizes, plus the cost of a transaction.
+
+Run with: pytest tests/performance/test_in_memory_database_benchmark.py -s
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.error_reporting_service.domain.entities.error_report import (
+    AudioQuality,
+    BackgroundNoise,
+    BucketType,
+    EnhancedMetadata,
+    ErrorReport,
+    NumberOfSpeakers,
+    SeverityLevel,
+    SpeakerClarity,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.adapter import (
+    InMemoryDatabaseAdapter,
+)
+
+REPORT_COUNTS = [10_000, 50_000, 100_000]
+SPEAKER_COUNT = 500
+QUERY_ROUNDS = 200
+WORDS = ["patient", "hypertension", "diabetes", "metformin", "bilateral", "fracture"]
+
+METADATA = EnhancedMetadata(
+    audio_quality=AudioQuality.GOOD,
+    speaker_clarity=SpeakerClarity.CLEAR,
+    background_noise=BackgroundNoise.LOW,
+    number_of_speakers=NumberOfSpeakers.ONE,
+    overlapping_speech=False,
+    requires_specialized_knowledge=False,
+)
+
+
+def _reports(count: int, speakers: list) -> list:
+    rng = random.Random(11)
+    now = datetime.utcnow()
+    reports = []
+    for i in range(count):
+        text = " ".join(rng.choices(WORDS, k=8)) + f" note{i}"
+        reports.append(
+            ErrorReport(
+                error_id=uuid4(),
+                job_id=uuid4(),
+                speaker_id=rng.choice(speakers),
+                client_id=uuid4(),
+                reported_by=uuid4(),
+                original_text=text,
+                corrected_text=text + " corrected",
+                error_categories=["medical_terminology"],
+                severity_level=rng.choice(list(SeverityLevel)),
+                start_position=0,
+                end_position=7,
+                error_timestamp=now,
+                reported_at=now,
+                bucket_type=rng.choice(list(BucketType)),
+                enhanced_metadata=METADATA,
+                metadata={"batch": i // 1000},
+            )
+        )
+    return reports
+
+
+def _per_query_ms(adapter, queries) -> float:
+    start_time = time.perf_counter()
+    for query in queries:
+        asyncio.run(adapter.search_errors(query))
+    return (time.perf_counter() - start_time) * 1000 / len(queries)
+
+
+@pytest.mark.slow
+class TestInMemoryDatabaseBenchmark:
+    """Benchmark indexed lookups, text search and transactions."""
+
+    def test_indexed_adapter_latency(self):
+        """Report saves/sec and mean query latency per store size."""
+        print(
+            f"\n{'reports':>8} {'saves/sec':>10} {'speaker ms':>11} "
+            f"{'text ms':>8} {'txn ms':>7}"
+        )
+
+        for count in REPORT_COUNTS:
+            speakers = [uuid4() for _ in range(SPEAKER_COUNT)]
+            reports = _reports(count, speakers)
+            adapter = InMemoryDatabaseAdapter()
+
+            start_time = time.perf_counter()
+            for report in reports:
+                asyncio.run(adapter.save_error_report(report))
+            saves_per_sec = count / (time.perf_counter() - start_time)
+
+            speaker_ms = _per_query_ms(
+                adapter,
+                [
+                    {
+                        "speaker_id": str(speakers[i % SPEAKER_COUNT]),
+                        "status": "submitted",
+                    }
+                    for i in range(QUERY_ROUNDS)
+                ],
+            )
+            text_ms = _per_query_ms(
+                adapter,
+                [{"text_search": f"note{i * 37} "} for i in range(QUERY_ROUNDS)],
+            )
+
+            start_time = time.perf_counter()
+            transaction = asyncio.run(adapter.begin_transaction())
+            asyncio.run(adapter.save_error_report(_reports(1, speakers)[0]))
+            asyncio.run(adapter.rollback_transaction(transaction))
+            txn_ms = (time.perf_counter() - start_time) * 1000
+
+            assert adapter.get_connection_info()["total_records"] == count
+            print(
+                f"{count:>8} {saves_per_sec:>10.0f} {speaker_ms:>11.3f} "
+                f"{text_ms:>8.3f} {txn_ms:>7.3f}"
+            )
@@ -0,0 +1,62 @@
+"""
+Metadata Aggregation Benchmark
+
+Compares one pass per insight over the report list (the previous dashboard
+approach) with the single-pass columnar aggregator.
+
+Run with: pytest tests/performance/test_metadata_aggregation_benchmark.py -s
+"""
+
+import time
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from src.error_reporting_service.domain.services.metadata_aggregation import (
+    MetadataAggregator,
+)
+from tests.factories import varied_reports
+
+REPORT_COUNT = 200_000
+CHUNK_SIZE = 5000
+
+
+def _per_insight_passes(reports) -> dict:
+    """Reference: one loop over all reports per distribution or frequency"""
+    return {
+        "audio": Counter(r.enhanced_metadata.audio_quality for r in reports),
+        "clarity": Counter(r.enhanced_metadata.speaker_clarity for r in reports),
+        "noise": Counter(r.enhanced_metadata.background_noise for r in reports),
+        "speakers": Counter(r.enhanced_metadata.number_of_speakers for r in reports),
+        "overlap": sum(r.enhanced_metadata.overlapping_speech for r in reports),
+        "specialized": sum(
+            r.enhanced_metadata.requires_specialized_knowledge for r in reports
+        ),
+        "complexity": Counter(r.calculate_complexity_score() for r in reports),
+    }
+
+
+@pytest.mark.slow
+def test_single_pass_aggregation_throughput():
+    reports = varied_reports(REPORT_COUNT, datetime(2024, 3, 1))
+
+    start = time.perf_counter()
+    reference = _per_insight_passes(reports)
+    per_insight = time.perf_counter() - start
+
+    start = time.perf_counter()
+    aggregator = MetadataAggregator()
+    for offset in range(0, len(reports), CHUNK_SIZE):
+        aggregator.add_reports(reports[offset : offset + CHUNK_SIZE])
+    insights = aggregator.insights()
+    single_pass = time.perf_counter() - start
+
+    print(
+        f"\n{REPORT_COUNT} reports: per-insight passes {per_insight:.2f}s, "
+        f"single pass {single_pass:.2f}s ({per_insight / single_pass:.1f}x)"
+    )
+    assert insights["total_errors_analyzed"] == REPORT_COUNT
+    assert insights["overlapping_speech_frequency"] == round(
+        reference["overlap"] / REPORT_COUNT * 100, 2
+    )
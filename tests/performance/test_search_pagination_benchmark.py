@@ -0,0 +1,130 @@
+"""
+Search Pagination Benchmark
+
+Compares page latency at increasing depths for OFFSET pagination and
+keyset (cursor) pagination in PostgreSQLAdapter.search_errors_page.
+
+Seeds the database named by SEARCH_BENCHMARK_DATABASE_URL (for example a
+disposable PostgreSQL test database), or a temporary SQLite file when unset.
+
+Run with: pytest tests/performance/test_search_pagination_benchmark.py -s
+"""
+
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.adapter import (
+    PostgreSQLAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.models import (
+    ErrorReportModel,
+)
+
+ROW_COUNT = 100_000
+PAGE_SIZE = 50
+DEPTHS = [0, 1_000, 10_000, 50_000, 95_000]
+REPEATS = 5
+INSERT_CHUNK_SIZE = 5_000
+
+
+def _rows(count: int) -> list:
+    rng = random.Random(3)
+    base_time = datetime(2024, 1, 1)
+    speakers = [uuid4() for _ in range(200)]
+    return [
+        {
+            "error_id": uuid4(),
+            "job_id": uuid4(),
+            "speaker_id": rng.choice(speakers),
+            "client_id": uuid4(),
+            "reported_by": uuid4(),
+            "original_text": "patient has hypertention",
+            "corrected_text": "patient has hypertension",
+            "error_categories": ["medical_terminology"],
+            "severity_level": rng.choice(["low", "medium", "high", "critical"]),
+            "start_position": 12,
+            "end_position": 24,
+            "error_timestamp": base_time,
+            # Several rows per second so error_id breaks ties
+            "reported_at": base_time + timedelta(seconds=i // 3),
+            "bucket_type": "medium_touch",
+            "audio_quality": "good",
+            "speaker_clarity": "clear",
+            "background_noise": "low",
+            "number_of_speakers": "one",
+            "overlapping_speech": False,
+            "requires_specialized_knowledge": False,
+            "status": "submitted",
+            "metadata": {},
+        }
+        for i in range(count)
+    ]
+
+
+async def _seed(adapter: PostgreSQLAdapter, rows: list) -> None:
+    await adapter.drop_tables()
+    await adapter.create_tables()
+    async with adapter.engine.begin() as conn:
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            await conn.execute(
+                ErrorReportModel.__table__.insert(),
+                rows[start : start + INSERT_CHUNK_SIZE],
+            )
+
+
+async def _page_ms(adapter: PostgreSQLAdapter, query: dict) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        items, _ = await adapter.search_errors_page(query)
+        timings.append(time.perf_counter() - start_time)
+        assert len(items) == PAGE_SIZE
+    return min(timings) * 1000
+
+
+async def _run(database_url: str) -> None:
+    adapter = PostgreSQLAdapter(database_url)
+    rows = _rows(ROW_COUNT)
+    await _seed(adapter, rows)
+
+    # Keyset positions in the descending (reported_at, error_id) search order
+    keys = sorted(((row["reported_at"], row["error_id"]) for row in rows), reverse=True)
+
+    print(f"\n{'depth':>8} {'offset ms':>10} {'cursor ms':>10}")
+    try:
+        for depth in DEPTHS:
+            offset_ms = await _page_ms(
+                adapter,
+                {"limit": PAGE_SIZE, "offset": depth, "include_total": False},
+            )
+            query = {"limit": PAGE_SIZE, "include_total": False}
+            if depth:
+                query["after"] = keys[depth - 1]
+            cursor_ms = await _page_ms(adapter, query)
+            print(f"{depth:>8} {offset_ms:>10.2f} {cursor_ms:>10.2f}")
+
+        total_ms = await _page_ms(adapter, {"limit": PAGE_SIZE})
+        print(f"first page with window-function total: {total_ms:.2f} ms")
+    finally:
+        await adapter.drop_tables()
+        await adapter.engine.dispose()
+
+
+@pytest.mark.slow
+class TestSearchPaginationBenchmark:
+    """Benchmark deep-page latency for offset and keyset pagination."""
+
+    def test_deep_page_latency(self, tmp_path):
+        """Report page latency per depth; cursor pages should stay flat."""
+        database_url = os.environ.get("SEARCH_BENCHMARK_DATABASE_URL")
+        if database_url is None:
+            pytest.importorskip("aiosqlite")
+            database_url = f"sqlite+aiosqlite:///{tmp_path / 'search.db'}"
+
+        asyncio.run(_run(database_url))
@@ -0,0 +1,98 @@
+"""
+SER Alignment Engine Benchmark
+
+Compares the edit distance engines used by SERCalculationService on synthetic
+dictation transcripts of 10 to 5,000 tokens and checks that every engine
+returns the same distance as the reference DP table.
+
+Run with: pytest tests/performance/test_ser_alignment_benchmark.py -s
+"""
+
+import random
+import time
+from typing import List, Tuple
+
+import pytest
+
+from src.verification_service.domain.services.alignment_engine import (
+    AlignmentEngineType,
+    get_alignment_engine,
+)
+
+TRANSCRIPT_LENGTHS = [10, 100, 1000, 5000]
+ERROR_RATE = 0.1
+
+
+def _make_transcript_pair(length: int, seed: int) -> Tuple[List[str], List[str]]:
+    """Create a reference transcript and an ASR hypothesis with ~10% errors."""
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(500)]
+    reference = [rng.choice(vocabulary) for _ in range(length)]
+    hypothesis = list(reference)
+
+    for _ in range(max(1, int(length * ERROR_RATE))):
+        position = rng.randrange(len(hypothesis))
+        operation = rng.choice(("substitute", "insert", "delete"))
+        if operation == "substitute":
+            hypothesis[position] = rng.choice(vocabulary)
+        elif operation == "insert":
+            hypothesis.insert(position, rng.choice(vocabulary))
+        elif len(hypothesis) > 1:
+            del hypothesis[position]
+
+    return hypothesis, reference
+
+
+@pytest.mark.slow
+class TestSERAlignmentBenchmark:
+    """Benchmark edit distance engines on long transcripts."""
+
+    def test_engine_benchmark(self):
+        """Report per-engine latency and verify identical results."""
+        print(f"\n{'tokens':>8} {'engine':>20} {'distance':>9} {'seconds':>10}")
+
+        for length in TRANSCRIPT_LENGTHS:
+            hypothesis, reference = _make_transcript_pair(length, seed=length)
+            distances = {}
+
+            for engine_type in AlignmentEngineType:
+                engine = get_alignment_engine(engine_type)
+                start_time = time.perf_counter()
+                distances[engine_type] = engine.distance(hypothesis, reference)
+                elapsed = time.perf_counter() - start_time
+                print(
+                    f"{length:>8} {engine_type.value:>20} "
+                    f"{distances[engine_type]:>9} {elapsed:>10.4f}"
+                )
+
+            assert len(set(distances.values())) == 1
+
+    def test_banded_threshold_benchmark(self):
+        """Report the cost of a threshold check versus a full distance."""
+        engine = get_alignment_engine(AlignmentEngineType.BIT_PARALLEL)
+        banded = get_alignment_engine(AlignmentEngineType.TWO_ROW)
+        print(f"\n{'tokens':>8} {'full':>10} {'bit_band':>10} {'dp_band':>10}")
+
+        for length in TRANSCRIPT_LENGTHS:
+            hypothesis, reference = _make_transcript_pair(length, seed=length)
+            max_distance = max(1, length // 20)  # 5% SER threshold
+
+            start_time = time.perf_counter()
+            distance = engine.distance(hypothesis, reference)
+            full_elapsed = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            bit_result = engine.bounded_distance(hypothesis, reference, max_distance)
+            bit_elapsed = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            band_result = banded.bounded_distance(hypothesis, reference, max_distance)
+            band_elapsed = time.perf_counter() - start_time
+
+            expected = distance if distance <= max_distance else None
+            assert bit_result == expected
+            assert band_result == expected
+            print(
+                f"{length:>8} {full_elapsed:>10.4f} "
+                f"{bit_elapsed:>10.4f} {band_elapsed:>10.4f}"
+            )
@@ -0,0 +1,85 @@
+"""
+Batch SER Throughput Benchmark
+
+Reports pairs/sec for batch SER scoring with 1, 2, 4 and N (CPU count)
+worker processes, for both the list-returning and the streaming APIs.
+
+Run with: pytest tests/performance/test_ser_batch_throughput_benchmark.py -s
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import List, Tuple
+
+import pytest
+
+from src.verification_service.domain.services.ser_calculation_service import (
+    SERCalculationService,
+)
+
+PAIR_COUNT = 2000
+TRANSCRIPT_LENGTH = 120
+CHUNK_SIZE = 64
+
+
+def _make_pairs(count: int, length: int) -> List[Tuple[str, str]]:
+    """Create historical ASR/final pairs with ~10% word errors."""
+    rng = random.Random(11)
+    vocabulary = [f"term{i}" for i in range(800)]
+    pairs = []
+    for _ in range(count):
+        reference = [rng.choice(vocabulary) for _ in range(length)]
+        hypothesis = [
+            rng.choice(vocabulary) if rng.random() < 0.1 else word for word in reference
+        ]
+        pairs.append((" ".join(hypothesis), " ".join(reference)))
+    return pairs
+
+
+def _worker_counts() -> List[int]:
+    return sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+@pytest.mark.slow
+class TestSERBatchThroughputBenchmark:
+    """Benchmark pooled batch SER scoring."""
+
+    def test_batch_throughput(self):
+        """Report pairs/sec for calculate_batch_ser per worker count."""
+        service = SERCalculationService()
+        pairs = _make_pairs(PAIR_COUNT, TRANSCRIPT_LENGTH)
+        print(f"\n{'workers':>8} {'seconds':>10} {'pairs/sec':>12}")
+
+        for workers in _worker_counts():
+            start_time = time.perf_counter()
+            results = service.calculate_batch_ser(
+                pairs, max_workers=workers, chunk_size=CHUNK_SIZE
+            )
+            elapsed = time.perf_counter() - start_time
+
+            assert len(results) == PAIR_COUNT
+            print(f"{workers:>8} {elapsed:>10.3f} {PAIR_COUNT / elapsed:>12.1f}")
+
+    def test_streaming_throughput(self):
+        """Report pairs/sec for stream_batch_ser per worker count."""
+        service = SERCalculationService()
+        pairs = _make_pairs(PAIR_COUNT, TRANSCRIPT_LENGTH)
+        print(f"\n{'workers':>8} {'seconds':>10} {'pairs/sec':>12} (streaming)")
+
+        async def consume(workers: int) -> int:
+            count = 0
+            async for _ in service.stream_batch_ser(
+                iter(pairs), max_workers=workers, chunk_size=CHUNK_SIZE
+            ):
+                count += 1
+            return count
+
+        for workers in _worker_counts():
+            start_time = time.perf_counter()
+            count = asyncio.run(consume(workers))
+            elapsed = time.perf_counter() - start_time
+
+            assert count == PAIR_COUNT
+            print(f"{workers:>8} {elapsed:>10.3f} {PAIR_COUNT / elapsed:>12.1f}")
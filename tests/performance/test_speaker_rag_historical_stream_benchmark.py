@@ -0,0 +1,128 @@
+"""
+Historical Data Streaming Benchmark
+
+Compares the previous per-record loop over historical data (one pair write
+and one job update per record) with the streaming pipeline in
+ProcessSpeakerRAGDataUseCase, against a repository with a fixed per-write
+latency. Reports throughput, repository writes and peak traced memory.
+
+Run with: pytest tests/performance/test_speaker_rag_historical_stream_benchmark.py -s
+"""
+
+import asyncio
+import os
+import time
+import tracemalloc
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.application.use_cases.historical_data_pipeline import (
+    HistoricalProcessingSettings,
+)
+from src.rag_integration_service.application.use_cases.process_speaker_rag_data_use_case import (
+    ProcessSpeakerRAGDataUseCase,
+)
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from tests.factories import make_record
+
+RECORD_COUNT = 5000
+WRITE_LATENCY_SECONDS = 0.001
+
+
+class CountingRepository:
+    """Discards writes after a fixed latency, counting them"""
+
+    def __init__(self):
+        self.writes = 0
+        self.pairs = 0
+
+    async def _write(self):
+        self.writes += 1
+        await asyncio.sleep(WRITE_LATENCY_SECONDS)
+
+    async def create_processing_job(self, job):
+        await self._write()
+        return job
+
+    async def update_processing_job(self, job):
+        await self._write()
+        return job
+
+    async def batch_create_error_correction_pairs(self, pairs):
+        await self._write()
+        self.pairs += len(pairs)
+        return pairs
+
+
+async def _records():
+    for i in range(RECORD_COUNT):
+        yield make_record(i)
+
+
+async def _per_record_loop(repository, service, speaker_id) -> int:
+    """Reference: the previous loop, writing pairs and progress per record"""
+    pairs_generated = 0
+    async for record in _records():
+        pairs = service.extract_error_correction_pairs(
+            asr_text=record.asr_text,
+            final_text=record.final_text,
+            speaker_id=speaker_id,
+            historical_data_id=record.historical_data_id,
+        )
+        if pairs:
+            await repository.batch_create_error_correction_pairs(pairs)
+            pairs_generated += len(pairs)
+        await repository.update_processing_job(None)
+    return pairs_generated
+
+
+async def _measure(run):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_historical_stream_benchmark():
+    service = SpeakerRAGProcessingService()
+    speaker_id = uuid4()
+
+    loop_repository = CountingRepository()
+    loop_pairs, loop_seconds, loop_peak = await _measure(
+        lambda: _per_record_loop(loop_repository, service, speaker_id)
+    )
+
+    stream_repository = CountingRepository()
+    use_case = ProcessSpeakerRAGDataUseCase(
+        speaker_rag_repository=stream_repository,
+        vector_storage=None,
+        rag_processing_service=service,
+        historical_settings=HistoricalProcessingSettings(),
+    )
+    response, stream_seconds, stream_peak = await _measure(
+        lambda: use_case.process_speaker_historical_stream(
+            speaker_id=speaker_id, records=_records(), total_records=RECORD_COUNT
+        )
+    )
+
+    print(
+        f"\n{RECORD_COUNT} records, {WRITE_LATENCY_SECONDS * 1e3:.0f}ms per write, "
+        f"{os.cpu_count()} CPUs"
+        f"\n{'pipeline':>10} {'records/s':>10} {'writes':>7} {'peak MiB':>9}"
+        f"\n{'loop':>10} {RECORD_COUNT / loop_seconds:>10.0f}"
+        f" {loop_repository.writes:>7} {loop_peak / 2**20:>9.1f}"
+        f"\n{'stream':>10} {RECORD_COUNT / stream_seconds:>10.0f}"
+        f" {stream_repository.writes:>7} {stream_peak / 2**20:>9.1f}"
+    )
+
+    assert response.total_pairs_generated == loop_pairs == stream_repository.pairs
+    assert stream_repository.writes * 50 < loop_repository.writes
+    assert stream_seconds < loop_seconds
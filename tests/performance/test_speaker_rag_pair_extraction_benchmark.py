@@ -0,0 +1,144 @@
+"""
+Error-Correction Pair Extraction Benchmark
+
+Compares the previous positional extraction (sentences paired by index,
+words compared position by position) with the alignment-based extraction
+in SpeakerRAGProcessingService on a synthetic dictation corpus, reporting
+pairs per document and CPU time.
+
+Run with: pytest tests/performance/test_speaker_rag_pair_extraction_benchmark.py -s
+"""
+
+import random
+import time
+from typing import Tuple
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+
+DOCUMENT_COUNT = 200
+SENTENCES_PER_DOCUMENT = 30
+WORDS_PER_SENTENCE = 14
+
+VOCABULARY = [f"term{i}" for i in range(400)]
+CORRECTIONS = [("diabetis", "diabetes"), ("hipertension", "hypertension")]
+
+
+def _make_document(rng: random.Random) -> Tuple[str, str, int]:
+    """
+    Create an ASR and final document with known edits.
+
+    Returns (asr_text, final_text, edits) where edits counts the corrections
+    a reviewer made: substitutions, inserted and deleted words, and dropped
+    sentences.
+    """
+    asr_sentences, final_sentences = [], []
+    edits = 0
+
+    for _ in range(SENTENCES_PER_DOCUMENT):
+        final_words = [rng.choice(VOCABULARY) for _ in range(WORDS_PER_SENTENCE)]
+        asr_words = list(final_words)
+
+        roll = rng.random()
+        if roll < 0.05:
+            # ASR missed the whole sentence
+            final_sentences.append(" ".join(final_words))
+            edits += 1
+            continue
+        if roll < 0.35:
+            position = rng.randrange(len(asr_words))
+            error, correction = rng.choice(CORRECTIONS)
+            asr_words[position], final_words[position] = error, correction
+            edits += 1
+        if rng.random() < 0.25:
+            # Filler word the reviewer removed
+            asr_words.insert(rng.randrange(1, len(asr_words)), "uhm")
+            edits += 1
+        if rng.random() < 0.15:
+            # Word the ASR dropped
+            del asr_words[rng.randrange(1, len(asr_words) - 1)]
+            edits += 1
+
+        asr_sentences.append(" ".join(asr_words))
+        final_sentences.append(" ".join(final_words))
+
+    return ". ".join(asr_sentences) + ".", ". ".join(final_sentences) + ".", edits
+
+
+class PositionalExtractionService(SpeakerRAGProcessingService):
+    """Reference: the previous index-based sentence and word comparison"""
+
+    def _align_sentences(self, asr_sentences, final_sentences):
+        aligned = []
+        for i in range(max(len(asr_sentences), len(final_sentences))):
+            asr_tokens = asr_sentences[i] if i < len(asr_sentences) else []
+            final_tokens = final_sentences[i] if i < len(final_sentences) else []
+            words1 = {token.text for token in asr_tokens}
+            words2 = {token.text for token in final_tokens}
+            union = words1 | words2
+            similarity = len(words1 & words2) / len(union) if union else 1.0
+            aligned.append((asr_tokens, final_tokens, similarity))
+        return aligned
+
+    def _extract_word_level_differences(self, asr_words, final_words):
+        differences = []
+        for i in range(min(len(asr_words), len(final_words))):
+            if asr_words[i] != final_words[i]:
+                differences.append((i, i + 1, i, i + 1, 0.9))
+        # Trailing insertions and deletions had an empty side, which the
+        # entity rejects, so they are left out here
+        return differences
+
+
+@pytest.mark.slow
+def test_pair_extraction_benchmark():
+    rng = random.Random(21)
+    corpus = [_make_document(rng) for _ in range(DOCUMENT_COUNT)]
+    edits = sum(document_edits for _, _, document_edits in corpus)
+    speaker_id = uuid4()
+
+    def extract_all(service):
+        start = time.process_time()
+        pairs = [
+            service.extract_error_correction_pairs(asr, final, speaker_id, uuid4())
+            for asr, final, _ in corpus
+        ]
+        return pairs, time.process_time() - start
+
+    positional, positional_cpu = extract_all(PositionalExtractionService())
+    aligned, aligned_cpu = extract_all(SpeakerRAGProcessingService())
+
+    # Known misspellings the extraction should recover as pairs
+    misspellings = sum(
+        asr.count(error) for asr, _, _ in corpus for error, _ in CORRECTIONS
+    )
+
+    def recovered(documents):
+        return sum(
+            (pair.error_text, pair.correction_text) in CORRECTIONS
+            for pairs in documents
+            for pair in pairs
+        )
+
+    positional_pairs = sum(len(pairs) for pairs in positional)
+    aligned_pairs = sum(len(pairs) for pairs in aligned)
+
+    print(
+        f"\n{DOCUMENT_COUNT} documents, {edits / DOCUMENT_COUNT:.1f} edits/document, "
+        f"{misspellings} known misspellings"
+        f"\n{'extraction':>12} {'pairs/doc':>10} {'recovered':>10} {'cpu ms/doc':>11}"
+        f"\n{'positional':>12} {positional_pairs / DOCUMENT_COUNT:>10.1f}"
+        f" {recovered(positional):>10} {positional_cpu / DOCUMENT_COUNT * 1e3:>11.2f}"
+        f"\n{'aligned':>12} {aligned_pairs / DOCUMENT_COUNT:>10.1f}"
+        f" {recovered(aligned):>10} {aligned_cpu / DOCUMENT_COUNT * 1e3:>11.2f}"
+    )
+
+    # Every reviewer edit yields at most one pair, and shifted words no
+    # longer produce a cascade of spurious substitutions
+    assert aligned_pairs <= edits
+    assert aligned_pairs < positional_pairs * 0.6
+    assert recovered(aligned) > recovered(positional)
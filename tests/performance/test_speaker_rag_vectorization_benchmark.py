@@ -0,0 +1,141 @@
+"""
+Speaker Pair Vectorization Benchmark
+
+Compares per-pair vectorization (one model call, one storage write and one
+link per pair) with the batched stage in ProcessSpeakerRAGDataUseCase, using
+the deterministic local embedding model with a fixed per-call latency and a
+repository with a fixed per-link latency. A second run of the stage over the
+same pairs measures skipping already-embedded training examples.
+
+Run with: pytest tests/performance/test_speaker_rag_vectorization_benchmark.py -s
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.application.use_cases.process_speaker_rag_data_use_case import (
+    ProcessSpeakerRAGDataUseCase,
+)
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from src.rag_integration_service.infrastructure.adapters.ml_models.hashing_embedding_model import (
+    HashingEmbeddingModel,
+)
+from src.rag_integration_service.infrastructure.adapters.vector_db.in_process_vector_storage import (
+    InProcessVectorStorageAdapter,
+)
+from tests.factories import extract_pairs
+
+RECORD_COUNT = 500
+MODEL_LATENCY_SECONDS = 0.002
+LINK_LATENCY_SECONDS = 0.001
+
+
+class LatencyRepository:
+    """Serves pairs and links embeddings after a fixed latency, counting calls"""
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+        self.link_calls = 0
+        self.links = 0
+
+    async def create_processing_job(self, job):
+        return job
+
+    async def update_processing_job(self, job):
+        return job
+
+    async def get_error_correction_pairs_by_speaker(self, speaker_id, **kwargs):
+        return self.pairs
+
+    async def link_embedding_to_speaker(
+        self, embedding_id, speaker_id, error_correction_pair_id=None
+    ):
+        self.link_calls += 1
+        self.links += 1
+        await asyncio.sleep(LINK_LATENCY_SECONDS)
+        return True
+
+    async def batch_link_embeddings_to_speaker(self, speaker_id, links):
+        self.link_calls += 1
+        self.links += len(links)
+        await asyncio.sleep(LINK_LATENCY_SECONDS)
+        return len(links)
+
+
+async def _per_pair_vectorization(repository, storage, model, speaker_id):
+    """Reference: embed, store and link one pair at a time"""
+    use_case = ProcessSpeakerRAGDataUseCase(repository, storage, None, ml_model=model)
+    for pair in repository.pairs:
+        training_example = pair.get_training_example()
+        vector = await model.generate_embedding(training_example["input"])
+        embedding = use_case._create_pair_embedding(
+            vector, str(pair.id), pair, training_example
+        )
+        await storage.store_embedding(embedding)
+        await repository.link_embedding_to_speaker(
+            embedding_id=embedding.id,
+            speaker_id=speaker_id,
+            error_correction_pair_id=pair.id,
+        )
+
+
+async def _timed(run):
+    start = time.perf_counter()
+    await run()
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_vectorization_benchmark():
+    speaker_id = uuid4()
+    pairs = extract_pairs(speaker_id, RECORD_COUNT)
+
+    loop_repository = LatencyRepository(pairs)
+    loop_model = HashingEmbeddingModel(call_latency_seconds=MODEL_LATENCY_SECONDS)
+    loop_seconds = await _timed(
+        lambda: _per_pair_vectorization(
+            loop_repository, InProcessVectorStorageAdapter(), loop_model, speaker_id
+        )
+    )
+
+    storage = InProcessVectorStorageAdapter()
+    stage_model = HashingEmbeddingModel(call_latency_seconds=MODEL_LATENCY_SECONDS)
+    stage_repository = LatencyRepository(pairs)
+    use_case = ProcessSpeakerRAGDataUseCase(
+        speaker_rag_repository=stage_repository,
+        vector_storage=storage,
+        rag_processing_service=SpeakerRAGProcessingService(),
+        ml_model=stage_model,
+    )
+    stage_seconds = await _timed(
+        lambda: use_case.vectorize_speaker_error_pairs(speaker_id)
+    )
+    stage_calls = (stage_model.call_count, stage_repository.link_calls)
+
+    rerun_seconds = await _timed(
+        lambda: use_case.vectorize_speaker_error_pairs(speaker_id)
+    )
+    rerun_model_calls = stage_model.call_count - stage_calls[0]
+
+    print(
+        f"\n{len(pairs)} pairs, {MODEL_LATENCY_SECONDS * 1e3:.0f}ms per model call, "
+        f"{LINK_LATENCY_SECONDS * 1e3:.0f}ms per link call"
+        f"\n{'stage':>10} {'pairs/s':>9} {'model':>6} {'links':>6}"
+        f"\n{'per-pair':>10} {len(pairs) / loop_seconds:>9.0f}"
+        f" {loop_model.call_count:>6} {loop_repository.link_calls:>6}"
+        f"\n{'batched':>10} {len(pairs) / stage_seconds:>9.0f}"
+        f" {stage_calls[0]:>6} {stage_calls[1]:>6}"
+        f"\n{'re-run':>10} {len(pairs) / rerun_seconds:>9.0f}"
+        f" {rerun_model_calls:>6} {stage_repository.link_calls - stage_calls[1]:>6}"
+    )
+
+    assert await storage.get_embedding_count() == len(pairs)
+    assert stage_repository.links == 2 * loop_repository.links
+    assert rerun_model_calls == 0
+    assert stage_seconds * 5 < loop_seconds
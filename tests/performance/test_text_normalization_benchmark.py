@@ -0,0 +1,88 @@
+"""
+Text Normalization Microbenchmark
+
+Compares the per-call cost of the previous regex-based normalizations in
+SERCalculationService and SpeakerRAGProcessingService against the shared
+precompiled / translate-table pipeline on medical transcription text.
+
+Run with: pytest tests/performance/test_text_normalization_benchmark.py -s
+"""
+
+import re
+import timeit
+
+import pytest
+
+from src.domain.text_normalization import (
+    normalize_for_extraction,
+    split_sentences,
+    tokenize_for_scoring,
+)
+
+MEDICAL_NOTE = (
+    "HISTORY OF PRESENT ILLNESS:  The patient is a 67-year-old male with a "
+    "history of hypertension, type 2 diabetes mellitus, and CHF (EF 35%) who "
+    "presents with worsening dyspnea on exertion x3 days .He denies chest pain, "
+    "palpitations, or syncope!  Home medications include lisinopril 20 mg daily, "
+    "metformin 1000 mg b.i.d., and furosemide 40 mg q.a.m.  Vitals: BP 148/92, "
+    "HR 96, RR 22, SpO2 91% on room air?  ASSESSMENT/PLAN: Acute on chronic "
+    "systolic heart failure — increase furosemide to 40 mg IV b.i.d.; daily "
+    "weights; strict I&O; repeat BMP in a.m.  "
+) * 4
+
+ITERATIONS = 2000
+
+
+def _legacy_scoring_tokens(text):
+    text = text.lower()
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"[^\w\s]", "", text)
+    return text.strip().split()
+
+
+def _legacy_extraction_sentences(text):
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([.!?])\s*", r"\1 ", text)
+    sentences = re.split(r"[.!?]+", text.strip())
+    return [s.strip() for s in sentences if s.strip()]
+
+
+def _per_call_microseconds(function) -> float:
+    return timeit.timeit(function, number=ITERATIONS) / ITERATIONS * 1e6
+
+
+@pytest.mark.slow
+class TestTextNormalizationBenchmark:
+    """Microbenchmark normalization before and after the shared module."""
+
+    def test_scoring_normalization_cost(self):
+        """Report per-call cost of SER tokenization."""
+        uncached = tokenize_for_scoring.__wrapped__
+        assert list(uncached(MEDICAL_NOTE)) == _legacy_scoring_tokens(MEDICAL_NOTE)
+
+        before = _per_call_microseconds(lambda: _legacy_scoring_tokens(MEDICAL_NOTE))
+        after = _per_call_microseconds(lambda: uncached(MEDICAL_NOTE))
+        cached = _per_call_microseconds(lambda: tokenize_for_scoring(MEDICAL_NOTE))
+
+        print(
+            f"\nSER tokenization ({len(MEDICAL_NOTE)} chars): "
+            f"regex {before:.1f}us, translate {after:.1f}us, cached {cached:.2f}us"
+        )
+
+    def test_extraction_normalization_cost(self):
+        """Report per-call cost of RAG sentence normalization."""
+        assert split_sentences(
+            normalize_for_extraction(MEDICAL_NOTE)
+        ) == _legacy_extraction_sentences(MEDICAL_NOTE)
+
+        before = _per_call_microseconds(
+            lambda: _legacy_extraction_sentences(MEDICAL_NOTE)
+        )
+        after = _per_call_microseconds(
+            lambda: split_sentences(normalize_for_extraction(MEDICAL_NOTE))
+        )
+
+        print(
+            f"\nRAG sentence normalization ({len(MEDICAL_NOTE)} chars): "
+            f"regex {before:.1f}us, precompiled {after:.1f}us"
+        )
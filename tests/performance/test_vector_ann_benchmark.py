@@ -0,0 +1,109 @@
+"""
+In-Process Vector Search Benchmark
+
+Reports recall@10 and mean query latency of the IVF index against exact
+(brute force) search for the in-process vector storage adapter.
+
+Run with: pytest tests/performance/test_vector_ann_benchmark.py -s
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from src.rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+from src.rag_integration_service.infrastructure.adapters.vector_db.in_process_vector_storage import (
+    InProcessVectorStorageAdapter,
+)
+
+DIMENSION = 1536
+COLLECTION_SIZE = 20000
+CLUSTERS = 200
+QUERY_COUNT = 50
+TOP_K = 10
+NPROBES = [1, 4, 8, 16]
+STORE_CHUNK_SIZE = 1000
+
+
+async def _populate(adapter: InProcessVectorStorageAdapter, rng) -> np.ndarray:
+    """Store clustered synthetic embeddings in chunks; returns the centers."""
+    centers = rng.standard_normal((CLUSTERS, DIMENSION)).astype(np.float32)
+    now = datetime.utcnow()
+    for start in range(0, COLLECTION_SIZE, STORE_CHUNK_SIZE):
+        vectors = centers[rng.integers(0, CLUSTERS, STORE_CHUNK_SIZE)]
+        vectors = vectors + 0.5 * rng.standard_normal(vectors.shape, dtype=np.float32)
+        await adapter.store_batch_embeddings(
+            [
+                VectorEmbedding(
+                    id=uuid4(),
+                    vector=vector.tolist(),
+                    text=f"error text {start + i}",
+                    text_hash=str(start + i),
+                    embedding_type=EmbeddingType.ERROR,
+                    model_version="v1.0",
+                    model_name="benchmark",
+                    metadata={"speaker_id": f"speaker-{(start + i) % 100}"},
+                    created_at=now,
+                )
+                for i, vector in enumerate(vectors)
+            ]
+        )
+    return centers
+
+
+async def _run_queries(adapter, queries):
+    results = []
+    start_time = time.perf_counter()
+    for query in queries:
+        hits = await adapter.find_similar(query, top_k=TOP_K, threshold=-1.0)
+        results.append({hit.embedding_id for hit in hits})
+    elapsed = time.perf_counter() - start_time
+    return results, elapsed / len(queries) * 1000
+
+
+@pytest.mark.slow
+class TestVectorANNBenchmark:
+    """Benchmark approximate vs exact in-process search."""
+
+    def test_ivf_recall_and_latency(self):
+        """Report recall@10 and ms/query for exact search and IVF per nprobe."""
+
+        async def run():
+            rng = np.random.default_rng(0)
+            adapter = InProcessVectorStorageAdapter()
+            centers = await _populate(adapter, rng)
+            queries = (
+                centers[rng.integers(0, CLUSTERS, QUERY_COUNT)]
+                + 0.5 * rng.standard_normal((QUERY_COUNT, DIMENSION))
+            ).tolist()
+
+            exact, exact_ms = await _run_queries(adapter, queries)
+            print(f"\n{'index':>10} {'recall@10':>10} {'ms/query':>10}")
+            print(f"{'flat':>10} {1.0:>10.3f} {exact_ms:>10.2f}")
+
+            for nprobe in NPROBES:
+                await adapter.create_index(
+                    {"type": "ivf", "nlist": CLUSTERS, "nprobe": nprobe}
+                )
+                approximate, ivf_ms = await _run_queries(adapter, queries)
+                recall = np.mean(
+                    [len(a & e) / TOP_K for a, e in zip(approximate, exact)]
+                )
+                print(f"{'ivf/' + str(nprobe):>10} {recall:>10.3f} {ivf_ms:>10.2f}")
+
+            filtered_start = time.perf_counter()
+            for query in queries:
+                await adapter.find_by_speaker(
+                    "speaker-7", query, top_k=TOP_K, threshold=-1.0
+                )
+            filtered_ms = (time.perf_counter() - filtered_start) / QUERY_COUNT * 1000
+            print(f"{'filtered':>10} {'':>10} {filtered_ms:>10.2f}")
+
+        asyncio.run(run())
@@ -0,0 +1,93 @@
+"""
+Vector Embedding Math Benchmark
+
+Compares pure-Python list math with the cached float32 representation,
+and pairwise vs batched cosine similarity for one query against N embeddings.
+
+Run with: pytest tests/performance/test_vector_embedding_benchmark.py -s
+"""
+
+import math
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from src.rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+from src.rag_integration_service.domain.value_objects.embedding_vector import (
+    cosine_similarities,
+    stack_vectors,
+)
+
+DIMENSION = 1536
+EMBEDDING_COUNT = 2000
+
+
+def _python_cosine(first, second) -> float:
+    """Reference implementation of the previous list-based cosine similarity."""
+    dot = sum(a * b for a, b in zip(first, second))
+    return dot / (
+        math.sqrt(sum(x * x for x in first)) * math.sqrt(sum(x * x for x in second))
+    )
+
+
+def _embeddings(count: int):
+    rng = np.random.default_rng(0)
+    now = datetime.utcnow()
+    return [
+        VectorEmbedding(
+            id=uuid4(),
+            vector=vector.tolist(),
+            text=f"error text {i}",
+            text_hash=str(i),
+            embedding_type=EmbeddingType.ERROR,
+            model_version="v1.0",
+            model_name="benchmark",
+            metadata={},
+            created_at=now,
+        )
+        for i, vector in enumerate(rng.standard_normal((count, DIMENSION)))
+    ]
+
+
+@pytest.mark.slow
+class TestVectorEmbeddingBenchmark:
+    """Benchmark embedding similarity math."""
+
+    def test_similarity_throughput(self):
+        """Report ms to score one query against N embeddings."""
+        embeddings = _embeddings(EMBEDDING_COUNT)
+        query = embeddings[0]
+
+        start_time = time.perf_counter()
+        python_scores = [_python_cosine(query.vector, e.vector) for e in embeddings]
+        python_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        pairwise_scores = [
+            query.cosine_similarity(e.embedding_vector) for e in embeddings
+        ]
+        pairwise_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        batch_scores = query.cosine_similarities(embeddings)
+        batch_ms = (time.perf_counter() - start_time) * 1000
+
+        matrix = stack_vectors([e.embedding_vector for e in embeddings])
+        start_time = time.perf_counter()
+        matrix_scores = cosine_similarities(query.embedding_vector, matrix)
+        matrix_ms = (time.perf_counter() - start_time) * 1000
+
+        assert np.allclose(python_scores, pairwise_scores, atol=1e-5)
+        assert np.allclose(python_scores, matrix_scores, atol=1e-5)
+        assert np.allclose(python_scores, batch_scores, atol=1e-5)
+        print(f"\n{'method':>14} {'ms':>10} (1 query x {EMBEDDING_COUNT})")
+        print(f"{'python lists':>14} {python_ms:>10.2f}")
+        print(f"{'pairwise f32':>14} {pairwise_ms:>10.2f}")
+        print(f"{'stack + score':>14} {batch_ms:>10.2f}")
+        print(f"{'pre-stacked':>14} {matrix_ms:>10.2f}")
@@ -0,0 +1,87 @@
+"""
+Vector Trend Analysis Benchmark
+
+Reports points/sec for paged analyze_error_trends against the local
+in-memory QdrantClient, for collections larger than a single scroll page.
+
+Run with: pytest tests/performance/test_vector_trend_analysis_benchmark.py -s
+"""
+
+import asyncio
+import random
+import time
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import PointStruct
+
+from src.error_reporting_service.infrastructure.external_services.enhanced_vector_database_service import (
+    EnhancedVectorDatabaseService,
+    VectorDatabaseConfig,
+)
+
+POINT_COUNTS = [10_000, 50_000, 200_000]
+PAGE_SIZES = [256, 1000, 4000]
+VECTOR_SIZE = 8
+
+
+def _populate(service: EnhancedVectorDatabaseService, count: int) -> None:
+    """Insert synthetic error points straight into the local client."""
+    rng = random.Random(5)
+    categories = ["medical_terminology", "numeric", "grammar", "punctuation"]
+    service.client.upsert(
+        collection_name=service.collection_name,
+        points=[
+            PointStruct(
+                id=str(uuid4()),
+                vector=[0.0] * VECTOR_SIZE,
+                payload={
+                    "error_id": str(i),
+                    "bucket_type": rng.choice(
+                        ["low_touch", "medium_touch", "high_touch"]
+                    ),
+                    "error_categories": rng.sample(categories, 2),
+                    "complexity_score": rng.uniform(0, 6),
+                    "audio_quality": rng.choice(["good", "fair", "poor"]),
+                    "speaker_clarity": rng.choice(["clear", "unclear"]),
+                    "overlapping_speech": rng.random() < 0.2,
+                    "requires_specialized_knowledge": rng.random() < 0.5,
+                    "original_text": "patient has hypertention " * 10,
+                    "corrected_text": "patient has hypertension " * 10,
+                },
+            )
+            for i in range(count)
+        ],
+    )
+
+
+@pytest.mark.slow
+class TestVectorTrendAnalysisBenchmark:
+    """Benchmark paged trend analysis."""
+
+    def test_trend_analysis_throughput(self):
+        """Report points/sec per collection size and scroll page size."""
+        print(f"\n{'points':>8} {'page':>6} {'seconds':>10} {'points/sec':>12}")
+
+        for count in POINT_COUNTS:
+            service = EnhancedVectorDatabaseService(
+                VectorDatabaseConfig(vector_size=VECTOR_SIZE),
+                client=QdrantClient(location=":memory:"),
+            )
+            asyncio.run(service._ensure_client())
+            _populate(service, count)
+
+            for page_size in PAGE_SIZES:
+                service.config.scroll_page_size = page_size
+                start_time = time.perf_counter()
+                trends = asyncio.run(service.analyze_error_trends())
+                elapsed = time.perf_counter() - start_time
+
+                assert trends["total_errors"] == count
+                print(
+                    f"{count:>8} {page_size:>6} {elapsed:>10.3f} {count / elapsed:>12.0f}"
+                )
@@ -0,0 +1,182 @@
+"""
+Unit tests for the gateway's stale-while-revalidate response cache.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api_gateway.response_cache import CachePolicy, ResponseCache, make_etag
+
+POLICY = CachePolicy(ttl_seconds=10, stale_seconds=20)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingFetch:
+    """Upstream fetch returning an incrementing version after a delay"""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"version": self.calls}
+
+
+class TestResponseCache:
+    """Freshness, stale serving, coalescing and ETags."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(clock=self.clock)
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_from_cache(self):
+        fetch = CountingFetch()
+
+        first = await self.cache.get_or_fetch("key", fetch, POLICY)
+        self.clock.now = 9
+        second = await self.cache.get_or_fetch("key", fetch, POLICY)
+
+        assert second is first
+        assert fetch.calls == 1
+        assert self.cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        fetch = CountingFetch(delay=0.05)
+
+        entries = await asyncio.gather(
+            *(self.cache.get_or_fetch("key", fetch, POLICY) for _ in range(10))
+        )
+
+        assert fetch.calls == 1
+        assert all(entry is entries[0] for entry in entries)
+        stats = self.cache.stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_revalidating(self):
+        fetch = CountingFetch()
+        await self.cache.get_or_fetch("key", fetch, POLICY)
+
+        self.clock.now = 15
+        stale = await self.cache.get_or_fetch("key", fetch, POLICY)
+        await asyncio.sleep(0.01)  # let the background revalidation finish
+        refreshed = await self.cache.get_or_fetch("key", fetch, POLICY)
+
+        assert stale.value == {"version": 1}
+        assert refreshed.value == {"version": 2}
+        stats = self.cache.stats()
+        assert stats["stale_hits"] == 1
+        assert stats["revalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_fetched_again(self):
+        fetch = CountingFetch()
+        await self.cache.get_or_fetch("key", fetch, POLICY)
+
+        self.clock.now = 31
+        entry = await self.cache.get_or_fetch("key", fetch, POLICY)
+
+        assert entry.value == {"version": 2}
+        assert self.cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        async def failing():
+            raise RuntimeError("service down")
+
+        with pytest.raises(RuntimeError):
+            await self.cache.get_or_fetch("key", failing, POLICY)
+        entry = await self.cache.get_or_fetch("key", CountingFetch(), POLICY)
+
+        assert entry.value == {"version": 1}
+        assert self.cache.stats()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_stale_entry(self):
+        await self.cache.get_or_fetch("key", CountingFetch(), POLICY)
+
+        async def failing():
+            raise RuntimeError("service down")
+
+        self.clock.now = 15
+        stale = await self.cache.get_or_fetch("key", failing, POLICY)
+        await asyncio.sleep(0.01)
+        again = await self.cache.get_or_fetch("key", failing, POLICY)
+
+        assert again is stale
+        assert self.cache.stats()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(clock=self.clock, max_entries=2)
+        fetch = CountingFetch()
+        await cache.get_or_fetch("a", fetch, POLICY)
+        await cache.get_or_fetch("b", fetch, POLICY)
+        await cache.get_or_fetch("a", fetch, POLICY)
+
+        await cache.get_or_fetch("c", fetch, POLICY)
+        await cache.get_or_fetch("a", fetch, POLICY)
+
+        assert fetch.calls == 3
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        await cache.get_or_fetch("b", fetch, POLICY)
+        assert fetch.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_degraded_responses_are_not_cached_by_default(self):
+        fetch = CountingFetch()
+
+        first = await self.cache.get_or_fetch(
+            "key", fetch, POLICY, is_degraded=lambda value: True
+        )
+        second = await self.cache.get_or_fetch(
+            "key", fetch, POLICY, is_degraded=lambda value: True
+        )
+
+        assert (first.value, second.value) == ({"version": 1}, {"version": 2})
+        assert self.cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_degraded_responses_expire_without_stale_serving(self):
+        policy = CachePolicy(ttl_seconds=10, stale_seconds=20, degraded_ttl_seconds=2)
+        fetch = CountingFetch()
+
+        def degraded(value):
+            return value["version"] == 1
+
+        await self.cache.get_or_fetch("key", fetch, policy, degraded)
+        self.clock.now = 1
+        cached = await self.cache.get_or_fetch("key", fetch, policy, degraded)
+        self.clock.now = 3
+        refetched = await self.cache.get_or_fetch("key", fetch, policy, degraded)
+
+        assert cached.value == {"version": 1}
+        assert refetched.value == {"version": 2}
+        assert not refetched.degraded
+        assert self.cache.stats()["stale_hits"] == 0
+
+
+class TestMakeEtag:
+    """ETags depend on content, not on volatile fields or key order."""
+
+    def test_ignores_volatile_fields_and_key_order(self):
+        first = make_etag({"a": 1, "b": 2, "timestamp": "t1"}, ["timestamp"])
+        second = make_etag({"b": 2, "a": 1, "timestamp": "t2"}, ["timestamp"])
+
+        assert first == second
+        assert first != make_etag({"a": 1, "b": 3}, ["timestamp"])
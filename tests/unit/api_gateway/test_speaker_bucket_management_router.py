@@ -0,0 +1,184 @@
+"""
+Unit tests for the API gateway's pooled service client and fan-out endpoints.
+
+Downstream services are served by httpx.MockTransport with artificial
+latency, so concurrency and deadlines are observable without a network.
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api_gateway import speaker_bucket_management_router as gateway
+from src.api_gateway.response_cache import ResponseCache
+from src.api_gateway.speaker_bucket_management_router import ServiceClient
+
+
+def stub_services(latencies: dict, status_codes: dict = None) -> httpx.MockTransport:
+    """Services answering after the latency configured for a path fragment"""
+    status_codes = status_codes or {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        for fragment, latency in latencies.items():
+            if fragment in path:
+                await asyncio.sleep(latency)
+        status = next(
+            (code for fragment, code in status_codes.items() if fragment in path),
+            200,
+        )
+        return httpx.Response(status, json={"path": path})
+
+    return httpx.MockTransport(handler)
+
+
+def service_client(transport: httpx.MockTransport) -> ServiceClient:
+    return ServiceClient(httpx.AsyncClient(transport=transport))
+
+
+class TestServiceClient:
+    """Independent calls run concurrently and respect their deadline."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_runs_calls_concurrently(self):
+        client = service_client(stub_services({"/a": 0.2, "/b": 0.2, "/c": 0.2}))
+
+        started = time.perf_counter()
+        results = await client.get_many(
+            {name: f"http://svc/{name}" for name in ("a", "b", "c")}
+        )
+        elapsed = time.perf_counter() - started
+
+        assert results == {name: {"path": f"/{name}"} for name in ("a", "b", "c")}
+        assert elapsed < 0.5
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_slow_call_times_out_without_blocking_others(self):
+        client = service_client(stub_services({"/slow": 1.0}))
+
+        results = await client.get_many(
+            {"fast": "http://svc/fast", "slow": "http://svc/slow"}, deadline=0.1
+        )
+
+        assert results["fast"] == {"path": "/fast"}
+        assert isinstance(results["slow"], asyncio.TimeoutError)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_dependency_returns_one_shared_client(self):
+        first = await gateway.get_service_client()
+        second = await gateway.get_service_client()
+
+        assert first is second
+        await gateway.close_service_client()
+        assert await gateway.get_service_client() is not first
+        await gateway.close_service_client()
+
+
+class TestFanOutEndpoints:
+    """Aggregating endpoints return partial results for slow services."""
+
+    def client_for(
+        self, transport: httpx.MockTransport, cache: ResponseCache = None
+    ) -> TestClient:
+        app = FastAPI()
+        app.include_router(gateway.router)
+        app.dependency_overrides[gateway.get_service_client] = lambda: (
+            service_client(transport)
+        )
+        cache = cache or ResponseCache()
+        app.dependency_overrides[gateway.get_response_cache] = lambda: cache
+        return TestClient(app)
+
+    def test_comprehensive_view_omits_slow_section(self, monkeypatch):
+        monkeypatch.setattr(gateway, "DOWNSTREAM_DEADLINE_SECONDS", 0.1)
+        speaker_id = uuid4()
+        client = self.client_for(stub_services({"/error-patterns": 1.0}))
+
+        response = client.get(
+            f"/api/v1/speaker-bucket-management/speakers/{speaker_id}/comprehensive"
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["speaker"] == {"path": f"/api/v1/speakers/{speaker_id}"}
+        assert body["ser_analysis"] is not None
+        assert body["error_patterns"] is None
+
+    def test_comprehensive_view_missing_speaker(self):
+        client = self.client_for(stub_services({}, status_codes={"/speakers/": 404}))
+
+        response = client.get(
+            f"/api/v1/speaker-bucket-management/speakers/{uuid4()}/comprehensive"
+        )
+
+        assert response.status_code == 404
+
+    def test_dashboard_overview_reports_failing_service(self):
+        client = self.client_for(stub_services({}, status_codes={"/ser/metrics": 503}))
+
+        response = client.get("/api/v1/speaker-bucket-management/dashboard/overview")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["services_status"] == {
+            "user_management": "healthy",
+            "verification": "error",
+            "rag_integration": "healthy",
+        }
+        assert "ser_metrics" not in body
+        assert "validation_statistics" in body
+
+    def test_dashboard_overview_is_cached_with_etag(self):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        client = self.client_for(httpx.MockTransport(handler))
+        url = "/api/v1/speaker-bucket-management/dashboard/overview"
+
+        first = client.get(url)
+        second = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        stats = client.get("/api/v1/speaker-bucket-management/cache/stats").json()
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert len(calls) == 5
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_dashboard_overview_with_failing_service_is_cached_briefly(self):
+        calls = []
+        now = [0.0]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            status = 503 if "/ser/metrics" in request.url.path else 200
+            return httpx.Response(status, json={"path": request.url.path})
+
+        client = self.client_for(
+            httpx.MockTransport(handler), ResponseCache(clock=lambda: now[0])
+        )
+        url = "/api/v1/speaker-bucket-management/dashboard/overview"
+
+        client.get(url)
+        client.get(url)
+        now[0] = 5
+        client.get(url)
+
+        # Within the degraded TTL the entry is served; past it, it is refetched
+        # instead of being served stale
+        assert len(calls) == 10
+        stats = client.get("/api/v1/speaker-bucket-management/cache/stats").json()
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 0, 2)
+        assert gateway._has_failed_section({"speaker": {}, "ser_analysis": None})
+        assert not gateway._has_failed_section({"speaker": {}, "ser_analysis": {}})
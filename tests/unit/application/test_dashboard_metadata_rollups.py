@@ -0,0 +1,175 @@
+"""
+Unit tests for rollup-backed dashboard metadata insights.
+
+Checks that insights read from hourly/daily rollups match the raw-scan path,
+that submissions keep the rollups current and that a rebuild repairs drift.
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.error_reporting_service.application.dto.requests import (
+    GetDashboardMetricsRequest,
+)
+from src.error_reporting_service.application.ports.secondary.event_publisher_port import (
+    EventPublisher,
+)
+from src.error_reporting_service.application.use_cases.dashboard_analytics_use_case import (
+    DashboardAnalyticsUseCase,
+)
+from src.error_reporting_service.application.use_cases.refresh_error_report_rollups import (
+    RefreshErrorReportRollupsUseCase,
+)
+from src.error_reporting_service.application.use_cases.submit_error_report import (
+    SubmitErrorReportUseCase,
+)
+from src.error_reporting_service.domain.services.categorization_service import (
+    ErrorCategorizationService,
+)
+from src.error_reporting_service.domain.services.validation_service import (
+    ErrorValidationService,
+)
+from src.error_reporting_service.domain.value_objects.error_report_rollup import (
+    RollupGranularity,
+    rollup_ranges,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.adapter import (
+    InMemoryDatabaseAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.error_report_rollup_adapter import (
+    InMemoryErrorReportRollupAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.repository import (
+    DatabaseErrorReportRepository,
+)
+from tests.factories import make_report, make_request, varied_reports
+
+
+class TestRollupRanges:
+    """Windows are covered by daily rollups plus hourly edges."""
+
+    def test_whole_days_use_daily_rollups(self):
+        date_from = datetime(2024, 1, 1, 22)
+        date_to = datetime(2024, 1, 5, 3, 30)
+
+        assert rollup_ranges(date_from, date_to) == [
+            (RollupGranularity.HOUR, date_from, datetime(2024, 1, 2)),
+            (RollupGranularity.DAY, datetime(2024, 1, 2), datetime(2024, 1, 5)),
+            (RollupGranularity.HOUR, datetime(2024, 1, 5), date_to),
+        ]
+
+    def test_window_within_a_day_uses_hourly_rollups(self):
+        date_from = datetime(2024, 1, 1, 22)
+        date_to = datetime(2024, 1, 2, 3)
+
+        assert rollup_ranges(date_from, date_to) == [
+            (RollupGranularity.HOUR, date_from, date_to)
+        ]
+
+    def test_unaligned_start_is_rejected(self):
+        with pytest.raises(ValueError):
+            rollup_ranges(datetime(2024, 1, 1, 22, 5), datetime(2024, 1, 2))
+
+
+class TestDashboardMetadataRollups:
+    """Rollup-backed insights agree with the raw-scan path."""
+
+    def setup_method(self):
+        self.db_adapter = InMemoryDatabaseAdapter()
+        self.rollups = InMemoryErrorReportRollupAdapter(self.db_adapter)
+        self.use_case = DashboardAnalyticsUseCase(
+            error_report_repository=self.db_adapter,
+            bucket_history_repository=AsyncMock(),
+            performance_metrics_repository=AsyncMock(),
+            verification_job_repository=AsyncMock(),
+            rollup_repository=self.rollups,
+        )
+
+    async def _save(self, reports):
+        await self.db_adapter.save_error_reports(reports)
+        await self.rollups.add_reports(reports)
+
+    @pytest.mark.asyncio
+    async def test_rollup_insights_match_raw_scan(self):
+        await self._save(varied_reports(500, datetime.utcnow()))
+
+        for time_period in ("last_7_days", "last_30_days", "last_90_days"):
+            check = await self.use_case.check_metadata_rollup_consistency(time_period)
+            assert check["consistent"], check["differences"]
+
+        response = await self.use_case.get_dashboard_metrics(
+            GetDashboardMetricsRequest(
+                metric_type="metadata_insights", time_period="last_7_days"
+            )
+        )
+        raw_use_case = DashboardAnalyticsUseCase(
+            error_report_repository=self.db_adapter,
+            bucket_history_repository=AsyncMock(),
+            performance_metrics_repository=AsyncMock(),
+            verification_job_repository=AsyncMock(),
+        )
+        raw_response = await raw_use_case.get_dashboard_metrics(
+            GetDashboardMetricsRequest(
+                metric_type="metadata_insights", time_period="last_7_days"
+            )
+        )
+        assert response.data == raw_response.data
+        assert 0 < response.data["total_errors_analyzed"] < 500
+
+    @pytest.mark.asyncio
+    async def test_rollups_read_far_fewer_rows_than_reports(self):
+        await self._save(varied_reports(2000, datetime.utcnow()))
+        date_from, date_to = self.use_case._get_insights_window("last_30_days")
+
+        rollups = await self.use_case._load_rollups(date_from, date_to)
+
+        assert sum(rollup.error_count for rollup in rollups) > len(rollups)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_repairs_missed_reports(self):
+        now = datetime.utcnow()
+        reports = varied_reports(100, now)
+        await self._save(reports[:60])
+        await self.db_adapter.save_error_reports(reports[60:])
+
+        check = await self.use_case.check_metadata_rollup_consistency("last_90_days")
+        assert not check["consistent"]
+
+        await self.rollups.rebuild(now - timedelta(days=90), now)
+
+        check = await self.use_case.check_metadata_rollup_consistency("last_90_days")
+        assert check["consistent"], check["differences"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_job_rebuilds_recent_days(self):
+        now = datetime.utcnow()
+        reports = [replace(make_report(), reported_at=now - timedelta(minutes=5))]
+        await self.db_adapter.save_error_reports(reports)
+
+        counted = await RefreshErrorReportRollupsUseCase(self.rollups).execute()
+
+        assert counted == 1
+        check = await self.use_case.check_metadata_rollup_consistency("last_7_days")
+        assert check["consistent"], check["differences"]
+
+    @pytest.mark.asyncio
+    async def test_submission_updates_rollups(self):
+        submit = SubmitErrorReportUseCase(
+            repository=DatabaseErrorReportRepository(self.db_adapter),
+            event_publisher=AsyncMock(spec=EventPublisher),
+            validation_service=ErrorValidationService(),
+            categorization_service=ErrorCategorizationService(),
+            rollup_repository=self.rollups,
+        )
+
+        for _ in range(3):
+            await submit.execute(make_request())
+
+        date_from, date_to = self.use_case._get_insights_window("last_7_days")
+        rollups = await self.use_case._load_rollups(date_from, date_to)
+        assert sum(rollup.error_count for rollup in rollups) == 3
+        check = await self.use_case.check_metadata_rollup_consistency("last_7_days")
+        assert check["consistent"], check["differences"]
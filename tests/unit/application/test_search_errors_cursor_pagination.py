@@ -0,0 +1,142 @@
+"""
+Unit tests for cursor-based pagination in SearchErrorsUseCase.
+
+The repository is backed by the in-memory database adapter so cursors are
+checked end to end: every page is one search_page call and the total seen
+on the first page is carried by the cursor instead of being recounted.
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.error_reporting_service.application.dto.requests import (
+    ErrorFilters,
+    PageCursor,
+    PaginationParams,
+    SearchErrorsRequest,
+    SortParams,
+)
+from src.error_reporting_service.application.ports.secondary.authorization_port import (
+    AuthorizationPort,
+)
+from src.error_reporting_service.application.ports.secondary.cache_port import CachePort
+from src.error_reporting_service.application.ports.secondary.repository_port import (
+    ErrorReportRepository,
+)
+from src.error_reporting_service.application.use_cases.search_errors import (
+    SearchErrorsUseCase,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.adapter import (
+    InMemoryDatabaseAdapter,
+)
+from tests.factories import make_report
+
+
+def _request(cursor=None, size=4):
+    return SearchErrorsRequest(
+        requested_by="qa-user",
+        filters=ErrorFilters(),
+        pagination=PaginationParams(page=1, size=size, cursor=cursor),
+        sort=SortParams(field="reported_at", direction="desc"),
+    )
+
+
+class TestPageCursor:
+    """Opaque cursor encoding."""
+
+    def test_round_trip(self):
+        cursor = PageCursor(
+            reported_at=datetime(2024, 5, 1, 12, 30), error_id="abc", total=42
+        )
+
+        assert PageCursor.decode(cursor.encode()) == cursor
+
+    def test_malformed_cursor_rejected(self):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            PageCursor.decode("not-a-cursor")
+
+
+class TestSearchErrorsCursorPagination:
+    """Keyset pages through the use case."""
+
+    def setup_method(self):
+        self.adapter = InMemoryDatabaseAdapter()
+        self.repository = AsyncMock(spec=ErrorReportRepository)
+        self.repository.search_page.side_effect = self.adapter.search_errors_page
+        self.cache = AsyncMock(spec=CachePort)
+        self.cache.get_search_results.return_value = None
+        self.authorization = AsyncMock(spec=AuthorizationPort)
+        self.authorization.can_search_errors.return_value = True
+
+        self.use_case = SearchErrorsUseCase(
+            repository=self.repository,
+            cache=self.cache,
+            authorization=self.authorization,
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_all_results_newest_first(self):
+        base_time = datetime(2024, 1, 1)
+        reports = [
+            replace(make_report(), reported_at=base_time + timedelta(minutes=i))
+            for i in range(10)
+        ]
+        for report in reports:
+            await self.adapter.save_error_report(report)
+
+        pages = []
+        response = await self.use_case.execute(_request())
+        pages.append(response.results)
+        while response.results.next_cursor:
+            response = await self.use_case.execute(
+                _request(cursor=response.results.next_cursor)
+            )
+            pages.append(response.results)
+
+        seen = [report.error_id for page in pages for report in page.items]
+        assert seen == [report.error_id for report in reversed(reports)]
+        assert [page.total for page in pages] == [10, 10, 10]
+        assert self.repository.search_page.await_count == 3
+
+        later_criteria = self.repository.search_page.await_args_list[1].args[0]
+        assert "after" in later_criteria
+        assert "offset" not in later_criteria
+        assert later_criteria["include_total"] is False
+
+    @pytest.mark.asyncio
+    async def test_total_can_be_skipped(self):
+        await self.adapter.save_error_report(make_report())
+
+        response = await self.use_case.execute(
+            SearchErrorsRequest(
+                requested_by="qa-user",
+                filters=ErrorFilters(),
+                pagination=PaginationParams(size=4, include_total=False),
+                sort=SortParams(),
+            )
+        )
+
+        assert len(response.results.items) == 1
+        assert response.results.total is None
+        assert response.results.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_relevance_ranked_results_have_no_cursor(self):
+        for _ in range(5):
+            await self.adapter.save_error_report(make_report())
+
+        response = await self.use_case.execute(
+            SearchErrorsRequest(
+                requested_by="qa-user",
+                filters=ErrorFilters(text_search="diabetes"),
+                pagination=PaginationParams(size=4),
+                sort=SortParams(field="relevance"),
+            )
+        )
+
+        assert len(response.results.items) == 4
+        assert response.results.total == 5
+        assert response.results.next_cursor is None
@@ -77,8 +77,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search
-        self.mock_repository.search.return_value = error_reports
-        self.mock_repository.count_by_filters.return_value = 5
+        self.mock_repository.search_page.return_value = (error_reports, 5)
 
         # Act
         response = await self.use_case.execute(request)
@@ -93,8 +92,7 @@ class TestSearchErrorsUseCase:
 
         # Verify interactions
         self.mock_authorization.can_search_errors.assert_called_once_with(user_id)
-        self.mock_repository.search.assert_called_once()
-        self.mock_repository.count_by_filters.assert_called_once()
+        self.mock_repository.search_page.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_search_with_severity_filter(self):
@@ -120,8 +118,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search
-        self.mock_repository.search.return_value = high_severity_errors
-        self.mock_repository.count_by_filters.return_value = 3
+        self.mock_repository.search_page.return_value = (high_severity_errors, 3)
 
         # Act
         response = await self.use_case.execute(request)
@@ -158,8 +155,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search
-        self.mock_repository.search.return_value = medical_errors
-        self.mock_repository.count_by_filters.return_value = 4
+        self.mock_repository.search_page.return_value = (medical_errors, 4)
 
         # Act
         response = await self.use_case.execute(request)
@@ -199,8 +195,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search
-        self.mock_repository.search.return_value = recent_errors
-        self.mock_repository.count_by_filters.return_value = 3
+        self.mock_repository.search_page.return_value = (recent_errors, 3)
 
         # Act
         response = await self.use_case.execute(request)
@@ -240,8 +235,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search
-        self.mock_repository.search.return_value = diabetes_errors
-        self.mock_repository.count_by_filters.return_value = 2
+        self.mock_repository.search_page.return_value = (diabetes_errors, 2)
 
         # Act
         response = await self.use_case.execute(request)
@@ -279,8 +273,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search
-        self.mock_repository.search.return_value = page_2_errors
-        self.mock_repository.count_by_filters.return_value = 25
+        self.mock_repository.search_page.return_value = (page_2_errors, 25)
 
         # Act
         response = await self.use_case.execute(request)
@@ -314,7 +307,7 @@ class TestSearchErrorsUseCase:
             await self.use_case.execute(request)
 
         # Verify repository was not accessed
-        self.mock_repository.search.assert_not_called()
+        self.mock_repository.search_page.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_search_cached_results(self):
@@ -350,7 +343,7 @@ class TestSearchErrorsUseCase:
         assert len(response.results.items) == 1
 
         # Verify repository was not called due to cache hit
-        self.mock_repository.search.assert_not_called()
+        self.mock_repository.search_page.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_search_empty_results(self):
@@ -372,8 +365,7 @@ class TestSearchErrorsUseCase:
         self.mock_cache.get.return_value = None
 
         # Mock repository search with empty results
-        self.mock_repository.search.return_value = []
-        self.mock_repository.count_by_filters.return_value = 0
+        self.mock_repository.search_page.return_value = ([], 0)
 
         # Act
         response = await self.use_case.execute(request)
@@ -405,8 +397,7 @@ class TestSearchErrorsUseCase:
 
         # Mock repository search with large dataset
         large_dataset = create_error_reports_batch(100)
-        self.mock_repository.search.return_value = large_dataset
-        self.mock_repository.count_by_filters.return_value = 10000
+        self.mock_repository.search_page.return_value = (large_dataset, 10000)
 
         # Act
         start_time = datetime.utcnow()
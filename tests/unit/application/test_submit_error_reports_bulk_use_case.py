@@ -0,0 +1,142 @@
+"""
+Unit tests for SubmitErrorReportsBulkUseCase.
+
+Runs the use case against the in-memory database adapter to check
+per-item results, chunked bulk writes and the single batched publish.
+"""
+
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from src.error_reporting_service.application.dto.requests import (
+    SubmitErrorReportsBulkRequest,
+)
+from src.error_reporting_service.application.ports.secondary.event_publisher_port import (
+    EventPublisher,
+)
+from src.error_reporting_service.application.use_cases.submit_error_reports_bulk import (
+    SubmitErrorReportsBulkUseCase,
+)
+from src.error_reporting_service.domain.services.categorization_service import (
+    ErrorCategorizationService,
+)
+from src.error_reporting_service.domain.services.validation_service import (
+    ErrorValidationService,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.adapter import (
+    InMemoryDatabaseAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.repository import (
+    DatabaseErrorReportRepository,
+)
+from tests.factories import make_request
+
+
+class TestSubmitErrorReportsBulkUseCase:
+    """Test suite for SubmitErrorReportsBulkUseCase"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.db_adapter = InMemoryDatabaseAdapter()
+        self.repository = DatabaseErrorReportRepository(self.db_adapter)
+        self.event_publisher = AsyncMock(spec=EventPublisher)
+
+        self.use_case = SubmitErrorReportsBulkUseCase(
+            repository=self.repository,
+            event_publisher=self.event_publisher,
+            validation_service=ErrorValidationService(),
+            categorization_service=ErrorCategorizationService(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_valid_reports_are_saved_and_published_once(self):
+        requests = [make_request() for _ in range(5)]
+
+        response = await self.use_case.execute(
+            SubmitErrorReportsBulkRequest(reports=requests, chunk_size=2)
+        )
+
+        assert (response.total, response.succeeded, response.failed) == (5, 5, 0)
+        assert [result.index for result in response.results] == list(range(5))
+        for result in response.results:
+            assert result.status == "success"
+            assert await self.db_adapter.find_error_by_id(UUID(result.error_id))
+
+        self.event_publisher.publish_errors_reported.assert_awaited_once()
+        events = self.event_publisher.publish_errors_reported.call_args.args[0]
+        assert [event.error_id for event in events] == [
+            result.error_id for result in response.results
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_reports_fail_individually(self):
+        requests = [
+            make_request(),
+            make_request(error_categories=["not_a_category"]),
+            make_request(job_id="not-a-uuid"),
+            make_request(severity_level="catastrophic"),
+            make_request(),
+        ]
+
+        response = await self.use_case.execute(
+            SubmitErrorReportsBulkRequest(reports=requests)
+        )
+
+        assert [result.status for result in response.results] == [
+            "success",
+            "failed",
+            "failed",
+            "failed",
+            "success",
+        ]
+        assert response.results[1].error == "Invalid error categories"
+        assert response.succeeded == 2
+        assert len(await self.db_adapter.search_errors({})) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_only_fails_its_reports(self):
+        save_error_reports = self.db_adapter.save_error_reports
+        calls = []
+
+        async def fail_second_chunk(error_reports):
+            calls.append(len(error_reports))
+            if len(calls) == 2:
+                raise RuntimeError("connection lost")
+            return await save_error_reports(error_reports)
+
+        self.db_adapter.save_error_reports = fail_second_chunk
+
+        response = await self.use_case.execute(
+            SubmitErrorReportsBulkRequest(
+                reports=[make_request() for _ in range(5)], chunk_size=2
+            )
+        )
+
+        assert calls == [2, 2, 1]
+        assert [result.status for result in response.results] == [
+            "success",
+            "success",
+            "failed",
+            "failed",
+            "success",
+        ]
+        assert "connection lost" in response.results[2].error
+        events = self.event_publisher.publish_errors_reported.call_args.args[0]
+        assert len(events) == 3
+
+    @pytest.mark.asyncio
+    async def test_nothing_published_when_no_report_is_saved(self):
+        response = await self.use_case.execute(
+            SubmitErrorReportsBulkRequest(
+                reports=[make_request(error_categories=["not_a_category"])]
+            )
+        )
+
+        assert response.failed == 1
+        self.event_publisher.publish_errors_reported.assert_not_called()
+
+    def test_chunk_size_must_be_positive(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            SubmitErrorReportsBulkRequest(reports=[], chunk_size=0)
@@ -0,0 +1,252 @@
+"""
+Unit tests for concurrent, rate-limited and resumable verification batches.
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.error_reporting_service.application.use_cases.batch_scheduling import (
+    RetryPolicy,
+    ServiceLimiter,
+    TokenBucket,
+)
+from src.error_reporting_service.application.use_cases.verification_workflow_use_case import (
+    VerificationWorkflowUseCase,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.verification_batch_checkpoint_adapter import (
+    InMemoryVerificationBatchCheckpointAdapter,
+)
+
+NO_BACKOFF = RetryPolicy(max_attempts=3, base_delay_seconds=0.0)
+
+
+class InMemoryVerificationJobs:
+    """Stores verification jobs by ID"""
+
+    def __init__(self):
+        self.jobs = {}
+        self.job_id_queries = []
+
+    async def save_verification_job(self, job):
+        self.jobs[job.verification_id] = job
+        return job
+
+    async def get_by_id(self, verification_id):
+        return self.jobs.get(verification_id)
+
+    async def get_by_job_ids(self, job_ids):
+        self.job_id_queries.append(list(job_ids))
+        return [job for job in self.jobs.values() if job.job_id in job_ids]
+
+
+class FakeInstaNote:
+    """Returns jobs_per_speaker jobs after a delay; can fail speakers"""
+
+    def __init__(self, delay=0.0, jobs_per_speaker=2, failing_speakers=()):
+        self.delay = delay
+        self.jobs_per_speaker = jobs_per_speaker
+        self.failing_speakers = set(failing_speakers)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_jobs_for_speaker(self, speaker_id, **kwargs):
+        self.calls.append(speaker_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if speaker_id in self.failing_speakers:
+                raise ConnectionError("InstaNote unavailable")
+            return [
+                {
+                    "job_id": f"{speaker_id}-{i}",
+                    "original_draft": "patient has diabetis",
+                }
+                for i in range(self.jobs_per_speaker)
+            ]
+        finally:
+            self.in_flight -= 1
+
+
+class FakeRAG:
+    """Corrects one word after a delay; the first failures calls fail"""
+
+    def __init__(self, delay=0.0, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.calls = 0
+
+    async def apply_corrections(self, original_text, speaker_id, job_metadata):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ValueError("RAG rejected the draft")
+        await asyncio.sleep(self.delay)
+        return {
+            "corrected_draft": original_text.replace("diabetis", "diabetes"),
+            "corrections": [
+                {
+                    "type": "spelling",
+                    "original": "diabetis",
+                    "corrected": "diabetes",
+                    "confidence": 0.95,
+                }
+            ],
+        }
+
+
+def make_use_case(instanote, rag=None, checkpoints=None, concurrency=8):
+    return VerificationWorkflowUseCase(
+        verification_job_repository=InMemoryVerificationJobs(),
+        instanote_service=instanote,
+        rag_service=rag or FakeRAG(),
+        checkpoint_repository=checkpoints,
+        instanote_limiter=ServiceLimiter("InstaNote", concurrency, 1000, NO_BACKOFF),
+        rag_limiter=ServiceLimiter("RAG", concurrency, 1000, NO_BACKOFF),
+    )
+
+
+def speaker_ids(count):
+    return [str(uuid4()) for _ in range(count)]
+
+
+class TestBatchProcessVerificationJobs:
+    """Speakers and jobs are processed concurrently within service limits."""
+
+    @pytest.mark.asyncio
+    async def test_processes_speakers_concurrently(self):
+        instanote = FakeInstaNote(delay=0.05)
+        use_case = make_use_case(instanote, FakeRAG(delay=0.05), concurrency=4)
+
+        started = time.perf_counter()
+        results = await use_case.batch_process_verification_jobs(
+            speaker_ids(20), max_concurrent_speakers=10
+        )
+        elapsed = time.perf_counter() - started
+
+        assert results["processed_speakers"] == 20
+        assert results["total_jobs_pulled"] == 40
+        assert results["jobs_with_corrections"] == 40
+        assert results["errors"] == []
+        # Sequentially this would take 20 * (0.05 + 2 * 0.05) = 3s
+        assert elapsed < 1.5
+        assert instanote.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_speakers_are_retried_on_resume(self):
+        speakers = speaker_ids(6)
+        checkpoints = InMemoryVerificationBatchCheckpointAdapter()
+        instanote = FakeInstaNote(failing_speakers=speakers[:2])
+        use_case = make_use_case(instanote, checkpoints=checkpoints)
+
+        first = await use_case.batch_process_verification_jobs(speakers)
+
+        assert first["processed_speakers"] == 4
+        assert {error["speaker_id"] for error in first["errors"]} == set(speakers[:2])
+        # Each failing speaker was attempted max_attempts times
+        assert len(instanote.calls) == 4 + 2 * 3
+
+        instanote.failing_speakers.clear()
+        instanote.calls.clear()
+        resumed = await use_case.batch_process_verification_jobs(
+            speakers, batch_id=first["batch_id"]
+        )
+
+        assert sorted(instanote.calls) == sorted(speakers[:2])
+        assert resumed["resumed_speakers"] == 4
+        assert resumed["processed_speakers"] == 6
+        assert resumed["total_jobs_pulled"] == 12
+        assert resumed["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_speaker_with_failed_job_resumes_without_duplicate_jobs(self):
+        speakers = speaker_ids(1)
+        checkpoints = InMemoryVerificationBatchCheckpointAdapter()
+        rag = FakeRAG(failures=1)
+        use_case = make_use_case(
+            FakeInstaNote(jobs_per_speaker=3), rag, checkpoints=checkpoints
+        )
+
+        first = await use_case.batch_process_verification_jobs(speakers)
+
+        assert len(first["errors"]) == 1
+        assert await checkpoints.get_completed_speakers(first["batch_id"]) == {}
+
+        resumed = await use_case.batch_process_verification_jobs(
+            speakers, batch_id=first["batch_id"]
+        )
+
+        assert resumed["errors"] == []
+        assert resumed["total_jobs_pulled"] == 3
+        assert resumed["jobs_with_corrections"] == 3
+        # Only the failed job was corrected again, and no job was saved twice
+        assert rag.calls == 4
+        repository = use_case._verification_job_repository
+        # Stored jobs were looked up by the pulled job IDs only
+        assert (
+            repository.job_id_queries == [[f"{speakers[0]}-{i}" for i in range(3)]] * 2
+        )
+        jobs = repository.jobs.values()
+        assert len(jobs) == 3
+        assert all(job.rag_corrected_draft is not None for job in jobs)
+        assert list(await checkpoints.get_completed_speakers(first["batch_id"])) == (
+            speakers
+        )
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self):
+        class FlakyInstaNote(FakeInstaNote):
+            async def get_jobs_for_speaker(self, speaker_id, **kwargs):
+                if self.calls.count(speaker_id) == 0:
+                    self.calls.append(speaker_id)
+                    raise TimeoutError("slow InstaNote")
+                return await super().get_jobs_for_speaker(speaker_id, **kwargs)
+
+        use_case = make_use_case(FlakyInstaNote())
+
+        results = await use_case.batch_process_verification_jobs(speaker_ids(3))
+
+        assert results["processed_speakers"] == 3
+        assert results["errors"] == []
+
+
+class TestBatchScheduling:
+    """Token bucket pacing and retry behavior."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_acquisitions(self):
+        bucket = TokenBucket(rate_per_second=50, capacity=1)
+
+        started = time.perf_counter()
+        for _ in range(6):
+            await bucket.acquire()
+        elapsed = time.perf_counter() - started
+
+        # The first token is available immediately, the other five take 20ms each
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_failures_are_not_retried(self):
+        limiter = ServiceLimiter("test", 1, 1000, NO_BACKOFF)
+        calls = []
+
+        async def missing():
+            calls.append(1)
+            raise ValueError("not found")
+
+        with pytest.raises(ValueError):
+            await limiter.call(missing)
+        assert len(calls) == 1
+
+    def test_backoff_is_jittered_below_the_cap(self):
+        policy = RetryPolicy(base_delay_seconds=1.0, max_delay_seconds=3.0)
+
+        delays = [
+            policy.backoff(attempt) for attempt in (1, 2, 3, 4) for _ in range(50)
+        ]
+
+        assert all(0 <= delay <= 3.0 for delay in delays)
+        assert len(set(delays)) > 1
@@ -0,0 +1,124 @@
+"""
+Unit tests for single-pass metadata aggregation.
+"""
+
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.error_reporting_service.domain.entities.error_report import AudioQuality
+from src.error_reporting_service.domain.services.metadata_aggregation import (
+    MetadataAggregator,
+    encode_reports,
+)
+from src.error_reporting_service.domain.value_objects.error_report_rollup import (
+    ErrorReportRollup,
+    RollupGranularity,
+)
+from tests.factories import varied_reports
+
+NOW = datetime(2024, 3, 1)
+
+
+def reference_distribution(values, members) -> dict:
+    counts = Counter(values)
+    total = len(values)
+    return {
+        member.value: {
+            "count": counts[member],
+            "percentage": round(counts[member] / total * 100, 2),
+        }
+        for member in members
+    }
+
+
+def reference_complexity(reports) -> Counter:
+    levels = Counter()
+    for report in reports:
+        score = report.calculate_complexity_score()
+        if score <= 2.0:
+            levels["low"] += 1
+        elif score <= 3.5:
+            levels["medium"] += 1
+        elif score <= 4.5:
+            levels["high"] += 1
+        else:
+            levels["very_high"] += 1
+    return levels
+
+
+class TestMetadataAggregator:
+    """Joint-count aggregation matches per-field counting."""
+
+    def test_distributions_match_reference_counts(self):
+        reports = varied_reports(997, NOW)
+        aggregator = MetadataAggregator()
+        aggregator.add_reports(reports)
+
+        insights = aggregator.insights()
+
+        assert insights["total_errors_analyzed"] == 997
+        assert insights["audio_quality_distribution"] == reference_distribution(
+            [r.enhanced_metadata.audio_quality for r in reports], AudioQuality
+        )
+        overlapping = sum(r.enhanced_metadata.overlapping_speech for r in reports)
+        assert insights["overlapping_speech_frequency"] == round(
+            overlapping / 997 * 100, 2
+        )
+        complexity = reference_complexity(reports)
+        assert {
+            level: value["count"]
+            for level, value in insights["complexity_score_distribution"].items()
+        } == {
+            level: complexity[level] for level in ("low", "medium", "high", "very_high")
+        }
+
+    def test_chunked_and_rollup_input_give_same_insights(self):
+        reports = varied_reports(600, NOW)
+        whole = MetadataAggregator()
+        whole.add_reports(reports)
+        chunked = MetadataAggregator()
+        for start in range(0, len(reports), 128):
+            chunked.add_reports(reports[start : start + 128])
+        from_rollups = MetadataAggregator()
+        from_rollups.add_rollups(
+            ErrorReportRollup.from_reports(reports, RollupGranularity.HOUR)
+        )
+
+        assert chunked.insights() == whole.insights()
+        assert from_rollups.insights() == whole.insights()
+
+    @pytest.mark.asyncio
+    async def test_async_chunks(self):
+        reports = varied_reports(300, NOW)
+
+        async def chunks():
+            for start in range(0, len(reports), 100):
+                yield reports[start : start + 100]
+
+        streamed = MetadataAggregator()
+        await streamed.add_report_chunks(chunks())
+        whole = MetadataAggregator()
+        whole.add_reports(reports)
+
+        assert streamed.total == 300
+        assert streamed.insights() == whole.insights()
+
+    def test_empty_input(self):
+        insights = MetadataAggregator().insights()
+
+        assert insights["total_errors_analyzed"] == 0
+        assert insights["overlapping_speech_frequency"] == 0.0
+        assert insights["audio_quality_distribution"]["good"] == {
+            "count": 0,
+            "percentage": 0,
+        }
+        assert set(insights["metadata_correlations"].values()) == {0.0}
+
+    def test_encoded_columns_are_compact(self):
+        codes = encode_reports(varied_reports(10, NOW))
+
+        assert codes.shape == (10, 7)
+        assert codes.dtype == np.uint8
@@ -0,0 +1,123 @@
+"""
+Unit tests for the shared text normalization module.
+"""
+
+import re
+
+import pytest
+
+from src.domain.text_normalization import (
+    TokenInterner,
+    normalize_for_extraction,
+    normalize_for_scoring,
+    split_sentence_tokens,
+    split_sentences,
+    tokenize_for_scoring,
+)
+
+SAMPLE_TEXTS = [
+    "",
+    "Patient presents with  hypertension,\tdiabetes; and CHF.",
+    "BP 120/80 mm-Hg — stable’ on lisinopril 10 mg daily!",
+    "Café  résumé: naïve_patient   ½ dose…",
+    "  Dr. Smith  ordered labs .Follow up in 2 weeks?  ",
+]
+
+
+def _regex_scoring_tokens(text):
+    """Original regex-based SER normalization, kept as the reference."""
+    if not text:
+        return []
+    text = text.lower()
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"[^\w\s]", "", text)
+    return text.strip().split()
+
+
+class TestScoringNormalization:
+    """Test normalization used for SER scoring."""
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_matches_regex_normalization(self, text):
+        """Test that the translate table matches the regex pipeline."""
+        assert list(tokenize_for_scoring(text)) == _regex_scoring_tokens(text)
+        assert normalize_for_scoring(text) == " ".join(_regex_scoring_tokens(text))
+
+    def test_tokens_are_cached(self):
+        """Test that repeated texts are served from the LRU cache."""
+        text = "Repeated reference text for caching."
+        tokenize_for_scoring(text)
+        hits_before = tokenize_for_scoring.cache_info().hits
+
+        tokenize_for_scoring(text)
+
+        assert tokenize_for_scoring.cache_info().hits == hits_before + 1
+
+
+class TestExtractionNormalization:
+    """Test normalization used for error-correction pair extraction."""
+
+    def test_normalize_for_extraction(self):
+        """Test whitespace and sentence punctuation spacing."""
+        assert (
+            normalize_for_extraction("  Patient  stable .Discharged  home!Done ")
+            == "Patient stable. Discharged home! Done"
+        )
+
+    def test_split_sentences(self):
+        """Test sentence splitting drops empty sentences."""
+        assert split_sentences("First one. Second one!! Third?") == [
+            "First one",
+            "Second one",
+            "Third",
+        ]
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_split_sentence_tokens_matches_normalized_sentences(self, text):
+        """Test offset-tracked tokens reproduce the normalized sentences."""
+        expected = [
+            sentence.split()
+            for sentence in split_sentences(normalize_for_extraction(text))
+        ]
+
+        sentences = split_sentence_tokens(text)
+
+        assert [
+            [token.text for token in sentence] for sentence in sentences
+        ] == expected
+        for sentence in sentences:
+            for token in sentence:
+                assert text[token.start : token.end] == token.text
+
+    def test_split_sentence_tokens_offsets(self):
+        """Test offsets point into the un-normalized text."""
+        text = "  Patient  stable .Discharged\n home!"
+
+        sentences = split_sentence_tokens(text)
+
+        assert [[tuple(token) for token in sentence] for sentence in sentences] == [
+            [("Patient", 2, 9), ("stable", 11, 17)],
+            [("Discharged", 19, 29), ("home", 31, 35)],
+        ]
+
+
+class TestTokenInterner:
+    """Test the shared token interner."""
+
+    def test_equal_tokens_share_ids(self):
+        """Test that IDs are consistent within and across sequences."""
+        ids1, ids2 = TokenInterner().intern(["a", "b", "a"], ["b", "c"])
+
+        assert ids1[0] == ids1[2]
+        assert ids1[1] == ids2[0]
+        assert len({ids1[0], ids1[1], ids2[1]}) == 3
+
+    def test_vocabulary_is_bounded(self):
+        """Test that a full vocabulary is replaced without reusing IDs."""
+        interner = TokenInterner(max_size=3)
+        (first,) = interner.intern(["a", "b", "c", "d"])
+
+        (second,) = interner.intern(["e"])
+
+        assert len(interner) == 1
+        assert second[0] not in first
@@ -0,0 +1,226 @@
+"""
+Unit tests for the enhanced vector database service.
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from src.error_reporting_service.infrastructure.external_services.enhanced_vector_database_service import (
+    BufferedWriteError,
+    EnhancedVectorDatabaseService,
+    ErrorEmbedding,
+    VectorDatabaseConfig,
+)
+
+
+class RecordingQdrantClient(QdrantClient):
+    """Local in-memory Qdrant client that records upserted batches"""
+
+    def __init__(self):
+        super().__init__(location=":memory:")
+        self.batches = []
+        self.threads = set()
+        self.closed = False
+        # Upserts that fail before the client recovers
+        self.failures = 0
+
+    def upsert(self, collection_name, points, **kwargs):
+        self.threads.add(threading.get_ident())
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("qdrant unavailable")
+        self.batches.append(list(points))
+        super().upsert(collection_name, points, **kwargs)
+
+    def close(self, **kwargs):
+        self.closed = True
+        super().close(**kwargs)
+
+
+def _embedding(index: int, **overrides) -> ErrorEmbedding:
+    now = datetime.utcnow()
+    fields = dict(
+        error_id=f"error-{index}",
+        speaker_id="speaker-1",
+        client_id="client-1",
+        bucket_type="high_touch",
+        error_categories=["medical_terminology"],
+        original_text="patient has hypertention",
+        corrected_text="patient has hypertension",
+        embedding_vector=[0.1, 0.2, 0.3],
+        audio_quality="good",
+        speaker_clarity="clear",
+        background_noise="low",
+        number_of_speakers="one",
+        overlapping_speech=False,
+        requires_specialized_knowledge=True,
+        complexity_score=2.5,
+        created_at=now,
+        updated_at=now,
+    )
+    fields.update(overrides)
+    return ErrorEmbedding(**fields)
+
+
+def _service(**config) -> EnhancedVectorDatabaseService:
+    return EnhancedVectorDatabaseService(
+        VectorDatabaseConfig(vector_size=3, **config), client=RecordingQdrantClient()
+    )
+
+
+class TestEnhancedVectorDatabaseServiceWrites:
+    """Test bulk and write-behind storage of error embeddings"""
+
+    @pytest.mark.asyncio
+    async def test_batch_store_chunks_upserts(self):
+        """Test that batch storage issues one upsert per chunk"""
+        service = _service(write_batch_size=4)
+
+        stored = await service.store_error_embeddings_batch(
+            [_embedding(i) for i in range(10)]
+        )
+
+        assert stored == 10
+        assert [len(batch) for batch in service.client.batches] == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_client_calls_run_off_event_loop(self):
+        """Test that blocking client calls run in an executor thread"""
+        service = _service()
+
+        assert await service.store_error_embedding(_embedding(0))
+        assert threading.get_ident() not in service.client.threads
+
+    @pytest.mark.asyncio
+    async def test_write_behind_coalesces_points(self):
+        """Test that buffered points are flushed in bulk"""
+        service = _service(write_batch_size=8, write_flush_interval=0.05)
+
+        for i in range(20):
+            await service.enqueue_error_embedding(_embedding(i))
+        await service.flush()
+
+        upserted = [
+            point.payload["error_id"]
+            for batch in service.client.batches
+            for point in batch
+        ]
+        assert upserted == [f"error-{i}" for i in range(20)]
+        assert len(service.client.batches) < 20
+        assert all(len(batch) <= 8 for batch in service.client.batches)
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_buffer(self):
+        """Test that enqueueing waits once the buffer is full"""
+        service = _service(write_batch_size=2, write_buffer_max_size=3)
+
+        for i in range(12):
+            await service.enqueue_error_embedding(_embedding(i))
+            assert service._write_queue.qsize() <= 3
+        await service.flush()
+
+        assert sum(len(batch) for batch in service.client.batches) == 12
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_points(self):
+        """Test that shutdown writes buffered points before closing the client"""
+        service = _service(write_batch_size=100, write_flush_interval=60)
+        client = service.client
+
+        for i in range(5):
+            await service.enqueue_error_embedding(_embedding(i))
+        await service._close_client()
+
+        assert sum(len(batch) for batch in client.batches) == 5
+        assert client.closed
+        assert service.client is None
+
+    @pytest.mark.asyncio
+    async def test_write_behind_retries_failed_upserts(self):
+        """Test that a transiently failing upsert is retried, not dropped"""
+        service = _service(write_batch_size=4, write_retry_backoff=0.001)
+        service.client.failures = 2
+
+        for i in range(4):
+            await service.enqueue_error_embedding(_embedding(i))
+        await service.flush()
+
+        assert [len(batch) for batch in service.client.batches] == [4]
+        assert service.failed_writes == 0
+
+    @pytest.mark.asyncio
+    async def test_unwritable_points_are_reported(self):
+        """Test that flush and close report points that could not be written"""
+        service = _service(
+            write_batch_size=3, write_max_retries=1, write_retry_backoff=0.001
+        )
+        client = service.client
+        client.failures = 2
+
+        for i in range(6):
+            await service.enqueue_error_embedding(_embedding(i))
+        with pytest.raises(BufferedWriteError) as error:
+            await service.flush()
+
+        assert [p.payload["error_id"] for p in error.value.points] == [
+            "error-0",
+            "error-1",
+            "error-2",
+        ]
+        assert [len(batch) for batch in client.batches] == [3]
+        await service.flush()
+
+        client.failures = 2
+        await service.enqueue_error_embedding(_embedding(6))
+        with pytest.raises(BufferedWriteError):
+            await service._close_client()
+        assert client.closed
+
+
+class TestEnhancedVectorDatabaseServiceTrends:
+    """Test paged trend analysis"""
+
+    @pytest.mark.asyncio
+    async def test_trends_follow_every_page(self):
+        """Test that totals include points beyond the first scroll page"""
+        service = _service(scroll_page_size=7)
+        await service.store_error_embeddings_batch(
+            [
+                _embedding(
+                    i,
+                    bucket_type="low_touch" if i % 3 == 0 else "high_touch",
+                    error_categories=["numeric", "grammar"] if i % 2 else ["numeric"],
+                    complexity_score=float(i % 6),
+                    overlapping_speech=i % 4 == 0,
+                )
+                for i in range(50)
+            ]
+        )
+
+        trends = await service.analyze_error_trends()
+
+        assert trends["total_errors"] == 50
+        assert trends["bucket_distribution"] == {"low_touch": 17, "high_touch": 33}
+        assert trends["category_distribution"] == {"numeric": 50, "grammar": 25}
+        assert trends["complexity_distribution"] == {"low": 26, "medium": 16, "high": 8}
+        assert trends["metadata_patterns"]["audio_quality"] == {"good": 50}
+        assert trends["metadata_patterns"]["overlapping_speech_frequency"] == 26.0
+        assert trends["metadata_patterns"]["specialized_knowledge_frequency"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_trends_apply_filters(self):
+        """Test that payload filters restrict the analysed points"""
+        service = _service(scroll_page_size=4)
+        await service.store_error_embeddings_batch(
+            [_embedding(i, speaker_id=f"speaker-{i % 2}") for i in range(10)]
+        )
+
+        trends = await service.analyze_error_trends(filters={"speaker_id": "speaker-1"})
+
+        assert trends["total_errors"] == 5
@@ -0,0 +1,219 @@
+"""
+Unit tests for the in-memory database adapter.
+
+Covers index-backed lookups, text search semantics, immutable snapshots
+and undo-log transactions.
+"""
+
+import copy
+import re
+from uuid import uuid4
+
+import pytest
+
+from src.error_reporting_service.domain.entities.error_report import (
+    ErrorStatus,
+    SeverityLevel,
+)
+from src.error_reporting_service.infrastructure.adapters.database.in_memory.adapter import (
+    InMemoryDatabaseAdapter,
+)
+from tests.factories import make_report
+
+
+@pytest.fixture
+def adapter():
+    return InMemoryDatabaseAdapter()
+
+
+class TestInMemoryDatabaseAdapterQueries:
+    """Index-backed lookups return the same results as a full scan."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_speaker_with_filters(self, adapter):
+        speaker_id = uuid4()
+        high = make_report(speaker_id=speaker_id)
+        low = make_report(
+            speaker_id=speaker_id,
+            severity_level=SeverityLevel.LOW,
+            error_categories=["grammar"],
+        )
+        await adapter.save_error_report(high)
+        await adapter.save_error_report(low)
+        await adapter.save_error_report(make_report())
+
+        assert await adapter.find_errors_by_speaker(speaker_id) == [high, low]
+        assert await adapter.find_errors_by_speaker(
+            speaker_id, {"severity_level": "low"}
+        ) == [low]
+        assert await adapter.find_errors_by_speaker(
+            speaker_id, {"categories": ["medical_terminology"]}
+        ) == [high]
+        assert (
+            await adapter.find_errors_by_speaker(speaker_id, {"status": "verified"})
+            == []
+        )
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_updates_and_deletes(self, adapter):
+        job_id = uuid4()
+        report = make_report(job_id=job_id)
+        await adapter.save_error_report(report)
+
+        await adapter.update_error_report(
+            report.error_id, {"status": ErrorStatus.VERIFIED}
+        )
+        assert await adapter.find_errors_by_job(job_id, {"status": "submitted"}) == []
+        assert await adapter.find_errors_by_job(job_id, {"status": "verified"}) == [
+            report
+        ]
+
+        assert await adapter.delete_error_report(report.error_id) is True
+        assert await adapter.find_errors_by_job(job_id) == []
+        assert await adapter.search_errors({"text_search": "diabetis"}) == []
+
+    @pytest.mark.asyncio
+    async def test_search_preserves_order_and_pagination(self, adapter):
+        speaker_id = uuid4()
+        reports = [make_report(speaker_id=speaker_id) for _ in range(5)]
+        for report in reports:
+            await adapter.save_error_report(report)
+
+        page = await adapter.search_errors(
+            {"speaker_id": str(speaker_id), "limit": 2, "offset": 2}
+        )
+
+        assert page == reports[2:4]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "term",
+        [
+            "diabet",
+            "has diab",
+            "patient has",
+            "ent has d",
+            "DIABETES",
+            "diabetes patient",
+            " ",
+            "xyz",
+        ],
+    )
+    async def test_text_search_matches_substring_or_all_words(self, adapter, term):
+        texts = [
+            ("The patient has diabetis", "The patient has diabetes"),
+            ("Blood pressure is high", "Blood pressure is elevated"),
+            ("Patient has no diabetes history", "Patient has no diabetic history"),
+        ]
+        reports = [make_report(original_text=o, corrected_text=c) for o, c in texts]
+        for report in reports:
+            await adapter.save_error_report(report)
+
+        term_words = set(re.findall(r"\w+", term.lower()))
+
+        def matches(report):
+            texts = [report.original_text.lower(), report.corrected_text.lower()]
+            words = set(re.findall(r"\w+", " ".join(texts)))
+            return any(term.lower() in text for text in texts) or (
+                bool(term_words) and term_words <= words
+            )
+
+        expected = {report.error_id for report in reports if matches(report)}
+        found = await adapter.search_errors({"text_search": term})
+
+        assert {report.error_id for report in found} == expected
+
+    @pytest.mark.asyncio
+    async def test_text_search_ranks_by_word_frequency(self, adapter):
+        once = make_report(original_text="Patient seen", corrected_text="Seen today")
+        often = make_report(
+            original_text="Patient notes: patient has diabetes",
+            corrected_text="Patient notes: patient has diabetes.",
+        )
+        for report in (once, often):
+            await adapter.save_error_report(report)
+
+        ranked = await adapter.search_errors(
+            {"text_search": "patient", "sort_field": "relevance"}
+        )
+        ranked_by_default = await adapter.search_errors({"text_search": "patient"})
+
+        assert ranked == ranked_by_default == [often, once]
+
+    @pytest.mark.asyncio
+    async def test_relevance_order_rejects_cursor(self, adapter):
+        report = make_report()
+        await adapter.save_error_report(report)
+
+        with pytest.raises(ValueError, match="cannot be paged by cursor"):
+            await adapter.search_errors(
+                {
+                    "text_search": "patient",
+                    "after": (report.reported_at, report.error_id),
+                }
+            )
+
+
+class TestInMemoryDatabaseAdapterSnapshots:
+    """Stored reports are shared immutable snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_saved_report_is_isolated_from_caller(self, adapter):
+        report = make_report()
+        await adapter.save_error_report(report)
+
+        report.error_categories.append("grammar")
+        report.metadata["source"]["tool"] = "changed"
+
+        stored = await adapter.find_error_by_id(report.error_id)
+        assert stored.error_categories == ["medical_terminology"]
+        assert stored.metadata == {"source": {"tool": "qa"}}
+
+    @pytest.mark.asyncio
+    async def test_returned_snapshot_rejects_mutation(self, adapter):
+        report = make_report()
+        await adapter.save_error_report(report)
+        stored = await adapter.find_error_by_id(report.error_id)
+
+        with pytest.raises(TypeError):
+            stored.error_categories.append("grammar")
+        with pytest.raises(TypeError):
+            stored.metadata["source"]["tool"] = "changed"
+
+        mutable = copy.deepcopy(stored)
+        mutable.metadata["source"]["tool"] = "changed"
+        assert type(mutable.error_categories) is list
+
+
+class TestInMemoryDatabaseAdapterTransactions:
+    """Undo-log transactions."""
+
+    @pytest.mark.asyncio
+    async def test_rollback_restores_previous_state(self, adapter):
+        kept = make_report()
+        deleted = make_report()
+        await adapter.save_error_report(kept)
+        await adapter.save_error_report(deleted)
+
+        transaction = await adapter.begin_transaction()
+        added = make_report()
+        await adapter.save_error_report(added)
+        await adapter.update_error_report(kept.error_id, {"context_notes": "edited"})
+        await adapter.delete_error_report(deleted.error_id)
+        await adapter.rollback_transaction(transaction)
+
+        assert await adapter.find_error_by_id(added.error_id) is None
+        assert (await adapter.find_error_by_id(kept.error_id)).context_notes is None
+        assert await adapter.search_errors({}) == [kept, deleted]
+        assert await adapter.search_errors({"speaker_id": str(added.speaker_id)}) == []
+        assert adapter.get_connection_info()["in_transaction"] is False
+
+    @pytest.mark.asyncio
+    async def test_commit_keeps_changes(self, adapter):
+        transaction = await adapter.begin_transaction()
+        report = make_report()
+        await adapter.save_error_report(report)
+        await adapter.commit_transaction(transaction)
+        await adapter.rollback_transaction(transaction)
+
+        assert await adapter.find_error_by_id(report.error_id) == report
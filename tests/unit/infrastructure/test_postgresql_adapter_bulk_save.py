@@ -0,0 +1,55 @@
+"""
+Bulk save tests for the PostgreSQL adapter.
+
+Runs the executemany path against a SQLite database; the asyncpg COPY path
+needs a PostgreSQL server and is exercised by the bulk ingest benchmark.
+"""
+
+from dataclasses import asdict
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiosqlite")
+
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.adapter import (
+    PostgreSQLAdapter,
+)
+from tests.factories import make_report
+
+
+@pytest_asyncio.fixture
+async def adapter(tmp_path):
+    adapter = PostgreSQLAdapter(f"sqlite+aiosqlite:///{tmp_path / 'errors.db'}")
+    await adapter.create_tables()
+    yield adapter
+    await adapter.engine.dispose()
+
+
+class TestPostgreSQLAdapterBulkSave:
+    """save_error_reports writes a batch in one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_saved_reports_read_back_unchanged(self, adapter):
+        reports = [make_report() for _ in range(5)]
+
+        saved = await adapter.save_error_reports(reports)
+
+        assert saved == reports
+        for report in reports:
+            found = await adapter.find_error_by_id(report.error_id)
+            assert asdict(found) == asdict(report)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_saves_nothing(self, adapter):
+        existing = make_report()
+        await adapter.save_error_report(existing)
+
+        with pytest.raises(Exception):
+            await adapter.save_error_reports([make_report(), existing])
+
+        assert len(await adapter.search_errors({})) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, adapter):
+        assert await adapter.save_error_reports([]) == []
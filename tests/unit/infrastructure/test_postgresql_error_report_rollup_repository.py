@@ -0,0 +1,103 @@
+"""
+Tests for the PostgreSQL error report rollup repository.
+
+Runs the repository's SQL against a SQLite database: ON CONFLICT upserts
+and INSERT ... SELECT rebuilds are supported there too, with strftime
+standing in for date_trunc.
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiosqlite")
+
+from src.error_reporting_service.domain.value_objects.error_report_rollup import (
+    RollupGranularity,
+)
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.adapter import (
+    PostgreSQLAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.error_report_rollup_repository import (
+    PostgreSQLErrorReportRollupRepository,
+)
+from tests.factories import make_report
+
+BASE_TIME = datetime(2024, 1, 1)
+TEMPLATE = make_report()
+
+
+@pytest_asyncio.fixture
+async def adapter(tmp_path):
+    adapter = PostgreSQLAdapter(f"sqlite+aiosqlite:///{tmp_path / 'errors.db'}")
+    await adapter.create_tables()
+    yield adapter
+    await adapter.engine.dispose()
+
+
+@pytest.fixture
+def repository(adapter):
+    return PostgreSQLErrorReportRollupRepository(adapter._session_factory)
+
+
+def reports_at(*offsets: timedelta) -> list:
+    """Reports sharing all rollup dimensions, reported at the given offsets"""
+    return [
+        replace(TEMPLATE, error_id=uuid4(), reported_at=BASE_TIME + offset)
+        for offset in offsets
+    ]
+
+
+def counts(rollups) -> dict:
+    return {rollup.period_start: rollup.error_count for rollup in rollups}
+
+
+class TestPostgreSQLErrorReportRollupRepository:
+    """Incremental upserts and rebuilds produce the same counts."""
+
+    @pytest.mark.asyncio
+    async def test_add_reports_accumulates_counts(self, repository):
+        await repository.add_reports(reports_at(timedelta(minutes=5)))
+        await repository.add_reports(
+            reports_at(timedelta(minutes=30), timedelta(hours=2))
+        )
+
+        hourly = await repository.get_rollups(
+            RollupGranularity.HOUR, BASE_TIME, BASE_TIME + timedelta(days=1)
+        )
+        daily = await repository.get_rollups(
+            RollupGranularity.DAY, BASE_TIME, BASE_TIME + timedelta(days=1)
+        )
+
+        assert counts(hourly) == {BASE_TIME: 2, BASE_TIME + timedelta(hours=2): 1}
+        assert counts(daily) == {BASE_TIME: 3}
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental_counts(self, adapter, repository):
+        reports = reports_at(
+            timedelta(minutes=5),
+            timedelta(minutes=30),
+            timedelta(hours=2),
+            timedelta(days=1, hours=3),
+        )
+        await adapter.save_error_reports(reports)
+        await repository.add_reports(reports[:2])
+
+        counted = await repository.rebuild(BASE_TIME, BASE_TIME + timedelta(days=2))
+
+        assert counted == 4
+        hourly = await repository.get_rollups(
+            RollupGranularity.HOUR, BASE_TIME, BASE_TIME + timedelta(days=2)
+        )
+        daily = await repository.get_rollups(
+            RollupGranularity.DAY, BASE_TIME, BASE_TIME + timedelta(days=2)
+        )
+        assert counts(hourly) == {
+            BASE_TIME: 2,
+            BASE_TIME + timedelta(hours=2): 1,
+            BASE_TIME + timedelta(days=1, hours=3): 1,
+        }
+        assert counts(daily) == {BASE_TIME: 3, BASE_TIME + timedelta(days=1): 1}
@@ -0,0 +1,56 @@
+"""
+Tests for the PostgreSQL verification batch checkpoint repository, run
+against SQLite, which supports the same ON CONFLICT upsert.
+"""
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiosqlite")
+
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.adapter import (
+    PostgreSQLAdapter,
+)
+from src.error_reporting_service.infrastructure.adapters.database.postgresql.verification_batch_checkpoint_repository import (
+    PostgreSQLVerificationBatchCheckpointRepository,
+)
+
+RESULT = {
+    "jobs_pulled": 2,
+    "jobs_with_corrections": 1,
+    "jobs_needing_review": 0,
+    "errors": [],
+}
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    adapter = PostgreSQLAdapter(f"sqlite+aiosqlite:///{tmp_path / 'errors.db'}")
+    await adapter.create_tables()
+    yield PostgreSQLVerificationBatchCheckpointRepository(adapter._session_factory)
+    await adapter.engine.dispose()
+
+
+class TestPostgreSQLVerificationBatchCheckpointRepository:
+    """Checkpoints are kept per batch and overwritten per speaker."""
+
+    @pytest.mark.asyncio
+    async def test_completed_speakers_are_scoped_to_their_batch(self, repository):
+        await repository.save_speaker_result("batch-1", "speaker-a", RESULT)
+        await repository.save_speaker_result("batch-2", "speaker-b", RESULT)
+
+        assert await repository.get_completed_speakers("batch-1") == {
+            "speaker-a": RESULT
+        }
+        assert await repository.get_completed_speakers("batch-3") == {}
+
+    @pytest.mark.asyncio
+    async def test_saving_again_replaces_the_result(self, repository):
+        await repository.save_speaker_result("batch-1", "speaker-a", RESULT)
+        await repository.save_speaker_result(
+            "batch-1", "speaker-a", {**RESULT, "jobs_pulled": 5}
+        )
+
+        completed = await repository.get_completed_speakers("batch-1")
+
+        assert completed["speaker-a"]["jobs_pulled"] == 5
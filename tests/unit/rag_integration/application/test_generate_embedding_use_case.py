@@ -13,7 +13,10 @@ from uuid import uuid4
 
 import pytest
 
-from src.rag_integration_service.application.dto.requests import EmbeddingRequest
+from src.rag_integration_service.application.dto.requests import (
+    BatchEmbeddingRequest,
+    EmbeddingRequest,
+)
 from src.rag_integration_service.application.dto.responses import EmbeddingResponse
 from src.rag_integration_service.application.ports.secondary.cache_port import CachePort
 from src.rag_integration_service.application.ports.secondary.ml_model_port import (
@@ -306,3 +309,152 @@ class TestGenerateEmbeddingUseCase:
         assert response.model_info["name"] == "test-model"
         assert response.model_info["version"] == "v1.0"
         assert response.model_info["dimensions"] == 1536
+
+
+class TestGenerateEmbeddingBatch:
+    """Test batched embedding generation."""
+
+    @pytest.fixture
+    def mock_ml_model(self):
+        """Create mock ML model port with a small batch size."""
+        mock = Mock(spec=MLModelPort)
+        mock.generate_batch_embeddings = AsyncMock(
+            side_effect=lambda texts, embedding_type: [[0.1] * 1536 for _ in texts]
+        )
+        mock.get_max_batch_size.return_value = 2
+        mock.get_model_name.return_value = "test-model"
+        mock.get_model_version.return_value = "v1.0"
+        mock.get_embedding_dimension.return_value = 1536
+        return mock
+
+    @pytest.fixture
+    def mock_vector_storage(self):
+        """Create mock vector storage port."""
+        mock = Mock(spec=VectorStoragePort)
+        mock.store_batch_embeddings = AsyncMock(return_value=True)
+        return mock
+
+    @pytest.fixture
+    def mock_cache(self):
+        """Create mock cache port with an empty cache."""
+        mock = Mock(spec=CachePort)
+        mock.get_embeddings_batch = AsyncMock(
+            side_effect=lambda text_hashes: [None] * len(text_hashes)
+        )
+        mock.set_embeddings_batch = AsyncMock(return_value=True)
+        return mock
+
+    @pytest.fixture
+    def use_case(self, mock_ml_model, mock_vector_storage, mock_cache):
+        """Create use case with mocked dependencies."""
+        return GenerateEmbeddingUseCase(
+            ml_model=mock_ml_model, vector_storage=mock_vector_storage, cache=mock_cache
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_and_chunks_misses(
+        self, use_case, mock_ml_model, mock_vector_storage, mock_cache
+    ):
+        """Test that duplicate texts are embedded once, in model-sized chunks."""
+        request = BatchEmbeddingRequest(
+            texts=["alpha", "beta", "alpha", "gamma", "delta"],
+            embedding_type=EmbeddingType.ERROR,
+        )
+
+        response = await use_case.execute_batch(request)
+
+        assert mock_cache.get_embeddings_batch.await_count == 1
+        assert len(mock_cache.get_embeddings_batch.await_args.args[0]) == 4
+        chunks = [
+            call.args[0]
+            for call in mock_ml_model.generate_batch_embeddings.await_args_list
+        ]
+        assert chunks == [["alpha", "beta"], ["gamma", "delta"]]
+        mock_vector_storage.store_batch_embeddings.assert_awaited_once()
+        assert len(mock_vector_storage.store_batch_embeddings.await_args.args[0]) == 4
+        mock_cache.set_embeddings_batch.assert_awaited_once()
+
+        assert response.batch_size == 5
+        assert response.success_count == 5
+        assert [e.text for e in response.embeddings] == request.texts
+        assert response.embeddings[0] is response.embeddings[2]
+        assert response.cache_hit_ratio == 0.0
+        assert {
+            "cache_lookup",
+            "model_inference",
+            "vector_storage",
+            "cache_write",
+        } <= set(response.stage_timings)
+
+    @pytest.mark.asyncio
+    async def test_batch_only_embeds_cache_misses(
+        self, use_case, mock_ml_model, mock_vector_storage, mock_cache
+    ):
+        """Test that cached texts skip the model and vector store."""
+        cached = VectorEmbedding(
+            id=uuid4(),
+            vector=[0.2] * 1536,
+            text="alpha",
+            text_hash="cached",
+            embedding_type=EmbeddingType.ERROR,
+            model_version="v1.0",
+            model_name="test-model",
+            metadata={},
+            created_at=datetime.utcnow(),
+        )
+        mock_cache.get_embeddings_batch = AsyncMock(
+            side_effect=lambda text_hashes: [cached] + [None] * (len(text_hashes) - 1)
+        )
+        request = BatchEmbeddingRequest(
+            texts=["alpha", "beta"], embedding_type=EmbeddingType.ERROR
+        )
+
+        response = await use_case.execute_batch(request)
+
+        mock_ml_model.generate_batch_embeddings.assert_awaited_once()
+        assert mock_ml_model.generate_batch_embeddings.await_args.args[0] == ["beta"]
+        assert response.embeddings[0] is cached
+        assert response.cache_hit_ratio == 0.5
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_failed_chunks(
+        self, use_case, mock_ml_model, mock_vector_storage, mock_cache
+    ):
+        """Test that a failing model chunk is reported without losing others."""
+
+        async def generate(texts, embedding_type):
+            if "beta" in texts:
+                raise RuntimeError("model unavailable")
+            return [[0.1] * 1536 for _ in texts]
+
+        mock_ml_model.generate_batch_embeddings = AsyncMock(side_effect=generate)
+        request = BatchEmbeddingRequest(
+            texts=["alpha", "beta", "gamma"], embedding_type=EmbeddingType.ERROR
+        )
+
+        response = await use_case.execute_batch(request)
+
+        assert response.status == "partial_success"
+        assert response.success_count == 1
+        assert [f["index"] for f in response.failures] == [0, 1]
+        assert response.failures[0]["error"] == "model unavailable"
+
+    @pytest.mark.asyncio
+    async def test_batch_cache_errors_do_not_break_flow(
+        self, use_case, mock_ml_model, mock_cache
+    ):
+        """Test that cache failures fall back to generating every text."""
+        mock_cache.get_embeddings_batch = AsyncMock(
+            side_effect=Exception("Cache error")
+        )
+        mock_cache.set_embeddings_batch = AsyncMock(
+            side_effect=Exception("Cache error")
+        )
+        request = BatchEmbeddingRequest(
+            texts=["alpha", "beta"], embedding_type=EmbeddingType.ERROR
+        )
+
+        response = await use_case.execute_batch(request)
+
+        assert response.success_count == 2
+        assert response.cache_hit_ratio == 0.0
@@ -0,0 +1,196 @@
+"""
+Unit tests for streaming historical data processing.
+
+Tests focus on batched repository writes, throttled progress updates,
+per-record error handling and bounded read-ahead of the record stream.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.application.dto.requests import (
+    ProcessSpeakerHistoricalDataRequest,
+)
+from src.rag_integration_service.application.use_cases.historical_data_pipeline import (
+    HistoricalProcessingSettings,
+    ProgressThrottle,
+)
+from src.rag_integration_service.application.use_cases.process_speaker_rag_data_use_case import (
+    ProcessSpeakerRAGDataUseCase,
+)
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from tests.factories import make_record
+
+
+class RecordingRepository:
+    """Keeps jobs and pairs in memory and counts writes"""
+
+    def __init__(self, save_delay: float = 0.0):
+        self.save_delay = save_delay
+        self.pairs = []
+        self.pair_batches = 0
+        self.job_updates = []
+
+    async def create_processing_job(self, job):
+        return job
+
+    async def update_processing_job(self, job):
+        self.job_updates.append((job.status, job.processed_records, job.error_records))
+        return job
+
+    async def batch_create_error_correction_pairs(self, pairs):
+        await asyncio.sleep(self.save_delay)
+        self.pair_batches += 1
+        self.pairs.extend(pairs)
+        return pairs
+
+
+class FailingOnMarkerService(SpeakerRAGProcessingService):
+    """Fails records whose ASR text contains FAIL"""
+
+    def extract_error_correction_pairs(self, asr_text, *args, **kwargs):
+        if "FAIL" in asr_text:
+            raise ValueError("unreadable draft")
+        return super().extract_error_correction_pairs(asr_text, *args, **kwargs)
+
+
+def make_use_case(repository, settings, service=None, executor=None):
+    return ProcessSpeakerRAGDataUseCase(
+        speaker_rag_repository=repository,
+        vector_storage=None,
+        rag_processing_service=service or SpeakerRAGProcessingService(),
+        extraction_executor=executor,
+        historical_settings=settings,
+    )
+
+
+class TestProcessSpeakerHistoricalStream:
+    """Test the streaming historical data pipeline."""
+
+    @pytest.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            yield executor
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched_and_throttled(self, executor):
+        repository = RecordingRepository()
+        settings = HistoricalProcessingSettings(
+            extraction_workers=2,
+            records_per_task=10,
+            pair_batch_size=100,
+            progress_interval_seconds=3600,
+            progress_step_percentage=25,
+        )
+        use_case = make_use_case(repository, settings, executor=executor)
+        records = [make_record(i) for i in range(200)]
+
+        async def stream():
+            for record in records:
+                yield record
+
+        response = await use_case.process_speaker_historical_stream(
+            speaker_id=uuid4(), records=stream(), total_records=len(records)
+        )
+
+        # Two pairs per record, persisted 100+ at a time
+        assert response.total_pairs_generated == 400
+        assert len(repository.pairs) == 400
+        assert repository.pair_batches <= 4
+        # Start, one write per 25% step, completion
+        assert len(repository.job_updates) <= 6
+        assert repository.job_updates[-1] == ("completed", 200, 0)
+        assert response.error_statistics["substitution"]["count"] == 400
+
+    @pytest.mark.asyncio
+    async def test_failed_records_are_counted_and_skipped(self, executor):
+        repository = RecordingRepository()
+        settings = HistoricalProcessingSettings(
+            extraction_workers=2, records_per_task=4, max_recorded_errors=2
+        )
+        use_case = make_use_case(
+            repository, settings, FailingOnMarkerService(), executor
+        )
+        request = ProcessSpeakerHistoricalDataRequest(
+            speaker_id=str(uuid4()),
+            historical_data_items=[make_record(i, fail=i % 5 == 0) for i in range(20)],
+        )
+
+        response = await use_case.process_speaker_historical_data(request)
+
+        summary = response.processing_summary
+        assert summary["processed_records"] == 16
+        assert summary["error_records"] == 4
+        assert response.total_pairs_generated == 32
+        assert repository.job_updates[-1][0] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_stream_is_read_with_bounded_lookahead(self, executor):
+        repository = RecordingRepository(save_delay=0.01)
+        settings = HistoricalProcessingSettings(
+            extraction_workers=1, records_per_task=10, queue_size=2, pair_batch_size=20
+        )
+        use_case = make_use_case(repository, settings, executor=executor)
+        read = 0
+        read_ahead = []
+
+        async def stream():
+            nonlocal read
+            for i in range(1000):
+                read += 1
+                read_ahead.append(read - len(repository.pairs) // 2)
+                yield make_record(i)
+
+        response = await use_case.process_speaker_historical_stream(
+            speaker_id=uuid4(), records=stream()
+        )
+
+        assert response.processing_summary["total_records"] == 1000
+        assert response.total_pairs_generated == 2000
+        # Records in flight are bounded by the queues, not by the input size
+        assert max(read_ahead) < 100
+
+    @pytest.mark.asyncio
+    async def test_process_pool_extraction(self):
+        repository = RecordingRepository()
+        settings = HistoricalProcessingSettings(
+            extraction_workers=2, records_per_task=5
+        )
+        use_case = make_use_case(repository, settings)
+        request = ProcessSpeakerHistoricalDataRequest(
+            speaker_id=str(uuid4()),
+            historical_data_items=[make_record(i) for i in range(12)],
+        )
+
+        response = await use_case.process_speaker_historical_data(request)
+
+        assert response.total_pairs_generated == 24
+        assert {pair.error_text for pair in repository.pairs} == {
+            "diabetis",
+            "hipertension",
+        }
+
+
+class TestProgressThrottle:
+    """Test progress write cadence."""
+
+    def test_writes_on_interval_or_step(self):
+        now = [0.0]
+        throttle = ProgressThrottle(10, 5, clock=lambda: now[0])
+        job = SimpleNamespace()
+
+        job.progress_percentage = Decimal("4")
+        assert not throttle.should_write(job)
+        job.progress_percentage = Decimal("5")
+        assert throttle.should_write(job)
+        job.progress_percentage = Decimal("6")
+        assert not throttle.should_write(job)
+        now[0] = 10.0
+        assert throttle.should_write(job)
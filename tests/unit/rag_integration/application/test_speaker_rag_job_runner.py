@@ -0,0 +1,211 @@
+"""
+Unit tests for the background speaker RAG job runner.
+
+Tests focus on claiming jobs with bounded concurrency, resuming an
+interrupted job from its checkpoint without duplicating persisted pairs,
+and the runner metrics.
+"""
+
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.application.use_cases.historical_data_pipeline import (
+    HistoricalProcessingSettings,
+)
+from src.rag_integration_service.application.use_cases.process_speaker_rag_data_use_case import (
+    ProcessSpeakerRAGDataUseCase,
+)
+from src.rag_integration_service.application.use_cases.speaker_rag_job_runner import (
+    JobRunnerSettings,
+    SpeakerRAGJobRunner,
+)
+from src.rag_integration_service.domain.entities.speaker_rag_processing_job import (
+    JobStatus,
+    JobType,
+    SpeakerRAGProcessingJob,
+)
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from src.rag_integration_service.infrastructure.adapters.ml_models.hashing_embedding_model import (
+    HashingEmbeddingModel,
+)
+from src.rag_integration_service.infrastructure.adapters.vector_db.in_process_vector_storage import (
+    InProcessVectorStorageAdapter,
+)
+from tests.factories import extract_pairs, make_record
+
+
+class InMemoryJobRepository:
+    """Keeps jobs, pairs and embedding links in memory"""
+
+    def __init__(self, pair_delay: float = 0.0):
+        self.pair_delay = pair_delay
+        self.jobs = {}
+        self.pairs = []
+        self.links = []
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def create_processing_job(self, job):
+        self.jobs[job.id] = job
+        return job
+
+    async def update_processing_job(self, job):
+        self.jobs[job.id] = job
+        return job
+
+    async def get_pending_processing_jobs(self):
+        return [job for job in self.jobs.values() if job.status == JobStatus.PENDING]
+
+    async def get_running_processing_jobs(self):
+        return [job for job in self.jobs.values() if job.status == JobStatus.RUNNING]
+
+    async def batch_create_error_correction_pairs(self, pairs):
+        self.pairs.extend(pairs)
+        return pairs
+
+    async def get_error_correction_pairs_by_speaker(self, speaker_id, **kwargs):
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        await asyncio.sleep(self.pair_delay)
+        self.concurrent -= 1
+        return [pair for pair in self.pairs if pair.speaker_id == speaker_id]
+
+    async def batch_link_embeddings_to_speaker(self, speaker_id, links):
+        self.links.extend(links)
+        return len(links)
+
+
+class GatedHistoricalDataSource:
+    """Serves records from a list, pausing at a record until released"""
+
+    def __init__(self, records, pause_at=None):
+        self.records = records
+        self.pause_at = pause_at
+        self.release = asyncio.Event()
+        self.start_offsets = []
+
+    async def count_records(self, speaker_id):
+        return len(self.records)
+
+    async def iterate_records(self, speaker_id, start_offset=0):
+        self.start_offsets.append(start_offset)
+        for offset in range(start_offset, len(self.records)):
+            if offset == self.pause_at:
+                await self.release.wait()
+            yield self.records[offset]
+
+
+def make_use_case(repository, source=None, executor=None):
+    return ProcessSpeakerRAGDataUseCase(
+        speaker_rag_repository=repository,
+        vector_storage=InProcessVectorStorageAdapter(),
+        rag_processing_service=SpeakerRAGProcessingService(),
+        extraction_executor=executor,
+        historical_settings=HistoricalProcessingSettings(
+            extraction_workers=1, records_per_task=5, pair_batch_size=20
+        ),
+        ml_model=HashingEmbeddingModel(),
+        historical_data_source=source,
+    )
+
+
+async def create_job(repository, job_type, **metadata):
+    return await repository.create_processing_job(
+        SpeakerRAGProcessingJob(
+            id=uuid4(), speaker_id=uuid4(), job_type=job_type, job_metadata=metadata
+        )
+    )
+
+
+class TestSpeakerRAGJobRunner:
+    """Test background job execution."""
+
+    @pytest.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            yield executor
+
+    @pytest.mark.asyncio
+    async def test_pending_jobs_run_with_bounded_concurrency(self):
+        repository = InMemoryJobRepository(pair_delay=0.01)
+        jobs = [await create_job(repository, JobType.VECTORIZATION) for _ in range(5)]
+        for job in jobs:
+            repository.pairs.extend(extract_pairs(job.speaker_id, 3))
+        # Not runnable by the use case, left for other consumers
+        correction_job = await create_job(repository, JobType.RAG_CORRECTION)
+        runner = SpeakerRAGJobRunner(
+            make_use_case(repository), repository, JobRunnerSettings(concurrency=2)
+        )
+
+        await runner.run_until_idle()
+
+        assert all(job.status == JobStatus.COMPLETED for job in jobs)
+        assert correction_job.status == JobStatus.PENDING
+        assert repository.max_concurrent == 2
+        assert len(repository.links) == 30
+        metrics = runner.get_metrics()
+        assert metrics["completed_jobs"] == 5
+        assert metrics["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_interrupted_job_resumes_from_checkpoint(self, executor):
+        repository = InMemoryJobRepository()
+        records = [make_record(i) for i in range(100)]
+        job = await create_job(repository, JobType.HISTORICAL_ANALYSIS)
+        source = GatedHistoricalDataSource(records, pause_at=60)
+        runner = SpeakerRAGJobRunner(
+            make_use_case(repository, source, executor),
+            repository,
+            JobRunnerSettings(concurrency=1, poll_interval_seconds=0.01),
+        )
+
+        await runner.start()
+        while job.get_checkpoint()["offset"] < 60:
+            await asyncio.sleep(0.01)
+        metrics = runner.get_metrics()
+        await runner.stop()
+
+        assert metrics["active_jobs"] == 1
+        assert metrics["jobs"][0]["records_per_minute"] > 0
+        assert metrics["jobs"][0]["estimated_completion"] is not None
+        assert job.status == JobStatus.RUNNING
+        assert job.can_be_claimed()
+        assert len(repository.pairs) == 120
+
+        resumed_source = GatedHistoricalDataSource(records)
+        resumed_runner = SpeakerRAGJobRunner(
+            make_use_case(repository, resumed_source, executor), repository
+        )
+        await resumed_runner.run_until_idle()
+
+        assert resumed_source.start_offsets == [60]
+        assert job.status == JobStatus.COMPLETED
+        assert (job.processed_records, job.error_records) == (100, 0)
+        assert job.job_metadata["pairs_generated"] == 200
+        assert job.job_metadata["resume_count"] == 1
+        # Every record's pairs were persisted exactly once
+        per_record = Counter(pair.historical_data_id for pair in repository.pairs)
+        assert len(per_record) == 100
+        assert set(per_record.values()) == {2}
+
+    @pytest.mark.asyncio
+    async def test_jobs_leased_by_a_live_runner_are_not_claimed(self):
+        repository = InMemoryJobRepository()
+        job = await create_job(repository, JobType.VECTORIZATION)
+        job.start_job()
+        job.acquire_lease("other-runner", 60)
+        runner = SpeakerRAGJobRunner(make_use_case(repository), repository)
+
+        assert await runner.claim_jobs() == 0
+
+        job.acquire_lease("other-runner", 60, datetime.utcnow() - timedelta(hours=1))
+        await runner.run_until_idle()
+
+        assert job.status == JobStatus.COMPLETED
@@ -0,0 +1,177 @@
+"""
+Unit tests for vectorizing speaker error-correction pairs.
+
+Tests focus on batched model calls, storage writes and links, and on
+skipping training examples that are already embedded.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.application.use_cases.process_speaker_rag_data_use_case import (
+    ProcessSpeakerRAGDataUseCase,
+)
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from src.rag_integration_service.infrastructure.adapters.ml_models.hashing_embedding_model import (
+    HashingEmbeddingModel,
+)
+from src.rag_integration_service.infrastructure.adapters.vector_db.in_process_vector_storage import (
+    InProcessVectorStorageAdapter,
+)
+from tests.factories import extract_pairs
+
+
+class LinkingRepository:
+    """Serves a speaker's pairs and records embedding links"""
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+        self.links = {}
+        self.link_calls = 0
+        self.jobs = []
+
+    async def create_processing_job(self, job):
+        self.jobs.append(job)
+        return job
+
+    async def update_processing_job(self, job):
+        return job
+
+    async def get_error_correction_pairs_by_speaker(self, speaker_id, **kwargs):
+        return self.pairs
+
+    async def batch_link_embeddings_to_speaker(self, speaker_id, links):
+        self.link_calls += 1
+        self.links.update((pair_id, embedding_id) for embedding_id, pair_id in links)
+        return len(links)
+
+
+class CountingStorage(InProcessVectorStorageAdapter):
+    """Counts batch writes"""
+
+    def __init__(self):
+        super().__init__()
+        self.store_calls = 0
+
+    async def store_batch_embeddings(self, embeddings):
+        self.store_calls += 1
+        return await super().store_batch_embeddings(embeddings)
+
+
+def make_use_case(repository, storage, model):
+    return ProcessSpeakerRAGDataUseCase(
+        speaker_rag_repository=repository,
+        vector_storage=storage,
+        rag_processing_service=SpeakerRAGProcessingService(),
+        ml_model=model,
+    )
+
+
+class TestVectorizeSpeakerErrorPairs:
+    """Test the vectorization stage."""
+
+    @pytest.mark.asyncio
+    async def test_pairs_are_embedded_stored_and_linked_in_batches(self):
+        speaker_id = uuid4()
+        repository = LinkingRepository(extract_pairs(speaker_id, 25))
+        storage = CountingStorage()
+        model = HashingEmbeddingModel(max_batch_size=8)
+        use_case = make_use_case(repository, storage, model)
+
+        response = await use_case.vectorize_speaker_error_pairs(
+            speaker_id, batch_size=20
+        )
+
+        assert response.status == "completed"
+        assert response.processed_records == 50
+        # 20 pairs per batch, embedded 8 at a time
+        assert model.call_count == 3 + 3 + 2
+        assert storage.store_calls == repository.link_calls == 3
+        assert await storage.get_embedding_count({"speaker_id": str(speaker_id)}) == 50
+
+        pair = repository.pairs[0]
+        embedding = await storage.find_embedding(repository.links[pair.id])
+        assert embedding.text == pair.get_full_context()
+        assert embedding.metadata["target"] == pair.get_correction_context()
+        assert embedding.metadata["error_correction_pair_id"] == str(pair.id)
+
+    @pytest.mark.asyncio
+    async def test_already_embedded_examples_are_skipped(self):
+        speaker_id = uuid4()
+        storage = CountingStorage()
+        model = HashingEmbeddingModel()
+        first = LinkingRepository(extract_pairs(speaker_id, 10))
+        await make_use_case(first, storage, model).vectorize_speaker_error_pairs(
+            speaker_id
+        )
+
+        # The same ten records extracted again, plus five new ones
+        second = LinkingRepository(
+            extract_pairs(speaker_id, 10) + extract_pairs(speaker_id, 5, start=10)
+        )
+        use_case = make_use_case(second, storage, model)
+        await use_case.vectorize_speaker_error_pairs(speaker_id)
+
+        assert await storage.get_embedding_count() == 30
+        assert len(second.links) == 30
+        assert set(first.links.values()) < set(second.links.values())
+        assert second.jobs[0].job_metadata["embeddings_created"] == 10
+        assert second.jobs[0].job_metadata["embeddings_reused"] == 20
+
+    @pytest.mark.asyncio
+    async def test_duplicate_examples_in_a_batch_share_an_embedding(self):
+        speaker_id = uuid4()
+        pairs = extract_pairs(speaker_id, 3) + extract_pairs(speaker_id, 3)
+        repository = LinkingRepository(pairs)
+        storage = CountingStorage()
+        use_case = make_use_case(repository, storage, HashingEmbeddingModel())
+
+        await use_case.vectorize_speaker_error_pairs(speaker_id)
+
+        assert await storage.get_embedding_count() == 6
+        assert repository.links[pairs[0].id] == repository.links[pairs[6].id]
+
+    @pytest.mark.asyncio
+    async def test_speaker_without_pairs_completes(self):
+        repository = LinkingRepository([])
+        use_case = make_use_case(repository, CountingStorage(), HashingEmbeddingModel())
+
+        response = await use_case.vectorize_speaker_error_pairs(uuid4())
+
+        assert response.status == "completed"
+        assert repository.link_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_requires_ml_model(self):
+        use_case = make_use_case(LinkingRepository([]), CountingStorage(), None)
+
+        with pytest.raises(ValueError, match="ML model"):
+            await use_case.vectorize_speaker_error_pairs(uuid4())
+
+
+class TestHashingEmbeddingModel:
+    """Test the deterministic local embedding model."""
+
+    @pytest.mark.asyncio
+    async def test_embeddings_are_deterministic_unit_vectors(self):
+        model = HashingEmbeddingModel()
+        texts = ["patient has diabetes", "patient has diabetes", "lungs are clear"]
+
+        vectors = await model.generate_batch_embeddings(texts)
+
+        assert len(vectors[0]) == 1536
+        assert vectors[0] == vectors[1]
+        assert vectors[0] == await HashingEmbeddingModel().generate_embedding(texts[0])
+        similarity = sum(a * b for a, b in zip(vectors[0], vectors[2]))
+        assert abs(sum(v * v for v in vectors[0]) - 1.0) < 1e-5
+        assert similarity < 0.5
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batches(self):
+        model = HashingEmbeddingModel(max_batch_size=2)
+
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            await model.generate_batch_embeddings(["a", "b", "c"])
@@ -0,0 +1,148 @@
+"""
+Unit tests for the EmbeddingVector value object and vectorized similarity.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from src.rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+from src.rag_integration_service.domain.value_objects.embedding_vector import (
+    EmbeddingVector,
+    cosine_similarities,
+)
+
+
+def _embedding(vector) -> VectorEmbedding:
+    return VectorEmbedding(
+        id=uuid4(),
+        vector=vector,
+        text="patient has hypertension",
+        text_hash="hash",
+        embedding_type=EmbeddingType.ERROR,
+        model_version="v1.0",
+        model_name="test-model",
+        metadata={},
+        created_at=datetime.utcnow(),
+    )
+
+
+class TestEmbeddingVector:
+    """Test EmbeddingVector value object."""
+
+    def test_values_are_read_only_float32(self):
+        """Test that the array cannot be mutated through the value object."""
+        vector = EmbeddingVector.from_values([3.0, 4.0])
+
+        assert vector.values.dtype == np.float32
+        assert vector.norm == 5.0
+        with pytest.raises(ValueError):
+            vector.values[0] = 1.0
+
+    def test_read_only_float32_arrays_are_not_copied(self):
+        """Test zero-copy wrapping of read-only float32 arrays."""
+        array = np.array([1.0, 2.0], dtype=np.float32)
+        array.flags.writeable = False
+
+        assert EmbeddingVector.from_values(array).values is array
+
+    def test_non_numeric_values_raise_error(self):
+        """Test that non-numeric values are rejected."""
+        with pytest.raises(ValueError, match="only numeric values"):
+            EmbeddingVector.from_values([1.0, "x"])
+
+    def test_batch_similarity_matches_pairwise(self):
+        """Test that one vectorized call equals per-pair cosine similarity."""
+        rng = np.random.default_rng(0)
+        query = EmbeddingVector.from_values(rng.standard_normal(16))
+        others = [rng.standard_normal(16) for _ in range(5)] + [np.zeros(16)]
+
+        scores = cosine_similarities(query, others)
+
+        expected = [query.cosine_similarity(other) for other in others]
+        assert np.allclose(scores, expected, atol=1e-6)
+        assert scores[-1] == 0.0
+
+
+class TestVectorEmbeddingArrayRepresentation:
+    """Test the array-backed behaviour of VectorEmbedding."""
+
+    def test_list_api_is_preserved(self):
+        """Test that list vectors stay lists and math matches float64 results."""
+        rng = np.random.default_rng(1)
+        first, second = rng.standard_normal((2, 1536)).tolist()
+        embedding = _embedding(first)
+
+        expected = np.dot(first, second) / (
+            np.linalg.norm(first) * np.linalg.norm(second)
+        )
+        assert embedding.vector is first
+        assert embedding.cosine_similarity(second) == pytest.approx(expected, abs=1e-5)
+        assert embedding.dot_product(second) == pytest.approx(
+            np.dot(first, second), rel=1e-4
+        )
+        assert isinstance(embedding.normalize(), list)
+
+    def test_from_array_keeps_compact_vector(self):
+        """Test creating an embedding from an array without a float list."""
+        embedding = VectorEmbedding.from_array(
+            np.ones(1536),
+            id=uuid4(),
+            text="text",
+            text_hash="hash",
+            embedding_type=EmbeddingType.CONTEXT,
+            model_version="v1.0",
+            model_name="test-model",
+            metadata={},
+            created_at=datetime.utcnow(),
+        )
+
+        assert embedding.as_array() is embedding.vector
+        assert embedding.calculate_magnitude() == pytest.approx(np.sqrt(1536))
+
+    def test_embeddings_built_from_arrays_compare_by_value(self):
+        """Test equality of embeddings whose vectors are arrays."""
+        fields = dict(
+            id=uuid4(),
+            text="text",
+            text_hash="hash",
+            embedding_type=EmbeddingType.CONTEXT,
+            model_version="v1.0",
+            model_name="test-model",
+            metadata={},
+            created_at=datetime.utcnow(),
+        )
+        first = VectorEmbedding.from_array(np.ones(1536), **fields)
+        same = VectorEmbedding.from_array(np.ones(1536), **fields)
+        from_list = VectorEmbedding(vector=[1.0] * 1536, **fields)
+        other = VectorEmbedding.from_array(np.zeros(1536), **fields)
+
+        assert first == same
+        assert first == from_list
+        assert first != other
+        assert first != VectorEmbedding.from_array(
+            np.ones(1536), **{**fields, "text": "other"}
+        )
+
+    def test_reassigned_vector_refreshes_cache(self):
+        """Test that replacing the vector updates cached math."""
+        embedding = _embedding([1.0] + [0.0] * 1535)
+        embedding.vector = [0.0, 2.0] + [0.0] * 1534
+
+        assert embedding.calculate_magnitude() == 2.0
+
+    def test_cosine_similarities_against_embeddings(self):
+        """Test scoring one embedding against many in one call."""
+        query = _embedding([1.0] + [0.0] * 1535)
+        others = [
+            _embedding([1.0] + [0.0] * 1535),
+            _embedding([0.0, 1.0] + [0.0] * 1534),
+            _embedding([-1.0] + [0.0] * 1535),
+        ]
+
+        assert query.cosine_similarities(others).tolist() == [1.0, 0.0, -1.0]
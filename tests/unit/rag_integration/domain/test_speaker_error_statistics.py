@@ -0,0 +1,85 @@
+"""
+Unit tests for incremental speaker error frequency statistics.
+"""
+
+import random
+from decimal import Decimal
+from uuid import uuid4
+
+from src.rag_integration_service.domain.entities.speaker_error_correction_pair import (
+    SpeakerErrorCorrectionPair,
+)
+from src.rag_integration_service.domain.services.speaker_error_statistics import (
+    SpeakerErrorFrequencyAccumulator,
+)
+
+
+def _reference_statistics(pairs):
+    """Previous list-based calculation, kept as the reference"""
+    error_counts = {}
+    for pair in pairs:
+        data = error_counts.setdefault(
+            pair.categorize_error_type(),
+            {"count": 0, "examples": [], "avg_confidence": 0.0},
+        )
+        data["count"] += 1
+        data["examples"].append(
+            {
+                "error": pair.error_text,
+                "correction": pair.correction_text,
+                "confidence": (
+                    float(pair.confidence_score) if pair.confidence_score else 0.0
+                ),
+            }
+        )
+    for data in error_counts.values():
+        data["frequency"] = data["count"] / len(pairs)
+        data["percentage"] = (data["count"] / len(pairs)) * 100
+        confidences = [
+            ex["confidence"] for ex in data["examples"] if ex["confidence"] > 0
+        ]
+        data["avg_confidence"] = (
+            sum(confidences) / len(confidences) if confidences else 0.0
+        )
+        data["examples"] = sorted(
+            data["examples"], key=lambda x: x["confidence"], reverse=True
+        )[:5]
+    return error_counts
+
+
+def make_pairs(count, seed=7):
+    rng = random.Random(seed)
+    words = ["diabetis", "diabetes", "mg", "the patient", "patient", "bid", "b.i.d."]
+    pairs = []
+    while len(pairs) < count:
+        error, correction = rng.sample(words, 2)
+        pairs.append(
+            SpeakerErrorCorrectionPair(
+                id=uuid4(),
+                speaker_id=uuid4(),
+                historical_data_id=uuid4(),
+                error_text=error,
+                correction_text=correction,
+                confidence_score=rng.choice(
+                    [None, Decimal("0.5"), Decimal("0.8"), Decimal("0.9")]
+                ),
+            )
+        )
+    return pairs
+
+
+class TestSpeakerErrorFrequencyAccumulator:
+    """Incremental statistics match the list-based calculation."""
+
+    def test_matches_reference_when_added_in_chunks(self):
+        pairs = make_pairs(500)
+        accumulator = SpeakerErrorFrequencyAccumulator()
+
+        for offset in range(0, len(pairs), 37):
+            accumulator.add(pairs[offset : offset + 37])
+
+        assert accumulator.total_pairs == 500
+        assert accumulator.statistics() == _reference_statistics(pairs)
+
+    def test_no_pairs(self):
+        assert SpeakerErrorFrequencyAccumulator().statistics() == {}
@@ -0,0 +1,92 @@
+"""
+Unit tests for SpeakerRAGProcessingJob checkpoints and leases.
+
+Tests focus on resuming an interrupted job from its last checkpoint and on
+lease-based claiming of interrupted jobs.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.domain.entities.speaker_rag_processing_job import (
+    JobType,
+    SpeakerRAGProcessingJob,
+)
+
+
+def make_running_job(total_records: int = 100) -> SpeakerRAGProcessingJob:
+    job = SpeakerRAGProcessingJob(
+        id=uuid4(), speaker_id=uuid4(), job_type=JobType.HISTORICAL_ANALYSIS
+    )
+    job.start_job()
+    job.set_total_records(total_records)
+    return job
+
+
+class TestCheckpoints:
+    """Test checkpoint recording and resumption."""
+
+    def test_resume_restores_counters_from_checkpoint(self):
+        job = make_running_job()
+        job.update_progress(38, 2)
+        job.record_checkpoint(40, pairs_generated=76)
+        # Progress made after the checkpoint was not persisted
+        job.update_progress(55, 3)
+
+        offset = job.resume_from_checkpoint()
+
+        assert offset == 40
+        assert (job.processed_records, job.error_records) == (38, 2)
+        assert job.progress_percentage == Decimal("40")
+        assert job.get_checkpoint()["pairs_generated"] == 76
+        assert job.job_metadata["resume_count"] == 1
+
+    def test_job_without_checkpoint_resumes_from_start(self):
+        job = make_running_job()
+        job.update_progress(10)
+
+        assert job.resume_from_checkpoint() == 0
+        assert job.processed_records == 0
+
+    def test_only_running_jobs_resume(self):
+        job = SpeakerRAGProcessingJob(
+            id=uuid4(), speaker_id=uuid4(), job_type=JobType.VECTORIZATION
+        )
+
+        with pytest.raises(ValueError, match="cannot be resumed"):
+            job.resume_from_checkpoint()
+
+    def test_estimated_completion_time(self):
+        job = make_running_job()
+        job.started_at = datetime.utcnow() - timedelta(minutes=10)
+        job.update_progress(50)
+
+        estimated = job.get_estimated_completion_time()
+
+        assert estimated - datetime.utcnow() == pytest.approx(
+            timedelta(minutes=10), abs=timedelta(seconds=5)
+        )
+
+
+class TestLeases:
+    """Test lease-based claiming."""
+
+    def test_running_job_is_claimable_once_its_lease_expires(self):
+        job = make_running_job()
+        now = datetime.utcnow()
+        job.acquire_lease("runner-a", 60, now)
+
+        assert not job.can_be_claimed(now + timedelta(seconds=30))
+        assert job.can_be_claimed(now + timedelta(seconds=61))
+
+        job.release_lease()
+        assert job.can_be_claimed(now)
+
+    def test_finished_job_is_not_claimable(self):
+        job = make_running_job()
+        job.complete_job()
+
+        assert not job.can_be_claimed()
@@ -0,0 +1,163 @@
+"""
+Unit tests for the transcript aligner and alignment-based pair extraction.
+
+Tests focus on sentence alignment across dropped and split sentences and on
+phrase-level word differences that do not cascade after an insertion.
+"""
+
+from uuid import uuid4
+
+from src.rag_integration_service.domain.services.speaker_rag_processing_service import (
+    SpeakerRAGProcessingService,
+)
+from src.rag_integration_service.domain.services.transcript_aligner import (
+    TranscriptAligner,
+)
+
+
+class TestSentenceAlignment:
+    """Test similarity-weighted sentence alignment."""
+
+    def setup_method(self):
+        self.aligner = TranscriptAligner()
+
+    def test_dropped_sentence_does_not_shift_later_sentences(self):
+        asr = ["patient denies chest pain", "lungs are clear", "follow up in two weeks"]
+        final = [
+            "patient denies chest pain",
+            "no shortness of breath",
+            "lungs are clear",
+            "follow up in two weeks",
+        ]
+
+        aligned = self.aligner.align_sentences(asr, final)
+
+        assert [(a, f) for a, f, _ in aligned] == [
+            ("patient denies chest pain", "patient denies chest pain"),
+            ("", "no shortness of breath"),
+            ("lungs are clear", "lungs are clear"),
+            ("follow up in two weeks", "follow up in two weeks"),
+        ]
+        assert aligned[1][2] == 0.0
+
+    def test_split_sentence_is_aligned_with_its_parts(self):
+        asr = ["blood pressure is stable", "heart rate is normal"]
+        final = ["blood pressure is stable and heart rate is normal"]
+
+        aligned = self.aligner.align_sentences(asr, final)
+
+        assert len(aligned) == 1
+        assert aligned[0][0] == "blood pressure is stable heart rate is normal"
+        assert aligned[0][2] > 0.8
+
+    def test_empty_inputs(self):
+        assert self.aligner.align_sentences([], []) == []
+        assert self.aligner.align_sentences(["only asr"], []) == [("only asr", "", 0.0)]
+
+
+class TestWordDifferences:
+    """Test opcode-based phrase differences."""
+
+    def setup_method(self):
+        self.aligner = TranscriptAligner()
+
+    def test_insertion_does_not_cascade_into_substitutions(self):
+        differences = self.aligner.word_differences(
+            "patient has a history of diabetis and hypertension",
+            "the patient has a history of diabetes and hypertension",
+        )
+
+        assert [(error, correction) for error, correction, _ in differences] == [
+            ("patient", "the patient"),
+            ("diabetis", "diabetes"),
+        ]
+
+    def test_multi_word_substitution_is_one_pair(self):
+        differences = self.aligner.word_differences(
+            "give five hundred milligrams daily", "give 500 mg daily"
+        )
+
+        assert len(differences) == 1
+        error, correction, confidence = differences[0]
+        assert (error, correction) == ("five hundred milligrams", "500 mg")
+        assert confidence < 0.9
+
+    def test_deletion_is_anchored_on_both_neighbours(self):
+        differences = self.aligner.word_differences(
+            "she reports uh chest pain", "she reports chest pain"
+        )
+
+        assert differences == [("reports uh chest", "reports chest", 0.8)]
+
+    def test_identical_sentences_have_no_differences(self):
+        assert self.aligner.word_differences("lungs are clear", "lungs are clear") == []
+
+
+class TestErrorCorrectionPairExtraction:
+    """Test pair extraction through SpeakerRAGProcessingService."""
+
+    def test_extracts_one_pair_per_correction(self):
+        service = SpeakerRAGProcessingService()
+        speaker_id = uuid4()
+
+        pairs = service.extract_error_correction_pairs(
+            asr_text=(
+                "The patient was given metformin five hundred mg daily. "
+                "She reports uh chest pain radiating to the arm."
+            ),
+            final_text=(
+                "The patient was given metformin 500 mg twice daily. "
+                "She reports chest pain radiating to the left arm."
+            ),
+            speaker_id=speaker_id,
+            historical_data_id=uuid4(),
+        )
+
+        assert [(pair.error_text, pair.correction_text) for pair in pairs] == [
+            ("five hundred", "500"),
+            ("mg daily", "mg twice daily"),
+            ("reports uh chest", "reports chest"),
+            ("the arm", "the left arm"),
+        ]
+        assert len({pair.id for pair in pairs}) == 4
+        assert all(pair.speaker_id == speaker_id for pair in pairs)
+
+    def test_context_is_sliced_at_the_pair_offsets(self):
+        service = SpeakerRAGProcessingService()
+        asr_text = "The dose is ten mg.\nThe  dose was doubled to  ten mg daily."
+        final_text = "The dose is ten mg. The dose was doubled to twenty mg daily."
+
+        pairs = service.extract_error_correction_pairs(
+            asr_text=asr_text,
+            final_text=final_text,
+            speaker_id=uuid4(),
+            historical_data_id=uuid4(),
+            context_window=12,
+        )
+
+        assert len(pairs) == 1
+        pair = pairs[0]
+        assert (pair.error_text, pair.correction_text) == ("ten", "twenty")
+        # The second "ten", not the first occurrence in the text
+        start, end = pair.get_error_span()
+        assert asr_text[start:end] == "ten"
+        assert start == asr_text.rindex("ten")
+        assert pair.context_before == "doubled to"
+        assert pair.context_after == "mg daily."
+
+    def test_multi_word_error_span_covers_original_whitespace(self):
+        service = SpeakerRAGProcessingService()
+        asr_text = "Give five\n  hundred mg."
+
+        pairs = service.extract_error_correction_pairs(
+            asr_text=asr_text,
+            final_text="Give 500 mg.",
+            speaker_id=uuid4(),
+            historical_data_id=uuid4(),
+        )
+
+        assert pairs[0].error_text == "five hundred"
+        start, end = pairs[0].get_error_span()
+        assert asr_text[start:end] == "five\n  hundred"
+        assert pairs[0].context_before == "Give"
+        assert pairs[0].context_after == "mg."
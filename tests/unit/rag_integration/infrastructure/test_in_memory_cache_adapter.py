@@ -0,0 +1,71 @@
+"""
+Unit tests for the in-memory cache adapter.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from src.rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+from src.rag_integration_service.infrastructure.adapters.cache.in_memory_cache_adapter import (
+    InMemoryCacheAdapter,
+)
+
+
+def _embedding(text_hash: str) -> VectorEmbedding:
+    return VectorEmbedding(
+        id=uuid4(),
+        vector=[0.1] * 1536,
+        text="patient has hypertension",
+        text_hash=text_hash,
+        embedding_type=EmbeddingType.ERROR,
+        model_version="v1.0",
+        model_name="test-model",
+        metadata={},
+        created_at=datetime.utcnow(),
+    )
+
+
+class TestInMemoryCacheAdapter:
+    """Test embedding caching, expiry and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_embedding_batches_share_keys_with_single_lookups(self):
+        cache = InMemoryCacheAdapter()
+        first, second = _embedding("hash-1"), _embedding("hash-2")
+
+        await cache.set_embeddings_batch([first, second], ttl=60)
+        await cache.set_embedding("hash-3", _embedding("hash-3"))
+
+        assert await cache.get_embedding("hash-2") is second
+        found = await cache.get_embeddings_batch(["hash-1", "missing", "hash-3"])
+        assert found[0] is first
+        assert found[1] is None
+        assert found[2].text_hash == "hash-3"
+        assert await cache.invalidate_by_pattern("embedding:*") == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, monkeypatch):
+        cache = InMemoryCacheAdapter(default_ttl=10)
+        now = 1000.0
+        monkeypatch.setattr(
+            "src.rag_integration_service.infrastructure.adapters.cache."
+            "in_memory_cache_adapter.time.monotonic",
+            lambda: now,
+        )
+        await cache.set("short", 1, ttl=5)
+        await cache.set("default", 2)
+        await cache.increment("default", 3)
+
+        now = 1006.0
+        assert await cache.get("short") is None
+        assert await cache.get("default") == 5
+        assert await cache.get_ttl("default") == 4
+
+        now = 1011.0
+        assert not await cache.exists("default")
+        assert (await cache.get_statistics())["entries"] == 0
@@ -0,0 +1,230 @@
+"""
+Unit tests for the in-process vector storage adapter.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from src.rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+from src.rag_integration_service.infrastructure.adapters.vector_db.in_process_vector_storage import (
+    InProcessVectorStorageAdapter,
+)
+
+DIMENSION = 1536
+
+
+def _embedding(vector, **metadata) -> VectorEmbedding:
+    return VectorEmbedding(
+        id=uuid4(),
+        vector=[float(x) for x in vector],
+        text="patient has hypertension",
+        text_hash="hash",
+        embedding_type=EmbeddingType.ERROR,
+        model_version="v1.0",
+        model_name="test-model",
+        metadata=metadata,
+        created_at=datetime.utcnow(),
+    )
+
+
+def _random_embeddings(count: int, seed: int = 0, **metadata):
+    rng = np.random.default_rng(seed)
+    return [
+        _embedding(vector, **metadata)
+        for vector in rng.standard_normal((count, DIMENSION))
+    ]
+
+
+def _brute_force(embeddings, query, top_k):
+    matrix = np.asarray([e.vector for e in embeddings])
+    scores = matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+    return [embeddings[i].id for i in np.argsort(-scores)[:top_k]]
+
+
+class TestInProcessVectorStorageAdapter:
+    """Test exact search, filtering and persistence."""
+
+    @pytest.mark.asyncio
+    async def test_exact_search_matches_brute_force(self):
+        """Test that flat search returns the true nearest neighbours."""
+        adapter = InProcessVectorStorageAdapter(initial_capacity=4)
+        embeddings = _random_embeddings(50)
+        await adapter.store_batch_embeddings(embeddings)
+        query = np.random.default_rng(1).standard_normal(DIMENSION)
+
+        results = await adapter.find_similar(query.tolist(), top_k=5, threshold=-1.0)
+
+        assert [r.embedding_id for r in results] == _brute_force(embeddings, query, 5)
+        scores = [r.similarity_score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_metadata_prefiltering(self):
+        """Test that speaker, job and category filters restrict results."""
+        adapter = InProcessVectorStorageAdapter()
+        speaker_a = _random_embeddings(10, seed=1, speaker_id="a", job_id="j1")
+        speaker_b = _random_embeddings(
+            10, seed=2, speaker_id="b", category=["numeric", "grammar"]
+        )
+        await adapter.store_batch_embeddings(speaker_a + speaker_b)
+        query = speaker_a[3].vector
+
+        by_speaker = await adapter.find_by_speaker("a", query, top_k=20, threshold=-1.0)
+        by_category = await adapter.find_by_category(
+            "grammar", query, top_k=20, threshold=-1.0
+        )
+        by_job = await adapter.find_by_job("j1", query, top_k=1)
+
+        assert {r.embedding_id for r in by_speaker} == {e.id for e in speaker_a}
+        assert {r.embedding_id for r in by_category} == {e.id for e in speaker_b}
+        assert by_job[0].embedding_id == speaker_a[3].id
+        assert await adapter.get_embedding_count({"speaker_id": ["a", "b"]}) == 20
+
+    @pytest.mark.asyncio
+    async def test_store_find_and_delete(self):
+        """Test round-tripping and deleting embeddings."""
+        adapter = InProcessVectorStorageAdapter()
+        embeddings = _random_embeddings(6, job_id="job-1")
+        await adapter.store_batch_embeddings(embeddings)
+
+        found = await adapter.find_embedding(embeddings[0].id)
+        assert np.allclose(found.vector, embeddings[0].vector, atol=1e-5)
+        assert found.metadata == {"job_id": "job-1"}
+
+        assert await adapter.delete_embedding(embeddings[0].id)
+        assert await adapter.find_embedding(embeddings[0].id) is None
+        assert await adapter.delete_embeddings_by_job("job-1") == 5
+        assert await adapter.get_embedding_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_find_by_text_hashes(self):
+        """Test the text hash lookup across deletes and compaction."""
+        adapter = InProcessVectorStorageAdapter()
+        embeddings = _random_embeddings(3)
+        for i, embedding in enumerate(embeddings):
+            embedding.text_hash = f"hash-{i}"
+        await adapter.store_batch_embeddings(embeddings)
+
+        found = await adapter.find_by_text_hashes(["hash-0", "hash-2", "unknown"])
+        assert found == {"hash-0": embeddings[0].id, "hash-2": embeddings[2].id}
+
+        await adapter.delete_embedding(embeddings[0].id)
+        adapter.compact()
+        assert await adapter.find_by_text_hashes(["hash-0", "hash-2"]) == {
+            "hash-2": embeddings[2].id
+        }
+
+    @pytest.mark.asyncio
+    async def test_repeated_id_in_a_batch_keeps_last_occurrence(self):
+        """Test that a batch repeating an ID leaves no unreachable rows."""
+        adapter = InProcessVectorStorageAdapter()
+        first, other, replacement = _random_embeddings(3)
+        first.text_hash = "hash-old"
+        replacement.id = first.id
+        replacement.text_hash = "hash-new"
+        await adapter.store_batch_embeddings([first, other, replacement])
+
+        assert await adapter.get_embedding_count() == 2
+        found = await adapter.find_embedding(first.id)
+        assert np.allclose(found.vector, replacement.vector, atol=1e-5)
+        assert await adapter.find_by_text_hashes(["hash-old", "hash-new"]) == {
+            "hash-new": first.id
+        }
+
+        assert await adapter.delete_embedding(first.id)
+        results = await adapter.find_similar(first.vector, top_k=5, threshold=-1.0)
+        assert [result.embedding_id for result in results] == [other.id]
+
+    @pytest.mark.asyncio
+    async def test_ivf_index_recall(self):
+        """Test that the IVF index finds most true neighbours."""
+        rng = np.random.default_rng(3)
+        centers = rng.standard_normal((20, DIMENSION))
+        vectors = centers[rng.integers(0, 20, 2000)] + 0.3 * rng.standard_normal(
+            (2000, DIMENSION)
+        )
+        embeddings = [_embedding(vector) for vector in vectors]
+        adapter = InProcessVectorStorageAdapter()
+        await adapter.store_batch_embeddings(embeddings)
+        await adapter.create_index({"type": "ivf", "nlist": 20, "nprobe": 3})
+
+        hits = 0
+        for query in vectors[:20]:
+            results = await adapter.find_similar(
+                query.tolist(), top_k=10, threshold=-1.0
+            )
+            expected = set(_brute_force(embeddings, query, 10))
+            hits += len(expected & {r.embedding_id for r in results})
+
+        assert hits / 200 >= 0.9
+
+    @pytest.mark.asyncio
+    async def test_index_created_before_inserts_is_trained_lazily(self):
+        """Test that an IVF index on an empty collection trains once filled."""
+        rng = np.random.default_rng(4)
+        centers = rng.standard_normal((20, DIMENSION))
+        vectors = centers[rng.integers(0, 20, 400)] + 0.3 * rng.standard_normal(
+            (400, DIMENSION)
+        )
+        embeddings = [_embedding(vector) for vector in vectors]
+        adapter = InProcessVectorStorageAdapter()
+        await adapter.create_index({"type": "ivf", "nlist": 20, "nprobe": 3})
+
+        await adapter.store_batch_embeddings(embeddings[:10])
+        assert not (await adapter.get_statistics())["index_trained"]
+        results = await adapter.find_similar(vectors[0].tolist(), top_k=1)
+        assert results[0].embedding_id == embeddings[0].id
+
+        for start in range(10, 400, 30):
+            await adapter.store_batch_embeddings(embeddings[start : start + 30])
+
+        assert (await adapter.get_statistics())["index_trained"]
+        results = await adapter.find_similar(vectors[300].tolist(), top_k=1)
+        assert results[0].embedding_id == embeddings[300].id
+
+    @pytest.mark.asyncio
+    async def test_open_reloads_a_saved_collection(self, tmp_path):
+        """Test opening an empty directory, saving and reopening it."""
+        adapter = InProcessVectorStorageAdapter.open(str(tmp_path))
+        embeddings = _random_embeddings(4)
+        await adapter.store_batch_embeddings(embeddings)
+        adapter.save(str(tmp_path))
+
+        reopened = InProcessVectorStorageAdapter.open(str(tmp_path))
+        await reopened.store_embedding(_random_embeddings(1, seed=9)[0])
+        reopened.save(str(tmp_path))
+
+        assert (
+            await InProcessVectorStorageAdapter.open(
+                str(tmp_path)
+            ).get_embedding_count()
+            == 5
+        )
+        with pytest.raises(ValueError, match="dimensional"):
+            InProcessVectorStorageAdapter.open(str(tmp_path), dimension=8)
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_memory_mapped(self, tmp_path):
+        """Test persisting a collection and reopening it memory-mapped."""
+        adapter = InProcessVectorStorageAdapter()
+        embeddings = _random_embeddings(8, speaker_id="a")
+        await adapter.store_batch_embeddings(embeddings)
+        await adapter.delete_embedding(embeddings[-1].id)
+        adapter.save(str(tmp_path))
+
+        loaded = InProcessVectorStorageAdapter.load(str(tmp_path))
+
+        assert (await loaded.get_statistics())["memory_mapped"]
+        assert await loaded.get_embedding_count({"speaker_id": "a"}) == 7
+        results = await loaded.find_similar(embeddings[2].vector, top_k=1)
+        assert results[0].embedding_id == embeddings[2].id
+
+        await loaded.store_embedding(embeddings[-1])
+        assert await loaded.get_embedding_count() == 8
+        assert not (await loaded.get_statistics())["memory_mapped"]
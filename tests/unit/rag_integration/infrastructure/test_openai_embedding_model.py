@@ -0,0 +1,66 @@
+"""
+Unit tests for the OpenAI embedding model adapter.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.rag_integration_service.infrastructure.adapters.ml_models import (
+    OpenAIEmbeddingModel,
+)
+
+
+class FakeEmbeddings:
+    """Embeddings endpoint answering with one vector per input, reversed"""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.requests = []
+
+    async def create(self, model, input):
+        self.requests.append((model, input))
+        data = [
+            SimpleNamespace(index=i, embedding=[float(i)] * self.dimension)
+            for i in range(len(input))
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+def _model(dimension: int = 4, returned_dimension: int = 4, **kwargs):
+    embeddings = FakeEmbeddings(returned_dimension)
+    client = SimpleNamespace(embeddings=embeddings)
+    return (
+        OpenAIEmbeddingModel(api_key="", dimension=dimension, client=client, **kwargs),
+        embeddings,
+    )
+
+
+class TestOpenAIEmbeddingModel:
+    """Test batching, ordering and validation of API embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_embedded_in_one_request_in_input_order(self):
+        model, embeddings = _model()
+
+        vectors = await model.generate_batch_embeddings(["a\nb", "c", "d"])
+
+        assert vectors == [[0.0] * 4, [1.0] * 4, [2.0] * 4]
+        assert embeddings.requests == [("text-embedding-ada-002", ["a b", "c", "d"])]
+        assert (await model.get_model_info())["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_limits_are_enforced(self):
+        model, _ = _model(returned_dimension=3, max_batch_size=2)
+
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            await model.generate_batch_embeddings(["a", "b", "c"])
+        with pytest.raises(ValueError, match="3-dimensional"):
+            await model.generate_embedding("a")
+        assert not await model.health_check()
+
+    def test_api_key_is_required_without_a_client(self):
+        with pytest.raises(ValueError, match="api_key"):
+            OpenAIEmbeddingModel(api_key="")
@@ -0,0 +1,209 @@
+"""
+Tests for the PostgreSQL speaker RAG repository.
+
+Runs the repository against a SQLite database through aiosqlite.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiosqlite")
+
+from src.rag_integration_service.domain.entities.speaker_error_correction_pair import (
+    SpeakerErrorCorrectionPair,
+)
+from src.rag_integration_service.domain.entities.speaker_rag_processing_job import (
+    JobStatus,
+    JobType,
+    SpeakerRAGProcessingJob,
+)
+from src.rag_integration_service.infrastructure.adapters.database import (
+    PostgreSQLSpeakerRAGRepositoryAdapter,
+)
+from src.rag_integration_service.infrastructure.adapters.database.postgresql.speaker_rag_repository_adapter import (  # noqa: E501
+    _async_engine_url,
+)
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    repository = PostgreSQLSpeakerRAGRepositoryAdapter(
+        f"sqlite+aiosqlite:///{tmp_path / 'rag.db'}"
+    )
+    await repository.create_tables()
+    yield repository
+    await repository.close()
+
+
+def make_pair(speaker_id, error_type="medical", confidence="0.8", **fields):
+    return SpeakerErrorCorrectionPair(
+        id=uuid4(),
+        speaker_id=speaker_id,
+        historical_data_id=fields.pop("historical_data_id", uuid4()),
+        error_text="hypertention",
+        correction_text="hypertension",
+        error_type=error_type,
+        confidence_score=Decimal(confidence) if confidence else None,
+        **fields,
+    )
+
+
+class TestPostgreSQLSpeakerRAGRepository:
+    """Jobs, pairs and embedding links round-trip through the database."""
+
+    @pytest.mark.asyncio
+    async def test_job_checkpoint_and_lease_survive_reconnecting(self, repository):
+        job = SpeakerRAGProcessingJob(
+            id=uuid4(),
+            speaker_id=uuid4(),
+            job_type=JobType.ERROR_PAIR_GENERATION,
+            total_records=10,
+        )
+        await repository.create_processing_job(job)
+        job.start_job()
+        job.processed_records = 4
+        job.record_checkpoint(4, pairs_generated=7)
+        job.acquire_lease("runner-1", 60)
+        await repository.update_processing_job(job)
+        await repository.close()
+
+        reopened = PostgreSQLSpeakerRAGRepositoryAdapter(repository.connection_string)
+        stored = await reopened.get_processing_job_by_id(job.id)
+        await reopened.close()
+
+        assert stored.status == JobStatus.RUNNING
+        assert stored.total_records == 10
+        assert stored.get_checkpoint()["pairs_generated"] == 7
+        assert stored.has_active_lease()
+
+    @pytest.mark.asyncio
+    async def test_claimable_jobs_are_listed_oldest_first(self, repository):
+        now = datetime.utcnow()
+        speaker_id = uuid4()
+        newer, older, running = (
+            SpeakerRAGProcessingJob(
+                id=uuid4(),
+                speaker_id=speaker_id,
+                job_type=JobType.VECTORIZATION,
+                status=status,
+                created_at=now - timedelta(minutes=minutes),
+            )
+            for status, minutes in (
+                (JobStatus.PENDING, 1),
+                (JobStatus.PENDING, 5),
+                (JobStatus.RUNNING, 3),
+            )
+        )
+        for job in (newer, older, running):
+            await repository.create_processing_job(job)
+
+        pending = await repository.get_pending_processing_jobs()
+        assert [job.id for job in pending] == [older.id, newer.id]
+        assert [job.id for job in await repository.get_running_processing_jobs()] == [
+            running.id
+        ]
+        by_status = await repository.get_processing_jobs_by_speaker(
+            speaker_id, job_type=JobType.VECTORIZATION, status=JobStatus.RUNNING
+        )
+        assert [job.id for job in by_status] == [running.id]
+        assert (await repository.get_processing_job_statistics())["jobs_by_status"] == {
+            "pending": 2,
+            "running": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_pairs_are_filtered_and_updated(self, repository):
+        speaker_id = uuid4()
+        historical_data_id = uuid4()
+        confident = make_pair(
+            speaker_id,
+            historical_data_id=historical_data_id,
+            metadata={"source": "qa"},
+            error_start_offset=3,
+            error_end_offset=15,
+        )
+        unsure = make_pair(speaker_id, error_type=None, confidence="0.3")
+        await repository.batch_create_error_correction_pairs([confident, unsure])
+
+        found = await repository.get_error_correction_pairs_by_speaker(
+            speaker_id, error_type="medical", min_confidence=0.5
+        )
+        assert [pair.id for pair in found] == [confident.id]
+        assert found[0].metadata == {"source": "qa"}
+        assert found[0].confidence_score == Decimal("0.8")
+        assert (found[0].error_start_offset, found[0].error_end_offset) == (3, 15)
+        assert [
+            pair.id
+            for pair in await repository.get_error_correction_pairs_by_historical_data(
+                historical_data_id
+            )
+        ] == [confident.id]
+
+        unsure.error_type = "grammar"
+        await repository.update_error_correction_pair(unsure)
+        assert await repository.get_error_type_distribution(speaker_id) == {
+            "medical": 1,
+            "grammar": 1,
+        }
+        with pytest.raises(ValueError, match="not found"):
+            await repository.update_error_correction_pair(make_pair(speaker_id))
+
+        assert await repository.delete_error_correction_pair(unsure.id)
+        assert not await repository.delete_error_correction_pair(unsure.id)
+
+    @pytest.mark.asyncio
+    async def test_embedding_links_and_statistics(self, repository):
+        speaker_id = uuid4()
+        pair = make_pair(speaker_id)
+        await repository.create_error_correction_pair(pair)
+        first, second = uuid4(), uuid4()
+
+        await repository.batch_link_embeddings_to_speaker(
+            speaker_id, [(first, pair.id), (second, None)]
+        )
+        await repository.link_embedding_to_speaker(first, speaker_id, pair.id)
+
+        assert await repository.get_speaker_embeddings(speaker_id) == [first, second]
+        assert await repository.get_speaker_embeddings(speaker_id, limit=1) == [first]
+        assert await repository.get_embeddings_by_error_correction_pair(pair.id) == [
+            first
+        ]
+        statistics = await repository.get_speaker_error_statistics(speaker_id)
+        assert statistics["total_pairs"] == 1
+        assert statistics["total_embeddings"] == 2
+        assert statistics["average_confidence"] == pytest.approx(0.8)
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_old_finished_jobs(self, repository):
+        old = datetime.utcnow() - timedelta(days=40)
+        jobs = {
+            status: SpeakerRAGProcessingJob(
+                id=uuid4(),
+                speaker_id=uuid4(),
+                job_type=JobType.VECTORIZATION,
+                status=status,
+                created_at=old,
+            )
+            for status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.PENDING)
+        }
+        for job in jobs.values():
+            await repository.create_processing_job(job)
+
+        assert await repository.cleanup_old_jobs(older_than_days=30) == 1
+        assert await repository.get_processing_job_by_id(jobs[JobStatus.FAILED].id)
+        assert await repository.cleanup_old_jobs(keep_failed_jobs=False) == 1
+        assert await repository.delete_processing_job(jobs[JobStatus.PENDING].id)
+
+
+def test_deployment_url_is_served_through_asyncpg():
+    url, connect_args = _async_engine_url(
+        "postgresql://user:pw@postgres:5432/db?options=-csearch_path%3Drag_integration"
+    )
+
+    assert url.drivername == "postgresql+asyncpg"
+    assert "options" not in url.query
+    assert connect_args == {"server_settings": {"search_path": "rag_integration"}}
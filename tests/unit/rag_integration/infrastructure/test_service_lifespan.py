@@ -0,0 +1,160 @@
+"""
+Unit tests for the RAG Integration Service lifespan.
+
+Tests focus on wiring the speaker RAG use case and starting and stopping
+the background job runner with the application.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from src.rag_integration_service import main
+from src.rag_integration_service.domain.entities.speaker_rag_processing_job import (
+    JobStatus,
+    JobType,
+    SpeakerRAGProcessingJob,
+)
+from src.rag_integration_service.domain.entities.vector_embedding import VectorEmbedding
+from src.rag_integration_service.domain.value_objects.embedding_type import (
+    EmbeddingType,
+)
+from src.rag_integration_service.infrastructure.adapters.database import (
+    PostgreSQLSpeakerRAGRepositoryAdapter,
+)
+from src.rag_integration_service.infrastructure.adapters.http.speaker_rag_router import (
+    get_speaker_rag_job_runner,
+)
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture(autouse=True)
+def vector_db_path(monkeypatch, tmp_path):
+    monkeypatch.setitem(main.settings.vector_db["local"], "path", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def database_url(monkeypatch, tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'rag.db'}"
+    monkeypatch.setitem(main.settings.database, "url", url)
+    monkeypatch.setitem(main.settings.ml_models, "default_model", "hashing")
+    monkeypatch.setitem(main.settings.processing, "job_poll_interval_seconds", 0.01)
+    return url
+
+
+async def wait_for_status(repository, job_id, status):
+    for _ in range(200):
+        job = await repository.get_processing_job_by_id(job_id)
+        if job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    return job
+
+
+class TestServiceLifespan:
+    """Test background job runner startup and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_runner_executes_queued_jobs_until_shutdown(self):
+        app = FastAPI()
+
+        async with main.lifespan(app):
+            runner = app.state.speaker_rag_job_runner
+            repository = app.state.speaker_rag_repository
+            job = await repository.create_processing_job(
+                SpeakerRAGProcessingJob(
+                    id=uuid4(), speaker_id=uuid4(), job_type=JobType.VECTORIZATION
+                )
+            )
+            job = await wait_for_status(repository, job.id, JobStatus.COMPLETED)
+
+            assert job.status == JobStatus.COMPLETED
+            assert runner.get_metrics()["completed_jobs"] == 1
+
+        assert runner._poller is None
+        assert runner._workers == []
+
+    @pytest.mark.asyncio
+    async def test_job_interrupted_by_a_crash_is_resumed(self, database_url):
+        repository = PostgreSQLSpeakerRAGRepositoryAdapter(database_url)
+        await repository.create_tables()
+        job = SpeakerRAGProcessingJob(
+            id=uuid4(),
+            speaker_id=uuid4(),
+            job_type=JobType.VECTORIZATION,
+            status=JobStatus.RUNNING,
+        )
+        job.acquire_lease("crashed-runner", 60, datetime.utcnow() - timedelta(hours=1))
+        await repository.create_processing_job(job)
+        await repository.close()
+
+        app = FastAPI()
+        async with main.lifespan(app):
+            resumed = await wait_for_status(
+                app.state.speaker_rag_repository, job.id, JobStatus.COMPLETED
+            )
+
+        assert resumed.status == JobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_startup_fails_without_a_database(self, monkeypatch):
+        monkeypatch.setitem(main.settings.database, "url", "")
+
+        with pytest.raises(RuntimeError, match="DATABASE_URL"):
+            async with main.lifespan(FastAPI()):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_startup_fails_without_a_supported_embedding_model(self, monkeypatch):
+        monkeypatch.setitem(main.settings.ml_models, "default_model", "huggingface")
+
+        with pytest.raises(RuntimeError, match="DEFAULT_ML_MODEL"):
+            async with main.lifespan(FastAPI()):
+                pass
+
+        monkeypatch.setitem(main.settings.ml_models, "default_model", "openai")
+        monkeypatch.setitem(main.settings.ml_models["openai"], "api_key", "")
+        with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
+            async with main.lifespan(FastAPI()):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_vector_collection_is_saved_and_reopened(self, vector_db_path):
+        app = FastAPI()
+        async with main.lifespan(app):
+            await app.state.vector_storage.store_embedding(
+                VectorEmbedding(
+                    id=uuid4(),
+                    vector=[0.1] * 1536,
+                    text="patient has hypertension",
+                    text_hash="hash",
+                    embedding_type=EmbeddingType.ERROR,
+                    model_version="v1.0",
+                    model_name="test-model",
+                    metadata={},
+                    created_at=datetime.utcnow(),
+                )
+            )
+
+        assert (vector_db_path / "records.json").exists()
+        async with main.lifespan(app):
+            assert await app.state.vector_storage.get_embedding_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_runner_dependency_reads_application_state(self):
+        app = FastAPI()
+        request = type("Request", (), {"app": app})()
+
+        with pytest.raises(HTTPException, match="not initialized"):
+            await get_speaker_rag_job_runner(request)
+
+        app.state.speaker_rag_job_runner = object()
+        assert (
+            await get_speaker_rag_job_runner(request)
+            is app.state.speaker_rag_job_runner
+        )
@@ -0,0 +1,47 @@
+"""
+Unit tests for CalculateSERMetricsUseCase streaming aggregates.
+"""
+
+import pytest
+
+from src.verification_service.application.use_cases.calculate_ser_metrics_use_case import (
+    CalculateSERMetricsUseCase,
+)
+from src.verification_service.domain.services.ser_calculation_service import (
+    SERCalculationService,
+)
+
+
+class TestStreamSummaryStatistics:
+    """Test streamed summary statistics for large batches."""
+
+    @pytest.mark.asyncio
+    async def test_matches_materialized_summary(self):
+        """Test that streamed aggregates equal the list-based summary."""
+        service = SERCalculationService()
+        use_case = CalculateSERMetricsUseCase(service)
+        text_pairs = [
+            ("the patient is stable", "the patient is stable"),
+            ("patient has hypertention", "patient has hypertension"),
+            ("no known allergies", "no known drug allergies noted"),
+        ] * 10
+
+        expected = use_case._calculate_summary_statistics(
+            service.calculate_batch_ser(text_pairs)
+        )
+        streamed = await use_case.stream_summary_statistics(
+            (pair for pair in text_pairs), max_workers=2, chunk_size=4
+        )
+
+        assert streamed["total_items"] == expected["total_items"]
+        assert streamed["quality_distribution"] == expected["quality_distribution"]
+        assert abs(streamed["average_ser"] - expected["average_ser"]) < 1e-9
+        assert streamed["min_ser"] == expected["min_ser"]
+        assert streamed["max_ser"] == expected["max_ser"]
+
+    @pytest.mark.asyncio
+    async def test_empty_input_returns_empty_summary(self):
+        """Test that no pairs produce an empty summary."""
+        use_case = CalculateSERMetricsUseCase(SERCalculationService())
+
+        assert await use_case.stream_summary_statistics([], max_workers=1) == {}
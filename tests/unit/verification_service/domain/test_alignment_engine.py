@@ -0,0 +1,129 @@
+"""
+Unit tests for the SER alignment engines.
+
+Every engine must return exactly the distance produced by the reference
+dynamic programming implementation.
+"""
+
+import random
+
+import pytest
+
+from src.verification_service.domain.services.alignment_engine import (
+    AlignmentEngineType,
+    BitParallelEngine,
+    DynamicProgrammingEngine,
+    TwoRowEngine,
+    get_alignment_engine,
+    intern_tokens,
+)
+from src.verification_service.domain.services.ser_calculation_service import (
+    SERCalculationService,
+)
+
+
+def _random_pairs(count: int, max_length: int, seed: int = 42):
+    rng = random.Random(seed)
+    vocabulary = ["patient", "has", "no", "known", "drug", "allergies", "the", "a"]
+    for _ in range(count):
+        yield (
+            [rng.choice(vocabulary) for _ in range(rng.randint(0, max_length))],
+            [rng.choice(vocabulary) for _ in range(rng.randint(0, max_length))],
+        )
+
+
+class TestAlignmentEngines:
+    """Test edit distance engines against the reference implementation."""
+
+    @pytest.mark.parametrize("engine", [TwoRowEngine(), BitParallelEngine()])
+    def test_distance_matches_reference(self, engine):
+        """Test that optimized engines are identical to the full DP table."""
+        reference = DynamicProgrammingEngine()
+
+        for tokens1, tokens2 in _random_pairs(500, 20):
+            assert engine.distance(tokens1, tokens2) == reference.distance(
+                tokens1, tokens2
+            )
+
+    def test_bit_parallel_handles_long_sequences(self):
+        """Test that the bit-parallel engine has no word-size limit."""
+        tokens1 = [f"w{i % 97}" for i in range(300)]
+        tokens2 = [f"w{i % 89}" for i in range(280)]
+
+        assert BitParallelEngine().distance(
+            tokens1, tokens2
+        ) == TwoRowEngine().distance(tokens1, tokens2)
+
+    @pytest.mark.parametrize(
+        "engine", [DynamicProgrammingEngine(), TwoRowEngine(), BitParallelEngine()]
+    )
+    def test_bounded_distance_respects_cutoff(self, engine):
+        """Test that bounded distance returns the distance or None past the cutoff."""
+        reference = DynamicProgrammingEngine()
+
+        for tokens1, tokens2 in _random_pairs(200, 12, seed=7):
+            distance = reference.distance(tokens1, tokens2)
+            for max_distance in range(0, 14):
+                expected = distance if distance <= max_distance else None
+                assert (
+                    engine.bounded_distance(tokens1, tokens2, max_distance) == expected
+                )
+
+    def test_empty_sequences(self):
+        """Test distances involving empty sequences."""
+        for engine_type in AlignmentEngineType:
+            engine = get_alignment_engine(engine_type)
+            assert engine.distance([], []) == 0
+            assert engine.distance(["a", "b"], []) == 2
+            assert engine.distance([], ["a"]) == 1
+
+    def test_get_alignment_engine_by_value(self):
+        """Test resolving engines from their string value."""
+        assert isinstance(get_alignment_engine("two_row"), TwoRowEngine)
+
+    def test_get_alignment_engine_unknown_raises_error(self):
+        """Test that unknown engines are rejected."""
+        with pytest.raises(ValueError, match="Unsupported alignment engine"):
+            get_alignment_engine("levenshtein_gpu")
+
+    def test_intern_tokens_shares_vocabulary(self):
+        """Test that equal tokens map to equal IDs across both sequences."""
+        ids1, ids2 = intern_tokens(["a", "b", "a"], ["b", "c"])
+
+        assert ids1[0] == ids1[2]
+        assert ids1[1] == ids2[0]
+        assert len({ids1[0], ids1[1], ids2[1]}) == 3
+
+
+class TestSERCalculationEngineSelection:
+    """Test engine selection in the SER calculation service."""
+
+    def test_calculate_ser_identical_across_engines(self):
+        """Test that SER metrics do not depend on the selected engine."""
+        service = SERCalculationService()
+        asr_text = "Patient has no known drug allergy, the the BP is stable."
+        reference_text = "The patient has no known drug allergies. BP is stable."
+
+        results = {
+            engine_type: service.calculate_ser(
+                asr_text, reference_text, engine=engine_type
+            )
+            for engine_type in AlignmentEngineType
+        }
+
+        assert (
+            len({metrics.to_dict()["ser_score"] for metrics in results.values()}) == 1
+        )
+        assert len({metrics.edit_distance for metrics in results.values()}) == 1
+
+    def test_exceeds_ser_threshold(self):
+        """Test the banded threshold check against the full SER score."""
+        service = SERCalculationService(alignment_engine=AlignmentEngineType.TWO_ROW)
+        asr_text = "patient has known allergies"
+        reference_text = "patient has no known allergies"
+
+        ser_score = float(service.calculate_ser(asr_text, reference_text).ser_score)
+
+        assert ser_score == 20.0
+        assert service.exceeds_ser_threshold(asr_text, reference_text, 19.9)
+        assert not service.exceeds_ser_threshold(asr_text, reference_text, 20.0)
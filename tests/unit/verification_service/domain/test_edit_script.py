@@ -0,0 +1,112 @@
+"""
+Unit tests for the EditScript value object and single-pass SER alignment.
+"""
+
+import random
+
+from src.verification_service.domain.services.alignment_engine import (
+    BitParallelEngine,
+    DynamicProgrammingEngine,
+)
+from src.verification_service.domain.services.ser_calculation_service import (
+    SERCalculationService,
+)
+from src.verification_service.domain.value_objects.edit_script import (
+    EditOperation,
+    EditScript,
+)
+from src.verification_service.domain.value_objects.ser_metrics import SERMetrics
+
+
+class TestEditScriptAlignment:
+    """Test edit scripts produced by the alignment engines."""
+
+    def test_alignment_distance_matches_reference(self):
+        """Test that the edit script is minimal and replays both sequences."""
+        rng = random.Random(3)
+        engine = BitParallelEngine()
+        reference_engine = DynamicProgrammingEngine()
+
+        for _ in range(300):
+            hypothesis = [rng.choice("abcdef") for _ in range(rng.randint(0, 25))]
+            reference = [rng.choice("abcdef") for _ in range(rng.randint(0, 25))]
+
+            script = engine.align(hypothesis, reference)
+
+            assert script.distance == reference_engine.distance(hypothesis, reference)
+            assert [
+                step.hypothesis_token
+                for step in script.steps
+                if step.hypothesis_token is not None
+            ] == hypothesis
+            assert [
+                step.reference_token
+                for step in script.steps
+                if step.reference_token is not None
+            ] == reference
+
+    def test_alignment_operations(self):
+        """Test that each operation kind is reported with its positions."""
+        script = BitParallelEngine().align(
+            ["patient", "has", "uh", "high", "hypertention"],
+            ["the", "patient", "has", "high", "hypertension"],
+        )
+        operations = [step.operation for step in script.steps]
+
+        assert operations == [
+            EditOperation.INSERTION,
+            EditOperation.MATCH,
+            EditOperation.MATCH,
+            EditOperation.DELETION,
+            EditOperation.MATCH,
+            EditOperation.SUBSTITUTION,
+        ]
+        assert script.steps[0].reference_index == 0
+        assert script.steps[0].hypothesis_index is None
+        assert script.steps[3].hypothesis_index == 2
+        assert script.steps[3].reference_index is None
+        assert script.steps[5].hypothesis_token == "hypertention"
+        assert script.steps[5].reference_token == "hypertension"
+
+    def test_moves_detected_from_unaligned_tokens(self):
+        """Test that a reordered word is reported as a move, not ins + del."""
+        script = BitParallelEngine().align(
+            ["stable", "blood", "pressure", "is", "now"],
+            ["blood", "pressure", "is", "now", "stable"],
+        )
+
+        assert script.moves == ((0, 4),)
+        assert script.net_insertions == 0
+        assert script.net_deletions == 0
+
+    def test_round_trip_dict(self):
+        """Test dictionary serialization of an edit script."""
+        script = BitParallelEngine().align(["a", "b", "c"], ["a", "x", "c", "d"])
+
+        assert EditScript.from_dict(script.to_dict()) == script
+
+
+class TestSERMetricsEditScript:
+    """Test that SER metrics expose the alignment they came from."""
+
+    def test_calculate_ser_exposes_edit_script(self):
+        """Test that metrics are derived from the returned edit script."""
+        service = SERCalculationService()
+
+        metrics = service.calculate_ser(
+            "Patient has hypertention today.", "The patient has hypertension."
+        )
+
+        assert metrics.edit_script is not None
+        assert metrics.edit_distance == metrics.edit_script.distance == 3
+        assert "edit_script" not in metrics.to_dict()
+        assert metrics.to_dict(include_edit_script=True)["edit_script"]["steps"]
+
+    def test_from_dict_restores_edit_script(self):
+        """Test that the edit script survives a dictionary round trip."""
+        metrics = SERCalculationService().calculate_ser("a b c", "a c d")
+
+        restored = SERMetrics.from_dict(metrics.to_dict(include_edit_script=True))
+
+        assert restored.edit_script == metrics.edit_script
+        assert restored == metrics
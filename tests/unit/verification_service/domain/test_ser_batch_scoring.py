@@ -0,0 +1,95 @@
+"""
+Unit tests for pooled and streaming batch SER scoring.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.verification_service.domain.services import ser_calculation_service
+from src.verification_service.domain.services.ser_calculation_service import (
+    SERCalculationService,
+)
+
+TEXT_PAIRS = [
+    (f"patient {i} has hypertention and diabetes", f"patient {i} has hypertension")
+    for i in range(25)
+] + [("blood pressure is stable", "blood pressure is stable today")] * 5
+
+
+class TestBatchSERScoring:
+    """Test batch SER scoring across worker processes."""
+
+    def test_process_pool_matches_in_process_results(self):
+        """Test that pooled scoring returns the same metrics in input order."""
+        service = SERCalculationService()
+
+        expected = service.calculate_batch_ser(TEXT_PAIRS)
+        pooled = service.calculate_batch_ser(TEXT_PAIRS, max_workers=2, chunk_size=4)
+
+        assert pooled == expected
+        assert all(metrics.edit_script is None for metrics in pooled)
+
+    def test_reuses_supplied_executor(self):
+        """Test that an explicit executor is used instead of a new pool."""
+        service = SERCalculationService()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = service.calculate_batch_ser(
+                TEXT_PAIRS, chunk_size=7, executor=executor
+            )
+
+        assert results == service.calculate_batch_ser(TEXT_PAIRS)
+
+    @pytest.mark.asyncio
+    async def test_stream_batch_ser_yields_every_pair(self):
+        """Test that streaming yields each pair exactly once with its index."""
+        service = SERCalculationService()
+        expected = service.calculate_batch_ser(TEXT_PAIRS)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            streamed = {
+                index: metrics
+                async for index, metrics in service.stream_batch_ser(
+                    iter(TEXT_PAIRS), chunk_size=4, executor=executor
+                )
+            }
+
+        assert sorted(streamed) == list(range(len(TEXT_PAIRS)))
+        assert [streamed[index] for index in range(len(TEXT_PAIRS))] == expected
+
+    @pytest.mark.asyncio
+    async def test_stream_batch_ser_with_process_pool(self):
+        """Test streaming through an owned process pool."""
+        service = SERCalculationService()
+
+        streamed = [
+            index
+            async for index, _ in service.stream_batch_ser(
+                TEXT_PAIRS, max_workers=2, chunk_size=8
+            )
+        ]
+
+        assert sorted(streamed) == list(range(len(TEXT_PAIRS)))
+
+    @pytest.mark.asyncio
+    async def test_stream_batch_ser_does_not_wait_for_pool_shutdown(self, monkeypatch):
+        """Test that an owned pool is shut down without waiting for workers."""
+        shutdowns = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        monkeypatch.setattr(
+            ser_calculation_service, "ProcessPoolExecutor", RecordingPool
+        )
+        stream = SERCalculationService().stream_batch_ser(
+            TEXT_PAIRS, max_workers=2, chunk_size=4
+        )
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert shutdowns == [(False, True)]
@@ -0,0 +1,105 @@
+"""
+Unit tests for incremental speaker SER aggregates.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.verification_service.domain.entities.speaker_ser_aggregate import (
+    SpeakerSERAggregate,
+)
+from src.verification_service.domain.value_objects.ser_metrics import SERMetrics
+
+
+def _metrics(edit_distance: int, reference_length: int = 20) -> SERMetrics:
+    ser_score = edit_distance / reference_length * 100
+    return SERMetrics.create(
+        ser_score=ser_score,
+        insert_percentage=ser_score,
+        delete_percentage=0.0,
+        move_percentage=0.0,
+        edit_distance=edit_distance,
+        reference_length=reference_length,
+        hypothesis_length=reference_length + edit_distance,
+    )
+
+
+SCORES = [_metrics(distance) for distance in (0, 1, 3, 4, 7, 2, 9, 5, 1, 6)]
+
+
+class TestSpeakerSERAggregate:
+    """Test SpeakerSERAggregate entity."""
+
+    def test_average_matches_full_recomputation(self):
+        """Test that the running mean equals averaging the full history."""
+        aggregate = SpeakerSERAggregate.from_metrics(SCORES)
+
+        expected = sum(metrics.ser_score for metrics in SCORES) / len(SCORES)
+
+        assert aggregate.count == len(SCORES)
+        assert aggregate.average_ser == expected.quantize(Decimal("0.01"))
+        assert aggregate.min_ser == min(metrics.ser_score for metrics in SCORES)
+        assert aggregate.max_ser == max(metrics.ser_score for metrics in SCORES)
+
+    def test_quality_distribution(self):
+        """Test quality counts are tracked per measurement."""
+        aggregate = SpeakerSERAggregate.from_metrics(SCORES)
+
+        expected = {"high": 0, "medium": 0, "low": 0}
+        for metrics in SCORES:
+            expected[metrics.get_quality_level()] += 1
+
+        assert aggregate.get_quality_distribution() == expected
+
+    def test_merge_equals_single_pass(self):
+        """Test that merging shard aggregates equals aggregating everything."""
+        speaker_id = uuid4()
+        first = SpeakerSERAggregate.from_metrics(SCORES[:4], speaker_id=speaker_id)
+        second = SpeakerSERAggregate.from_metrics(SCORES[4:], speaker_id=speaker_id)
+
+        merged = first.merge(second)
+
+        assert merged == SpeakerSERAggregate.from_metrics(SCORES, speaker_id=speaker_id)
+
+    def test_merge_rejects_different_speakers(self):
+        """Test that aggregates of different speakers cannot be merged."""
+        first = SpeakerSERAggregate(speaker_id=uuid4())
+        second = SpeakerSERAggregate(speaker_id=uuid4())
+
+        with pytest.raises(ValueError, match="different speakers"):
+            first.merge(second)
+
+    def test_recent_scores_are_bounded(self):
+        """Test that only the most recent scores are retained."""
+        aggregate = SpeakerSERAggregate.from_metrics(SCORES, recent_scores_size=3)
+
+        assert aggregate.get_recent_scores() == [
+            metrics.ser_score for metrics in SCORES[-3:]
+        ]
+
+    def test_variance(self):
+        """Test population variance of the scores."""
+        aggregate = SpeakerSERAggregate.from_metrics([_metrics(2), _metrics(6)])
+
+        # Scores are 10% and 30%
+        assert aggregate.ser_variance == Decimal("100")
+        assert aggregate.ser_std_dev == Decimal("10")
+
+    def test_empty_aggregate(self):
+        """Test an aggregate without measurements."""
+        aggregate = SpeakerSERAggregate()
+
+        assert aggregate.average_ser == Decimal("0")
+        assert aggregate.min_ser is None
+        assert aggregate.ser_variance == Decimal("0")
+
+    def test_dict_round_trip(self):
+        """Test serialization to and from a dictionary."""
+        aggregate = SpeakerSERAggregate.from_metrics(SCORES, speaker_id=uuid4())
+
+        restored = SpeakerSERAggregate.from_dict(aggregate.to_dict())
+
+        assert restored == aggregate
+        assert restored.recent_scores.maxlen == aggregate.recent_scores_size